@@ -0,0 +1,74 @@
+"""Compare results of microbenchmarks (see microbenchmarks.py) with a baseline and flag regressions.
+
+Usage:
+    python compare_benchmarks.py BASELINE.json CURRENT.json [--threshold 0.25]
+
+A case is flagged as a regression if its time exceeds the baseline time by more than the threshold
+(a fraction; 0.25 means 25%). The script fails (exit code 1) if any regression is found. Cases present in only one
+of the files are listed, but not flagged.
+
+Timings depend on the machine; a baseline is only meaningful if it was recorded on similar hardware
+(the 'meta' section of the files is shown to help judging that).
+"""
+
+import argparse
+import json
+import sys
+
+
+def load_results(file_name: str) -> tuple[dict, dict[str, float]]:
+    """Load metadata and results (time per call, by case name) from a JSON file made by microbenchmarks.py."""
+
+    with open(file_name) as f:
+        contents = json.load(f)
+    return contents.get('meta', {}), contents['results']
+
+
+def compare(baseline: dict[str, float], current: dict[str, float], threshold: float) -> list[str]:
+    """Print a comparison table of the results; return names of the cases which regressed beyond the threshold."""
+
+    regressions = []
+    for name, baseline_time in baseline.items():
+        if name not in current:
+            continue
+        ratio = current[name] / baseline_time
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = 'REGRESSION'
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            flag = 'improvement'
+        print(f"{name:75s}: {baseline_time:12.0f} -> {current[name]:12.0f} ns ({ratio:5.2f}x) {flag}")
+
+    for name in current:
+        if name not in baseline:
+            print(f"{name:75s}: new case (not in the baseline)")
+    for name in baseline:
+        if name not in current:
+            print(f"{name:75s}: missing (not in the current results)")
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('baseline', help="JSON file with the baseline results")
+    parser.add_argument('current', help="JSON file with the current results")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed relative slow-down of a case before it is flagged as a regression")
+    args = parser.parse_args()
+
+    baseline_meta, baseline = load_results(args.baseline)
+    current_meta, current = load_results(args.current)
+    if baseline_meta != current_meta:
+        print(f"Warning: results recorded in different environments:\n  baseline: {baseline_meta}\n"
+              f"  current:  {current_meta}\n")
+
+    regressions = compare(baseline, current, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than the baseline by more than {100 * args.threshold:.0f}%")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
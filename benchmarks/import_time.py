@@ -0,0 +1,63 @@
+"""Measure the time needed to import the package.
+
+Usage:
+    python import_time.py [--repeat N] [--budget SECONDS]
+
+Each import is done in a fresh interpreter. numpy is imported (and timed) first, so that the reported time
+of importing dliswriter does not include it. The script fails (exit code 1) if the median import time
+exceeds the budget. The optional dependencies used only in some cases (h5py, progressbar) are expected not to be
+imported; the script reports them if they are.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+
+LAZY_MODULES = ('h5py', 'progressbar', 'concurrent.futures.process')
+
+_TIMING_CODE = f"""
+import sys, time
+t0 = time.perf_counter()
+import numpy
+t1 = time.perf_counter()
+import dliswriter
+t2 = time.perf_counter()
+loaded = [m for m in {LAZY_MODULES!r} if m in sys.modules]
+print(t1 - t0, t2 - t1, ','.join(loaded))
+"""
+
+
+def measure_once() -> tuple[float, float, list[str]]:
+    """Import numpy and dliswriter in a new interpreter; return the times (seconds) and eagerly loaded modules."""
+
+    out = subprocess.run([sys.executable, '-c', _TIMING_CODE], check=True, capture_output=True, text=True).stdout
+    numpy_time, dliswriter_time, *loaded = out.split()
+    return float(numpy_time), float(dliswriter_time), loaded[0].split(',') if loaded else []
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=10, help="Number of imports to time")
+    parser.add_argument('--budget', type=float, default=0.5,
+                        help="Maximal allowed median time (seconds) of importing dliswriter (excluding numpy)")
+    args = parser.parse_args()
+
+    results = [measure_once() for _ in range(args.repeat)]
+    numpy_time = statistics.median(r[0] for r in results)
+    dliswriter_time = statistics.median(r[1] for r in results)
+    loaded = sorted(set(m for r in results for m in r[2]))
+
+    print(f"import numpy:      {1e3 * numpy_time:7.1f} ms (median of {args.repeat})")
+    print(f"import dliswriter: {1e3 * dliswriter_time:7.1f} ms (median of {args.repeat}; budget: "
+          f"{1e3 * args.budget:.0f} ms)")
+    if loaded:
+        print(f"Modules which should be imported lazily, but were imported eagerly: {', '.join(loaded)}")
+
+    if dliswriter_time > args.budget or loaded:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
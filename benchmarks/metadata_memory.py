@@ -0,0 +1,62 @@
+"""Measure memory taken by and time needed to create metadata objects (channels and equipment items).
+
+Usage:
+    python metadata_memory.py [--n-items N]
+
+The script reports the memory allocated (as traced by tracemalloc) per channel and per equipment item,
+including all the Attribute instances of the items.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Callable
+
+from dliswriter.logical_record import eflr_types
+
+
+def measure(make_items: Callable[[int], list], n_items: int) -> tuple[float, float]:
+    """Create the items and return the memory (bytes) per item and total time (seconds) taken."""
+
+    gc.collect()
+    tracemalloc.start()
+    start_mem = tracemalloc.get_traced_memory()[0]
+    start_time = time.perf_counter()
+
+    items = make_items(n_items)
+
+    elapsed = time.perf_counter() - start_time
+    gc.collect()
+    mem = tracemalloc.get_traced_memory()[0] - start_mem
+    tracemalloc.stop()
+
+    del items
+    return mem / n_items, elapsed
+
+
+def make_channels(n: int) -> list:
+    parent = eflr_types.ChannelSet()
+    return [eflr_types.ChannelItem(f'CH{i}', parent=parent, units='m', long_name=f'Channel {i}', origin_reference=1)
+            for i in range(n)]
+
+
+def make_equipment(n: int) -> list:
+    parent = eflr_types.EquipmentSet()
+    return [eflr_types.EquipmentItem(f'EQ{i}', parent=parent, trademark_name='XYZ', status=1, height=1.5,
+                                     origin_reference=1)
+            for i in range(n)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--n-items', type=int, default=5000, help="Number of items of each type to create")
+    args = parser.parse_args()
+
+    for label, func in (('ChannelItem', make_channels), ('EquipmentItem', make_equipment)):
+        mem, elapsed = measure(func, args.n_items)
+        print(f"{label:15s}: {mem / 1024:8.2f} KiB per item, {1e6 * elapsed / args.n_items:8.1f} us per item")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""Measure the time taken by the encoding primitives used when writing metadata (EFLR objects) of DLIS files.
+
+Usage:
+    python microbenchmarks.py [--filter SUBSTRING] [--repeat N] [--output RESULTS.json]
+
+Each case calls a primitive (e.g. 'write_struct_uvari', 'Attribute.get_as_bytes') with the given parameters
+(e.g. value size) repeatedly; the best (minimal) time per call out of several repetitions is reported, in nanoseconds.
+The results can be saved to a JSON file and compared with a baseline (see compare_benchmarks.py):
+
+    python microbenchmarks.py --output current.json
+    python compare_benchmarks.py baselines/microbenchmarks.json current.json
+
+To update the baseline kept in the repository, save the results to baselines/microbenchmarks.json.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from datetime import datetime
+from typing import Any, Callable, Iterator
+
+import numpy as np
+
+from dliswriter.logical_record import eflr_types
+from dliswriter.logical_record.core.logical_record.logical_record_bytes import LogicalRecordBytes
+from dliswriter.utils.internal.converters import ReprCodeConverter
+from dliswriter.utils.internal.struct_writer import (write_struct_uvari, write_struct_ascii, write_struct_dtime,
+                                                     write_struct_obname)
+
+
+case_type = tuple[str, Callable[[], Any]]
+
+
+def _make_channel(name: str = 'CH', **kwargs: Any) -> eflr_types.ChannelItem:
+    return eflr_types.ChannelItem(name, parent=eflr_types.ChannelSet(), origin_reference=1, **kwargs)
+
+
+def struct_cases() -> Iterator[case_type]:
+    """Cases for the write_struct_* functions; sizes of the values cover the different encodings used."""
+
+    for value in (1, 200, 100_000):  # USHORT, UNORM, ULONG
+        yield f'write_struct_uvari[value={value}]', lambda v=value: write_struct_uvari(v)
+
+    for length in (8, 256, 4096):
+        yield f'write_struct_ascii[length={length}]', lambda v='A' * length: write_struct_ascii(v)
+
+    date_time = datetime(2024, 5, 17, 13, 45, 11, 120000)
+    yield 'write_struct_dtime', lambda: write_struct_dtime(date_time)
+
+    for length in (4, 64):
+        channel = _make_channel('C' * length)
+        yield f'write_struct_obname[name_length={length}]', lambda c=channel: write_struct_obname(c)
+
+
+def attribute_cases() -> Iterator[case_type]:
+    """Cases for Attribute.get_as_bytes, including building the descriptor (characteristics) of the attribute."""
+
+    channel = _make_channel(units='m', long_name='Channel', minimum_value=0.5)
+    yield 'Attribute.get_as_bytes[text]', channel.long_name.get_as_bytes
+    yield 'Attribute.get_as_bytes[float,units]', channel.minimum_value.get_as_bytes
+    yield 'Attribute.get_as_bytes[template]', lambda: channel.long_name.get_as_bytes(for_template=True)
+
+    for n in (1, 100, 10_000):
+        parameter = eflr_types.ParameterItem('P', parent=eflr_types.ParameterSet(), values=list(np.arange(n) * 0.5),
+                                             origin_reference=1)
+        yield f'Attribute.get_as_bytes[float_list,count={n}]', parameter.values.get_as_bytes
+
+    frame = eflr_types.FrameItem('F', parent=eflr_types.FrameSet(), origin_reference=1,
+                                 channels=[_make_channel(f'CH{i}') for i in range(100)])
+    yield 'Attribute.get_as_bytes[obname_list,count=100]', frame.channels.get_as_bytes
+
+
+def eflr_set_cases() -> Iterator[case_type]:
+    """Cases for EFLRSet._make_template_bytes; the template depends on the number of attributes of the set type."""
+
+    for set_type, item_type in ((eflr_types.ZoneSet, eflr_types.ZoneItem),
+                                (eflr_types.ChannelSet, eflr_types.ChannelItem),
+                                (eflr_types.OriginSet, eflr_types.OriginItem)):
+        eflr_set = set_type()
+        item_type('ITEM', parent=eflr_set, origin_reference=1)
+        yield f'EFLRSet._make_template_bytes[{set_type.__name__}]', eflr_set._make_template_bytes
+
+
+def logical_record_cases() -> Iterator[case_type]:
+    """Cases for LogicalRecordBytes.make_segments (split into segments fitting the default visible record length)."""
+
+    for size in (1_000, 100_000, 1_000_000):
+        lrb = LogicalRecordBytes(bytes(size), lr_type_struct=b'\x03', is_eflr=True)
+        yield f'LogicalRecordBytes.make_segments[size={size}]', lambda lrb=lrb: list(lrb.make_segments(8188))
+
+
+def repr_code_cases() -> Iterator[case_type]:
+    """Cases for ReprCodeConverter.determine_repr_code_from_value."""
+
+    values: dict[str, Any] = {
+        'int': 12,
+        'float': 1.5,
+        'str': 'abc',
+        'datetime': datetime(2024, 5, 17),
+        'float_list,count=100': [0.5] * 100,
+        'mixed_int_list,count=100': list(range(-50, 50)),
+    }
+    for label, value in values.items():
+        yield (f'ReprCodeConverter.determine_repr_code_from_value[{label}]',
+               lambda v=value: ReprCodeConverter.determine_repr_code_from_value(v))
+
+
+def all_cases() -> Iterator[case_type]:
+    yield from struct_cases()
+    yield from attribute_cases()
+    yield from eflr_set_cases()
+    yield from logical_record_cases()
+    yield from repr_code_cases()
+
+
+def time_case(func: Callable[[], Any], repeat: int, min_time: float = 0.05) -> float:
+    """Return the minimal time (nanoseconds) per call of the function; each repetition lasts at least 'min_time' s."""
+
+    timer = timeit.Timer(func)
+    n_calls, _ = timer.autorange()
+    n_calls = max(1, int(n_calls * min_time / 0.2))  # autorange aims at 0.2 s
+    return 1e9 * min(timer.repeat(repeat=repeat, number=n_calls)) / n_calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', default='', help="Only run the cases whose names contain this substring")
+    parser.add_argument('--repeat', type=int, default=5, help="Number of repetitions of each case")
+    parser.add_argument('--output', help="JSON file to save the results to")
+    args = parser.parse_args()
+
+    results: dict[str, float] = {}
+    for name, func in all_cases():
+        if args.filter not in name:
+            continue
+        results[name] = round(time_case(func, args.repeat), 1)
+        print(f"{name:75s}: {results[name]:12.0f} ns")
+
+    if args.output:
+        meta = {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'machine': platform.machine(),
+            'platform': sys.platform,
+        }
+        with open(args.output, 'w') as f:
+            json.dump({'meta': meta, 'unit': 'ns', 'results': results}, f, indent=2)
+            f.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,11 @@ from dliswriter.logical_record import eflr_types
 from dliswriter.utils.internal.internal_enums import RepresentationCode
 from dliswriter.utils import enums
 from dliswriter.utils.high_compatibility_mode import high_compatibility_mode, high_compatibility_mode_decorator
+from dliswriter.utils.encoding_cache import EncodingCache, CachePolicy, encoding_cache_scope
+from dliswriter.logical_record.core.eflr.parallel_encoder import ParallelEFLREncoder, parallel_eflr_encoding_scope
+from dliswriter.utils.spill_store import SpillStore
+from dliswriter.utils.channel_transform import ChannelTransform
+from dliswriter.utils.virtual_channel import VirtualChannel, EvenlySpacedIndex, DerivedChannel
 from dliswriter.utils.source_data_wrappers import SourceDataWrapper, DictDataWrapper, NumpyDataWrapper, HDF5DataWrapper
 
 
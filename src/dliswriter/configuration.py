@@ -1,9 +1,33 @@
+from contextvars import ContextVar
 from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dliswriter.utils.encoding_cache import EncodingCache
+    from dliswriter.logical_record.core.eflr.parallel_encoder import ParallelEFLREncoder
+
+
+# set per execution context (e.g. per thread), so that concurrent writes do not share or replace each other's
+# cache or EFLR encoder
+encoding_cache_context: ContextVar[Optional["EncodingCache"]] = ContextVar('encoding_cache', default=None)
+eflr_encoder_context: ContextVar[Optional["ParallelEFLREncoder"]] = ContextVar('eflr_encoder', default=None)
 
 
 @dataclass
 class DLISWriterConfig:
     high_compat_mode: bool = False
 
+    @property
+    def encoding_cache(self) -> Optional["EncodingCache"]:
+        """EncodingCache used in the current execution context (see encoding_cache_scope)."""
+
+        return encoding_cache_context.get()
+
+    @property
+    def eflr_encoder(self) -> Optional["ParallelEFLREncoder"]:
+        """ParallelEFLREncoder used in the current execution context (see parallel_eflr_encoding_scope)."""
+
+        return eflr_encoder_context.get()
+
 
 global_config = DLISWriterConfig()
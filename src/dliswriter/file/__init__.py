@@ -1,3 +1,4 @@
 from .multi_frame_data import MultiFrameData
+from .no_format_data_stream import NoFormatDataStream
 from .writer import DLISWriter
 from .file import DLISFile
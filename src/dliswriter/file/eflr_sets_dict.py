@@ -5,6 +5,7 @@ from dliswriter.logical_record.core.eflr import EFLRSet
 
 if TYPE_CHECKING:
     from dliswriter.logical_record.core.eflr.eflr_item import EFLRItem
+    from dliswriter.logical_record.core.attribute.attribute import Attribute
 
 
 AnyEFLRSet = TypeVar("AnyEFLRSet", bound="EFLRSet")
@@ -70,4 +71,36 @@ class EFLRSetsDict(defaultdict):
         """Retrieve all EFLRItem instances registered for all instances of given EFLRSet subclass."""
 
         for value in self[eflr_set_type].values():
-            yield from value.get_all_eflr_items()
+            yield from value.iter_eflr_items()
+
+    def count_items_for_set_type(self, eflr_set_type: type[EFLRSet]) -> int:
+        """Count EFLRItem instances registered for all instances of given EFLRSet subclass."""
+
+        return sum(eflr_set.n_items for eflr_set in self[eflr_set_type].values())
+
+    def clone(self, mapping: dict[int, "EFLRItem"], references: list["Attribute"], lazy: bool = False
+              ) -> "EFLRSetsDict":
+        """Create a copy of the structure, with copies of all the registered EFLRSets (see EFLRSet.clone).
+
+        The copied sets are linked together, so that renaming an item of one of them invalidates the shared encoded
+        bodies of all of them (they might refer to the renamed item).
+
+        Args:
+            mapping     :   Dictionary to which the mapping of IDs of the original items on their copies is added.
+            references  :   List to which the Attributes of the copies referring to other items are appended.
+                            The references have to be redirected (EFLRItem.redirect_references) by the caller
+                            once all the referred items have been copied.
+            lazy        :   If True, Attributes of the items are only copied when needed (see EFLRItem.clone).
+        """
+
+        new = EFLRSetsDict()
+        linked_sets: list[EFLRSet] = []
+
+        for eflr_set_type, eflr_set_dict in self.items():
+            new_set_dict = new[eflr_set_type]
+            for set_name, eflr_set in eflr_set_dict.items():
+                new_set_dict[set_name] = new_set = eflr_set.clone(mapping, references, lazy=lazy)
+                new_set._linked_sets = linked_sets
+                linked_sets.append(new_set)
+
+        return new
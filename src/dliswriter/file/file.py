@@ -3,33 +3,56 @@
 Note: unless otherwise specified, all quotes come from teh RP66 v1 standard specification.
 """
 
-from typing import Any, Union, Optional, TypeVar, Generator
+import os
+import gc
+import heapq
+import inspect
+from functools import lru_cache
+from contextlib import contextmanager, nullcontext
+from typing import Any, Union, Optional, TypeVar, Generator, Iterable, Iterator, Callable, ContextManager
 import numpy as np
 from timeit import timeit
 from datetime import timedelta, datetime
 import logging
 
 from dliswriter.utils.source_data_wrappers import DictDataWrapper, SourceDataWrapper
+from dliswriter.utils.spill_store import SpillStore
+from dliswriter.utils.channel_transform import ChannelTransform
+from dliswriter.utils.virtual_channel import VirtualChannel
+from dliswriter.utils.internal.cast_checker import CastPolicy
+from dliswriter.utils.internal.dtype_narrowing import NarrowingProposal
 from dliswriter.utils.internal.types import (
     numpy_dtype_type,
     number_type,
     dtime_or_number_type,
     list_of_values_type,
+    numeric_values_type,
     file_name_type,
     data_form_type,
+    bytes_type,
     ListOrTuple,
     NestedList,
     AttrDict,
 )
 from dliswriter.utils.internal.sized_generator import SizedGenerator
+from dliswriter.utils.internal.records import records_type, iter_records
+from dliswriter.utils.internal.sampling_detection import detect_sampling
+from dliswriter.utils.internal.decimation import DecimationMethod, expand_for_method
+from dliswriter.utils.internal.fshort import decode_fshort
 from dliswriter.utils import enums
 from dliswriter.logical_record.core.eflr import EFLRItem, AttrSetup
 from dliswriter.logical_record.misc import StorageUnitLabel
 from dliswriter.logical_record import eflr_types
 from dliswriter.logical_record.iflr_types.no_format_frame_data import NoFormatFrameData
+from dliswriter.logical_record.iflr_types.frame_data import FrameData
 from dliswriter.file.multi_frame_data import MultiFrameData
+from dliswriter.file.no_format_data_stream import NoFormatDataStream
+from dliswriter.file.frame_data_scheduler import FrameDataScheduler
 from dliswriter.file.writer import DLISWriter
-from dliswriter.file.eflr_sets_dict import EFLRSetsDict
+from dliswriter.file.eflr_sets_dict import EFLRSetsDict, AnyEFLRSet
+from dliswriter.file.logical_file_template import LogicalFileTemplate
+from dliswriter.utils.encoding_cache import EncodingCache, encoding_cache_scope
+from dliswriter.logical_record.core.eflr.parallel_encoder import ParallelEFLREncoder, parallel_eflr_encoding_scope
 from dliswriter.configuration import global_config
 
 logger = logging.getLogger(__name__)
@@ -57,6 +80,31 @@ def _set_up_sul_or_fh(item_class: type[T], item: Optional[T], **kwargs: Any) ->
     return item
 
 
+@lru_cache(maxsize=None)
+def _argument_names(method: Callable) -> frozenset[str]:
+    """Names of the arguments of a method (excluding 'self'); used to validate columns of tabular definitions."""
+
+    return frozenset(inspect.signature(method).parameters) - {'self'}
+
+
+@contextmanager
+def _gc_paused() -> Generator[None, None, None]:
+    """Context manager. Pause the cyclic garbage collector, e.g. while creating many objects which are all kept.
+
+    Each EFLRItem references its Attributes, which reference the item back; creating many of them triggers repeated
+    garbage collection passes over the growing (but live) object graph. The collector is re-enabled on exit
+    (if it was enabled before).
+    """
+
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
 def raise_or_warn(message: str) -> None:
     """If high-compatibility mode is on, raise a RuntimeError with given message. Otherwise, put it in the logs."""
 
@@ -74,8 +122,10 @@ class DLISFile:
         set_identifier: str = "MAIN-STORAGE-UNIT",
         sul_sequence_number: int = 1,
         max_record_length: int = 8192,
+        spill_store: Optional[SpillStore] = None,
     ):
         self.logical_files: list[LogicalFile] = []
+        self._spill_store = spill_store
 
         self._sul: StorageUnitLabel = _set_up_sul_or_fh(
             item_class=StorageUnitLabel,
@@ -93,6 +143,12 @@ class DLISFile:
 
         return self._sul
 
+    @property
+    def spill_store(self) -> Optional[SpillStore]:
+        """Store keeping the data passed to 'add_channel' on disk until the file is written (if any)."""
+
+        return self._spill_store
+
     def add_logical_file(
         self,
         file_header: Optional[eflr_types.FileHeaderItem] = None,
@@ -110,8 +166,56 @@ class DLISFile:
         self.logical_files.append(lf)
         return lf
 
-    def generator(self, multi_frame_data_objects: list[list[MultiFrameData]]) -> Generator:
-        """Define a generator yielding logical records to be put in the file."""
+    def add_logical_file_from_template(self, template: LogicalFileTemplate,
+                                       data: Optional[dict[str, np.ndarray]] = None) -> "LogicalFile":
+        """Add a new logical file with copies of the file header and all the objects of a LogicalFileTemplate.
+
+        Copying the objects is much cheaper than defining them anew: the copies share the attribute values
+        (and, as long as they are not modified, the encoded bytes) with the template. See LogicalFileTemplate.
+
+        Args:
+            template    :   The template to create the logical file from (see LogicalFile.freeze).
+            data        :   New data of (some of) the channels, by channel name (see LogicalFile.set_channel_data).
+                            Channels not included keep the data of the template.
+
+        Returns:
+            The new logical file. It can be further modified without affecting the template.
+        """
+
+        file_header_item, eflr_sets = template.clone()
+
+        lf = LogicalFile(physical_file=self, file_header=file_header_item)
+        lf._eflr_sets = eflr_sets
+        lf._data_dict = template.data_dict
+        lf._next_dataset_copy = template.next_dataset_copy
+
+        for eflr_set_dict in eflr_sets.values():
+            for eflr_set in eflr_set_dict.values():
+                self._eflr_sets.try_add_set(eflr_set)
+
+        for channel_name, channel_data in (data or {}).items():
+            lf.set_channel_data(channel_name, channel_data)
+
+        self.logical_files.append(lf)
+        return lf
+
+    def generator(self, multi_frame_data_objects: list[list[MultiFrameData]],
+                  frame_data_scheduler: Optional[FrameDataScheduler] = None,
+                  interleave_frames: bool = False) -> Generator:
+        """Define a generator yielding logical records to be put in the file.
+
+        Args:
+            multi_frame_data_objects    :   MultiFrameData objects of each logical file.
+            frame_data_scheduler        :   If provided, FrameData are not yielded one by one as FrameData objects,
+                                            but as EncodedRecords (blocks of already encoded FrameData) retrieved
+                                            from the scheduler.
+            interleave_frames           :   If True, FrameData of the frames of each logical file are merged
+                                            in the order of their index values (see _interleave_frame_data).
+                                            Cannot be combined with 'frame_data_scheduler'.
+        """
+
+        if interleave_frames and frame_data_scheduler is not None:
+            raise ValueError("Frames cannot be interleaved when the frame data are encoded by a scheduler")
 
         for idx_lf, logical_file in enumerate(self.logical_files):
             yield logical_file.file_header_item.parent
@@ -122,22 +226,94 @@ class DLISFile:
                 if set_type not in (eflr_types.FileHeaderSet, eflr_types.OriginSet):
                     yield from set_dict.values()
 
-            yield from logical_file._no_format_frame_data
+            for no_format_frame_data in logical_file._no_format_frame_data:
+                if isinstance(no_format_frame_data, NoFormatDataStream):
+                    yield from no_format_frame_data
+                else:
+                    yield no_format_frame_data
+
+            if interleave_frames:
+                yield from self._interleave_frame_data(multi_frame_data_objects[idx_lf])
+                continue
 
             for multi_frame_data in multi_frame_data_objects[idx_lf]:
-                yield from multi_frame_data
+                if frame_data_scheduler is not None:
+                    yield from frame_data_scheduler.encoded_records(multi_frame_data)
+                else:
+                    yield from multi_frame_data
 
-    def generate_logical_records(
+    @staticmethod
+    def _interleaving_order(multi_frame_data_objects: list[MultiFrameData]) -> bool:
+        """Check that the indexed frames can be interleaved; return True if their indices are decreasing.
+
+        The direction of the index of each frame is taken from its 'spacing' or 'direction' (determined from
+        the data if not specified); if neither is known, the index is assumed to be increasing.
+        """
+
+        if any(mfd.frame.overviews for mfd in multi_frame_data_objects):
+            raise ValueError("Frames with overview frames cannot be interleaved")
+
+        directions = set()
+        for mfd in multi_frame_data_objects:
+            fr = mfd.frame
+            if fr.index_type.value is not None:
+                spacing = fr.spacing.value
+                directions.add(fr.direction.value == 'DECREASING' or (spacing is not None and spacing < 0))
+
+        if len(directions) > 1:
+            raise ValueError("Frames with increasing and decreasing indices cannot be interleaved")
+
+        return directions == {True}
+
+    @classmethod
+    def _interleave_frame_data(cls, multi_frame_data_objects: list[MultiFrameData]) -> Iterator[FrameData]:
+        """Merge the FrameData of frames (of one logical file) in the order of the values of their index channels.
+
+        The FrameData of each frame are already ordered by the (monotonic) index, so they are merged lazily
+        (k-way merge): at most one chunk of data of each frame is loaded at a time. The FrameData keep their frame
+        numbers; FrameData with equal index values are yielded in the order of the frames. FrameData of frames
+        without an index channel are not interleaved - they are yielded afterwards, frame by frame.
+        """
+
+        reverse = cls._interleaving_order(multi_frame_data_objects)
+
+        # each MultiFrameData is wrapped in a generator: heapq.merge might call 'iter' on it again, which would
+        # restart the iteration over its FrameData
+        yield from (frame_data for _, frame_data in heapq.merge(
+            *(cls._iter_with_index_values(mfd) for mfd in multi_frame_data_objects
+              if mfd.frame.index_type.value is not None),
+            key=lambda keyed_frame_data: keyed_frame_data[0],
+            reverse=reverse,
+        ))
+
+        for mfd in multi_frame_data_objects:
+            if mfd.frame.index_type.value is None:
+                yield from mfd
+
+    @staticmethod
+    def _iter_with_index_values(mfd: MultiFrameData) -> Iterator[tuple[Any, FrameData]]:
+        """Yield the FrameData of a frame together with their index values (FSHORT index values decoded)."""
+
+        index_channel = mfd.frame.channels.value[0]
+        if index_channel.cast_dtype is None or np.dtype(index_channel.cast_dtype) != np.float16:
+            for frame_data in mfd:
+                yield frame_data.slots[0], frame_data
+            return
+
+        for frame_data in mfd:  # loaded as FSHORT words, whose order is not that of the values
+            yield float(decode_fshort(np.asarray(frame_data.slots[0]).reshape(1))[0]), frame_data
+
+    def _make_multi_frame_data_objects(
         self,
         chunk_size: Optional[int],
         data: Optional[data_form_type] = None,
         **kwargs: Any,
-    ) -> SizedGenerator:
-        """Iterate over all logical records defined in the file.
+    ) -> list[list[MultiFrameData]]:
+        """Create MultiFrameData objects for all frames of all logical files.
 
-        Yields: EFLR and IFLR objects defined for the file.
-
-        Note: Storage Unit Label should be added to the file separately before adding other records.
+        The created objects hold source data wrappers, which might keep resources (e.g. open HDF5 files);
+        they should be closed (see _close_multi_frame_data_objects) when no longer needed. If creating any of
+        the objects fails, the ones created so far are closed before the exception is propagated.
         """
 
         for idx_lf, f in enumerate(self.logical_files):
@@ -147,32 +323,145 @@ class DLISFile:
                 )
 
         multi_frame_data_objects: list[list[MultiFrameData]] = []
-        frame_items: list[Generator[eflr_types.FrameItem, None, None]] = []
 
-        for idx_lf, logical_file in enumerate(self.logical_files):
+        try:
+            for logical_file in self.logical_files:
+
+                lf_frame_items: Generator[eflr_types.FrameItem, None, None] = \
+                    logical_file._eflr_sets.get_all_items_for_set_type(eflr_types.FrameSet)
+
+                lf_multi_frame_data_objects: list[MultiFrameData] = []
+                multi_frame_data_objects.append(lf_multi_frame_data_objects)
 
+                for fr in lf_frame_items:
+                    if fr.is_overview:
+                        continue  # data computed together with those of the source frame
+                    lf_multi_frame_data_objects.append(
+                        logical_file._make_multi_frame_data(
+                            fr, chunk_size=chunk_size, data=data, **kwargs
+                        )
+                    )
+        except Exception:
+            self._close_multi_frame_data_objects(multi_frame_data_objects)
+            raise
+
+        return multi_frame_data_objects
+
+    def analyse_narrowing(
+        self,
+        input_chunk_size: Optional[int] = None,
+        data: Optional[data_form_type] = None,
+        from_idx: int = 0,
+        to_idx: Optional[int] = None,
+        hdf5_options: Optional[dict[str, Any]] = None,
+        index_range: Optional[tuple[number_type, number_type]] = None,
+    ) -> list[NarrowingProposal]:
+        """Find the smallest data types (representation codes) representing the data of the channels exactly.
+
+        The data of all frames are loaded in chunks, as they would be written (see 'write' for the arguments),
+        and analysed - e.g. float64 values which survive a round trip through float32, or integral values fitting
+        in the range of a small unsigned integer type. Only channels without 'cast_dtype' set are analysed.
+        Nothing is changed; see 'auto_narrow' of 'write' to apply the proposals.
+
+        Returns:
+            Proposals of the data types for the channels, including the number of bytes saved by each.
+        """
+
+        proposals: list[NarrowingProposal] = []
+
+        for logical_file in self.logical_files:
             lf_frame_items: Generator[eflr_types.FrameItem, None, None] = \
                 logical_file._eflr_sets.get_all_items_for_set_type(eflr_types.FrameSet)
 
-            frame_items.append(lf_frame_items)
+            for fr in lf_frame_items:
+                if fr.is_overview:
+                    continue
+                proposals.extend(logical_file._analyse_narrowing(
+                    fr, chunk_size=input_chunk_size, index_range=index_range, data=data, from_idx=from_idx,
+                    to_idx=to_idx, hdf5_options=hdf5_options
+                ).values())
 
-            multi_frame_data_objects.append(
-                [
-                    logical_file._make_multi_frame_data(
-                        fr, chunk_size=chunk_size, data=data, **kwargs
-                    )
-                    for fr in frame_items[idx_lf]
-                ]
-            )
+        return proposals
+
+    @classmethod
+    def _check_interleaving(cls, multi_frame_data_objects: list[list[MultiFrameData]],
+                            n_workers: Optional[int] = None) -> None:
+        """Check - before writing starts - that the frames of each logical file can be interleaved."""
+
+        if n_workers is not None and n_workers != 1:
+            raise ValueError("Frames cannot be interleaved when the frame data are encoded by multiple workers")
+
+        for lf_multi_frame_data_objects in multi_frame_data_objects:
+            cls._interleaving_order(lf_multi_frame_data_objects)
+
+    @staticmethod
+    def _finalise_multi_frame_data_objects(multi_frame_data_objects: list[list[MultiFrameData]]) -> None:
+        """Log the cast summaries and assign the collected channel statistics once the data have been written."""
+
+        for lf_multi_frame_data_objects in multi_frame_data_objects:
+            for mfd in lf_multi_frame_data_objects:
+                mfd.data.log_cast_summary()
+                mfd.assign_channel_statistics()
+
+    @staticmethod
+    def _close_multi_frame_data_objects(multi_frame_data_objects: list[list[MultiFrameData]]) -> None:
+        """Close the source data wrappers of all provided MultiFrameData objects."""
+
+        for lf_multi_frame_data_objects in multi_frame_data_objects:
+            for mfd in lf_multi_frame_data_objects:
+                mfd.close()
+
+    def _count_logical_records(
+        self,
+        multi_frame_data_objects: list[list[MultiFrameData]],
+        frame_data_in_chunks: bool = False,
+    ) -> Optional[int]:
+        """Count the logical records (or blocks of encoded records) to be yielded by the generator.
+
+        Args:
+            multi_frame_data_objects    :   MultiFrameData objects of each logical file.
+            frame_data_in_chunks        :   If True, FrameData are counted as chunks (blocks of encoded records)
+                                            rather than individual records.
+
+        Returns:
+            Number of records, or None if it cannot be determined beforehand (no-format data streamed
+            from an iterator).
+        """
 
         n = 0
-        for eflr_set_type in self._eflr_sets:
-            n += len(list(self._eflr_sets.get_all_items_for_set_type(eflr_set_type)))
+        for logical_file in self.logical_files:
+            for eflr_set_type in logical_file._eflr_sets:
+                n += logical_file._eflr_sets.count_items_for_set_type(eflr_set_type)
 
         for idx_lf, logical_file in enumerate(self.logical_files):
             for mfd in multi_frame_data_objects[idx_lf]:
-                n += len(mfd)
-            n += len(logical_file._no_format_frame_data)
+                n += mfd.n_chunks if frame_data_in_chunks else len(mfd)
+            for no_format_frame_data in logical_file._no_format_frame_data:
+                if isinstance(no_format_frame_data, NoFormatDataStream):
+                    n_records = no_format_frame_data.n_records
+                    if n_records is None:
+                        return None
+                    n += n_records
+                else:
+                    n += 1
+
+        return n
+
+    def generate_logical_records(
+        self,
+        chunk_size: Optional[int],
+        data: Optional[data_form_type] = None,
+        **kwargs: Any,
+    ) -> SizedGenerator:
+        """Iterate over all logical records defined in the file.
+
+        Yields: EFLR and IFLR objects defined for the file.
+
+        Note: Storage Unit Label should be added to the file separately before adding other records.
+        """
+
+        multi_frame_data_objects = self._make_multi_frame_data_objects(chunk_size=chunk_size, data=data, **kwargs)
+        n = self._count_logical_records(multi_frame_data_objects)
 
         return SizedGenerator(self.generator(multi_frame_data_objects), size=n)
 
@@ -184,6 +473,16 @@ class DLISFile:
         data: Optional[data_form_type] = None,
         from_idx: int = 0,
         to_idx: Optional[int] = None,
+        n_workers: Optional[int] = None,
+        hdf5_options: Optional[dict[str, Any]] = None,
+        encoding_cache: Optional[EncodingCache] = None,
+        cast_policy: Union[CastPolicy, str] = CastPolicy.WARN,
+        eflr_n_workers: Optional[int] = None,
+        collect_channel_statistics: bool = False,
+        fill_channel_limits: bool = False,
+        auto_narrow: bool = False,
+        index_range: Optional[tuple[number_type, number_type]] = None,
+        interleave_frames: bool = False,
     ) -> None:
         """Create a DLIS file form the current specifications.
 
@@ -195,6 +494,54 @@ class DLISFile:
             from_idx                :   Index from which the data should be loaded (or number of initial rows
                                         to ignore).
             to_idx                  :   Index up to which data should be loaded.
+            n_workers               :   Number of worker processes encoding the frame data. If None or 1, the data
+                                        are encoded in the main process. Otherwise, chunks of the data of all frames
+                                        (of all logical files) are encoded concurrently and the results are
+                                        put together in the order required by the standard. Each chunk consists
+                                        of complete frames (rows), so setting 'input_chunk_size' is advised.
+                                        The produced file is identical to the one created without workers.
+            hdf5_options            :   Keyword arguments passed to h5py.File when opening the source HDF5 file
+                                        (if 'data' is a path to one), e.g. 'rdcc_nbytes' (chunk cache size in bytes)
+                                        or 'driver' ('sec2', 'core', etc.). The file is closed when writing is done
+                                        (also if it fails).
+            encoding_cache          :   Cache for the encoded values of object attributes. If not provided, a new
+                                        EncodingCache with the default settings is used. Either way, the cache is
+                                        cleared when writing is done; its hit/miss statistics remain available.
+            cast_policy             :   What to do if channel data have values which cannot be represented
+                                        in the channels' cast_dtype (out of range, NaN cast to integers):
+                                        'raise' an error, 'clip' the values to the range of the target type, or
+                                        'warn' - cast the values as they are (letting them overflow) and log
+                                        a warning. Summaries of the cast are logged per channel when writing is done.
+            eflr_n_workers          :   Number of worker processes encoding the items of large EFLR sets (e.g. tens
+                                        of thousands of parameters or channels); see ParallelEFLREncoder.
+                                        If None or 1, all EFLRs are encoded in the main process.
+                                        The produced file is identical to the one created without workers.
+            collect_channel_statistics  :   If True, statistics (min, max, NaN count) of the data of each channel
+                                        are computed from the chunks of data being written (no additional pass
+                                        over the data). The statistics are available as 'statistics' of the
+                                        channels once writing is done.
+            fill_channel_limits     :   If True, 'minimum_value' and 'maximum_value' of the channels which do not
+                                        have them specified are set from the statistics of the channels' data.
+                                        As the channels are written before their data, this requires a pre-pass:
+                                        the data are loaded (and cast) in chunks and the statistics computed before
+                                        writing starts. The statistics of the channels are available afterwards
+                                        (as with 'collect_channel_statistics').
+            auto_narrow             :   If True, channels without 'cast_dtype' are written in the smallest data types
+                                        representing their data exactly (see 'analyse_narrowing'); the data types are
+                                        set as the channels' 'cast_dtype'. This requires a pre-pass over the data.
+                                        The narrowed channels and the bytes saved are logged.
+            index_range             :   Range (smallest and largest value, both inclusive) of the index values
+                                        of the rows to be written, e.g. a depth interval. For each frame, the rows
+                                        are found by a binary search on the data of the frame's index channel
+                                        (which must be monotonic), within the rows selected by 'from_idx'
+                                        and 'to_idx'. Only a few chunks of the index data are read to find them.
+                                        Frames without an index channel (index_type) cannot be written this way.
+            interleave_frames       :   If True, the frame data (FrameData records) of the frames of each logical
+                                        file are written in the order of their index values (e.g. time), rather than
+                                        frame after frame - so that the rows of a fast and a slow frame which are
+                                        close in time are also close in the file. The indices of all the frames
+                                        must have the same direction. Frames without an index channel are written
+                                        after the interleaved ones. Cannot be combined with 'n_workers'.
         """
 
         def timed_func() -> None:
@@ -206,23 +553,65 @@ class DLISFile:
             for lf in self.logical_files:
                 lf.check_objects()
 
-            logical_records = self.generate_logical_records(
+            multi_frame_data_objects = self._make_multi_frame_data_objects(
                 chunk_size=input_chunk_size,
                 data=data,
                 from_idx=from_idx,
                 to_idx=to_idx,
+                hdf5_options=hdf5_options,
+                cast_policy=cast_policy,
+                collect_statistics=collect_channel_statistics,
+                fill_channel_limits=fill_channel_limits,
+                auto_narrow=auto_narrow,
+                index_range=index_range,
             )
 
+            try:
+                if interleave_frames:
+                    self._check_interleaving(multi_frame_data_objects, n_workers=n_workers)
+                write_records(multi_frame_data_objects)
+                self._finalise_multi_frame_data_objects(multi_frame_data_objects)
+            finally:
+                self._close_multi_frame_data_objects(multi_frame_data_objects)
+
+        def write_records(multi_frame_data_objects: list[list[MultiFrameData]]) -> None:
+            """Write the storage unit label and all logical records to the file."""
+
             writer = DLISWriter(
                 dlis_file_name,
                 visible_record_length=self.storage_unit_label.max_record_length,
             )
             writer.write_storage_unit_label(self.storage_unit_label)
-            writer.write_logical_records(
-                logical_records, output_chunk_size=output_chunk_size
-            )
 
-        exec_time = timeit(timed_func, number=1)
+            if n_workers is None or n_workers == 1:
+                logical_records = SizedGenerator(
+                    self.generator(multi_frame_data_objects, interleave_frames=interleave_frames),
+                    size=self._count_logical_records(multi_frame_data_objects)
+                )
+                writer.write_logical_records(
+                    logical_records, output_chunk_size=output_chunk_size
+                )
+                return
+
+            with FrameDataScheduler(
+                [mfd for lf_mfds in multi_frame_data_objects for mfd in lf_mfds],
+                visible_record_length=self.storage_unit_label.max_record_length,
+                n_workers=n_workers,
+            ) as scheduler:
+                logical_records = SizedGenerator(
+                    self.generator(multi_frame_data_objects, frame_data_scheduler=scheduler),
+                    size=self._count_logical_records(multi_frame_data_objects, frame_data_in_chunks=True)
+                )
+                writer.write_logical_records(
+                    logical_records, output_chunk_size=output_chunk_size
+                )
+
+        eflr_encoding_scope: ContextManager = nullcontext()  # keep the encoder set up outside (if any)
+        if eflr_n_workers is not None and eflr_n_workers != 1:
+            eflr_encoding_scope = parallel_eflr_encoding_scope(ParallelEFLREncoder(eflr_n_workers))
+
+        with encoding_cache_scope(encoding_cache), eflr_encoding_scope:
+            exec_time = timeit(timed_func, number=1)
         logger.info(
             f"DLIS file created in {timedelta(seconds=exec_time)} ({exec_time} seconds)"
         )
@@ -287,8 +676,9 @@ class LogicalFile:
 
         self._data_dict: dict[str, np.ndarray] = {}
         self._max_dataset_copy = 1000
+        self._next_dataset_copy: dict[str, int] = {}  # first suffix worth trying for each (repeated) channel name
 
-        self._no_format_frame_data: list[NoFormatFrameData] = []
+        self._no_format_frame_data: list[Union[NoFormatFrameData, NoFormatDataStream]] = []
 
     @property
     def file_header(self) -> eflr_types.FileHeaderItem:
@@ -296,14 +686,21 @@ class LogicalFile:
 
         return self.file_header_item
 
+    def freeze(self) -> LogicalFileTemplate:
+        """Make a snapshot of the file header and all the objects of this logical file, to be used as a template.
+
+        New logical files (with copies of the objects) are created from the template using
+        DLISFile.add_logical_file_from_template. Changes made to this logical file after freezing do not affect
+        the template. See LogicalFileTemplate for details.
+        """
+
+        return LogicalFileTemplate(self)
+
     @property
     def defining_origin(self) -> Union[eflr_types.OriginItem, None]:
         """First Origin of this Logical File, describing the circumstances under which it was created."""
 
-        origins: list[eflr_types.OriginItem] = list(
-            self._eflr_sets.get_all_items_for_set_type(eflr_types.OriginSet)
-        )
-        return origins[0] if origins else None
+        return next(self._eflr_sets.get_all_items_for_set_type(eflr_types.OriginSet), None)
 
     @property
     def default_origin_reference(self) -> Union[int, None]:
@@ -362,10 +759,7 @@ class LogicalFile:
             origin_reference    :   origin_reference of the Origin this record belongs to.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.AxisSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.AxisSet, set_name=set_name)
 
         ax = eflr_types.AxisItem(
             name=name,
@@ -435,10 +829,7 @@ class LogicalFile:
             A configured calibration object.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.CalibrationSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.CalibrationSet, set_name=set_name)
 
         c = eflr_types.CalibrationItem(
             name=name,
@@ -458,10 +849,10 @@ class LogicalFile:
         self,
         name: str,
         label: OptAttrSetupType[str] = None,
-        coefficients: OptAttrSetupType[list[number_type]] = None,
-        references: OptAttrSetupType[list[number_type]] = None,
-        plus_tolerances: OptAttrSetupType[list[number_type]] = None,
-        minus_tolerances: OptAttrSetupType[list[number_type]] = None,
+        coefficients: OptAttrSetupType[Union[list[number_type], np.ndarray]] = None,
+        references: OptAttrSetupType[Union[list[number_type], np.ndarray]] = None,
+        plus_tolerances: OptAttrSetupType[Union[list[number_type], np.ndarray]] = None,
+        minus_tolerances: OptAttrSetupType[Union[list[number_type], np.ndarray]] = None,
         set_name: Optional[str] = None,
         origin_reference: Optional[int] = None,
     ) -> eflr_types.CalibrationCoefficientItem:
@@ -515,10 +906,7 @@ class LogicalFile:
             A configured calibration coefficient item.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.CalibrationCoefficientSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.CalibrationCoefficientSet, set_name=set_name)
 
         c = eflr_types.CalibrationCoefficientItem(
             name=name,
@@ -541,16 +929,16 @@ class LogicalFile:
         measurement_type: OptAttrSetupType[str] = None,
         dimension: OptAttrSetupType[list[int]] = None,
         axis: OptAttrSetupType[eflr_types.AxisItem] = None,
-        measurement: OptAttrSetupType[NestedList[number_type]] = None,
+        measurement: OptAttrSetupType[numeric_values_type] = None,
         sample_count: OptAttrSetupType[int] = None,
-        maximum_deviation: OptAttrSetupType[NestedList[number_type]] = None,
-        standard_deviation: OptAttrSetupType[NestedList[number_type]] = None,
+        maximum_deviation: OptAttrSetupType[numeric_values_type] = None,
+        standard_deviation: OptAttrSetupType[numeric_values_type] = None,
         begin_time: OptAttrSetupType[dtime_or_number_type] = None,
         duration: OptAttrSetupType[number_type] = None,
-        reference: OptAttrSetupType[NestedList[number_type]] = None,
-        standard: OptAttrSetupType[NestedList[number_type]] = None,
-        plus_tolerance: OptAttrSetupType[NestedList[number_type]] = None,
-        minus_tolerance: OptAttrSetupType[NestedList[number_type]] = None,
+        reference: OptAttrSetupType[numeric_values_type] = None,
+        standard: OptAttrSetupType[numeric_values_type] = None,
+        plus_tolerance: OptAttrSetupType[numeric_values_type] = None,
+        minus_tolerance: OptAttrSetupType[numeric_values_type] = None,
         set_name: Optional[str] = None,
         origin_reference: Optional[int] = None,
     ) -> eflr_types.CalibrationMeasurementItem:
@@ -647,10 +1035,7 @@ class LogicalFile:
             A configured CalibrationMeasurementItem instance.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.CalibrationMeasurementSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.CalibrationMeasurementSet, set_name=set_name)
 
         m = eflr_types.CalibrationMeasurementItem(
             name=name,
@@ -681,14 +1066,18 @@ class LogicalFile:
         data: Optional[np.ndarray] = None,
         dataset_name: Optional[str] = None,
         cast_dtype: Optional[numpy_dtype_type] = None,
+        absent_value: Optional[number_type] = None,
+        mask: Optional[np.ndarray] = None,
+        transform: Optional[ChannelTransform] = None,
+        virtual: Optional[VirtualChannel] = None,
         long_name: OptAttrSetupType[Union[eflr_types.LongNameItem, str]] = None,
         dimension: OptAttrSetupType[Union[int, list[int]]] = None,
         element_limit: OptAttrSetupType[Union[int, list[int]]] = None,
         properties: OptAttrSetupType[list[Union[str, enums.Property]]] = None,
         units: OptAttrSetupType[Union[str, enums.Unit]] = None,
         axis: OptAttrSetupType[eflr_types.AxisItem] = None,
-        minimum_value: OptAttrSetupType[float] = None,
-        maximum_value: OptAttrSetupType[float] = None,
+        minimum_value: OptAttrSetupType[Union[number_type, numeric_values_type]] = None,
+        maximum_value: OptAttrSetupType[Union[number_type, numeric_values_type]] = None,
         source: OptAttrSetupType[EFLRItem] = None,
         set_name: Optional[str] = None,
         origin_reference: Optional[int] = None,
@@ -704,6 +1093,27 @@ class LogicalFile:
             dataset_name        :   Name of the data array associated with the Channel in the data source provided
                                     at init of DLISFile.
             cast_dtype          :   Numpy data type the Channel data should be cast to - e.g. np.float64, np.int32.
+                                    np.float16 means FSHORT: a low precision float (2 bytes, 12-bit mantissa),
+                                    exact for float16 values with magnitudes from 0.5 to 32768; values out of
+                                    the FSHORT range are saturated.
+            absent_value        :   Value written in place of absent values of the Channel data: NaNs and masked values
+                                    (if 'data' is a numpy masked array or 'mask' is given). If not specified,
+                                    the absent value of the Frame (if any) is used, provided that it can be
+                                    represented in the Channel's data type. If neither is specified,
+                                    the data are written as they are.
+            mask                :   Boolean array of the shape of 'data', True where the values are absent
+                                    (as in numpy masked arrays). Ignored if 'data' is not given.
+            transform           :   Transform (scale/offset, unit conversion, clipping) applied to the Channel data,
+                                    chunk by chunk, when they are written. If the transform defines target units,
+                                    they are set as the units of the Channel. For a quantizing transform
+                                    (see ChannelTransform.quantization), the Channel data are written as integer
+                                    codes; unless 'source' is specified, a Calibration Coefficient
+                                    ('<name>-DEQUANTIZATION', coefficients: [gain, offset]) is added and set as
+                                    the Channel's source, so that the values can be restored as code * gain + offset.
+            virtual             :   Virtual channel computing the Channel data chunk by chunk when they are written,
+                                    instead of reading them from the data: an EvenlySpacedIndex (start + step * row)
+                                    or a DerivedChannel (a numpy expression or a function of other data sets).
+                                    Cannot be combined with 'data'.
             long_name           :   Description of the Channel.
             properties          :   '[A] List of Property Indicators (...). The Property Indicators summarize the
                                     characteristics of the Channel and the processing that has occurred to produce it.'
@@ -722,8 +1132,8 @@ class LogicalFile:
                                     as specified by the Dimension Attribute (...).'
             units               :   Unit of the Channel data.
             axis                :   Axis associated with the Channel.
-            minimum_value       :   Minimum value of the Channel data.
-            maximum_value       :   Maximum value of the Channel data.
+            minimum_value       :   Minimum value of the Channel data (a number, or a list or array of numbers).
+            maximum_value       :   Maximum value of the Channel data (a number, or a list or array of numbers).
             source              :   '[A] reference to another Object that describes the immediate source of the Channel,
                                     for example, a TOOL, PROCESS, SPLICE, or CALIBRATION Object.'
             set_name            :   Name of the ChannelSet this Channel should be added to.
@@ -733,24 +1143,19 @@ class LogicalFile:
             A configured ChannelItem instance, which is already added to the DLIS (but not to any frame).
         """
 
-        if data is not None and not isinstance(data, np.ndarray):
-            raise ValueError(f"Expected a numpy.ndarray, got a {type(data)}: {data}")
-
-        dataset_name = self._get_unique_dataset_name(
-            channel_name=name, dataset_name=dataset_name
-        )
-
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.ChannelSet, set_name=set_name
-        )
-
-        self._eflr_sets.try_add_set(parent)
-
-        ch = eflr_types.ChannelItem(
+        return self._make_channel(
             name,
-            long_name=long_name,
+            parents={},
+            set_name=set_name,
+            origin_reference=origin_reference or self.default_origin_reference,
+            data=data,
+            mask=mask,
             dataset_name=dataset_name,
+            long_name=long_name,
             cast_dtype=cast_dtype,
+            absent_value=absent_value,
+            transform=transform,
+            virtual=virtual,
             properties=properties,
             dimension=dimension,
             element_limit=element_limit,
@@ -759,35 +1164,239 @@ class LogicalFile:
             minimum_value=minimum_value,
             maximum_value=maximum_value,
             source=source,
-            parent=parent,
-            origin_reference=origin_reference or self.default_origin_reference,
+        )
+
+    def add_channels(
+        self,
+        records: records_type,
+        set_name: Optional[str] = None,
+        origin_reference: Optional[int] = None,
+    ) -> list[eflr_types.ChannelItem]:
+        """Define multiple channels at once (e.g. from a channel catalogue) and add them to the DLIS.
+
+        The column names are validated once and the common setup (parent set, origin reference) is determined
+        once for all the records, rather than for each channel separately as when calling 'add_channel' in a loop.
+
+        Args:
+            records             :   Definitions of the channels: a list of dicts, a numpy structured array,
+                                    or a pandas DataFrame. The keys/field names/columns are the names of the arguments
+                                    of 'add_channel'; 'name' is required. Missing values (None or NaN) are ignored.
+            set_name            :   Name of the ChannelSet the channels should be added to, unless specified
+                                    otherwise in a record.
+            origin_reference    :   origin_reference of the Origin the channels belong to, unless specified
+                                    otherwise in a record.
+
+        Returns:
+            A list of configured ChannelItem instances, in the order of the records. If any of the records
+            is invalid, an error is raised; the channels defined by the preceding records remain added.
+        """
+
+        default_origin_reference = origin_reference or self.default_origin_reference
+        parents: dict[Optional[str], eflr_types.ChannelSet] = {}
+        channels: list[eflr_types.ChannelItem] = []
+
+        with _gc_paused():
+            for record in iter_records(records, allowed_keys=_argument_names(LogicalFile.add_channel)):
+                name = record.pop('name', None)
+                if name is None:
+                    raise ValueError(f"Name not specified for the channel no. {len(channels)}")
+
+                channels.append(self._make_channel(
+                    name,
+                    parents=parents,
+                    set_name=record.pop('set_name', set_name),
+                    origin_reference=record.pop('origin_reference', None) or default_origin_reference,
+                    **record,
+                ))
+
+        return channels
+
+    def _make_channel(
+        self,
+        name: str,
+        parents: dict[Optional[str], eflr_types.ChannelSet],
+        set_name: Optional[str],
+        origin_reference: Optional[int],
+        data: Optional[np.ndarray] = None,
+        mask: Optional[np.ndarray] = None,
+        dataset_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> eflr_types.ChannelItem:
+        """Define a channel and add its data (if given); the common part of 'add_channel' and 'add_channels'.
+
+        Args:
+            name                :   Name of the channel.
+            parents             :   ChannelSets already found or made (by set name); the parent set of the channel
+                                    is added to it if not included yet.
+            set_name            :   Name of the ChannelSet the channel should be added to.
+            origin_reference    :   origin_reference of the Origin the channel belongs to.
+            data                :   Data associated with the channel.
+            mask                :   Mask of the data (see 'add_channel').
+            dataset_name        :   Name of the data array associated with the channel.
+            **kwargs            :   Other arguments of 'add_channel', passed to ChannelItem.
+
+        Returns:
+            The configured ChannelItem.
+        """
+
+        if data is not None and not isinstance(data, np.ndarray):
+            raise ValueError(f"Expected a numpy.ndarray, got a {type(data)}: {data}")
+        if data is not None and kwargs.get('virtual') is not None:
+            raise ValueError("Data cannot be specified for a virtual channel")
+
+        dataset_name = self._get_unique_dataset_name(channel_name=name, dataset_name=dataset_name)
+
+        parent = parents.get(set_name)
+        if parent is None:
+            parent = parents[set_name] = self._get_or_make_set(eflr_types.ChannelSet, set_name=set_name)
+
+        transform = kwargs.get('transform')
+        if isinstance(transform, ChannelTransform) and transform.dequantization is not None \
+                and kwargs.get('source') is None:
+            kwargs['source'] = self._add_dequantization_coefficient(name, transform, origin_reference=origin_reference)
+
+        ch = eflr_types.ChannelItem(
+            name, parent=parent, dataset_name=dataset_name, origin_reference=origin_reference, **kwargs
         )
 
         if data is not None:
-            self._data_dict[ch.dataset_name] = data
+            self._add_data(ch.dataset_name, data, mask=mask)
 
         return ch
 
+    def set_channel_data(
+        self,
+        channel: Union[eflr_types.ChannelItem, str],
+        data: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        cast_dtype: Optional[numpy_dtype_type] = None,
+    ) -> eflr_types.ChannelItem:
+        """Associate a new data array with a channel of the logical file, replacing the previous data (if any).
+
+        This is the way to provide the data of the channels of a logical file created from a LogicalFileTemplate
+        (see DLISFile.add_logical_file_from_template), which otherwise writes the data of the template.
+
+        If the shape of the samples (rows) of the new data differs from the channel's dimension, the dimension
+        and element limit of the channel are set from the new data.
+
+        Args:
+            channel     :   The channel (ChannelItem of this logical file) or its name.
+            data        :   Data of the channel.
+            mask        :   Boolean array of the shape of 'data', True where the values are absent (see add_channel).
+            cast_dtype  :   Numpy data type the data should be cast to (e.g. if the new data are of a different type
+                            than the previous ones). If not given, the cast dtype of the channel (if any) is kept.
+
+        Returns:
+            The channel.
+        """
+
+        if not isinstance(data, np.ndarray):
+            raise ValueError(f"Expected a numpy.ndarray, got a {type(data)}: {data}")
+
+        ch = self._get_channel(channel)
+        if ch.virtual is not None:
+            raise ValueError(f"Data cannot be specified for a virtual channel ({ch})")
+
+        dim = list(data.shape[1:]) or [1]
+        if ch.dimension.value is not None and list(ch.dimension.value) != dim:
+            logger.debug(f"Setting dimension and element limit of {ch} to {dim} (from the new data)")
+            ch.dimension.value = dim
+            ch.element_limit.value = dim
+
+        if cast_dtype is not None:
+            ch.cast_dtype = cast_dtype
+
+        self._add_data(ch.dataset_name, data, mask=mask)
+        return ch
+
+    def _get_channel(self, channel: Union[eflr_types.ChannelItem, str]) -> eflr_types.ChannelItem:
+        """Find the channel of this logical file, given as a ChannelItem or by name."""
+
+        for ch in self.channels:
+            if ch is channel or ch.name == channel:
+                return ch
+
+        raise ValueError(f"Channel {channel} not found in the logical file")
+
+    def _add_dequantization_coefficient(
+        self,
+        channel_name: str,
+        transform: ChannelTransform,
+        origin_reference: Optional[int] = None,
+    ) -> eflr_types.CalibrationCoefficientItem:
+        """Add a Calibration Coefficient recording the gain and offset restoring the values of a quantized channel."""
+
+        return self.add_calibration_coefficient(
+            f"{channel_name}-DEQUANTIZATION",
+            label="DEQUANTIZATION",
+            coefficients=list(transform.dequantization),  # type: ignore  # checked by the caller
+            origin_reference=origin_reference,
+        )
+
+    def _add_data(self, dataset_name: str, data: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        """Associate the data array with the dataset name; keep it on disk if the DLIS file has a SpillStore.
+
+        If a mask is given (or the data are a masked array), the data are kept as a numpy masked array
+        (the data and the mask are not copied).
+        """
+
+        if mask is not None:
+            if np.shape(mask) != data.shape:
+                raise ValueError(f"Shape of the mask {np.shape(mask)} does not match that of the data {data.shape}")
+            data = np.ma.MaskedArray(data, mask=mask, copy=False)
+
+        spill_store = self.physical_file.spill_store
+        if spill_store is not None:
+            if isinstance(data, np.ma.MaskedArray):
+                data = np.ma.MaskedArray(spill_store.store(data.data), mask=spill_store.store(np.ma.getmaskarray(data)))
+            else:
+                data = spill_store.store(data)
+
+        self._data_dict[dataset_name] = data
+
+    def _get_or_make_set(self, eflr_set_type: type[AnyEFLRSet], set_name: Optional[str] = None) -> AnyEFLRSet:
+        """Retrieve (or create) an EFLRSet of the physical file and make sure it is registered in this logical file.
+
+        If the logical file already has a set of the given type and name (e.g. one cloned from a LogicalFileTemplate),
+        that set is returned.
+        """
+
+        eflr_set: Optional[AnyEFLRSet] = self._eflr_sets[eflr_set_type].get(set_name)
+        if eflr_set is not None:
+            return eflr_set
+
+        eflr_set = self.physical_file._eflr_sets.get_or_make_set(eflr_set_type, set_name=set_name)
+        self._eflr_sets.try_add_set(eflr_set)
+        return eflr_set
+
+    def _has_dataset_name(self, dataset_name: str) -> bool:
+        """Check whether any of the channels of this logical file uses the given dataset name."""
+
+        channel_sets: dict[Optional[str], eflr_types.ChannelSet] = self._eflr_sets[eflr_types.ChannelSet]
+        return any(channel_set.has_dataset_name(dataset_name) for channel_set in channel_sets.values())
+
     def _get_unique_dataset_name(
         self, channel_name: str, dataset_name: Optional[str] = None
     ) -> str:
-        """Determine a unique name for channel's data in the internal data dict."""
+        """Determine a unique name for channel's data in the internal data dict.
 
-        current_dataset_names = [ch.dataset_name for ch in self.channels]
+        The dataset names in use are looked up in the indexes kept by the ChannelSets. For a repeated channel name,
+        the search for a free suffix starts after the last suffix assigned for that name (suffixes are never freed).
+        """
 
         if dataset_name is not None:
-            if dataset_name in current_dataset_names:
+            if self._has_dataset_name(dataset_name):
                 raise ValueError(
                     f"A data set with name '{dataset_name}' already exists"
                 )
             return dataset_name
 
-        if channel_name not in current_dataset_names:
+        if not self._has_dataset_name(channel_name):
             return channel_name
 
-        for i in range(1, self._max_dataset_copy):
+        for i in range(self._next_dataset_copy.get(channel_name, 1), self._max_dataset_copy):
             n = f"{channel_name}__{i}"
-            if n not in current_dataset_names:
+            if not self._has_dataset_name(n):
                 break
         else:
             # loop not broken - all options exhausted
@@ -795,6 +1404,7 @@ class LogicalFile:
                 f"Cannot find a unique dataset name for channel '{channel_name}'"
             )
 
+        self._next_dataset_copy[channel_name] = i + 1
         return n
 
     def add_comment(
@@ -816,10 +1426,7 @@ class LogicalFile:
             A configured comment item.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.CommentSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.CommentSet, set_name=set_name)
 
         c = eflr_types.CommentItem(
             name=name,
@@ -838,7 +1445,7 @@ class LogicalFile:
         dimension: OptAttrSetupType[list[int]] = None,
         axis: OptAttrSetupType[ListOrTuple[eflr_types.AxisItem]] = None,
         zones: OptAttrSetupType[ListOrTuple[eflr_types.ZoneItem]] = None,
-        values: OptAttrSetupType[NestedList[number_type]] = None,
+        values: OptAttrSetupType[numeric_values_type] = None,
         source: OptAttrSetupType[EFLRItem] = None,
         set_name: Optional[str] = None,
         origin_reference: Optional[int] = None,
@@ -882,10 +1489,7 @@ class LogicalFile:
             A configured computation item.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.ComputationSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.ComputationSet, set_name=set_name)
 
         c = eflr_types.ComputationItem(
             name=name,
@@ -989,10 +1593,7 @@ class LogicalFile:
             A configured EquipmentItem instance.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.EquipmentSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.EquipmentSet, set_name=set_name)
 
         eq = eflr_types.EquipmentItem(
             name=name,
@@ -1030,6 +1631,7 @@ class LogicalFile:
         encrypted: OptAttrSetupType[int] = None,
         index_min: OptAttrSetupType[number_type] = None,
         index_max: OptAttrSetupType[number_type] = None,
+        absent_value: Optional[number_type] = None,
         set_name: Optional[str] = None,
         origin_reference: Optional[int] = None,
     ) -> eflr_types.FrameItem:
@@ -1086,6 +1688,10 @@ class LogicalFile:
                                     'If there is no Index Channel, then this is the number of Frames in the Frame Type'
                                     (i.e. 'the number of rows' in the data table in which Channels are
                                     the (sets of) columns).
+            absent_value        :   Value written in place of absent values (NaNs, masked values) of the data
+                                    of the Frame's Channels, unless specified otherwise for a Channel. It is not
+                                    used for Channels whose data types cannot represent it (e.g. -999.25 for
+                                    integer Channels).
             set_name            :   Name of the FrameSet this frame should be added to.
             origin_reference    :   origin_reference of the Origin this record belongs to.
 
@@ -1111,10 +1717,7 @@ class LogicalFile:
                 f"got types: {', '.join(str(type(c)) for c in channels)}"
             )
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.FrameSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.FrameSet, set_name=set_name)
 
         fr = eflr_types.FrameItem(
             name,
@@ -1126,12 +1729,153 @@ class LogicalFile:
             encrypted=encrypted,
             index_min=index_min,
             index_max=index_max,
+            absent_value=absent_value,
             parent=parent,
             origin_reference=origin_reference or self.default_origin_reference,
         )
 
         return fr
 
+    def add_multi_rate_frames(
+        self,
+        name: str,
+        data: Union[dict[str, np.ndarray], np.ndarray],
+        index_name: str,
+        index_type: OptAttrSetupType[Union[str, enums.FrameIndexType]] = 'NON-STANDARD',
+        chunk_size: Optional[int] = None,
+        absent_value: Optional[number_type] = None,
+        set_name: Optional[str] = None,
+        origin_reference: Optional[int] = None,
+    ) -> list[eflr_types.FrameItem]:
+        """Define frames for data sets sampled at different rates, aligned on a common index grid.
+
+        Data sampled at different rates (e.g. 1, 10, and 100 Hz) are often aligned on the grid of the fastest one
+        and padded with absent values (NaNs, masked values). Written as a single frame, most of such data would be
+        padding. Instead, the effective sampling of each data set is detected (chunk by chunk; see SamplingDetection)
+        and the data sets of the same sampling are grouped in a frame of their own, with a decimated copy
+        of the index channel. The channels' data are strided views of the source arrays - nothing is copied.
+
+        The frames are named '<name>-<stride>' (e.g. 'MAIN-1', 'MAIN-10', 'MAIN-100'; with '-<phase>' appended
+        if the first valid value of the group is not in a row divisible by the stride) and their index channels
+        '<index_name>-<stride>' (-<phase>). The other channels are named after the data sets. Data sets with fewer
+        than 2 valid values are added to the frame of the full-rate data.
+
+        Args:
+            name                :   Base name of the frames.
+            data                :   Data sets of the same number of rows - a dict of numpy arrays or a numpy
+                                    structured array.
+            index_name          :   Name of the index data set (e.g. time); it must have a valid value in every row.
+            index_type          :   Index type of the frames ('NON-STANDARD', as RP66 defines no index type for time).
+            chunk_size          :   Number of rows in which the data sets are processed when detecting their sampling.
+            absent_value        :   Absent value of the frames (written in place of NaNs and masked values which
+                                    remain in the decimated data).
+            set_name            :   Name of the FrameSet the frames should be added to.
+            origin_reference    :   origin_reference of the Origin the frames and channels belong to.
+
+        Returns:
+            The added frames, from the fastest sampling (smallest stride) to the slowest.
+        """
+
+        if isinstance(data, np.ndarray) and data.dtype.names:
+            data = {field: data[field] for field in data.dtype.names}
+        if not isinstance(data, dict):
+            raise TypeError(f"Expected a dictionary of numpy arrays or a structured numpy array; got {type(data)}")
+        if index_name not in data:
+            raise ValueError(f"No index data set '{index_name}' found in the data")
+
+        detections = detect_sampling(data, chunk_rows=chunk_size)
+        index_data = data[index_name]
+        if detections[index_name].n_valid != index_data.shape[0]:
+            raise ValueError(f"Index data set '{index_name}' must have a valid value in every row")
+
+        groups: dict[tuple[int, int], list[str]] = {}
+        for dataset_name in data:
+            if dataset_name != index_name:
+                groups.setdefault(detections[dataset_name].sampling or (0, 1), []).append(dataset_name)
+
+        frames: list[eflr_types.FrameItem] = []
+        for (phase, stride), dataset_names in sorted(groups.items(), key=lambda item: item[0][::-1]):
+            suffix = f"{stride}-{phase}" if phase else f"{stride}"
+            rows = slice(phase, None, stride)
+            channels = [self.add_channel(f"{index_name}-{suffix}", data=index_data[rows],
+                                         origin_reference=origin_reference)]
+            channels.extend(self.add_channel(dataset_name, data=data[dataset_name][rows],
+                                             origin_reference=origin_reference) for dataset_name in dataset_names)
+            frames.append(self.add_frame(f"{name}-{suffix}", channels=channels, index_type=index_type,
+                                         absent_value=absent_value, set_name=set_name,
+                                         origin_reference=origin_reference))
+            logger.info(f"Frame '{name}-{suffix}': {len(dataset_names)} channel(s) sampled every {stride} row(s) "
+                        f"from row {phase}")
+
+        return frames
+
+    def add_overview_frame(
+        self,
+        frame: eflr_types.FrameItem,
+        factor: int,
+        method: Union[DecimationMethod, str] = DecimationMethod.PICK,
+        name: Optional[str] = None,
+        description: OptAttrSetupType[str] = None,
+        set_name: Optional[str] = None,
+        origin_reference: Optional[int] = None,
+    ) -> eflr_types.FrameItem:
+        """Define an overview frame: a decimated copy of the data of a frame, e.g. for a quick look at long logs.
+
+        Each row of the overview frame is computed from a window of 'factor' consecutive rows of the frame's data.
+        The rows are computed from the chunks of data loaded for writing the frame (in the same pass over the data)
+        and written as frame data of their own, following the chunks they were computed from (according to RP66,
+        the IFLRs of a frame type need not be contiguous). The last window might be partial.
+
+        Decimation methods (see DecimationMethod):
+            'pick'      :   values of the first row of each window.
+            'mean'      :   means of the values of each window - including the index channel.
+            'min-max'   :   minimum and maximum of the values of each window, written as two channels
+                            ('<channel name>-MIN<factor>', '<channel name>-MAX<factor>'); the index value
+                            is that of the first row of the window.
+        Absent values (NaNs, the absent values of the channels) are excluded from the means, minima, and maxima.
+
+        The channels of the overview frame are named '<channel name>-OVERVIEW<factor>' (except for the 'min-max'
+        ones; see above) and take the units and the source of the frame's channels; their dimensions and data types
+        are taken from the frame's channels when the file is written.
+
+        Args:
+            frame               :   Frame whose data should be decimated.
+            factor              :   Number of rows of the frame's data per row of the overview frame (at least 2).
+            method              :   Method of reducing the values of a window to a single row.
+            name                :   Name of the overview frame; defaults to '<frame name>-OVERVIEW<factor>'.
+            description         :   Description of the overview frame.
+            set_name            :   Name of the FrameSet the overview frame should be added to.
+            origin_reference    :   origin_reference of the Origin the overview frame and its channels belong to.
+
+        Returns:
+            The added overview frame.
+        """
+
+        if not isinstance(frame, eflr_types.FrameItem):
+            raise TypeError(f"Expected a FrameItem; got {type(frame)}: {frame}")
+        if isinstance(factor, bool) or not isinstance(factor, int) or factor < 2:
+            raise ValueError(f"Decimation factor must be an integer larger than 1; got {factor}")
+        method = DecimationMethod(method)
+
+        source_channels: list[eflr_types.ChannelItem] = frame.channels.value or []
+        has_index = frame.index_type.value is not None
+        names = [f"{ch.name}-OVERVIEW{factor}" for ch in source_channels]
+        if method is DecimationMethod.MIN_MAX:
+            names = names[:int(has_index)] + [f"{ch.name}-{suffix}{factor}" for ch in source_channels[int(has_index):]
+                                              for suffix in ('MIN', 'MAX')]
+
+        channels = [
+            self.add_channel(channel_name, units=ch.units.value, source=ch.source.value,
+                             origin_reference=origin_reference)
+            for channel_name, ch in zip(names, expand_for_method(source_channels, method, has_index))
+        ]
+        overview = self.add_frame(name or f"{frame.name}-OVERVIEW{factor}", channels=channels,
+                                  description=description, index_type=frame.index_type.value, set_name=set_name,
+                                  origin_reference=origin_reference)
+        frame.add_overview(overview, factor, method)
+
+        return overview
+
     def add_group(
         self,
         name: str,
@@ -1160,19 +1904,14 @@ class LogicalFile:
             A configured group item.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.GroupSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.GroupSet, set_name=set_name)
 
         g = eflr_types.GroupItem(
             name=name,
             description=description,
             object_list=object_list,
             group_list=group_list,
-            parent=self.physical_file._eflr_sets.get_or_make_set(
-                eflr_types.GroupSet, set_name=set_name
-            ),
+            parent=parent,
             origin_reference=origin_reference or self.default_origin_reference,
         )
 
@@ -1250,10 +1989,7 @@ class LogicalFile:
             A configured Long Name item.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.LongNameSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.LongNameSet, set_name=set_name)
 
         ln = eflr_types.LongNameItem(
             name=name,
@@ -1309,10 +2045,7 @@ class LogicalFile:
             A configured message.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.MessageSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.MessageSet, set_name=set_name)
 
         m = eflr_types.MessageItem(
             name=name,
@@ -1363,10 +2096,7 @@ class LogicalFile:
             A configured no-format item.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.NoFormatSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.NoFormatSet, set_name=set_name)
 
         nf = eflr_types.NoFormatItem(
             name=name,
@@ -1379,22 +2109,37 @@ class LogicalFile:
         return nf
 
     def add_no_format_frame_data(
-        self, no_format_object: eflr_types.NoFormatItem, data: str
-    ) -> NoFormatFrameData:
+        self,
+        no_format_object: eflr_types.NoFormatItem,
+        data: Union[str, bytes_type, os.PathLike[str], Iterable[Union[str, bytes_type]]],
+        chunk_size: int = 2**16,
+    ) -> Union[NoFormatFrameData, NoFormatDataStream]:
         """Create a no-format frame data object.
 
         A no-format frame data object forms a data item, multiple of which can be collected under a NoFormatItem
         descriptor (see add_no_format method).
 
+        Large data (e.g. contents of other files) can be provided as a path to a file or as an iterable yielding
+        consecutive pieces of the data. In such a case, the data are not loaded into memory, but streamed into
+        the DLIS file in pieces of 'chunk_size' bytes, each piece forming a separate no-format frame data record.
+
         Args:
             no_format_object    :   No-format item this data belongs to.
-            data                :   Data associated with the object. Will be encoded as ASCII.
+            data                :   Data associated with the object: str (encoded as ASCII), bytes,
+                                    a path-like object pointing to a file (note: a str is always interpreted
+                                    as the data itself, not as a file path), or an iterable of str/bytes.
+            chunk_size          :   Size (in bytes) of the pieces the data are written in, if streamed from a file
+                                    or an iterable.
 
         Returns:
-            A configured NoFormatFrameData instance.
+            A configured NoFormatFrameData instance (for str or bytes data) or a NoFormatDataStream.
         """
 
-        d = NoFormatFrameData(no_format_object, data)
+        d: Union[NoFormatFrameData, NoFormatDataStream]
+        if isinstance(data, (str, bytes, bytearray)):
+            d = NoFormatFrameData(no_format_object, data)
+        else:
+            d = NoFormatDataStream(no_format_object, data, chunk_size=chunk_size)
 
         self._no_format_frame_data.append(d)
         return d
@@ -1522,12 +2267,9 @@ class LogicalFile:
             A configured OriginItem instance.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.OriginSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.OriginSet, set_name=set_name)
 
-        origins: list[eflr_types.OriginItem] = list(self._eflr_sets.get_all_items_for_set_type(eflr_types.OriginSet))
+        origins: list[eflr_types.OriginItem] = self.origins
         new_origin_ref = self.next_available_origin_ref(origin_reference, origins)
         """ origins_refs = [o.origin_reference for o in origins]
         next_available_origin_ref: int = 0
@@ -1570,21 +2312,18 @@ class LogicalFile:
             parent=parent,
         )
 
-        if (
-            len(list(self._eflr_sets.get_all_items_for_set_type(eflr_types.OriginSet)))
-            == 1
-        ):
+        if self._eflr_sets.count_items_for_set_type(eflr_types.OriginSet) == 1:
             logger.info(
                 f"Assigning origin reference {o.origin_reference} to all EFLR items without origin reference defined"
             )
             for eflr_set_dict in self._eflr_sets.values():
                 for eflr_set in eflr_set_dict.values():
-                    for eflr_item in eflr_set.get_all_eflr_items():
+                    for eflr_item in eflr_set.iter_eflr_items():
                         if eflr_item.origin_reference is None:
                             eflr_item.origin_reference = o.origin_reference
             for eflr_set_dict in self.physical_file._eflr_sets.values():
                 for eflr_set in eflr_set_dict.values():
-                    for eflr_item in eflr_set.get_all_eflr_items():
+                    for eflr_item in eflr_set.iter_eflr_items():
                         if eflr_item.origin_reference is None:
                             eflr_item.origin_reference = o.origin_reference
 
@@ -1600,7 +2339,7 @@ class LogicalFile:
         dimension: OptAttrSetupType[list[int]] = None,
         axis: OptAttrSetupType[eflr_types.AxisItem] = None,
         zones: OptAttrSetupType[ListOrTuple[eflr_types.ZoneItem]] = None,
-        values: OptAttrSetupType[NestedList[Union[str, int, float]]] = None,
+        values: OptAttrSetupType[Union[NestedList[Union[str, int, float]], np.ndarray]] = None,
         set_name: Optional[str] = None,
         origin_reference: Optional[int] = None,
     ) -> eflr_types.ParameterItem:
@@ -1634,10 +2373,7 @@ class LogicalFile:
             A configured ParameterItem instance.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.ParameterSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.ParameterSet, set_name=set_name)
 
         p = eflr_types.ParameterItem(
             name=name,
@@ -1652,6 +2388,52 @@ class LogicalFile:
 
         return p
 
+    def add_parameters(
+        self,
+        records: records_type,
+        set_name: Optional[str] = None,
+        origin_reference: Optional[int] = None,
+    ) -> list[eflr_types.ParameterItem]:
+        """Define multiple parameters at once (e.g. from a table of parameters).
+
+        The column names are validated once and the common setup (parent set, origin reference) is determined
+        once for all the records.
+
+        Args:
+            records             :   Definitions of the parameters: a list of dicts, a numpy structured array,
+                                    or a pandas DataFrame. The keys/field names/columns are the names of the arguments
+                                    of 'add_parameter'; 'name' is required. Missing values (None or NaN) are ignored.
+            set_name            :   Name of the ParameterSet the parameters should be added to, unless specified
+                                    otherwise in a record.
+            origin_reference    :   origin_reference of the Origin the parameters belong to, unless specified
+                                    otherwise in a record.
+
+        Returns:
+            A list of configured ParameterItem instances, in the order of the records. If any of the records
+            is invalid, an error is raised; the parameters defined by the preceding records remain added.
+        """
+
+        default_origin_reference = origin_reference or self.default_origin_reference
+        parents: dict[Optional[str], eflr_types.ParameterSet] = {}
+        parameters: list[eflr_types.ParameterItem] = []
+
+        with _gc_paused():
+            for record in iter_records(records, allowed_keys=_argument_names(LogicalFile.add_parameter)):
+                name = record.pop('name', None)
+                if name is None:
+                    raise ValueError(f"Name not specified for the parameter no. {len(parameters)}")
+
+                record_set_name = record.pop('set_name', set_name)
+                parent = parents.get(record_set_name)
+                if parent is None:
+                    parent = parents[record_set_name] = self._get_or_make_set(eflr_types.ParameterSet, record_set_name)
+
+                record['origin_reference'] = record.get('origin_reference') or default_origin_reference
+
+                parameters.append(eflr_types.ParameterItem(name, parent=parent, **record))
+
+        return parameters
+
     def add_path(
         self,
         name: str,
@@ -1751,10 +2533,7 @@ class LogicalFile:
             A configured Path instance.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.PathSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.PathSet, set_name=set_name)
 
         p = eflr_types.PathItem(
             name=name,
@@ -1827,10 +2606,7 @@ class LogicalFile:
             A configured ProcessItem instance.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.ProcessSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.ProcessSet, set_name=set_name)
 
         p = eflr_types.ProcessItem(
             name=name,
@@ -1887,10 +2663,7 @@ class LogicalFile:
             A configured splice.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.SpliceSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.SpliceSet, set_name=set_name)
 
         sp = eflr_types.SpliceItem(
             name=name,
@@ -1944,10 +2717,7 @@ class LogicalFile:
             A configured tool.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.ToolSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.ToolSet, set_name=set_name)
 
         t = eflr_types.ToolItem(
             name=name,
@@ -2030,10 +2800,7 @@ class LogicalFile:
             A configured WellReferencePointItem instance.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.WellReferencePointSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.WellReferencePointSet, set_name=set_name)
 
         w = eflr_types.WellReferencePointItem(
             name=name,
@@ -2096,10 +2863,7 @@ class LogicalFile:
             A configured zone, added to the DLIS.
         """
 
-        parent = self.physical_file._eflr_sets.get_or_make_set(
-            eflr_types.ZoneSet, set_name=set_name
-        )
-        self._eflr_sets.try_add_set(parent)
+        parent = self._get_or_make_set(eflr_types.ZoneSet, set_name=set_name)
 
         z = eflr_types.ZoneItem(
             name=name,
@@ -2107,9 +2871,7 @@ class LogicalFile:
             domain=domain,
             maximum=maximum,
             minimum=minimum,
-            parent=self.physical_file._eflr_sets.get_or_make_set(
-                eflr_types.ZoneSet, set_name=set_name
-            ),
+            parent=parent,
             origin_reference=origin_reference or self.default_origin_reference,
         )
 
@@ -2121,6 +2883,32 @@ class LogicalFile:
         self._check_completeness()
         self._check_channels_assigned_to_frames()
         self._check_defining_origin_params()
+        self._check_dequantization_coefficients()
+
+    def _check_dequantization_coefficients(self) -> None:
+        """Make sure that the gain and offset of each quantized channel are recorded in the file.
+
+        The Calibration Coefficient restoring the values of a quantized channel is added when the channel
+        is defined with a quantizing transform (see add_channel); this covers the channels whose transform
+        was set or replaced afterwards. A coefficient added this way is updated if the transform was replaced
+        by one with a different range. Channels with a different source (e.g. a user-defined one) are not affected.
+        """
+
+        for ch in self.channels:
+            transform = ch.transform
+            if transform is None or transform.dequantization is None:
+                continue
+
+            source = ch.source.value
+            if source is None:
+                logger.debug(f"Adding a dequantization coefficient for {ch}")
+                ch.source.value = self._add_dequantization_coefficient(
+                    ch.name, transform, origin_reference=ch.origin_reference
+                )
+            elif isinstance(source, eflr_types.CalibrationCoefficientItem) and source.label.value == "DEQUANTIZATION" \
+                    and source.coefficients.value != list(transform.dequantization):
+                logger.debug(f"Updating the dequantization coefficients of {ch}")
+                source.coefficients.value = list(transform.dequantization)
 
     def _check_defining_origin_params(self) -> None:
         """Check that the file_id of the defining origin is the same as the ID of the header."""
@@ -2153,10 +2941,10 @@ class LogicalFile:
         if not self.defining_origin:
             raise RuntimeError("No origin defined for the file")
 
-        if not self.channels:
+        if not self._eflr_sets.count_items_for_set_type(eflr_types.ChannelSet):
             raise RuntimeError("No channels defined for the file")
 
-        if not self.frames:
+        if not self._eflr_sets.count_items_for_set_type(eflr_types.FrameSet):
             raise RuntimeError("No frames defined for the file")
 
     def _check_channels_assigned_to_frames(self) -> None:
@@ -2187,48 +2975,159 @@ class LogicalFile:
                     f"can only be added to a single frame"
                 )
 
-    def _make_multi_frame_data(
+    def _make_data_object(
         self,
         fr: eflr_types.FrameItem,
         data: Optional[data_form_type] = None,
         from_idx: int = 0,
         to_idx: Optional[int] = None,
-        **kwargs: Any,
-    ) -> MultiFrameData:
-        """Create a MultiFrameData object, containing the frame and associated data, generating FrameData instances."""
-
-        data_object: SourceDataWrapper
+        hdf5_options: Optional[dict[str, Any]] = None,
+        cast_policy: Union[CastPolicy, str] = CastPolicy.WARN,
+    ) -> SourceDataWrapper:
+        """Create a source data wrapper for the frame's channels (see _make_multi_frame_data for the arguments)."""
 
         if data is None:
             data = {}
 
         if isinstance(data, dict):
             self._data_dict = self._data_dict | data
-            data_object = DictDataWrapper(
+            return DictDataWrapper(
                 self._data_dict,
                 mapping=fr.channel_name_mapping,
                 known_dtypes=fr.known_channel_dtypes_mapping,
+                absent_values=fr.absent_values_mapping,
+                default_absent_value=fr.absent_value,
+                transforms=fr.transforms_mapping,
+                virtual_channels=fr.virtual_channels_mapping,
                 from_idx=from_idx,
                 to_idx=to_idx,
+                cast_policy=cast_policy,
             )
-        else:
-            if self._data_dict:
-                raise TypeError(
-                    f"Expected a dictionary of np.ndarrays; got {type(data)}: {data} "
-                    f"(Note: a dictionary is the only allowed type because some channels have been added"
-                    f"with associated data arrays"
-                )
-            data_object = SourceDataWrapper.make_wrapper(
-                data,
-                mapping=fr.channel_name_mapping,
-                known_dtypes=fr.known_channel_dtypes_mapping,
-                from_idx=from_idx,
-                to_idx=to_idx,
+
+        if self._data_dict:
+            raise TypeError(
+                f"Expected a dictionary of np.ndarrays; got {type(data)}: {data} "
+                f"(Note: a dictionary is the only allowed type because some channels have been added"
+                f"with associated data arrays"
             )
+        return SourceDataWrapper.make_wrapper(
+            data,
+            mapping=fr.channel_name_mapping,
+            known_dtypes=fr.known_channel_dtypes_mapping,
+            absent_values=fr.absent_values_mapping,
+            default_absent_value=fr.absent_value,
+            transforms=fr.transforms_mapping,
+            virtual_channels=fr.virtual_channels_mapping,
+            from_idx=from_idx,
+            to_idx=to_idx,
+            hdf5_options=hdf5_options,
+            cast_policy=cast_policy,
+        )
+
+    def _find_index_rows(self, fr: eflr_types.FrameItem, index_range: tuple[number_type, number_type],
+                         **kwargs: Any) -> tuple[int, int]:
+        """Find the rows of the frame's data with values of the index channel in the given range.
+
+        Args:
+            fr          :   Frame whose rows should be found.
+            index_range :   Smallest and largest index value (both inclusive) of the rows.
+            **kwargs    :   Arguments specifying the data, passed to _make_data_object.
+
+        Returns:
+            The first selected row and the row after the last one (to be used as 'from_idx' and 'to_idx').
+        """
+
+        if fr.index_type.value is None or not fr.channels.value:
+            raise ValueError(f"{fr} has no index channel (index_type is not defined); its rows cannot be selected "
+                             f"by an index range")
+
+        with self._make_data_object(fr, **kwargs) as data_object:
+            return data_object.find_index_rows(fr.channels.value[0].name, index_range)
+
+    def _analyse_narrowing(self, fr: eflr_types.FrameItem, chunk_size: Optional[int] = None,
+                           index_range: Optional[tuple[number_type, number_type]] = None,
+                           **kwargs: Any) -> dict[str, NarrowingProposal]:
+        """Propose the smallest lossless data types for the frame's channels which do not have cast_dtype set.
+
+        Args:
+            fr          :   Frame whose channels should be analysed.
+            chunk_size  :   Size (in number of rows) of chunks in which the data should be loaded.
+            index_range :   Range of the index values of the rows to be analysed (see _find_index_rows).
+            **kwargs    :   Arguments specifying the data, passed to _make_data_object.
+        """
+
+        if index_range is not None:
+            kwargs['from_idx'], kwargs['to_idx'] = self._find_index_rows(fr, index_range, **kwargs)
+
+        with self._make_data_object(fr, **kwargs) as data_object:
+            proposals = data_object.analyse_narrowing(chunk_rows=chunk_size)
+
+        return {ch.name: proposals[ch.name] for ch in fr.channels.value if ch.cast_dtype is None}
+
+    def _make_multi_frame_data(
+        self,
+        fr: eflr_types.FrameItem,
+        data: Optional[data_form_type] = None,
+        from_idx: int = 0,
+        to_idx: Optional[int] = None,
+        hdf5_options: Optional[dict[str, Any]] = None,
+        cast_policy: Union[CastPolicy, str] = CastPolicy.WARN,
+        chunk_size: Optional[int] = None,
+        collect_statistics: bool = False,
+        fill_channel_limits: bool = False,
+        auto_narrow: bool = False,
+        index_range: Optional[tuple[number_type, number_type]] = None,
+    ) -> MultiFrameData:
+        """Create a MultiFrameData object, containing the frame and associated data, generating FrameData instances.
+
+        Args:
+            fr                  :   Frame the data belong to.
+            data                :   Data for the frame's channels (if not specified when the channels were added).
+            from_idx            :   Index from which the data should be loaded.
+            to_idx              :   Index up to which data should be loaded.
+            hdf5_options        :   Keyword arguments for opening the source HDF5 file, if 'data' is a path to one.
+            cast_policy         :   Policy for values which cannot be represented in the channels' cast_dtype.
+            chunk_size          :   Size (in number of rows) of chunks in which the data should be loaded.
+            collect_statistics  :   If True, statistics of the channels' data are collected when the data are loaded.
+            fill_channel_limits :   If True, the data are loaded in a pre-pass to compute the statistics, which are
+                                    used to set the channels' minimum and maximum values (if not set already).
+            auto_narrow         :   If True, the data are loaded in a pre-pass to find the smallest data types
+                                    representing the data of the channels (without cast_dtype set) exactly;
+                                    these are set as the channels' cast_dtype.
+            index_range         :   Range of the index values of the rows to be written; the rows are found
+                                    (within from_idx:to_idx) by a binary search on the index channel data.
+        """
+
+        data_kwargs: dict[str, Any] = dict(
+            data=data, from_idx=from_idx, to_idx=to_idx, hdf5_options=hdf5_options, cast_policy=cast_policy
+        )
 
-        self._check_data(data_object)
-        fr.setup_from_data(data_object)
-        return MultiFrameData(fr, data_object, **kwargs)
+        if index_range is not None:
+            data_kwargs['from_idx'], data_kwargs['to_idx'] = self._find_index_rows(fr, index_range, **data_kwargs)
+
+        if auto_narrow:
+            proposals = self._analyse_narrowing(fr, chunk_size=chunk_size, **data_kwargs)
+            for channel in fr.channels.value:
+                proposal = proposals.get(channel.name)
+                if proposal is not None and proposal.narrowed:
+                    logger.info(f"Narrowing data type of channel {proposal}")
+                    channel.cast_dtype = proposal.proposed_dtype.type
+
+        data_object = self._make_data_object(fr, **data_kwargs)
+
+        try:
+            self._check_data(data_object)
+            if fill_channel_limits:
+                statistics = data_object.compute_statistics(chunk_rows=chunk_size)
+                for channel in fr.channels.value:
+                    channel.set_limits_from_statistics(statistics[channel.name])
+            elif collect_statistics:
+                data_object.collect_statistics()
+            fr.setup_from_data(data_object)
+            return MultiFrameData(fr, data_object, chunk_size=chunk_size)
+        except Exception:
+            data_object.close()
+            raise
 
     @staticmethod
     def _check_data(data: SourceDataWrapper) -> None:
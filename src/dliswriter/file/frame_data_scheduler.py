@@ -0,0 +1,178 @@
+import logging
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import Optional, Generator, Iterator, Union, Any
+from typing_extensions import Self
+import numpy as np
+
+from dliswriter.file.multi_frame_data import MultiFrameData
+from dliswriter.file.writer import EncodedRecords, make_visible_records
+from dliswriter.logical_record.core.logical_record import LogicalRecordBytes
+from dliswriter.logical_record.iflr_types import FrameData
+from dliswriter.utils.internal.struct_writer import write_struct_uvari
+
+
+logger = logging.getLogger(__name__)
+
+
+def encode_frame_data_chunk(frame_obname: bytes, first_frame_number: int, chunk: np.ndarray,
+                            visible_record_length: int) -> bytes:
+    """Create bytes of visible records holding FrameData logical records made from a chunk of frame data.
+
+    The function is self-contained (takes only picklable arguments), so that it can be run in a worker process.
+    The produced bytes are identical to those created by DLISWriter from the corresponding FrameData objects.
+
+    Args:
+        frame_obname            :   OBNAME bytes of the FrameItem the data belong to.
+        first_frame_number      :   Frame number (counting from 1) of the first row of the chunk.
+        chunk                   :   Structured numpy array - a chunk of the frame's data.
+        visible_record_length   :   Maximum allowed length of visible records, in bytes.
+
+    Returns:
+        Bytes of the visible records, in the order of the rows of the chunk.
+    """
+
+    row_size = chunk.dtype.itemsize
+    data = chunk.byteswap().tobytes()  # same as byte-swapping all slots of each row separately
+    lr_type_struct = FrameData.lr_type_struct
+
+    vrs = bytearray()
+    for i in range(chunk.shape[0]):
+        body = frame_obname + write_struct_uvari(first_frame_number + i) + data[i * row_size:(i + 1) * row_size]
+        for vr in make_visible_records(LogicalRecordBytes(body, lr_type_struct), visible_record_length):
+            vrs += vr
+
+    return bytes(vrs)
+
+
+class FrameDataScheduler:
+    """Encode FrameData of all frames of a file concurrently, in a pool of worker processes.
+
+    The data of each frame (MultiFrameData) are loaded chunk by chunk in the main process. Each chunk - a block
+    of complete frames (rows) - is then encoded to visible records in a worker. Chunks are submitted in the order
+    in which they are to appear in the file, across frames and logical files, so that while the writer is busy
+    with the records of one frame, the data of the next frames (possibly from the next logical files) are already
+    being encoded. The number of chunks being processed (or waiting to be written) at any time is limited,
+    which keeps the memory usage bounded.
+
+    Encoded chunks are retrieved per MultiFrameData object, in the order in which the objects were provided.
+    """
+
+    def __init__(self, multi_frame_data_objects: list[MultiFrameData], visible_record_length: int,
+                 n_workers: int, max_pending: Optional[int] = None, executor: Optional[Executor] = None):
+        """Initialise FrameDataScheduler.
+
+        Args:
+            multi_frame_data_objects    :   All MultiFrameData objects to be written to the file, in the order
+                                            required by the standard (i.e. the order they should appear in the file).
+            visible_record_length       :   Maximum allowed length of visible records, in bytes.
+            n_workers                   :   Number of worker processes.
+            max_pending                 :   Maximum number of chunks submitted, but not yet retrieved.
+                                            Defaults to twice the number of workers.
+            executor                    :   Executor to run the encoding in. If not provided, a ProcessPoolExecutor
+                                            is created (and shut down at 'close').
+        """
+
+        if not isinstance(n_workers, int) or n_workers < 1:
+            raise ValueError(f"Number of workers must be a positive integer; got {n_workers}")
+
+        self._visible_record_length = visible_record_length
+        self._max_pending = max_pending or 2 * n_workers
+
+        self._own_executor = executor is None
+        if executor is None:
+            from concurrent.futures import ProcessPoolExecutor  # imported on first use, to speed up package import
+            executor = ProcessPoolExecutor(max_workers=n_workers)
+        self._executor: Executor = executor
+
+        self._chunks = self._iter_all_chunks(multi_frame_data_objects)
+        # submitted chunks: MultiFrameData object, Future of the encoding task, number of rows (frames) in the chunk;
+        # an entry with no Future marks the end of the data of the given MultiFrameData
+        self._pending: deque[tuple[MultiFrameData, Union[Future, None], int]] = deque()
+        self._n_submitted_chunks = 0
+
+    @staticmethod
+    def _iter_all_chunks(multi_frame_data_objects: list[MultiFrameData]) -> Iterator:
+        """Iterate over chunks of all MultiFrameData objects (and their overview frames). Mark the end of each object's
+        data with a None.
+        """
+
+        for mfd in multi_frame_data_objects:
+            for frame, first_frame_number, chunk in mfd.iter_frame_chunks():
+                yield mfd, frame, first_frame_number, chunk
+            yield mfd, None, None, None
+
+    def _submit_next(self) -> bool:
+        """Submit the next chunk for encoding. Return False if there are no more chunks, True otherwise."""
+
+        try:
+            mfd, frame, first_frame_number, chunk = next(self._chunks)
+        except StopIteration:
+            return False
+
+        if chunk is None:
+            self._pending.append((mfd, None, 0))  # end of data of this MultiFrameData
+            return True
+
+        future = self._executor.submit(
+            encode_frame_data_chunk,
+            frame.obname,
+            first_frame_number,
+            chunk,
+            self._visible_record_length
+        )
+        self._pending.append((mfd, future, chunk.shape[0]))
+        self._n_submitted_chunks += 1
+        return True
+
+    def _fill(self) -> None:
+        """Submit chunks until the maximum number of pending chunks is reached or no more chunks are available."""
+
+        while sum(f is not None for _, f, _ in self._pending) < self._max_pending:
+            if not self._submit_next():
+                break
+
+    def encoded_records(self, multi_frame_data: MultiFrameData) -> Generator:
+        """Yield encoded chunks (EncodedRecords) of the given MultiFrameData, in order.
+
+        The MultiFrameData objects must be requested in the same order as they were passed at init.
+        """
+
+        while True:
+            self._fill()
+
+            if not self._pending:
+                raise RuntimeError(f"No (more) encoded data available for {multi_frame_data.frame}")
+
+            mfd, future, n_rows = self._pending.popleft()
+            if mfd is not multi_frame_data:
+                raise RuntimeError(f"Expected data of {multi_frame_data.frame}, but the next scheduled data "
+                                   f"are for {mfd.frame}; the data must be retrieved in the order of submission")
+
+            if future is None:
+                break
+
+            yield EncodedRecords(future.result(), n_records=n_rows)
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context; the executor is shut down when the context is exited."""
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the runtime context; shut down the executor."""
+
+        self.close()
+
+    def close(self) -> None:
+        """Cancel any pending tasks and shut down the executor (if created by this object)."""
+
+        for _, future, _ in self._pending:
+            if future is not None:
+                future.cancel()
+        self._pending.clear()
+
+        if self._own_executor:
+            self._executor.shutdown(wait=True)
+
+        logger.debug(f"Frame data encoding finished; {self._n_submitted_chunks} chunk(s) encoded in total")
@@ -0,0 +1,117 @@
+"""Define LogicalFileTemplate: a frozen snapshot of a configured LogicalFile, to be cloned into new logical files."""
+
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from dliswriter.logical_record import eflr_types
+from dliswriter.logical_record.core.eflr import EFLRItem
+from dliswriter.logical_record.core.attribute.attribute import Attribute
+from dliswriter.file.eflr_sets_dict import EFLRSetsDict
+
+if TYPE_CHECKING:
+    from dliswriter.file.file import LogicalFile
+
+
+logger = logging.getLogger(__name__)
+
+
+class LogicalFileTemplate:
+    """Frozen snapshot of the objects (EFLRs) of a LogicalFile, from which new logical files can be created cheaply.
+
+    Creating a template copies the file header and all the objects of the logical file. Further changes to the
+    logical file do not affect the template and vice versa. Logical files are created from the template using
+    'DLISFile.add_logical_file_from_template'.
+
+    The copies (of the template and of the logical files created from it) share the values of their attributes
+    with the original objects - an attribute value is only copied when a new value is assigned to it. Values must
+    therefore be replaced rather than modified in place (e.g. 'channel.units.value = "m"', but not
+    'frame.channels.value.append(channel)'); to enforce this, the shared values are frozen (lists become tuples and
+    numpy arrays become read-only). In the logical files created from the template, the attributes themselves
+    are only copied when first accessed.
+
+    The copies also share the encoded bytes of the EFLR sets (other than the file header): a set is encoded once,
+    when the first logical file created from the template is written, and reused by the other logical files - as long
+    as none of its objects has been modified (or added). Attributes set from the data at write time (e.g. dimension and
+    representation code of channels, index range of frames) count as modifications if they change a value; freezing
+    a logical file which has already been written (or whose channels have explicitly specified dimensions and
+    cast dtypes) allows reusing more of the bytes.
+
+    Data arrays associated with channels are shared (not copied) with the new logical files. No-format frame data
+    are not included in the template.
+    """
+
+    def __init__(self, logical_file: "LogicalFile") -> None:
+        """Initialise LogicalFileTemplate.
+
+        Args:
+            logical_file    :   The logical file to make a snapshot of.
+        """
+
+        self._file_header_item, self._eflr_sets = self.clone_objects(logical_file.file_header_item,
+                                                                     logical_file._eflr_sets, lazy=False)
+
+        # the file header is not shared: it is tiny and its parameters (e.g. sequence number) usually differ
+        for eflr_set_dict in self._eflr_sets.values():
+            for eflr_set in eflr_set_dict.values():
+                for eflr_item in eflr_set.iter_eflr_items():
+                    eflr_item._run_checks_and_set_defaults()
+                eflr_set.share_encoded_body()
+
+        self._data_dict: dict[str, np.ndarray] = logical_file._data_dict.copy()
+        self._next_dataset_copy: dict[str, int] = logical_file._next_dataset_copy.copy()
+
+        if logical_file._no_format_frame_data:
+            logger.warning("No-format frame data are not included in the logical file template")
+
+    @property
+    def file_header_item(self) -> eflr_types.FileHeaderItem:
+        """File header of the template."""
+
+        return self._file_header_item
+
+    @property
+    def data_dict(self) -> dict[str, np.ndarray]:
+        """Data arrays associated with the channels of the template, by dataset name."""
+
+        return self._data_dict.copy()
+
+    @property
+    def next_dataset_copy(self) -> dict[str, int]:
+        """First suffix worth trying for each (repeated) channel name (see LogicalFile._get_unique_dataset_name)."""
+
+        return self._next_dataset_copy.copy()
+
+    @staticmethod
+    def clone_objects(file_header_item: eflr_types.FileHeaderItem, eflr_sets: EFLRSetsDict, lazy: bool
+                      ) -> tuple[eflr_types.FileHeaderItem, EFLRSetsDict]:
+        """Copy the file header and the EFLR sets, making the copied objects refer to one another.
+
+        Args:
+            file_header_item    :   File header to be copied (together with its set).
+            eflr_sets           :   EFLR sets to be copied (together with their items).
+            lazy                :   If True, Attributes of the items are only copied when needed
+                                    (see EFLRItem.clone); the original objects must not be modified afterwards.
+
+        Returns:
+            The copied file header and EFLR sets.
+        """
+
+        mapping: dict[int, EFLRItem] = {}
+        references: list[Attribute] = []
+
+        new_eflr_sets = eflr_sets.clone(mapping, references, lazy=lazy)
+        file_header_item.parent.clone(mapping, references)
+        EFLRItem.redirect_references(references, mapping)
+        for new_item in mapping.values():
+            if isinstance(new_item, eflr_types.FrameItem):
+                new_item.redirect_overviews(mapping)
+
+        new_file_header_item: eflr_types.FileHeaderItem = mapping[id(file_header_item)]  # type: ignore
+        return new_file_header_item, new_eflr_sets
+
+    def clone(self) -> tuple[eflr_types.FileHeaderItem, EFLRSetsDict]:
+        """Copy the file header and the EFLR sets of the template, to be used in a new logical file."""
+
+        return self.clone_objects(self._file_header_item, self._eflr_sets, lazy=True)
@@ -1,9 +1,11 @@
+import numpy as np
 from typing import Any, Union, Generator, Optional
 from typing_extensions import Self
 
 from dliswriter.logical_record.eflr_types.frame import FrameItem
 from dliswriter.logical_record.iflr_types import FrameData
 from dliswriter.utils.source_data_wrappers import SourceDataWrapper
+from dliswriter.utils.internal.decimation import Decimator, n_overview_chunks
 
 
 class MultiFrameData:
@@ -11,6 +13,9 @@ class MultiFrameData:
 
     Iterate over an instance of MultiFrameData to yield consecutive instances of FrameData according to the provided
     SourceDataObject (specifying numerical data, channel names, data types etc.)
+
+    The data of the overview frames of the frame (see FrameItem.overviews) are computed from the same chunks
+    of data; the FrameData of an overview frame follow those of the chunk which completed them.
     """
 
     def __init__(self, frame: FrameItem, data: SourceDataWrapper, chunk_size: Optional[int] = None):
@@ -40,7 +45,6 @@ class MultiFrameData:
         self._origin_reference: Union[int, None] = self._frame.origin_reference
 
         self._chunk_rows = chunk_size
-        self._i = 0  # keep track of current frame number during iteration
         self._data_item_generator: Union[Generator, None] = None
 
     @staticmethod
@@ -57,16 +61,111 @@ class MultiFrameData:
 
         return self._frame
 
+    @property
+    def data(self) -> SourceDataWrapper:
+        """Source data wrapper providing the frame's data."""
+
+        return self._data_source
+
+    def assign_channel_statistics(self) -> None:
+        """Assign the statistics of the data collected by the source data wrapper (if any) to the frame's channels."""
+
+        statistics = self._data_source.channel_statistics
+        if not statistics:
+            return
+
+        for channel in self._frame.channels.value:
+            channel.statistics = statistics[channel.name]
+
+    def close(self) -> None:
+        """Close the underlying source data wrapper (e.g. the source HDF5 file)."""
+
+        self._data_source.close()
+
     def __len__(self) -> int:
-        """Number of data rows (= number of FrameData objects that can be created from the provided data)."""
+        """Number of FrameData objects that can be created from the provided data - including the overview frames'."""
+
+        n_rows = self._data_source.n_rows
+        return n_rows + sum(-(-n_rows // overview.factor) for overview in self._frame.overviews)
+
+    @property
+    def n_chunks(self) -> int:
+        """Number of chunks of data yielded by 'iter_frame_chunks' - including the chunks of the overview frames."""
+
+        n_rows = self._data_source.n_rows
+        return self._data_source.n_chunks(self._chunk_rows) + sum(
+            n_overview_chunks(n_rows, self._chunk_rows, overview.factor) for overview in self._frame.overviews)
+
+    def iter_chunks(self) -> Generator:
+        """Define a generator yielding consecutive chunks of the frame's data.
+
+        Yields:
+            2-tuples of:
+                int         :   Frame number of the first row of the chunk (counting from 1).
+                np.ndarray  :   Structured numpy array with the data of the consecutive frames (rows).
+        """
+
+        for start, chunk in self._data_source.iter_chunks(chunk_rows=self._chunk_rows):
+            yield start + 1, chunk
+
+    def _make_decimators(self) -> list[tuple[FrameItem, Decimator]]:
+        """Create decimators computing the rows of the overview frames of the frame."""
+
+        return [(overview.frame, Decimator(
+            overview.factor,
+            overview.method,
+            dtype=self._data_source.dtype,
+            chunk_dtype=self._data_source.chunk_dtype,
+            absent_values=self._data_source.absent_values,
+            has_index=self._frame.index_type.value is not None,
+        )) for overview in self._frame.overviews]
+
+    def iter_frame_chunks(self) -> Generator:
+        """Define a generator yielding consecutive chunks of the frame's data and of the data of its overview frames.
+
+        After each chunk of the frame's data, the overview rows completed by the chunk are yielded (if any),
+        overview frame by overview frame. The rows of the last, partial windows follow the last chunk.
+
+        Yields:
+            3-tuples of:
+                FrameItem   :   Frame the data belong to (the frame or one of its overview frames).
+                int         :   Frame number of the first row of the chunk (counting from 1).
+                np.ndarray  :   Structured numpy array with the data of the consecutive frames (rows).
+        """
 
-        return self._data_source.n_rows
+        decimators = self._make_decimators()
+        next_frame_numbers = [1] * len(decimators)
+
+        def overview_chunks(source_chunk: Optional[np.ndarray]) -> Generator:
+            for i, (overview_frame, decimator) in enumerate(decimators):
+                rows = decimator.flush() if source_chunk is None else decimator.update(source_chunk)
+                if rows.shape[0]:
+                    yield overview_frame, next_frame_numbers[i], rows
+                    next_frame_numbers[i] += rows.shape[0]
+
+        for first_frame_number, chunk in self.iter_chunks():
+            yield self._frame, first_frame_number, chunk
+            yield from overview_chunks(chunk)
+
+        yield from overview_chunks(None)
+
+    def _make_frame_data_generator(self) -> Generator:
+        """Define a generator yielding FrameData of the frame and its overview frames (see iter_frame_chunks)."""
+
+        for frame, first_frame_number, chunk in self.iter_frame_chunks():
+            origin_reference = self._origin_reference if frame is self._frame else frame.origin_reference
+            for i, row in enumerate(chunk):
+                yield FrameData(
+                    frame=frame,
+                    frame_number=first_frame_number + i,
+                    slots=row,
+                    origin_reference=origin_reference
+                )
 
     def __iter__(self) -> Self:
         """Set up iteration over FrameData objects (to be) defined based on the data."""
 
-        self._i = 0
-        self._data_item_generator = self._data_source.make_chunked_generator(chunk_rows=self._chunk_rows)
+        self._data_item_generator = self._make_frame_data_generator()
         return self
 
     def __next__(self) -> FrameData:
@@ -75,14 +174,5 @@ class MultiFrameData:
         if not self._data_item_generator:
             raise RuntimeError("Iteration has not been defined")
 
-        if self._i >= self._data_source.n_rows:
-            raise StopIteration
-
-        self._i += 1
-
-        return FrameData(
-            frame=self._frame,
-            frame_number=self._i,
-            slots=next(self._data_item_generator),
-            origin_reference=self._origin_reference
-        )
+        frame_data: FrameData = next(self._data_item_generator)
+        return frame_data
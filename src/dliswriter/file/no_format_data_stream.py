@@ -0,0 +1,132 @@
+import os
+import logging
+from pathlib import Path
+from typing import Union, Optional, Generator, Iterable, Iterator
+
+from dliswriter.logical_record.eflr_types.no_format import NoFormatItem
+from dliswriter.logical_record.iflr_types import NoFormatFrameData
+from dliswriter.utils.internal.types import bytes_type
+
+
+logger = logging.getLogger(__name__)
+
+
+class NoFormatDataStream:
+    """Create a generator for NoFormatFrameData objects, streaming the data from a file or from an iterator.
+
+    The data are not loaded into memory at once. Instead, they are read (or retrieved from the iterator) piece by
+    piece; each piece becomes the data of a separate NoFormatFrameData object (a NOFMT IFLR). Readers are expected
+    to concatenate the data of consecutive NoFormatFrameData objects of the same NoFormatItem to obtain the full
+    payload.
+
+    All pieces except the last one have exactly the specified size. The last piece is merged with the preceding one
+    if it would otherwise be shorter than the minimal size of a logical record body, because such records are padded,
+    which would alter the payload.
+    """
+
+    min_piece_size = 12  #: minimal number of bytes in a single piece of data (minimal length of a LR body)
+
+    def __init__(self, no_format_object: NoFormatItem,
+                 source: Union[os.PathLike[str], Iterable[Union[str, bytes_type]]], chunk_size: int = 2**16) -> None:
+        """Initialise NoFormatDataStream.
+
+        Args:
+            no_format_object    :   No-format item the data belong to.
+            source              :   Path to a file whose contents should be included or an iterable yielding
+                                    consecutive pieces of the data (str - encoded as ASCII - or bytes).
+                                    An iterator can only be consumed once, i.e. the file can be written only once.
+            chunk_size          :   Size (in bytes) of the data pieces - of the data of single NoFormatFrameData.
+        """
+
+        if not isinstance(no_format_object, NoFormatItem):
+            raise TypeError(f"Expected a NoFormatItem; got {type(no_format_object)}: {no_format_object}")
+
+        if not isinstance(chunk_size, int) or chunk_size < self.min_piece_size:
+            raise ValueError(f"Chunk size must be an integer not smaller than {self.min_piece_size}; got {chunk_size}")
+
+        if isinstance(source, (str, bytes, bytearray)):
+            raise TypeError("Data of NoFormatDataStream must be a path-like object or an iterable of str/bytes; "
+                            "to include str or bytes as they are, use NoFormatFrameData instead")
+
+        self._source: Union[Path, Iterable[Union[str, bytes_type]]]
+        if isinstance(source, os.PathLike):
+            self._source = Path(source)
+            if not self._source.is_file():
+                raise FileNotFoundError(f"No file found at {self._source}")
+        elif isinstance(source, Iterable):
+            self._source = source
+        else:
+            raise TypeError(f"Expected a path-like object or an iterable; got {type(source)}: {source}")
+
+        self.no_format_object = no_format_object
+        self._chunk_size = chunk_size
+        self._consumed = False
+
+    @property
+    def chunk_size(self) -> int:
+        """Size (in bytes) of the data pieces."""
+
+        return self._chunk_size
+
+    @property
+    def n_records(self) -> Optional[int]:
+        """Number of NoFormatFrameData objects to be created. None if it cannot be determined beforehand."""
+
+        if not isinstance(self._source, Path):
+            return None
+
+        n_full, remainder = divmod(os.path.getsize(self._source), self._chunk_size)
+        if not n_full:
+            return 1
+        if remainder and remainder < self.min_piece_size:
+            return n_full  # remainder merged with the last full piece
+        return n_full + int(bool(remainder))
+
+    def _iter_source(self) -> Iterator[bytes_type]:
+        """Iterate over the source data, as provided (i.e. in pieces of arbitrary size)."""
+
+        if isinstance(self._source, Path):
+            with self._source.open('rb') as f:
+                while data := f.read(self._chunk_size):
+                    yield data
+            return
+
+        if self._consumed:
+            raise RuntimeError(f"Data iterator of {self.no_format_object} has already been consumed")
+        self._consumed = True
+
+        for piece in self._source:
+            if isinstance(piece, str):
+                yield piece.encode('ascii')
+            elif isinstance(piece, (bytes, bytearray)):
+                yield piece
+            else:
+                raise TypeError(f"Expected str or bytes from the data iterator; got {type(piece)}")
+
+    def iter_pieces(self) -> Generator[bytes, None, None]:
+        """Yield consecutive pieces of the data, re-chunked to the pre-defined size."""
+
+        buffer = bytearray()
+        chunk_size = self._chunk_size
+
+        for data in self._iter_source():
+            buffer += data
+
+            # always keep at least min_piece_size bytes in the buffer, so that the last piece is not too short
+            n_full = (len(buffer) - self.min_piece_size) // chunk_size
+            if n_full > 0:
+                for i in range(n_full):
+                    yield bytes(buffer[i * chunk_size:(i + 1) * chunk_size])
+                del buffer[:n_full * chunk_size]
+
+        yield bytes(buffer)
+
+    def __iter__(self) -> Generator[NoFormatFrameData, None, None]:
+        """Yield NoFormatFrameData objects with consecutive pieces of the data."""
+
+        n = 0
+        for piece in self.iter_pieces():
+            n += 1
+            yield NoFormatFrameData(self.no_format_object, piece)
+
+        logger.debug(f"Data of {self.no_format_object} written in {n} NoFormatFrameData record(s)")
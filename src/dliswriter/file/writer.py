@@ -1,15 +1,97 @@
 import logging
-from progressbar import progressbar
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Generator
 from pathlib import Path
 
 from dliswriter.utils.internal.internal_enums import RepresentationCode
 from dliswriter.utils.internal.types import file_name_type, number_type, bytes_type
+from dliswriter.utils.internal.sized_generator import SizedGenerator
 from dliswriter.logical_record.misc import StorageUnitLabel
+from dliswriter.logical_record.core.logical_record import LogicalRecordBytes
 
 logger = logging.getLogger(__name__)
 
 
+#: format version is a required part of each visible record and is fixed for a given version of the standard
+FORMAT_VERSION = RepresentationCode.USHORT.convert(255) + RepresentationCode.USHORT.convert(1)
+
+
+def make_visible_record(body: bytes_type, visible_record_length: int, size: Optional[int] = None) -> bytes:
+    """Create a visible record (physical DLIS unit) from the provided body bytes.
+
+    Args:
+        body                    :   Bytes to create the visible record from.
+        visible_record_length   :   Maximum allowed length of the visible record, in bytes.
+        size                    :   Number of bytes in the body. If not provided, it is calculated from the body object.
+
+    Returns:
+        Created visible record (provided body bytes preceded by header bytes) as a bytes object.
+
+    Note:
+        For performance purposes, the provided size is not checked against the length of the body bytes.
+    """
+
+    if size is None:
+        size = len(body)
+
+    size += 4  # 4 header bytes will be added
+
+    if size > visible_record_length:
+        raise ValueError(f"VR length is too large; got {size}, max is {visible_record_length}")
+
+    return RepresentationCode.UNORM.convert(size) + FORMAT_VERSION + body
+
+
+def make_visible_records(lr_bytes: LogicalRecordBytes, visible_record_length: int) -> Generator:
+    """Split bytes of a logical record into segments and wrap each of them in a separate visible record.
+
+    Args:
+        lr_bytes                :   Bytes of a logical record.
+        visible_record_length   :   Maximum allowed length of the visible records, in bytes.
+
+    Yields:
+        Bytes of consecutive visible records.
+    """
+
+    # max allowed size of an LR segment body; 4 bytes reserved for VR header and another 4 for LR segment header
+    max_lr_segment_size = visible_record_length - 8
+
+    for segment, segment_size in lr_bytes.make_segments(max_lr_segment_size):
+        yield make_visible_record(segment, visible_record_length, segment_size)
+
+
+class EncodedRecords:
+    """Bytes of visible records made (e.g. in a worker process) from one or more consecutive logical records."""
+
+    def __init__(self, bts: bytes_type, n_records: int):
+        """Initialise EncodedRecords.
+
+        Args:
+            bts         :   Bytes of the visible records, ready to be written to the file.
+            n_records   :   Number of logical records the bytes were made from.
+        """
+
+        self._bts = bts
+        self._n_records = n_records
+
+    @property
+    def bts(self) -> bytes_type:
+        """Bytes of the visible records."""
+
+        return self._bts
+
+    @property
+    def size(self) -> int:
+        """Number of bytes."""
+
+        return len(self._bts)
+
+    @property
+    def n_records(self) -> int:
+        """Number of logical records represented by the bytes."""
+
+        return self._n_records
+
+
 class ByteWriter:
     """Write bytes to DLIS file."""
 
@@ -100,6 +182,12 @@ class BufferedOutput:
         size = size or len(bts)
         new_size = self._filled_size + size
 
+        if size > self._buffer_size:
+            # the bytes would not fit even in an empty buffer; pass them to the file writer directly
+            self.pass_bytes_to_writer()
+            self._writer.write_bytes(bts, size)
+            return
+
         if new_size > self._buffer_size:
             self.pass_bytes_to_writer()  # also sets up a new output buffer
             logger.debug(f"Making new output chunk; current total output size is {self._writer.total_size}")
@@ -137,9 +225,6 @@ class DLISWriter:
         self._check_visible_record_length(visible_record_length)
         self._visible_record_length: int = visible_record_length  #: Maximum allowed visible record length, in bytes
 
-        # format version is a required part of each visible record and is fixed for a given version of the standard
-        self._fmt_version = RepresentationCode.USHORT.convert(255) + RepresentationCode.USHORT.convert(1)
-
         # flag set to True as soon as a StorageUnitLabel is written to the file (through write_storage_unit_label);
         # SUL must be the first element of the file
         self._sul_written = False
@@ -161,28 +246,9 @@ class DLISWriter:
             raise ValueError("Visible record length must be an even number")
 
     def _make_visible_record(self, body: bytes_type, size: Optional[int] = None) -> bytes:
-        """Create a visible record (physical DLIS unit) from the provided body bytes.
-
-        Args:
-            body    :   Bytes to create the visible record from.
-            size    :   Number of bytes in the body. If not provided, it is calculated from the body object.
-
-        Returns:
-            Created visible record (provided body bytes preceded by header bytes) as a bytes object.
-
-        Note:
-            For performance purposes, the provided size is not checked against the length of the body bytes.
-        """
-
-        if size is None:
-            size = len(body)
-
-        size += 4  # 4 header bytes will be added
+        """Create a visible record (physical DLIS unit) from the provided body bytes. See 'make_visible_record'."""
 
-        if size > self._visible_record_length:
-            raise ValueError(f"VR length is too large; got {size}, max is {self._visible_record_length}")
-
-        return RepresentationCode.UNORM.convert(size) + self._fmt_version + body
+        return make_visible_record(body, self._visible_record_length, size)
 
     def _check_output_chunk_size(self, output_chunk_size: number_type) -> None:
         """Check output chunk size type (integer or float with zero decimal part) and value (>= max VR length)."""
@@ -215,10 +281,15 @@ class DLISWriter:
         Otherwise, a RuntimeError is raised.
 
         Args:
-            logical_records     :   Logical records to become part of the file.
+            logical_records     :   Logical records to become part of the file. Apart from LogicalRecord instances,
+                                    the sequence can contain EncodedRecords, whose bytes are written as they are.
+                                    The number of the records does not have to be known beforehand
+                                    (see SizedGenerator).
             output_chunk_size   :   Size of the buffers accumulating file bytes before file write action is called.
         """
 
+        from progressbar import progressbar, UnknownLength  # imported on first use, to speed up package import
+
         if not self._sul_written:
             raise RuntimeError("Storage Unit Label absent from the file; "
                                "add it calling DLISWriter.write_storage_unit_label")
@@ -229,18 +300,24 @@ class DLISWriter:
         logger.debug(f"Output file will be produced in chunks of max size {output_chunk_size} bytes")
         output = BufferedOutput(int(output_chunk_size), self._byte_writer)
 
-        # max allowed size of an LR segment body; 4 bytes reserved for VR header and another 4 for LR segment header
-        max_lr_segment_size = self._visible_record_length - 8
-
         # loop through the logical records, transform them and write them to the file
         logger.info("Creating & writing visible records of the DLIS...")
-        for lr in progressbar(logical_records, max_value=len(logical_records)):
-            # represent a logical record as bytes; split it segments as needed
-            for segment, segment_size in lr.represent_as_bytes().make_segments(max_lr_segment_size):
-                # wrap each segment's bytes in a separate visible record and write the VR to the file
-                output.add_bytes(self._make_visible_record(segment, segment_size))
+        n_records = logical_records.size if isinstance(logical_records, SizedGenerator) else len(logical_records)
+
+        n_written = 0
+        for lr in progressbar(logical_records, max_value=UnknownLength if n_records is None else n_records):
+            n_written += 1
+            if isinstance(lr, EncodedRecords):
+                # visible records already made elsewhere (e.g. in a worker process)
+                output.add_bytes(lr.bts, lr.size)
+                continue
+
+            # represent a logical record as bytes; split it segments as needed;
+            # wrap each segment's bytes in a separate visible record and write the VR to the file
+            for vr in make_visible_records(lr.represent_as_bytes(), self._visible_record_length):
+                output.add_bytes(vr)
         output.pass_bytes_to_writer()  # pass the remaining bytes kept in the output buffer (not full atm) to the writer
 
         # summarise
-        logger.info(f'{len(logical_records)} written to DLIS file at {Path(self._byte_writer.filename).resolve()}')
+        logger.info(f'{n_written} written to DLIS file at {Path(self._byte_writer.filename).resolve()}')
         logger.info(f"Total file size is {self._byte_writer.total_size} bytes")
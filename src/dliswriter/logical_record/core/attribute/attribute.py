@@ -1,7 +1,10 @@
 from typing import Union, Any, TYPE_CHECKING, Callable, Optional
+from functools import lru_cache
+from types import MethodType
 import logging
+import numpy as np
 
-from dliswriter.utils.internal.struct_writer import write_struct, write_struct_ascii, write_struct_uvari
+from dliswriter.utils.internal.struct_writer import write_struct, write_structs, write_struct_array, write_struct_uvari
 from dliswriter.utils.internal.internal_enums import RepresentationCode
 from dliswriter.utils.enums import Unit
 from dliswriter.utils.internal.converters import ReprCodeConverter
@@ -12,13 +15,66 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: description of an attribute of an EFLRItem: count (if to be written), representation code, units, and value;
+#: or the bytes of the attribute if they are already known
+attribute_body_spec_type = Union[tuple[Optional[int], RepresentationCode, Optional[str], Any], bytes]
+
+
+def write_attribute_body(buffer: bytearray, spec: attribute_body_spec_type) -> None:
+    """Append the bytes of an attribute (as part of an EFLRItem) described by the spec to the buffer.
+
+    The function only depends on its (picklable) arguments, so that it can be used in a worker process.
+    See Attribute.make_body_spec.
+    """
+
+    if isinstance(spec, bytes):
+        buffer += spec
+        return
+
+    count, rc, units, value = spec
+    descriptor = 0b00100001  # attribute component, with a value (the label is only included in the set template)
+
+    pos = len(buffer)
+    buffer.append(0)  # placeholder for the descriptor
+
+    if count is not None:
+        buffer += write_struct_uvari(count)
+        descriptor |= 0b1000
+
+    if rc:
+        buffer += RepresentationCode.USHORT.convert(rc.value)
+        descriptor |= 0b100
+
+    if units:
+        buffer += write_struct(RepresentationCode.IDENT, units)
+        descriptor |= 0b10
+
+    if isinstance(value, np.ndarray):
+        buffer += write_struct_array(rc, value)
+    elif isinstance(value, (list, tuple)):
+        buffer += write_structs(rc, Attribute.flatten_list(value))
+    else:
+        buffer += write_struct(rc, value)
+
+    buffer[pos] = descriptor
+
 
 class Attribute:
-    """Represent an RP66 V1 Attribute."""
+    """Represent an RP66 V1 Attribute.
+
+    A file might contain many thousands of attributes, so their memory footprint is kept small: instances use
+    __slots__ and the converters/checkers common to all instances are defined at class level.
+    """
+
+    __slots__ = ('_label', '_multivalued', '_multidimensional', '_representation_code', '_units', '_value',
+                 '_converter', 'parent_eflr')
 
     _valid_repr_codes = tuple(RepresentationCode.__members__.values())
     _default_repr_code: Union[RepresentationCode, None] = None
     _units_settable: bool = True
+    refers_to_items: bool = False  #: whether the value(s) might be EFLRItems (references to other objects)
+    _unit_checker = staticmethod(Unit.make_converter("units", soft=True, allow_none=True))
+    _slot_names: tuple[str, ...]  # names of the slots of the (sub)class; see '_get_slot_names'
 
     def __init__(self, label: str, multivalued: bool = False, multidimensional: bool = False,
                  representation_code: Optional[RepresentationCode] = None, units: Optional[str] = None,
@@ -41,11 +97,15 @@ class Attribute:
 
         """
 
-        self._check_type(label, str)
-        self._check_type(multivalued, bool)
-        self._check_type(multidimensional, bool)
-        self._check_type(representation_code, RepresentationCode, allow_none=True)
-        self._check_type(units, str, allow_none=True)
+        if not (label.__class__ is str and multivalued.__class__ is bool and multidimensional.__class__ is bool
+                and (representation_code is None or representation_code.__class__ is RepresentationCode)
+                and (units is None or units.__class__ is str)):
+            # the common case is checked above in one go; check each argument separately only if necessary
+            self._check_type(label, str)
+            self._check_type(multivalued, bool)
+            self._check_type(multidimensional, bool)
+            self._check_type(representation_code, RepresentationCode, allow_none=True)
+            self._check_type(units, str, allow_none=True)
 
         if multidimensional and not multivalued:
             raise ValueError("An Attribute cannot be multidimensional without being multivalued")
@@ -53,7 +113,7 @@ class Attribute:
         if converter and not callable(converter):
             raise TypeError(f"Converter must be a callable; got {type(converter)}: {converter}")
 
-        self._label = label.strip('_').upper().replace('_', '-')
+        self._label = self._make_label(label)
         self._multivalued = multivalued
         self._multidimensional = multidimensional
         self._representation_code = representation_code if representation_code is not None else self._default_repr_code
@@ -62,7 +122,84 @@ class Attribute:
         self._converter = converter  # to convert value
         self.parent_eflr = parent_eflr
 
-        self._unit_checker = Unit.make_converter("units", soft=True, allow_none=True)
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _make_label(name: str) -> str:
+        """Transform an attribute name to a label: strip leading/trailing underscores, use dashes and uppercase."""
+
+        return name.strip('_').upper().replace('_', '-')
+
+    @classmethod
+    def is_same_value(cls, v1: Any, v2: Any) -> bool:
+        """Check whether two values are the same, i.e. whether they would be represented by the same bytes.
+
+        Types are compared as well (e.g. 1 and 1.0 are not the same value). The comparison is conservative:
+        if in doubt (e.g. for NaNs), the values are considered different.
+        """
+
+        if v1 is v2:
+            return True
+        if isinstance(v1, (list, tuple)) and isinstance(v2, (list, tuple)):  # written the same way
+            return len(v1) == len(v2) and all(cls.is_same_value(e1, e2) for e1, e2 in zip(v1, v2))
+        if v1.__class__ is not v2.__class__:
+            return False
+        if isinstance(v1, np.ndarray):
+            return v1.dtype == v2.dtype and v1.shape == v2.shape and bool((v1 == v2).all())
+        try:
+            return bool(v1 == v2)
+        except Exception:
+            return False
+
+    def _check_modified(self, previous_value: Any, new_value: Any) -> None:
+        """If the parent EFLRSet shares encoded bytes (with a template), mark it modified if the value has changed."""
+
+        item = self.parent_eflr
+        eflr_set = getattr(item, '_parent', None)
+        if eflr_set is not None and eflr_set.shares_encoded_body and not self.is_same_value(previous_value, new_value):
+            eflr_set.mark_modified()
+
+    def copy(self, parent_eflr: "Optional[EFLRItem]" = None) -> "Attribute":
+        """Create a copy of the attribute, belonging to the given EFLRItem.
+
+        The value is not copied, but shared with the original attribute. To make sure it is replaced (by the 'value'
+        setter) rather than modified in place, the shared value is frozen: lists become tuples and numpy arrays become
+        read-only (see '_freeze_value'). Converters which are bound methods of the original parent item are re-bound
+        to the new one.
+        """
+
+        cls = self.__class__
+        new = cls.__new__(cls)
+        for name in cls._get_slot_names():
+            setattr(new, name, getattr(self, name))
+
+        conv = self._converter
+        if conv is not None and self.parent_eflr is not None and getattr(conv, '__self__', None) is self.parent_eflr:
+            new._converter = MethodType(conv.__func__, parent_eflr)  # type: ignore  # bound method (checked above)
+
+        new._value = self._value = self._freeze_value(self._value)
+        new.parent_eflr = parent_eflr
+        return new
+
+    @classmethod
+    def _freeze_value(cls, value: Any) -> Any:
+        """Make an attribute value immutable: (nested) lists become tuples and numpy arrays become read-only."""
+
+        if isinstance(value, list):
+            return tuple(cls._freeze_value(v) for v in value)
+        if isinstance(value, np.ndarray) and value.flags.writeable:
+            value = value.view()
+            value.flags.writeable = False
+        return value
+
+    @classmethod
+    def _get_slot_names(cls) -> tuple[str, ...]:
+        """Names of the slots of the (sub)class and its base classes; determined once per class."""
+
+        names = cls.__dict__.get('_slot_names')
+        if names is None:
+            names = tuple(n for klass in cls.__mro__ for n in klass.__dict__.get('__slots__', ()))
+            cls._slot_names = names
+        return names
 
     @staticmethod
     def _check_type(value: Any, *expected_types: type, allow_none: bool = False) -> None:
@@ -96,7 +233,9 @@ class Attribute:
     def value(self, val: Any) -> None:
         """Set a new value of the attribute. Use the provided converter (if any) to transform/validate the value."""
 
+        previous_value = self._value
         self._value = self.convert_value(val)
+        self._check_modified(previous_value, self._value)
 
     @property
     def representation_code(self) -> Union[RepresentationCode, None]:
@@ -116,10 +255,14 @@ class Attribute:
         if self._value is None:
             return None
         if self._multivalued:
-            if not self._value:
+            if not len(self._value):
                 return None
 
-        value_flat = self.flatten_list(self._value) if self._multidimensional else self._value
+        value_flat: Any
+        if isinstance(self._value, np.ndarray):
+            value_flat = self._value  # representation code determined from the dtype
+        else:
+            value_flat = self.flatten_list(self._value) if self._multidimensional else self._value
 
         try:
             return ReprCodeConverter.determine_repr_code_from_value(value_flat)
@@ -153,7 +296,9 @@ class Attribute:
             raise RuntimeError(f"Units of {self.__class__.__name__} cannot be set")
 
         self._unit_checker(units)
+        previous_units = self._units
         self._units = units
+        self._check_modified(previous_units, units)
 
     @property
     def count(self) -> Union[int, None]:
@@ -163,6 +308,8 @@ class Attribute:
             return 1
         if self._value is None:
             return None
+        if isinstance(self._value, np.ndarray):
+            return self._value.size
         if isinstance(self._value, (list, tuple)):
             return len(self.flatten_list(self._value))
         return 1
@@ -182,26 +329,42 @@ class Attribute:
     def convert_value(self, value: Any) -> Any:
         """Transform/validate the provided value according to the provided converter.
 
-        If the attribute is set up as multivalued, before converting the value, parse it to a list."""
+        If the attribute is set up as multivalued, before converting the value, parse it to a list.
+        Numeric numpy arrays set as values of multivalued attributes are validated as a whole (see '_convert_array').
+        """
 
         if self._multivalued:
+            if isinstance(value, np.ndarray):
+                return self._convert_array(value)
             if not isinstance(value, (list, tuple)):
                 value = [value]
-            return [self.converter(v) for v in value]
-        return self.converter(value)
+            return [self._convert_element(v) for v in value]
+        return self._convert_element(value)
+
+    def _convert_array(self, value: np.ndarray) -> Any:
+        """Validate a numpy array set as the value of a multivalued attribute.
+
+        Numeric arrays are kept as (a copy of) the array if their data type corresponds to a representation code
+        valid for the attribute; the values are then encoded all at once and the representation code - if not
+        specified explicitly - is determined from the dtype. The converter of the attribute is not applied
+        to the individual elements of such arrays. Any other arrays are converted to (nested) lists and treated
+        like list values.
+        """
+
+        if value.dtype.kind not in 'iuf' or value.ndim == 0 or (value.ndim > 1 and not self._multidimensional):
+            return self.convert_value(value.tolist())
+
+        dtype = ReprCodeConverter.determine_supported_numpy_dtype(value)
+        if ReprCodeConverter.numpy_dtypes_to_repr_codes[dtype.name] not in self._valid_repr_codes:
+            return self.convert_value(value.tolist())
+
+        return value.astype(dtype)
 
     @property
     def converter(self) -> Callable:
         """Converter used to transform/validate values set through the setter of property 'value'."""
 
-        conv = self._converter or (lambda v: v)
-
-        def wrapper(value: Any) -> Any:
-            if self._multidimensional and isinstance(value, (list, tuple)):
-                return [wrapper(value_element) for value_element in value]
-            return conv(value)
-
-        return wrapper
+        return self._convert_element
 
     @converter.setter
     def converter(self, conv: Union[Callable, None]) -> None:
@@ -214,59 +377,32 @@ class Attribute:
                 raise TypeError(f"Expected a callable; got {type(conv)}")
             self._converter = conv
 
-    def _write_for_template(self, bts: bytes, characteristics: str) -> tuple[bytes, str]:
-        """Transform the attribute to bytes and characteristics needed for an EFLRSet template."""
+    def _convert_element(self, value: Any) -> Any:
+        """Convert a single element of the value; in the multidimensional case, it might be a (nested) list."""
 
-        if self._label:
-            bts += write_struct_ascii(self._label)
-            characteristics += '1'
-        else:
-            characteristics += '0'
+        if self._multidimensional and isinstance(value, (list, tuple)):
+            return [self._convert_element(value_element) for value_element in value]
+        return self._convert_single(value)
 
-        # count, representation code, units, and value - no defaults
-        characteristics += '0000'
-
-        return bts, characteristics
+    def _convert_single(self, value: Any) -> Any:
+        """Convert/validate a single value, using the converter provided at init (if any)."""
 
-    def _write_for_body(self, bts: bytes, characteristics: str) -> tuple[bytes, str]:
-        """Transform the attribute to bytes and characteristics needed to describe this part of an EFLRItem."""
+        conv = self._converter
+        return conv(value) if conv is not None else value
 
-        # label
-        characteristics += '0'
+    def _write_for_template(self, buffer: bytearray, characteristics: str) -> str:
+        """Append the bytes needed for an EFLRSet template to the buffer; return the updated characteristics."""
 
-        # count
-        count = self.count
-        if count and count != 1:
-            bts += write_struct_uvari(count)
-            characteristics += '1'
-        else:
-            if self._value is not None:
-                if count is not None and count > 1:
-                    bts += write_struct_uvari(count)
-                    characteristics += '1'
-                else:
-                    characteristics += '0'
-            else:
-                characteristics += '0'
-
-        # representation code
-        if self.representation_code:
-            bts += RepresentationCode.USHORT.convert(self.representation_code.value)
-            characteristics += '1'
-        else:
-            characteristics += '0'
-
-        # units
-        if self._units:
-            bts += write_struct_ascii(self._units)
+        if self._label:
+            buffer += write_struct(RepresentationCode.IDENT, self._label)
             characteristics += '1'
         else:
             characteristics += '0'
 
-        # values
-        bts, characteristics = self._write_values(bts, characteristics)
+        # count, representation code, units, and value - no defaults
+        characteristics += '0000'
 
-        return bts, characteristics
+        return characteristics
 
     @staticmethod
     def flatten_list(v: Union[list, tuple], res: Optional[list] = None) -> list:
@@ -283,25 +419,48 @@ class Attribute:
 
         return res
 
-    def _write_values(self, bts: bytes, characteristics: str) -> tuple[bytes, str]:
-        """Transform the attribute to bytes and characteristics for template/describing its EFLRItem."""
+    def make_body_spec(self) -> attribute_body_spec_type:
+        """Describe the attribute (as part of an EFLRItem) in a compact, picklable form; see 'write_attribute_body'.
+
+        Values referring to other EFLRItems (OBNAME, OBJREF) are encoded right away; the returned spec is then
+        the bytes of the whole attribute.
+        """
 
-        rc = self.representation_code
         value = self._value
+        if value is None:
+            return b'\x00'
 
-        if value is not None:
-            if isinstance(value, (list, tuple)):
-                for val in self.flatten_list(value):
-                    bts += write_struct(rc, val)
-            else:
-                bts += write_struct(rc, value)
+        rc = self.representation_code
+        if rc is None:
+            raise RuntimeError(f"Representation code of {self} could not be determined")
 
-            characteristics += '1'
+        count = self.count
+        spec = (count if count and count != 1 else None, rc, self._units or None, value)
 
-        else:
-            characteristics += '0'
+        if rc is RepresentationCode.OBNAME or rc is RepresentationCode.OBJREF:
+            buffer = bytearray()
+            write_attribute_body(buffer, spec)
+            return bytes(buffer)
+
+        return spec
 
-        return bts, characteristics
+    def write_to(self, buffer: bytearray, for_template: bool = False) -> None:
+        """Append the bytes representing the attribute to the buffer.
+
+        The descriptor byte (characteristics) is reserved first and filled in once the remaining bytes are written.
+
+        Args:
+            buffer          :   Buffer the bytes should be appended to.
+            for_template    :   If True, create the bytes for EFLRSet template; otherwise, for EFLRItem description.
+        """
+
+        if not for_template:
+            write_attribute_body(buffer, self.make_body_spec())
+            return
+
+        pos = len(buffer)
+        buffer.append(0)  # placeholder for the descriptor
+        buffer[pos] = int(self._write_for_template(buffer, '001'), 2)
 
     def get_as_bytes(self, for_template: bool = False) -> bytes:
         """Convert attribute to bytes to be put in the DLIS file.
@@ -310,12 +469,6 @@ class Attribute:
             for_template: If True, create the bytes for EFLRSet template; otherwise, for EFLRItem description.
         """
 
-        bts = b''
-        characteristics = '001'
-
-        if for_template:
-            bts, characteristics = self._write_for_template(bts, characteristics)
-        else:
-            bts, characteristics = self._write_for_body(bts, characteristics)
-
-        return RepresentationCode.USHORT.convert(int(characteristics, 2)) + bts
+        buffer = bytearray()
+        self.write_to(buffer, for_template=for_template)
+        return bytes(buffer)
@@ -1,4 +1,5 @@
 import logging
+import numpy as np
 from numbers import Number
 from datetime import datetime
 from typing import Union, Optional, Any, overload
@@ -21,7 +22,10 @@ class EFLRAttribute(Attribute):
     or Channels of Frame.
     """
 
+    __slots__ = ('_object_class',)
+
     _units_settable = False
+    refers_to_items = True
     _valid_repr_codes = (RepC.OBNAME, RepC.OBJREF)
     _default_repr_code: Union[RepC, None] = RepC.OBNAME
 
@@ -44,7 +48,11 @@ class EFLRAttribute(Attribute):
         super().__init__(label=label, **kwargs)
 
         self._object_class = object_class
-        self._converter = self._convert_value
+
+    def _convert_single(self, value: Any) -> Any:
+        """Check that the value is an EFLRItem of the right type."""
+
+        return self._convert_value(value)
 
     def _convert_value(self, v: EFLRItem) -> EFLRItem:
         """Implements default converter/checker for the value(s). Check that the value is an EFLRObject."""
@@ -58,6 +66,8 @@ class EFLRAttribute(Attribute):
 class EFLROrTextAttribute(EFLRAttribute):
     """Model an Attribute whose value might be an EFLRItem instance or a string."""
 
+    __slots__ = ()
+
     _valid_repr_codes = (RepC.OBNAME, RepC.ASCII)
     _default_repr_code = None
 
@@ -105,6 +115,8 @@ class EFLROrTextAttribute(EFLRAttribute):
 class DTimeAttribute(Attribute):
     """Model an attribute whose value is a datetime object."""
 
+    __slots__ = ('_allow_float',)
+
     dtime_formats = ["%Y/%m/%d %H:%M:%S", "%Y.%m.%d %H:%M:%S"]  #: accepted date-time formats
     _valid_repr_codes = (RepC.DTIME, RepC.FDOUBL, RepC.FSINGL)
 
@@ -130,8 +142,12 @@ class DTimeAttribute(Attribute):
         self._allow_float = allow_float
         if not self._allow_float and not self._representation_code:
             self._representation_code = RepC.DTIME
-        if not self._converter:
-            self._converter = self._convert_value
+
+    def _convert_single(self, value: Any) -> Any:
+        """Convert the value using the custom converter (if provided at init) or parse it as date-time."""
+
+        conv = self._converter
+        return conv(value) if conv is not None else self._convert_value(value)
 
     def _convert_value(self, value: Union[str, datetime, int, float]) -> dtime_or_number_type:
         """Default value converter: parse string as date time or (if so specified at init) as a float."""
@@ -178,6 +194,8 @@ class DTimeAttribute(Attribute):
 class NumericAttribute(Attribute):
     """Model an attribute which can only have numerical values."""
 
+    __slots__ = ('_int_only', '_float_only')
+
     _valid_repr_codes = ReprCodeConverter.numeric_codes
 
     def __init__(self, *args: Any, int_only: bool = False, float_only: bool = False, **kwargs: Any) -> None:
@@ -201,17 +219,12 @@ class NumericAttribute(Attribute):
 
         super().__init__(*args, **kwargs)
 
-        if not self._converter:
-            self._converter = self._convert_number
-        else:
-            custom_converter = self._converter
+    def _convert_single(self, value: Any) -> Any:
+        """Convert the value to a number; then apply the custom converter (if provided at init)."""
 
-            def converter(number: number_type) -> number_type:
-                number = self._convert_number(number)
-                number = custom_converter(number)
-                return number
-
-            self._converter = converter
+        number = self._convert_number(value)
+        conv = self._converter
+        return conv(number) if conv is not None else number
 
     def _check_repr_code_numeric(self, rc: Union[RepC, None]) -> None:
         """Check that the provided representation code, if not None, is of appropriate numerical type."""
@@ -257,10 +270,35 @@ class NumericAttribute(Attribute):
 
         return self._float_parser(value)
 
+    def _convert_array(self, value: np.ndarray) -> Any:
+        """Validate a numpy array, analogously to '_convert_number' for individual values.
+
+        If integers are required, float arrays are converted to integer ones (if all values are integers).
+        Otherwise, integer arrays are converted to float64 ones, while float arrays keep their dtype.
+        """
+
+        arr = super()._convert_array(value)
+        if not isinstance(arr, np.ndarray):
+            return arr
+
+        if self._int_only or self._representation_code in ReprCodeConverter.int_codes:
+            if arr.dtype.kind == 'f':
+                if not np.array_equal(arr, np.trunc(arr)):
+                    raise ValueError(f"Values of the array cannot all be represented as integers in {self}")
+                arr = arr.astype(ReprCodeConverter.determine_supported_numpy_dtype(arr.astype(np.int64)))
+            return arr
+
+        if arr.dtype.kind != 'f':
+            return arr.astype(np.float64)
+
+        return arr
+
 
 class DimensionAttribute(NumericAttribute):
     """Model an attribute expressing dimensions (e.g. dimension or element_limit of Channel)."""
 
+    __slots__ = ()
+
     _units_settable = False
     _valid_repr_codes = (RepC.UVARI,)
     _default_repr_code = RepC.UVARI
@@ -282,6 +320,8 @@ class DimensionAttribute(NumericAttribute):
 class StatusAttribute(Attribute):
     """Model an attribute which can only have value 1 or 0."""
 
+    __slots__ = ()
+
     _units_settable = False
     _valid_repr_codes = (RepC.STATUS,)
     _default_repr_code = RepC.STATUS
@@ -319,6 +359,8 @@ class StatusAttribute(Attribute):
 class TextAttribute(Attribute):
     """Model an attribute representing text in ASCII format."""
 
+    __slots__ = ()
+
     _units_settable = False
     _valid_repr_codes = (RepC.ASCII,)
     _default_repr_code = RepC.ASCII
@@ -346,6 +388,8 @@ class TextAttribute(Attribute):
 class IdentAttribute(Attribute):
     """Model an attribute represented as IDENT."""
 
+    __slots__ = ()
+
     _units_settable = False
     _valid_repr_codes = (RepC.IDENT,)
     _default_repr_code = RepC.IDENT
@@ -364,6 +408,8 @@ class IdentAttribute(Attribute):
 class PropertiesAttribute(IdentAttribute):
     """Model an attribute representing properties of DLIS objects - Channel, Computation, and Process."""
 
+    __slots__ = ()
+
     def __init__(self, label: str) -> None:
         super().__init__(
             label,
@@ -1,10 +1,9 @@
 import logging
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Union, Optional, Generator
 import numpy as np
 
 from dliswriter.utils.internal.struct_writer import write_struct_obname
-from dliswriter.logical_record.core.attribute.attribute import Attribute
+from dliswriter.logical_record.core.attribute.attribute import Attribute, attribute_body_spec_type, write_attribute_body
 from dliswriter.utils.internal.value_checkers import validate_string
 from dliswriter.utils import enums
 
@@ -15,6 +14,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_unset = object()  # marker of slots without a value
+_initialising = object()  # value of '_source' of items whose EFLRItem.__init__ has not finished (see __setattr__)
+
+#: OBNAME bytes of an EFLRItem and descriptions of its attributes; see EFLRItem.make_body_spec
+item_body_spec_type = tuple[bytes, list[attribute_body_spec_type]]
+
 
 class AttrSetup:
     """Convenience class to pass setup for an Attribute without creating a dictionary."""
@@ -36,9 +41,25 @@ class AttrSetup:
 
 
 class EFLRItem:
-    """Model an item belonging to an Explicitly Formatted Logical Record - e.g. a particular channel."""
+    """Model an item belonging to an Explicitly Formatted Logical Record - e.g. a particular channel.
+
+    Subclasses are expected to define __slots__, listing the names of their Attributes (in the order in which they
+    should appear in the file) and of any other instance attributes. The names of the Attributes of a subclass
+    (its attribute schema) are determined once per subclass, when the first instance is created.
+    """
+
+    __slots__ = ('_name', '_parent', '_origin_reference', '_copy_number', '_obname', '_source')
 
     parent_eflr_class: type["EFLRSet"] = NotImplemented
+    _attribute_names: tuple[str, ...]  # names of the Attributes of the subclass; see '_get_attribute_names'
+    _clone_schema: tuple[tuple[str, ...], tuple[str, ...]]  # see '_get_clone_schema'
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "EFLRItem":
+        """Create an instance, marked as being initialised until the end of EFLRItem.__init__ (see __setattr__)."""
+
+        new = super().__new__(cls)
+        object.__setattr__(new, '_source', _initialising)
+        return new
 
     def __init__(self, name: str, parent: "EFLRSet", origin_reference: Optional[int] = None, **kwargs: Any) -> None:
         """Initialise an EFLRItem.
@@ -57,7 +78,7 @@ class EFLRItem:
 
         """
 
-        self.name = validate_string(name)    #: name of the item
+        self._name = validate_string(name)    #: name of the item
 
         self._check_parent(parent)
         self._parent = parent  #: EFLRSet instance this item belongs to
@@ -69,11 +90,34 @@ class EFLRItem:
         #: copy number of the item - ith EFLRItem of the same name and type
         self._copy_number = self._compute_copy_number()
 
-        for attribute in self.attributes.values():
-            attribute.parent_eflr = self
+        self._obname: Optional[bytes] = None
+
+        for attr_name in self._get_attribute_names(self):
+            getattr(self, attr_name).parent_eflr = self
 
         self.set_attributes(**{k: v for k, v in kwargs.items() if v is not None})
 
+        self._source = None  #: item this one was cloned from (see 'clone'); None also marks the end of __init__
+
+    @property
+    def name(self) -> str:
+        """Name of the item. This will be the name it is stored with in the created DLIS file."""
+
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        """Set a new name of the item. Update the name index of the parent EFLRSet.
+
+        Note: the copy number of the item is not changed.
+        """
+
+        previous_name = self._name
+        self._name = validate_string(name)
+        self._obname = None
+        self._parent.rename_item(self, previous_name)
+        self._parent.mark_modified(references_changed=True)
+
     @property
     def parent(self) -> "EFLRSet":
         """EFLRSet instance that this EFLRItem is a part of."""
@@ -96,7 +140,11 @@ class EFLRItem:
     def origin_reference(self, v: int) -> None:
         """Set a new origin reference (point to a different Origin)."""
 
+        previous_origin_reference = self._origin_reference
         self._origin_reference = self._validate_origin_reference(v)
+        if self._origin_reference != previous_origin_reference:
+            self._obname = None
+            self._parent.mark_modified(references_changed=True)
 
     @staticmethod
     def _validate_origin_reference(v: Union[int, None], allow_none: bool = False) -> Union[int, None]:
@@ -116,8 +164,7 @@ class EFLRItem:
     def _compute_copy_number(self) -> int:
         """Compute copy number of this ELFRItem, i.e. how many other objects of the same type and name there are."""
 
-        items_with_the_same_name = filter(lambda o: o.name == self.name, self.parent.get_all_eflr_items())
-        return len(list(items_with_the_same_name)) - 1
+        return self.parent.count_items_with_name(self.name) - 1
 
     @classmethod
     def _check_parent(cls, parent: "EFLRSet") -> None:
@@ -134,11 +181,118 @@ class EFLRItem:
             raise TypeError(f"Expected an instance of {cls.parent_eflr_class.__name__}; "
                             f"got a {type(parent)}: {parent}")
 
+    @classmethod
+    def _get_attribute_names(cls, instance: "EFLRItem") -> tuple[str, ...]:
+        """Names of the Attributes defined for this EFLRItem subclass, determined from an instance of the subclass.
+
+        The names are determined once per subclass and stored in the subclass. Attributes kept in the instance
+        __dict__ (e.g. in subclasses not defining __slots__) come first, followed by the ones defined in __slots__
+        of the subclass and its base classes.
+        """
+
+        names = cls.__dict__.get('_attribute_names')
+        if names is None:
+            candidates = list(getattr(instance, '__dict__', {}))
+            for klass in cls.__mro__:
+                slots = klass.__dict__.get('__slots__', ())
+                candidates.extend((slots,) if isinstance(slots, str) else slots)
+            names = tuple(n for n in candidates if isinstance(getattr(instance, n, None), Attribute))
+            cls._attribute_names = names
+
+        return names
+
+    @classmethod
+    def _get_clone_schema(cls, instance: "EFLRItem") -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Names of the slots other than Attributes and names of the Attributes which might refer to other items.
+
+        The names are determined once per subclass (from an instance of the subclass); they are used in 'clone'.
+        """
+
+        schema = cls.__dict__.get('_clone_schema')
+        if schema is None:
+            attribute_names = cls._get_attribute_names(instance)
+            slot_names = tuple(n for klass in cls.__mro__ for n in klass.__dict__.get('__slots__', ())
+                               if n not in attribute_names)
+            reference_names = tuple(n for n in attribute_names if getattr(instance, n).refers_to_items)
+            schema = cls._clone_schema = (slot_names, reference_names)
+        return schema
+
+    def clone(self, parent: "EFLRSet", references: list[Attribute], lazy: bool = False) -> "EFLRItem":
+        """Create a copy of the item, registered with the given parent EFLRSet.
+
+        The copy is made without calling __init__: the instance attributes are copied and the Attributes are copied
+        shallowly (see Attribute.copy), so that the values are shared with the original item. Name, origin reference,
+        and copy number are the same as those of the original item.
+
+        Args:
+            parent      :   EFLRSet the copy should be registered with.
+            references  :   List to which the Attributes of the copy referring to other EFLRItems are appended,
+                            so that the references can be redirected to the copies of those items (see
+                            'redirect_references').
+            lazy        :   If True, Attributes which do not refer to other items are only copied when first
+                            accessed. The original item must then not be modified (e.g. it is part of a template).
+        """
+
+        cls = self.__class__
+        new = cls.__new__(cls)
+        set_attr = object.__setattr__  # bypass the guard of Attribute instances (see __setattr__)
+        slot_names, reference_names = self._get_clone_schema(self)
+
+        for name in slot_names:
+            if (value := getattr(self, name, _unset)) is not _unset:
+                set_attr(new, name, value)
+        if (instance_dict := getattr(self, '__dict__', None)) is not None:
+            new.__dict__.update(instance_dict)
+
+        for name in (reference_names if lazy else self._get_attribute_names(self)):
+            attr = getattr(self, name)
+            if lazy and attr.value is None:
+                continue  # nothing to redirect; copied on access like the other Attributes
+            attr = attr.copy(parent_eflr=new)
+            set_attr(new, name, attr)
+            if name in reference_names and attr.value is not None:
+                references.append(attr)
+
+        set_attr(new, '_source', self if lazy else None)
+        set_attr(new, '_parent', parent)
+        parent.register_item(new)
+
+        return new
+
+    if not TYPE_CHECKING:  # keep type checking of (misspelled) attribute names
+        def __getattr__(self, name: str) -> Any:
+            """Copy an Attribute of the source item on first access (for items cloned lazily; see 'clone')."""
+
+            if name != '_source' and isinstance(source := getattr(self, '_source', None), EFLRItem) \
+                    and name in self.__class__.__dict__.get('_attribute_names', ()):
+                attr = getattr(source, name).copy(parent_eflr=self)
+                object.__setattr__(self, name, attr)
+                return attr
+
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    @staticmethod
+    def redirect_references(references: list[Attribute], mapping: dict[int, "EFLRItem"]) -> None:
+        """Make Attributes refer to the copies of EFLRItems rather than the original ones.
+
+        Args:
+            references  :   Attributes whose values are (or include) EFLRItems.
+            mapping     :   Mapping of IDs of the original EFLRItems on their copies. Items not included
+                            in the mapping are kept as they are.
+        """
+
+        for attr in references:
+            value = attr.value
+            if isinstance(value, EFLRItem):
+                attr._value = mapping.get(id(value), value)
+            elif isinstance(value, (list, tuple)):
+                attr._value = tuple(mapping.get(id(v), v) if isinstance(v, EFLRItem) else v for v in value)
+
     @property
     def attributes(self) -> dict[str, Attribute]:
         """Attributes defined for this EFLRItem (sub)class with its values for the current instance."""
 
-        return {key: value for key, value in self.__dict__.items() if isinstance(value, Attribute)}
+        return {name: getattr(self, name) for name in self._get_attribute_names(self)}
 
     def __str__(self) -> str:
         """Description of the EFLRItem instance."""
@@ -151,45 +305,62 @@ class EFLRItem:
         This prevents overwriting Attribute instances being attributes of this EFLRItem. ValueError is raised at such
         attempt. If only a value of the Attribute instance is supposed to be changed, the Attribute's 'value' attribute
         should be used instead.
+
+        Once the attribute schema of the subclass is known, only the names included in it are checked.
+        The Attributes defined in __init__ (before EFLRItem.__init__ finishes) are not checked: looking up
+        the unset slots is a considerable part of the cost of creating an item.
         """
 
-        if isinstance(getattr(self, key, None), Attribute):
-            raise RuntimeError(f"Cannot set DLIS Attribute '{key}'. Did you mean setting '{key}.value' instead?")
+        if self._source is not _initialising:
+            names = self.__class__.__dict__.get('_attribute_names')
+            if (names is None or key in names) and isinstance(getattr(self, key, None), Attribute):
+                raise RuntimeError(f"Cannot set DLIS Attribute '{key}'. Did you mean setting '{key}.value' instead?")
 
-        return super().__setattr__(key, value)
+        object.__setattr__(self, key, value)
 
-    @cached_property
+    @property
     def obname(self) -> bytes:
         """Create OBNAME bytes of this item - bytes used to identify an item in the file.
 
         They serve as a reference to the current item - e.g. when a Parameter references a Zone.
+        The bytes are computed once, on the first access.
         """
 
-        return write_struct_obname(self)
+        if self._obname is None:
+            self._obname = write_struct_obname(self)
+        return self._obname
 
-    def _make_attrs_bytes(self) -> bytes:
-        """Create bytes describing the values of the EFLRItem instance's Attributes."""
+    def _make_attribute_specs(self) -> list[attribute_body_spec_type]:
+        """Describe the values of the EFLRItem instance's Attributes (see Attribute.make_body_spec)."""
 
-        _bytes = b''
-        for attr in self.attributes.values():
-            if attr.value is None:
-                _bytes += b'\x00'
-            else:
-                _bytes += attr.get_as_bytes()
-
-        return _bytes
+        return [getattr(self, name).make_body_spec() for name in self._get_attribute_names(self)]
 
     def _run_checks_and_set_defaults(self) -> None:
         """Called before writing the item's bytes. Set default values to some attributes if they were not set at all."""
 
         pass
 
-    def make_item_body_bytes(self) -> bytes:
-        """Create bytes describing the item: its name and values of its attributes."""
+    def make_body_spec(self) -> item_body_spec_type:
+        """Describe the item - its name and values of its attributes - in a compact, picklable form.
+
+        The defaults are set (see '_run_checks_and_set_defaults') before the description is made.
+        The bytes of the item are created from the description by 'write_item_body_from_spec'.
+        """
 
         self._run_checks_and_set_defaults()
+        return self.obname, self._make_attribute_specs()
+
+    def write_item_body(self, buffer: bytearray) -> None:
+        """Append bytes describing the item - its name and values of its attributes - to the buffer."""
 
-        return b'p' + self.obname + self._make_attrs_bytes()
+        write_item_body_from_spec(buffer, self.make_body_spec())
+
+    def make_item_body_bytes(self) -> bytes:
+        """Create bytes describing the item: its name and values of its attributes."""
+
+        buffer = bytearray()
+        self.write_item_body(buffer)
+        return bytes(buffer)
 
     def set_attributes(self, **kwargs: Any) -> None:
         """Set the values and other characteristics of the EFLRItem's attributes.
@@ -204,10 +375,13 @@ class EFLRItem:
         or maximum_value.value respectively) is set to the value of the keyword argument.
         """
 
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         def set_value(_attr: Attribute, _value: Any, _key: str = 'value') -> None:
             """Set 'value' or 'units' of the provided Attribute instance."""
 
-            logger.debug(f"Setting {_attr.label}.{_key} of {self} to {repr(_value)}")
+            if debug:
+                logger.debug(f"Setting {_attr.label}.{_key} of {self} to {repr(_value)}")
             setattr(_attr, _key, _value)
 
         for attr_name, attr_value in kwargs.items():
@@ -239,9 +413,34 @@ class EFLRItem:
         return value_counts
 
 
+def write_item_body_from_spec(buffer: bytearray, spec: item_body_spec_type) -> None:
+    """Append bytes of an EFLRItem described by the spec (see EFLRItem.make_body_spec) to the buffer."""
+
+    obname, attribute_specs = spec
+
+    buffer += b'p'
+    buffer += obname
+    for attribute_spec in attribute_specs:
+        write_attribute_body(buffer, attribute_spec)
+
+
+def encode_item_bodies(specs: list[item_body_spec_type]) -> bytes:
+    """Create bytes of multiple EFLRItems described by the specs (see EFLRItem.make_body_spec).
+
+    The function only depends on its (picklable) arguments, so that it can be run in a worker process.
+    """
+
+    buffer = bytearray()
+    for spec in specs:
+        write_item_body_from_spec(buffer, spec)
+    return bytes(buffer)
+
+
 class DimensionedItem:
     """Mixin to be used with EFLRItem subclasses which define 'axis' and 'dimension' Attributes."""
 
+    __slots__ = ()
+
     axis: Attribute
     dimension: "DimensionAttribute"
 
@@ -267,7 +466,7 @@ class DimensionedItem:
                 raise RuntimeError(f"{self}: number of coordinates in axis {i+1} ({nc}) does not match the "
                                    f"dimension {i+1} ({dims[i]})")
 
-    def _check_or_set_value_dimensionality(self, value: Union[list, tuple, None],
+    def _check_or_set_value_dimensionality(self, value: Union[list, tuple, np.ndarray, None],
                                            value_label: Optional[str] = None) -> None:
         """Determine the dimensionality (shape) of a value. Verify or set up the 'dimension' attr based on that."""
 
@@ -277,13 +476,14 @@ class DimensionedItem:
         value_label = value_label or 'value'
 
         try:
-            arr = np.array(value)
+            arr = np.asarray(value)
         except ValueError:
             raise RuntimeError(f"{self}: {value_label} {value} does not have a regular dimensionality structure")
 
         dim_from_value = list(arr.shape[1:])
         if self.dimension.value is not None:
-            if dim_from_value != self.dimension.value:
+            # single-element values have dimension [1] (set as default), even though their shape is ()
+            if (dim_from_value or [1]) != (list(self.dimension.value) or [1]):  # might be a tuple (Attribute.copy)
                 raise RuntimeError(f"{self}: shape of {value_label} {value} (shape {arr.shape}) does not match "
                                    f"the specified dimensionality: {self.dimension.value}")
         else:
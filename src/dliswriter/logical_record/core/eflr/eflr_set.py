@@ -1,10 +1,13 @@
 import logging
-from typing import Optional
+from typing import Optional, Iterator
 
 from dliswriter.utils.internal.struct_writer import write_struct_ascii
 from dliswriter.utils.internal.internal_enums import EFLRType
+from dliswriter.utils.internal.types import bytes_type
+from dliswriter.configuration import global_config
 from dliswriter.logical_record.core.logical_record import LogicalRecord
 from dliswriter.logical_record.core.eflr.eflr_item import EFLRItem
+from dliswriter.logical_record.core.attribute.attribute import Attribute
 
 
 logger = logging.getLogger(__name__)
@@ -32,6 +35,13 @@ class EFLRSet(LogicalRecord):
         self._set_type_struct = write_struct_ascii(self.set_type)  # used in the header
         self._eflr_item_list: list[EFLRItem] = []  # instances of EFLRItem registered with this EFLRSet instance
 
+        # index of the registered items by name (items of each name in the order of registration/renaming)
+        self._eflr_items_by_name: dict[str, list[EFLRItem]] = {}
+
+        # encoded body shared with the set this one was cloned from (and its other clones) as long as it is unmodified
+        self._shared_body: Optional[list[Optional[bytes]]] = None
+        self._linked_sets: list[EFLRSet] = []  # sets cloned together with this one (which might refer to its items)
+
     def __str__(self) -> str:
         """Represent the EFLRSet instance as str."""
 
@@ -47,34 +57,109 @@ class EFLRSet(LogicalRecord):
 
         return _bytes
 
-    def _make_template_bytes(self) -> bytes:
-        """Create bytes describing the attribute template of this EFLR.
+    def _write_template(self, buffer: bytearray) -> None:
+        """Append bytes describing the attribute template of this EFLR to the buffer.
 
-        Note: if no EFLRItems are registered, this will return an empty bytes object."""
+        Note: if no EFLRItems are registered, nothing is appended."""
 
-        _bytes = b''
         if self._eflr_item_list:
             child0 = self._eflr_item_list[0]
             for attr in child0.attributes.values():
-                _bytes += attr.get_as_bytes(for_template=True)
+                attr.write_to(buffer, for_template=True)
 
-        return _bytes
+    def _make_template_bytes(self) -> bytes:
+        """Create bytes describing the attribute template of this EFLR.
+
+        Note: if no EFLRItems are registered, this will return an empty bytes object."""
+
+        buffer = bytearray()
+        self._write_template(buffer)
+        return bytes(buffer)
 
-    def _make_body_bytes(self) -> bytes:
+    def _make_body_bytes(self) -> bytes_type:
         """Create bytes describing the body of this EFLRSet - the values of attributes of the registered EFLRItems.
 
+        All parts are appended to a single buffer, so that the time needed is linear in the size of the set
+        and the bytes are not copied over and over. The buffer (a bytearray) is returned as is.
         If no EFLRItems are registered, this will return an empty bytes object.
+
+        If a ParallelEFLREncoder is active (see 'parallel_eflr_encoding_scope'), items of large sets are encoded
+        in worker processes.
         """
 
-        eflr_items = self.get_all_eflr_items()
-        if not eflr_items:
+        if not self._eflr_item_list:
             return b''
 
-        bts = self._make_set_component_bytes() + self._make_template_bytes()
-        for ei in eflr_items:
-            bts += ei.make_item_body_bytes()
+        shared_body = self._shared_body
+        if shared_body is not None and shared_body[0] is not None:
+            return shared_body[0]
+
+        buffer = bytearray(self._make_set_component_bytes())
+        self._write_template(buffer)
+
+        encoder = global_config.eflr_encoder
+        if encoder is not None and len(self._eflr_item_list) >= encoder.min_items:
+            buffer += encoder.encode_items(self._eflr_item_list)
+        else:
+            for ei in self._eflr_item_list:
+                ei.write_item_body(buffer)
+
+        if shared_body is not None and self._shared_body is shared_body:  # not modified while writing the items
+            shared_body[0] = bytes(buffer)
+
+        return buffer
+
+    @property
+    def shares_encoded_body(self) -> bool:
+        """True if the encoded body of the set is shared with other sets (see 'clone'); False otherwise."""
+
+        return self._shared_body is not None
+
+    def share_encoded_body(self) -> None:
+        """Allow the encoded body of this set to be shared with its clones as long as they are not modified.
+
+        The set itself should not be modified afterwards; it is meant to be used as a template.
+        """
+
+        if self._shared_body is None:
+            self._shared_body = [None]
 
-        return bts
+    def mark_modified(self, references_changed: bool = False) -> None:
+        """Mark the set as modified, so that its encoded body is no longer shared with other sets.
+
+        Args:
+            references_changed  :   If True, name or origin reference of one of the items has changed, which
+                                    changes the bytes of the sets referring to it; the linked sets (sets cloned
+                                    together with this one) are marked modified as well.
+        """
+
+        self._shared_body = None
+        if references_changed:
+            for eflr_set in self._linked_sets:
+                eflr_set._shared_body = None
+
+    def _make_empty_copy(self) -> "EFLRSet":
+        """Create a new, empty set of the same type and name."""
+
+        return self.__class__(set_name=self.set_name)
+
+    def clone(self, mapping: dict[int, EFLRItem], references: list[Attribute], lazy: bool = False) -> "EFLRSet":
+        """Create a copy of the set and its items (see EFLRItem.clone).
+
+        If the set shares its encoded body (see 'share_encoded_body'), the copy shares it too.
+
+        Args:
+            mapping     :   Dictionary to which the mapping of IDs of the original items on their copies is added.
+            references  :   List to which the Attributes of the copies referring to other items are appended.
+            lazy        :   If True, Attributes of the items are only copied when needed (see EFLRItem.clone).
+        """
+
+        new = self._make_empty_copy()
+        for item in self._eflr_item_list:
+            mapping[id(item)] = item.clone(new, references, lazy=lazy)
+
+        new._shared_body = self._shared_body
+        return new
 
     def register_item(self, child: EFLRItem) -> None:
         """Register a child EFLRItem with this EFLRSet."""
@@ -83,12 +168,45 @@ class EFLRSet(LogicalRecord):
             raise TypeError(f"Expected an instance of {self.item_type}; got {type(child)}: {child}")
 
         self._eflr_item_list.append(child)
+        self._eflr_items_by_name.setdefault(child.name, []).append(child)
+        self._shared_body = None
 
     def get_all_eflr_items(self) -> list[EFLRItem]:
         """Return a list of all EFLRItem instances registered with this EFLRSet instance."""
 
         return self._eflr_item_list[:]  # copy
 
+    def iter_eflr_items(self) -> Iterator[EFLRItem]:
+        """Iterate over the EFLRItem instances registered with this EFLRSet instance, without copying the list.
+
+        Items must not be registered while the iterator is being consumed.
+        """
+
+        return iter(self._eflr_item_list)
+
+    def count_items_with_name(self, name: str) -> int:
+        """Number of EFLRItem instances with the given name registered with this EFLRSet instance."""
+
+        return len(self._eflr_items_by_name.get(name, ()))
+
+    def get_eflr_item(self, name: str, copy_number: int = 0) -> Optional[EFLRItem]:
+        """Return the registered EFLRItem with the given name and copy number; None if there is no such item."""
+
+        for item in self._eflr_items_by_name.get(name, ()):
+            if item.copy_number == copy_number:
+                return item
+        return None
+
+    def rename_item(self, child: EFLRItem, previous_name: str) -> None:
+        """Update the name index after a registered EFLRItem has been renamed."""
+
+        items = self._eflr_items_by_name[previous_name]
+        items.remove(child)
+        if not items:
+            del self._eflr_items_by_name[previous_name]
+
+        self._eflr_items_by_name.setdefault(child.name, []).append(child)
+
     @property
     def n_items(self) -> int:
         """Number of EFLRItem instances registered with this EFLRSet instance."""
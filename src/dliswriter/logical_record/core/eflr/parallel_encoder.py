@@ -0,0 +1,143 @@
+import logging
+from collections import deque
+from concurrent.futures import Executor, Future
+from contextlib import contextmanager
+from typing import Any, Generator, Optional, Sequence
+from typing_extensions import Self
+
+from dliswriter.configuration import eflr_encoder_context
+from dliswriter.logical_record.core.eflr.eflr_item import EFLRItem, encode_item_bodies
+
+
+logger = logging.getLogger(__name__)
+
+
+class ParallelEFLREncoder:
+    """Encode items of large EFLR sets in a pool of worker processes.
+
+    The items are described in the main process (EFLRItem.make_body_spec) - this is also where the defaults are set
+    and the checks are run, so that any errors are raised as in serial encoding. The descriptions are compact
+    and picklable: values of the attributes together with their representation codes and units (references to other
+    items are encoded right away). Batches of the descriptions are encoded in the workers, while the main process
+    prepares the next batches. The encoded batches are concatenated in the original order; the result is identical
+    to the bytes created by serial encoding.
+
+    Only the conversion of the values to bytes is done in the workers, so the speed-up is limited: describing
+    the items takes roughly as long as encoding them.
+    """
+
+    def __init__(self, n_workers: int, min_items: int = 2000, batch_size: Optional[int] = None,
+                 executor: Optional[Executor] = None) -> None:
+        """Initialise ParallelEFLREncoder.
+
+        Args:
+            n_workers   :   Number of worker processes.
+            min_items   :   Minimal number of items of a set for the items to be encoded in parallel.
+                            Smaller sets are encoded serially (the overhead would outweigh the gain).
+            batch_size  :   Number of items encoded in a single task. By default, the items of each set are split
+                            into 4 batches per worker (with at least 250 items in a batch).
+            executor    :   Executor to run the encoding in. If not provided, a ProcessPoolExecutor is created
+                            (on first use) and shut down at 'close'.
+        """
+
+        if not isinstance(n_workers, int) or n_workers < 1:
+            raise ValueError(f"Number of workers must be a positive integer; got {n_workers}")
+        if not isinstance(min_items, int) or min_items < 1:
+            raise ValueError(f"Minimal number of items must be a positive integer; got {min_items}")
+        if batch_size is not None and (not isinstance(batch_size, int) or batch_size < 1):
+            raise ValueError(f"Batch size must be a positive integer; got {batch_size}")
+
+        self._n_workers = n_workers
+        self._min_items = min_items
+        self._batch_size = batch_size
+
+        self._own_executor = executor is None
+        self._executor = executor
+        self._n_encoded_sets = 0
+
+    @property
+    def min_items(self) -> int:
+        """Minimal number of items of a set for the items to be encoded in parallel."""
+
+        return self._min_items
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor  # imported on first use, to speed up package import
+            self._executor = ProcessPoolExecutor(max_workers=self._n_workers)
+        return self._executor
+
+    def _get_batch_size(self, n_items: int) -> int:
+        if self._batch_size is not None:
+            return self._batch_size
+        return max(250, -(-n_items // (4 * self._n_workers)))
+
+    def encode_items(self, items: Sequence[EFLRItem]) -> bytes:
+        """Create bytes of the items (see EFLRItem.write_item_body), encoding batches of them in the workers.
+
+        At most two batches per worker are submitted at a time, which keeps the memory usage bounded.
+        """
+
+        executor = self._get_executor()
+        batch_size = self._get_batch_size(len(items))
+        max_pending = 2 * self._n_workers
+
+        pending: deque[Future] = deque()
+        parts: list[bytes] = []
+
+        try:
+            for start in range(0, len(items), batch_size):
+                specs = [item.make_body_spec() for item in items[start:start + batch_size]]
+                pending.append(executor.submit(encode_item_bodies, specs))
+                if len(pending) >= max_pending:
+                    parts.append(pending.popleft().result())
+
+            while pending:
+                parts.append(pending.popleft().result())
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+        self._n_encoded_sets += 1
+        return b''.join(parts)
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context; the executor is shut down when the context is exited."""
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the runtime context; shut down the executor."""
+
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the executor (if created by this object)."""
+
+        if self._own_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        logger.debug(f"Parallel EFLR encoding finished; items of {self._n_encoded_sets} set(s) encoded in parallel")
+
+
+@contextmanager
+def parallel_eflr_encoding_scope(encoder: Optional[ParallelEFLREncoder]) -> Generator:
+    """Context manager. Use the given ParallelEFLREncoder for encoding large EFLR sets within the scope of the context.
+
+    If the encoder is None, EFLR sets are encoded serially. On exit, the encoder is closed and the previously
+    used one (if any) is restored.
+
+    The encoder is set for the current execution context only (e.g. the current thread): writes running concurrently
+    in other threads use their own encoders.
+    """
+
+    token = eflr_encoder_context.set(encoder)
+
+    try:
+        yield encoder
+    finally:
+        eflr_encoder_context.reset(token)
+        if encoder is not None:
+            encoder.close()
@@ -3,6 +3,7 @@ from typing import Optional, Generator
 
 from dliswriter.logical_record.core.logical_record.segment_attributes import SegmentAttributes
 from dliswriter.utils.internal.internal_enums import RepresentationCode as RepC
+from dliswriter.utils.internal.types import bytes_type
 
 
 logger = logging.getLogger(__name__)
@@ -13,7 +14,7 @@ class LogicalRecordBytes:
 
     padding: bytes = RepC.USHORT.convert(1)  #: padding byte added if the number of bytes in a segment is odd
 
-    def __init__(self, bts: bytes, lr_type_struct: bytes, is_eflr: bool = False):
+    def __init__(self, bts: bytes_type, lr_type_struct: bytes, is_eflr: bool = False):
         """Initialise a LogicalRecordBytes object.
 
         Args:
@@ -29,7 +30,7 @@ class LogicalRecordBytes:
         self._is_eflr = is_eflr
 
     @property
-    def bts(self) -> bytes:
+    def bts(self) -> bytes_type:
         """Bytes describing a logical record."""
 
         return self._bts
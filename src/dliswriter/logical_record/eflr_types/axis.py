@@ -9,6 +9,8 @@ from dliswriter.utils.internal.value_checkers import validate_string, convert_ma
 class AxisItem(EFLRItem):
     """Model an object being part of Axis EFLR."""
 
+    __slots__ = ('axis_id', 'coordinates', 'spacing')
+
     parent: "AxisSet"
 
     def __init__(self, name: str, parent: "AxisSet", **kwargs: Any) -> None:
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class CalibrationItem(EFLRItem):
     """Model an object being part of Calibration EFLR."""
 
+    __slots__ = ('calibrated_channels', 'uncalibrated_channels', 'coefficients', 'measurements', 'parameters', 'method')
+
     parent: "CalibrationSet"
 
     def __init__(self, name: str, parent: "CalibrationSet", **kwargs: Any) -> None:
@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class CalibrationCoefficientItem(EFLRItem):
     """Model an object being part of CalibrationCoefficient EFLR."""
 
+    __slots__ = ('label', 'coefficients', 'references', 'plus_tolerances', 'minus_tolerances')
+
     parent: "CalibrationCoefficientSet"
 
     def __init__(self, name: str, parent: "CalibrationCoefficientSet", **kwargs: Any) -> None:
@@ -16,6 +16,10 @@ logger = logging.getLogger(__name__)
 class CalibrationMeasurementItem(EFLRItem, DimensionedItem):
     """Model an object being part of CalibrationMeasurement EFLR."""
 
+    __slots__ = ('phase', 'measurement_source', 'type', 'dimension', 'axis', 'measurement', 'sample_count',
+                 'maximum_deviation', 'standard_deviation', 'begin_time', 'duration', 'reference', 'standard',
+                 'plus_tolerance', 'minus_tolerance')
+
     parent: "CalibrationMeasurementSet"
 
     def __init__(self, name: str, parent: "CalibrationMeasurementSet", **kwargs: Any) -> None:
@@ -1,7 +1,6 @@
 import logging
-from typing import Union, Optional, Any
+from typing import Union, Optional, Any, TYPE_CHECKING
 import numpy as np
-from h5py import Dataset  # type: ignore  # untyped library
 
 from dliswriter.logical_record.core.eflr import EFLRSet, EFLRItem, DimensionedItem
 from dliswriter.logical_record.eflr_types.axis import AxisSet
@@ -9,10 +8,16 @@ from dliswriter.logical_record.eflr_types.long_name import LongNameSet
 from dliswriter.utils.internal.internal_enums import RepresentationCode as RepC, EFLRType
 from dliswriter.utils.enums import Unit
 from dliswriter.utils.internal.converters import ReprCodeConverter
-from dliswriter.utils.internal.types import numpy_dtype_type
+from dliswriter.utils.internal.types import numpy_dtype_type, number_type
 from dliswriter.logical_record.core.attribute import (Attribute, DimensionAttribute, EFLRAttribute, NumericAttribute,
                                                       IdentAttribute, EFLROrTextAttribute, PropertiesAttribute)
 from dliswriter.utils.source_data_wrappers import SourceDataWrapper
+from dliswriter.utils.internal.channel_statistics import ChannelStatistics
+from dliswriter.utils.channel_transform import ChannelTransform
+from dliswriter.utils.virtual_channel import VirtualChannel
+
+if TYPE_CHECKING:
+    from h5py import Dataset  # type: ignore  # untyped library
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +29,15 @@ class ReprCodeAttribute(Attribute):
     from its data.
     """
 
+    __slots__ = ()
+
     def __init__(self, parent_eflr: Optional[EFLRItem] = None) -> None:
-        super().__init__('representation_code', converter=self.no_set, representation_code=RepC.USHORT,
-                         parent_eflr=parent_eflr)
+        super().__init__('representation_code', representation_code=RepC.USHORT, parent_eflr=parent_eflr)
+
+    def _convert_single(self, value: Any) -> Any:
+        """Setting the value is not allowed (see 'no_set')."""
+
+        return self.no_set(value)
 
     def no_set(self, rc: Any) -> None:
         """Do not allow setting repr code of channel directly."""
@@ -36,26 +47,39 @@ class ReprCodeAttribute(Attribute):
     def set_from_dtype(self, dt: Union[numpy_dtype_type, None]) -> None:
         """Determine the correct representation code from a numpy dtype and set it as the Attribute's value."""
 
+        previous_value = self._value
         if dt is None:
             self._value = None
         else:
             self._value = ReprCodeConverter.determine_repr_code_from_numpy_dtype(dt)
+        self._check_modified(previous_value, self._value)
 
 
 class ChannelItem(EFLRItem, DimensionedItem):
     """Model an object being part of Channel EFLR."""
 
+    __slots__ = ('_cast_dtype', 'long_name', 'properties', 'representation_code', 'units', 'dimension', 'axis',
+                 'element_limit', 'source', 'minimum_value', 'maximum_value', '_dataset_name', '_statistics',
+                 '_absent_value', '_transform', '_virtual')
+
     parent: "ChannelSet"
 
     def __init__(self, name: str, parent: "ChannelSet", dataset_name: Optional[str] = None,
-                 cast_dtype: Optional[numpy_dtype_type] = None, **kwargs: Any) -> None:
+                 cast_dtype: Optional[numpy_dtype_type] = None, absent_value: Optional[number_type] = None,
+                 transform: Optional[ChannelTransform] = None, virtual: Optional[VirtualChannel] = None,
+                 **kwargs: Any) -> None:
         """Initialise ChannelItem.
 
         Args:
             name            :   Name of the ChannelItem.
             parent          :   Parent ChannelSet of this ChannelItem.
             dataset_name    :   Name of the data corresponding to this channel in the SourceDataWrapper.
-            cast_dtype      :   Numpy data type the channel data should be cast to.
+            cast_dtype      :   Numpy data type the channel data should be cast to. Data cast to float16
+                                are written as FSHORT (low precision float; 2 bytes per value).
+            absent_value    :   Value written in place of absent values (NaNs, masked values) of the channel data.
+            transform       :   Transform (e.g. unit conversion) applied to the channel data when they are written.
+            virtual         :   Virtual channel computing the channel data chunk by chunk (instead of reading them
+                                from the source data).
             **kwargs        :   Values of to be set as characteristics of the ChannelItem Attributes.
         """
 
@@ -73,11 +97,28 @@ class ChannelItem(EFLRItem, DimensionedItem):
         self.minimum_value = NumericAttribute('minimum_value', representation_code=RepC.FDOUBL, multivalued=True)
         self.maximum_value = NumericAttribute('maximum_value', representation_code=RepC.FDOUBL, multivalued=True)
 
+        # needed when registering the item with the parent set
+        self._dataset_name: Union[str, None] = dataset_name
+
+        # statistics of the channel's data, computed when the data are written (if requested)
+        self._statistics: Optional[ChannelStatistics] = None
+
+        self._absent_value = self.check_absent_value(absent_value)
+
+        self._transform: Optional[ChannelTransform] = None
+
+        self._virtual: Optional[VirtualChannel] = None
+
         super().__init__(name, parent=parent, **kwargs)
 
-        self._dataset_name: Union[str, None] = dataset_name
         self._set_cast_dtype(cast_dtype)
 
+        if transform is not None:
+            self.transform = transform
+
+        if virtual is not None:
+            self.virtual = virtual
+
     @property
     def dataset_name(self) -> str:
         """Name of the data corresponding to this channel in the SourceDataWrapper."""
@@ -88,7 +129,118 @@ class ChannelItem(EFLRItem, DimensionedItem):
     def dataset_name(self, name: str) -> None:
         """Set a new dataset name."""
 
+        previous_name = self.dataset_name
         self._dataset_name = name
+        self.parent.update_dataset_name(previous_name, self.dataset_name)
+
+    @property
+    def absent_value(self) -> Optional[number_type]:
+        """Value written in place of absent values of the channel data: NaNs and values masked in the source data.
+
+        If None, the absent value of the frame (if any) is used (see FrameItem.absent_value).
+        """
+
+        return self._absent_value
+
+    @absent_value.setter
+    def absent_value(self, value: Optional[number_type]) -> None:
+        """Set or remove the absent value of the channel."""
+
+        self._absent_value = self.check_absent_value(value)
+
+    @property
+    def transform(self) -> Optional[ChannelTransform]:
+        """Transform (scale, offset, clipping) applied to the channel data, chunk by chunk, when they are written.
+
+        The source data are not modified. If the channel data are of an integer type, the transformed values
+        are cast back to it (set 'cast_dtype' to a float type to avoid that). For a quantizing transform
+        (see ChannelTransform.quantization), 'cast_dtype' is set to the data type of the codes; unless the channel
+        has another source, the gain and offset of the codes are recorded as a Calibration Coefficient set as
+        the channel's source (at the latest when the file is written; see LogicalFile.add_channel).
+        """
+
+        return self._transform
+
+    @transform.setter
+    def transform(self, transform: Optional[ChannelTransform]) -> None:
+        """Set or remove the transform of the channel data; if it defines target units, set them as channel units."""
+
+        if transform is not None:
+            if not isinstance(transform, ChannelTransform):
+                raise TypeError(f"Expected a ChannelTransform; got {type(transform)}: {transform}")
+
+            if transform.to_unit is not None:
+                units = self.units.value
+                if units is not None and units not in (transform.from_unit, transform.to_unit):
+                    raise ValueError(f"Units of {self} ('{units}') do not match the units of the transform: "
+                                     f"'{transform.from_unit}' -> '{transform.to_unit}'")
+                if units != transform.to_unit:
+                    logger.debug(f"Setting units of {self} to '{transform.to_unit}'")
+                    self.units.value = transform.to_unit
+
+            if transform.quantized_dtype is not None:
+                logger.debug(f"Setting cast dtype of {self} to {transform.quantized_dtype} (quantized values)")
+                self._set_cast_dtype(transform.quantized_dtype.type)
+
+        self._transform = transform
+
+    @property
+    def virtual(self) -> Optional[VirtualChannel]:
+        """Virtual channel computing the channel data chunk by chunk, e.g. an evenly spaced index (if defined).
+
+        If defined, the channel data are not read from the source data (the channel's dataset is not used).
+        """
+
+        return self._virtual
+
+    @virtual.setter
+    def virtual(self, virtual: Optional[VirtualChannel]) -> None:
+        """Set or remove the virtual channel computing the channel data."""
+
+        if virtual is not None and not isinstance(virtual, VirtualChannel):
+            raise TypeError(f"Expected a VirtualChannel; got {type(virtual)}: {virtual}")
+
+        self._virtual = virtual
+
+    @staticmethod
+    def check_absent_value(value: Optional[number_type]) -> Optional[number_type]:
+        """Check that the absent value is a (non-NaN) number or None."""
+
+        if value is None:
+            return None
+
+        if isinstance(value, bool) or not isinstance(value, (int, float, np.integer, np.floating)):
+            raise TypeError(f"Absent value must be a number; got {type(value)}: {value}")
+        if np.isnan(value):
+            raise ValueError("Absent value cannot be NaN")
+
+        return value
+
+    @property
+    def statistics(self) -> Optional[ChannelStatistics]:
+        """Statistics (min, max, NaN count) of the channel's data, as written to the file.
+
+        Only available after the file has been written with 'collect_channel_statistics' or 'fill_channel_limits'
+        (see DLISFile.write); None otherwise.
+        """
+
+        return self._statistics
+
+    @statistics.setter
+    def statistics(self, statistics: Optional[ChannelStatistics]) -> None:
+        """Set the statistics of the channel's data."""
+
+        self._statistics = statistics
+
+    def set_limits_from_statistics(self, statistics: ChannelStatistics) -> None:
+        """Set minimum and maximum value of the channel from the statistics of its data (unless already set)."""
+
+        self._statistics = statistics
+
+        for attr, value in ((self.minimum_value, statistics.minimum), (self.maximum_value, statistics.maximum)):
+            if attr.value is None and value is not None:
+                logger.debug(f"Setting {attr.label} of {self} to {value}")
+                attr.value = float(value)
 
     @property
     def cast_dtype(self) -> Union[numpy_dtype_type, None]:
@@ -118,19 +270,19 @@ class ChannelItem(EFLRItem, DimensionedItem):
         self._set_dimension_from_data(sub_data)
         self._set_repr_code_from_data(sub_data)
 
-    def _set_dimension_from_data(self, sub_data: Union[np.ndarray, Dataset]) -> None:
+    def _set_dimension_from_data(self, sub_data: Union[np.ndarray, "Dataset"]) -> None:
         """Determine dimension (and element limit) of the Channel data from a relevant subset of a SourceDataWrapper."""
 
         dim = list(sub_data.shape[1:]) or [1]
 
-        if self.dimension.value != dim:
+        if list(self.dimension.value or ()) != dim:  # value might be a tuple (see Attribute.copy)
             if self.dimension.value:
                 raise RuntimeError(f"Previously defined dimension of {self}: {self.dimension.value} "
                                    f"does not match the dimension from data: {dim}")
             logger.debug(f"Setting dimension of {self} to {dim}")
             self.dimension.value = dim
 
-        if self.element_limit.value != dim:
+        if list(self.element_limit.value or ()) != dim:
             if self.element_limit.value:  # was specified and is not exactly equal to dim
                 if not self._compare_element_limit_vs_dimension(self.element_limit.value, dim):
                     # the difference is and not acceptable according to RP66 rules
@@ -164,7 +316,7 @@ class ChannelItem(EFLRItem, DimensionedItem):
 
         return True
 
-    def _set_repr_code_from_data(self, sub_data: Union[np.ndarray, Dataset]) -> None:
+    def _set_repr_code_from_data(self, sub_data: Union[np.ndarray, "Dataset"]) -> None:
         """Determine representation code of the Channel data from a relevant subset of a SourceDataWrapper."""
 
         dt = sub_data.dtype
@@ -189,7 +341,7 @@ class ChannelItem(EFLRItem, DimensionedItem):
                          f"as element limit: {self.element_limit.value}")
             self.dimension.value = self.element_limit.value
 
-        elif self.element_limit.value != self.dimension.value:
+        elif list(self.element_limit.value or ()) != list(self.dimension.value or ()):
             if not self._compare_element_limit_vs_dimension(self.element_limit.value, self.dimension.value):
                 # difference is not acceptable according to RP66 rules
                 raise RuntimeError(f"For channel '{self.name}', dimension is {self.dimension.value} "
@@ -209,5 +361,53 @@ class ChannelSet(EFLRSet):
     logical_record_type = EFLRType.CHANNL
     item_type = ChannelItem
 
+    def __init__(self, set_name: Optional[str] = None):
+        """Initialise ChannelSet.
+
+        Args:
+            set_name    :   Name of the set.
+        """
+
+        super().__init__(set_name=set_name)
+
+        self._dataset_name_counts: dict[str, int] = {}  # number of registered channels using each dataset name
+
+    def register_item(self, child: EFLRItem) -> None:
+        """Register a child ChannelItem with this ChannelSet; index its dataset name."""
+
+        super().register_item(child)
+        self._add_dataset_name(child.dataset_name)  # type: ignore  # type checked in super().register_item
+
+    def rename_item(self, child: EFLRItem, previous_name: str) -> None:
+        """Update the name index and - if the dataset name follows the channel name - the dataset name index."""
+
+        super().rename_item(child, previous_name)
+        if child._dataset_name is None:  # type: ignore  # only ChannelItems are registered
+            self.update_dataset_name(previous_name, child.name)
+
+    def _add_dataset_name(self, name: str) -> None:
+        """Add a dataset name to the index."""
+
+        self._dataset_name_counts[name] = self._dataset_name_counts.get(name, 0) + 1
+
+    def _remove_dataset_name(self, name: str) -> None:
+        """Remove (one occurrence of) a dataset name from the index."""
+
+        if (count := self._dataset_name_counts.get(name, 0)) > 1:
+            self._dataset_name_counts[name] = count - 1
+        else:
+            self._dataset_name_counts.pop(name, None)
+
+    def update_dataset_name(self, previous_name: str, new_name: str) -> None:
+        """Update the dataset name index after the dataset name of a registered ChannelItem has changed."""
+
+        self._remove_dataset_name(previous_name)
+        self._add_dataset_name(new_name)
+
+    def has_dataset_name(self, name: str) -> bool:
+        """Check whether any of the registered ChannelItems uses the given dataset name."""
+
+        return name in self._dataset_name_counts
+
 
 ChannelItem.parent_eflr_class = ChannelSet
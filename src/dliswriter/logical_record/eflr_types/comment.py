@@ -8,6 +8,8 @@ from dliswriter.logical_record.core.attribute import TextAttribute
 class CommentItem(EFLRItem):
     """Model an object being part of Comment EFLR."""
 
+    __slots__ = ('text',)
+
     parent: "CommentSet"
 
     def __init__(self, name: str, parent: "CommentSet", **kwargs: Any) -> None:
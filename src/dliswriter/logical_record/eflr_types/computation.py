@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class ComputationItem(EFLRItem, DimensionedItem):
     """Model an object being part of Computation EFLR."""
 
+    __slots__ = ('long_name', 'properties', 'dimension', 'axis', 'zones', 'values', 'source')
+
     parent: "ComputationSet"
 
     def __init__(self, name: str, parent: "ComputationSet", **kwargs: Any) -> None:
@@ -48,7 +50,7 @@ class ComputationItem(EFLRItem, DimensionedItem):
         self._check_axis_vs_dimension()
         self._check_or_set_value_dimensionality(self.values.value)
 
-        if self.values.value and not self.dimension.value:
+        if self.values.count and not self.dimension.value:
             logger.debug(f"Setting dimension of '{self}' to [1]")
             self.dimension.value = [1]
 
@@ -14,6 +14,10 @@ logger = logging.getLogger(__name__)
 class EquipmentItem(EFLRItem):
     """Model an object being part of Equipment EFLR."""
 
+    __slots__ = ('trademark_name', 'status', '_type', 'serial_number', 'location', 'height', 'length',
+                 'minimum_diameter', 'maximum_diameter', 'volume', 'weight', 'hole_size', 'pressure', 'temperature',
+                 'vertical_depth', 'radial_drift', 'angular_drift')
+
     parent: "EquipmentSet"
 
     def __init__(self, name: str, parent: "EquipmentSet", **kwargs: Any) -> None:
@@ -10,6 +10,7 @@ from dliswriter.utils.internal.converters import get_ascii_bytes
 from dliswriter.utils.internal.struct_writer import write_struct_ascii
 from dliswriter.utils.internal.internal_enums import RepresentationCode, EFLRType
 from dliswriter.logical_record.core.eflr import EFLRSet, EFLRItem
+from dliswriter.logical_record.core.attribute.attribute import attribute_body_spec_type
 from dliswriter.utils.internal.value_checkers import validate_string
 
 
@@ -20,6 +21,8 @@ def pack_ushort(v: int) -> bytes:
 class FileHeaderItem(EFLRItem):
     """Model an object being part of FileHeader EFLR."""
 
+    __slots__ = ('header_id', 'sequence_number')
+
     parent: "FileHeaderSet"
 
     header_id_length_limit = 65             #: max length of the file header name
@@ -78,19 +81,22 @@ class FileHeaderItem(EFLRItem):
 
         return True
 
-    def _make_attrs_bytes(self) -> bytes:
-        """Create bytes describing the values of attributes of FIleHeaderItem."""
+    def _make_attribute_specs(self) -> list[attribute_body_spec_type]:
+        """Create bytes describing the values of attributes of FileHeaderItem (see EFLRItem.make_body_spec)."""
 
-        bts = b''
+        buffer = bytearray()
+        self._write_attrs(buffer)
+        return [bytes(buffer)]
 
-        bts += pack_ushort(int('00100001', 2))
-        bts += pack_ushort(10)
-        bts += get_ascii_bytes(str(self.sequence_number), 10, justify_left=False)
-        bts += pack_ushort(int('00100001', 2))
-        bts += pack_ushort(65)
-        bts += get_ascii_bytes(self.header_id, 65, justify_left=True)
+    def _write_attrs(self, buffer: bytearray) -> None:
+        """Append bytes describing the values of attributes of FIleHeaderItem to the buffer."""
 
-        return bts
+        buffer += pack_ushort(int('00100001', 2))
+        buffer += pack_ushort(10)
+        buffer += get_ascii_bytes(str(self.sequence_number), 10, justify_left=False)
+        buffer += pack_ushort(int('00100001', 2))
+        buffer += pack_ushort(65)
+        buffer += get_ascii_bytes(self.header_id, 65, justify_left=True)
 
 
 class FileHeaderSet(EFLRSet):
@@ -103,20 +109,21 @@ class FileHeaderSet(EFLRSet):
     def __init__(self) -> None:
         super().__init__(set_name=None)
 
-    def _make_template_bytes(self) -> bytes:
-        """Create bytes describing the template - kinds of attributes to be found in the FileHeader EFLR."""
+    def _make_empty_copy(self) -> "FileHeaderSet":
+        """Create a new, empty FileHeaderSet."""
 
-        bts = b''
+        return self.__class__()
 
-        bts += pack_ushort(int('00110100', 2))
-        bts += write_struct_ascii('SEQUENCE-NUMBER')
-        bts += pack_ushort(20)
+    def _write_template(self, buffer: bytearray) -> None:
+        """Append bytes describing the template - kinds of attributes to be found in the FileHeader EFLR."""
 
-        bts += pack_ushort(int('00110100', 2))
-        bts += write_struct_ascii('ID')
-        bts += pack_ushort(20)
+        buffer += pack_ushort(int('00110100', 2))
+        buffer += write_struct_ascii('SEQUENCE-NUMBER')
+        buffer += pack_ushort(20)
 
-        return bts
+        buffer += pack_ushort(int('00110100', 2))
+        buffer += write_struct_ascii('ID')
+        buffer += pack_ushort(20)
 
 
 FileHeaderItem.parent_eflr_class = FileHeaderSet
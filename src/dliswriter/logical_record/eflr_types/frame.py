@@ -1,6 +1,6 @@
 import logging
 import numpy as np
-from typing import Union, Any
+from typing import Union, Any, Optional
 
 from dliswriter.logical_record.core.eflr import EFLRSet, EFLRItem
 from dliswriter.utils.internal.internal_enums import EFLRType, RepresentationCode as RepC
@@ -9,7 +9,10 @@ from dliswriter.logical_record.eflr_types.channel import ChannelSet, ChannelItem
 from dliswriter.logical_record.core.attribute import (Attribute, EFLRAttribute, NumericAttribute, TextAttribute,
                                                       IdentAttribute)
 from dliswriter.utils.source_data_wrappers import SourceDataWrapper
+from dliswriter.utils.virtual_channel import EvenlySpacedIndex
+from dliswriter.utils.internal.decimation import DecimationMethod, OverviewDefinition, expand_for_method
 from dliswriter.configuration import global_config
+from dliswriter.utils.internal.types import number_type
 
 
 logger = logging.getLogger(__name__)
@@ -18,15 +21,22 @@ logger = logging.getLogger(__name__)
 class FrameItem(EFLRItem):
     """Model an object being part of Frame EFLR."""
 
+    __slots__ = ('description', 'channels', 'index_type', 'direction', 'spacing', 'encrypted', 'index_min', 'index_max',
+                 '_absent_value', '_overviews', '_is_overview')
+
     parent: "FrameSet"
 
-    def __init__(self, name: str, parent: "FrameSet", **kwargs: Any) -> None:
+    def __init__(self, name: str, parent: "FrameSet", absent_value: Optional[number_type] = None,
+                 **kwargs: Any) -> None:
         """Initialise FrameItem.
 
         Args:
-            name        :   Name of the FrameItem.
-            parent      :   Parent FrameSet of this FrameItem.
-            **kwargs    :   Values of to be set as characteristics of the FrameItem Attributes.
+            name            :   Name of the FrameItem.
+            parent          :   Parent FrameSet of this FrameItem.
+            absent_value    :   Value written in place of absent values (NaNs, masked values) of the data
+                                of the frame's channels which do not define their own absent value
+                                (and whose data types can represent it exactly).
+            **kwargs        :   Values of to be set as characteristics of the FrameItem Attributes.
         """
 
         self.description = TextAttribute('description')
@@ -42,8 +52,61 @@ class FrameItem(EFLRItem):
         self.index_min = NumericAttribute('index_min')
         self.index_max = NumericAttribute('index_max')
 
+        self._absent_value = ChannelItem.check_absent_value(absent_value)
+
+        # overview frames computed from the data of this frame; for an overview frame, _is_overview is True
+        self._overviews: list[OverviewDefinition] = []
+        self._is_overview = False
+
         super().__init__(name, parent=parent, **kwargs)
 
+    @property
+    def absent_value(self) -> Optional[number_type]:
+        """Value written in place of absent values of the data of channels without their own absent value."""
+
+        return self._absent_value
+
+    @absent_value.setter
+    def absent_value(self, value: Optional[number_type]) -> None:
+        """Set or remove the absent value of the frame."""
+
+        self._absent_value = ChannelItem.check_absent_value(value)
+
+    @property
+    def overviews(self) -> list[OverviewDefinition]:
+        """Overview frames computed from the data of this frame (see LogicalFile.add_overview_frame)."""
+
+        return self._overviews.copy()
+
+    @property
+    def is_overview(self) -> bool:
+        """True if this is an overview frame, whose data are computed from the data of another frame."""
+
+        return self._is_overview
+
+    def add_overview(self, frame: "FrameItem", factor: int, method: DecimationMethod) -> None:
+        """Register an overview frame, whose rows are computed from windows of 'factor' rows of this frame's data.
+
+        Args:
+            frame   :   Overview frame; its channels must match those of this frame (see expand_for_method).
+            factor  :   Number of rows of this frame's data per row of the overview frame.
+            method  :   Method of reducing the values of a window to a single row.
+        """
+
+        if self._is_overview:
+            raise ValueError(f"{self} is an overview frame; overviews of overview frames are not supported")
+        if frame is self or frame._is_overview or frame._overviews:
+            raise ValueError(f"{frame} cannot be added as an overview frame of {self}")
+
+        frame._is_overview = True
+        self._overviews = self._overviews + [OverviewDefinition(frame, factor, method)]
+
+    def redirect_overviews(self, mapping: dict[int, EFLRItem]) -> None:
+        """Make a copy of the frame refer to the copies of its overview frames (see LogicalFileTemplate)."""
+
+        self._overviews = [overview._replace(frame=mapping.get(id(overview.frame), overview.frame))  # type: ignore
+                           for overview in self._overviews]
+
     @staticmethod
     def convert_encrypted(value: Union[str, int, float, bool]) -> int:
         """Convert a provided 'encrypted' attribute value to an integer flag (0 or 1)."""
@@ -75,6 +138,9 @@ class FrameItem(EFLRItem):
 
         self._setup_frame_params_from_data(data)
 
+        for overview in self._overviews:
+            self._setup_overview(overview, data.n_rows)
+
     def _setup_frame_params_from_data(self, data: SourceDataWrapper) -> None:
         """Set up the index characteristics of the frame based on the source data.
 
@@ -84,20 +150,14 @@ class FrameItem(EFLRItem):
         This assumption is frequently made in DLIS readers.
         """
 
-        def assign_if_none(attr: Attribute, value: Any, key: str = 'value') -> None:
-            """Check if an attribute part has already been assigned. If not, assign it to the provided value.
-
-            Args:
-                attr    :   Attribute instance whose part should be assigned a value.
-                value   :   Value to be assigned to the attribute part, if no value has been assigned so far.
-                key     :   Name of the part of attribute which should be assigned.
-            """
+        assign_if_none = self._assign_if_none
+        index_channel: ChannelItem = self.channels.value[0]
 
-            if getattr(attr, key) is None and value is not None:
-                logger.debug(f"Setting {attr.label}.{key} of {self} to {value}")
-                setattr(attr, key, value)
+        virtual_index = data.virtual_channels.get(index_channel.name)
+        if self.index_type.value is not None and isinstance(virtual_index, EvenlySpacedIndex):
+            self._setup_frame_params_from_evenly_spaced_index(virtual_index, data)
+            return
 
-        index_channel: ChannelItem = self.channels.value[0]
         index_data = data[index_channel.name][:]
 
         if self.index_type.value is None:
@@ -134,6 +194,61 @@ class FrameItem(EFLRItem):
                 assign_if_none(self.spacing, spacing)
                 # no need to define direction if spacing is defined
 
+    def _assign_if_none(self, attr: Attribute, value: Any, key: str = 'value') -> None:
+        """Check if an attribute part has already been assigned. If not, assign it to the provided value.
+
+        Args:
+            attr    :   Attribute instance whose part should be assigned a value.
+            value   :   Value to be assigned to the attribute part, if no value has been assigned so far.
+            key     :   Name of the part of attribute which should be assigned.
+        """
+
+        if getattr(attr, key) is None and value is not None:
+            logger.debug(f"Setting {attr.label}.{key} of {self} to {value}")
+            setattr(attr, key, value)
+
+    def _setup_frame_params_from_evenly_spaced_index(self, index: EvenlySpacedIndex, data: SourceDataWrapper) -> None:
+        """Set up the index characteristics of the frame from the definition of its (virtual) index channel.
+
+        The limits and the spacing are known without computing (or scanning) the index values.
+        """
+
+        limits = (index.value_at(data.from_idx), index.value_at(data.from_idx + data.n_rows - 1))
+        self._assign_if_none(self.index_min, min(limits))
+        self._assign_if_none(self.index_max, max(limits))
+        self._assign_if_none(self.spacing, index.step)
+        for at in (self.index_min, self.index_max, self.spacing):
+            self._assign_if_none(at, key='units', value=self.channels.value[0].units.value)
+
+    def _setup_overview(self, overview: OverviewDefinition, n_rows: int) -> None:
+        """Set up attributes of an overview frame and its channels based on those of this (set up) frame.
+
+        The channels of the overview frame take the dimensions and data types of the corresponding channels.
+        The index limits of an indexed overview frame are not known before its rows are computed and are left unset.
+        """
+
+        has_index = self.index_type.value is not None
+        sources = expand_for_method(self.channels.value, overview.method, has_index)
+        for source, channel in zip(sources, overview.frame.channels.value):
+            channel.cast_dtype = source.cast_dtype
+            for attr in ('dimension', 'element_limit'):
+                getattr(channel, attr).value = getattr(source, attr).value
+
+        frame = overview.frame
+        n_overview_rows = -(-n_rows // overview.factor)  # ceiling division
+        if not has_index:
+            frame._assign_if_none(frame.spacing, 1)
+            frame._assign_if_none(frame.index_min, 1)
+            frame._assign_if_none(frame.index_max, n_overview_rows)
+            return
+
+        frame._assign_if_none(frame.direction, self.direction.value)
+        # window means of an evenly spaced index are evenly spaced - except for a last, partial window
+        if self.spacing.value is not None and (overview.method is not DecimationMethod.MEAN
+                                               or n_rows % overview.factor == 0):
+            frame._assign_if_none(frame.spacing, self.spacing.value * overview.factor)
+            frame._assign_if_none(frame.spacing, key='units', value=self.spacing.units)
+
     @staticmethod
     def _compute_spacing_and_direction(index_data: np.ndarray) -> tuple[Union[int, float, None], Union[bool, None]]:
         """Compute spacing and direction of the data.
@@ -183,6 +298,28 @@ class FrameItem(EFLRItem):
 
         return {ch.name: ch.cast_dtype for ch in self.channels.value if ch.cast_dtype is not None}
 
+    @property
+    def absent_values_mapping(self) -> dict:
+        """Mapping of names of channels of the frame on their own absent values, if defined.
+
+        The absent value of the frame (if any) is used for the other channels whose data types can represent it
+        (see SourceDataWrapper).
+        """
+
+        return {ch.name: ch.absent_value for ch in self.channels.value if ch.absent_value is not None}
+
+    @property
+    def transforms_mapping(self) -> dict:
+        """Mapping of names of channels of the frame on the transforms of their data, if defined."""
+
+        return {ch.name: ch.transform for ch in self.channels.value if ch.transform is not None}
+
+    @property
+    def virtual_channels_mapping(self) -> dict:
+        """Mapping of names of channels of the frame on the virtual channels computing their data, if defined."""
+
+        return {ch.name: ch.virtual for ch in self.channels.value if ch.virtual is not None}
+
 
 class FrameSet(EFLRSet):
     """Model Frame EFLR."""
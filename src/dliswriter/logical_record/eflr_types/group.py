@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class GroupItem(EFLRItem):
     """Model an object being part of Group EFLR."""
 
+    __slots__ = ('description', 'object_type', 'object_list', 'group_list')
+
     parent: "GroupSet"
 
     def __init__(self, name: str, parent: "GroupSet", **kwargs: Any) -> None:
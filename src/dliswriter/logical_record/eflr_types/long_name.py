@@ -8,6 +8,10 @@ from dliswriter.logical_record.core.attribute import TextAttribute
 class LongNameItem(EFLRItem):
     """Model an object being part of LongName EFLR."""
 
+    __slots__ = ('general_modifier', 'quantity', 'quantity_modifier', 'altered_form', 'entity', 'entity_modifier',
+                 'entity_number', 'entity_part', 'entity_part_number', 'generic_source', 'source_part',
+                 'source_part_number', 'conditions', 'standard_symbol', 'private_symbol')
+
     parent: "LongNameSet"
 
     def __init__(self, name: str, parent: "LongNameSet", **kwargs: Any) -> None:
@@ -8,6 +8,8 @@ from dliswriter.logical_record.core.attribute import IdentAttribute, DTimeAttrib
 class MessageItem(EFLRItem):
     """Model an object being part of Message EFLR."""
 
+    __slots__ = ('_type', 'time', 'borehole_drift', 'vertical_depth', 'radial_drift', 'angular_drift', 'text')
+
     parent: "MessageSet"
 
     def __init__(self, name: str, parent: "MessageSet", **kwargs: Any) -> None:
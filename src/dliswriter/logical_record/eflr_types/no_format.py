@@ -8,6 +8,8 @@ from dliswriter.logical_record.core.attribute import IdentAttribute, TextAttribu
 class NoFormatItem(EFLRItem):
     """Model an object being part of NoFormat EFLR."""
 
+    __slots__ = ('consumer_name', 'description')
+
     parent: "NoFormatSet"
 
     def __init__(self, name: str, parent: "NoFormatSet", **kwargs: Any) -> None:
@@ -17,6 +17,10 @@ logger = logging.getLogger(__name__)
 class OriginItem(EFLRItem):
     """Model an object being part of Origin EFLR."""
 
+    __slots__ = ('file_id', 'file_set_name', 'file_set_number', 'file_number', 'file_type', 'product', 'version',
+                 'programs', 'creation_time', 'order_number', 'descent_number', 'run_number', 'well_id', 'well_name',
+                 'field_name', 'producer_code', 'producer_name', 'company', 'name_space_name', 'name_space_version')
+
     parent: "OriginSet"
 
     def __init__(
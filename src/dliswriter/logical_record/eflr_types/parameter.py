@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 class ParameterItem(EFLRItem, DimensionedItem):
     """Model an object being part of Parameter EFLR."""
 
+    __slots__ = ('long_name', 'dimension', 'axis', 'zones', 'values')
+
     parent: "ParameterSet"
 
     def __init__(self, name: str, parent: "ParameterSet", **kwargs: Any) -> None:
@@ -53,7 +55,7 @@ class ParameterItem(EFLRItem, DimensionedItem):
         self._check_axis_vs_dimension()
         self._check_or_set_value_dimensionality(self.values.value)
 
-        if self.values.value and not self.dimension.value:
+        if self.values.count and not self.dimension.value:
             logger.debug(f"Setting dimension of '{self}' to [1]")
             self.dimension.value = [1]
 
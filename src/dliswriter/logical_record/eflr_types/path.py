@@ -15,6 +15,9 @@ logger = logging.getLogger(__name__)
 class PathItem(EFLRItem):
     """Model an object being part of Path EFLR."""
 
+    __slots__ = ('frame_type', 'well_reference_point', 'value', 'borehole_depth', 'vertical_depth', 'radial_drift',
+                 'angular_drift', 'time', 'depth_offset', 'measure_point_offset', 'tool_zero_offset')
+
     parent: "PathSet"
 
     def __init__(self, name: str, parent: "PathSet", **kwargs: Any) -> None:
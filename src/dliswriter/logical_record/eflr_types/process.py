@@ -16,6 +16,9 @@ logger = logging.getLogger(__name__)
 class ProcessItem(EFLRItem):
     """Model an object being part of Process EFLR."""
 
+    __slots__ = ('description', 'trademark_name', 'version', 'properties', 'status', 'input_channels',
+                 'output_channels', 'input_computations', 'output_computations', 'parameters', 'comments')
+
     parent: "ProcessSet"
 
     def __init__(self, name: str, parent: "ProcessSet", **kwargs: Any) -> None:
@@ -14,6 +14,8 @@ logger = logging.getLogger(__name__)
 class SpliceItem(EFLRItem):
     """Model an object being part of Splice EFLR."""
 
+    __slots__ = ('output_channel', 'input_channels', 'zones')
+
     parent: "SpliceSet"
 
     def __init__(self, name: str, parent: "SpliceSet", **kwargs: Any) -> None:
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 class ToolItem(EFLRItem):
     """Model an object being part of Tool EFLR."""
 
+    __slots__ = ('description', 'trademark_name', 'generic_name', 'parts', 'status', 'channels', 'parameters')
+
     parent: "ToolSet"
 
     def __init__(self, name: str, parent: "ToolSet", **kwargs: Any) -> None:
@@ -12,6 +12,10 @@ from dliswriter.logical_record.core.attribute import NumericAttribute, TextAttri
 class WellReferencePointItem(EFLRItem):
     """Model an object being part of WellReferencePoint EFLR."""
 
+    __slots__ = ('permanent_datum', 'vertical_zero', 'permanent_datum_elevation', 'above_permanent_datum',
+                 'magnetic_declination', 'coordinate_1_name', 'coordinate_1_value', 'coordinate_2_name',
+                 'coordinate_2_value', 'coordinate_3_name', 'coordinate_3_value')
+
     parent: "WellReferencePointSet"
 
     def __init__(self, name: str, parent: "WellReferencePointSet", **kwargs: Any) -> None:
@@ -15,6 +15,8 @@ from dliswriter.logical_record.core.attribute import IdentAttribute, DTimeAttrib
 class ZoneItem(EFLRItem):
     """Model an object being part of Zone EFLR."""
 
+    __slots__ = ('description', 'domain', 'maximum', 'minimum')
+
     parent: "ZoneSet"
 
     def __init__(self, name: str, parent: "ZoneSet", **kwargs: Any) -> None:
@@ -37,6 +37,18 @@ class FrameData(IFLR):
 
         self.origin_reference = origin_reference
 
+    @property
+    def frame_number(self) -> int:
+        """Number of the frame (row of data), counting from 1."""
+
+        return self._frame_number
+
+    @property
+    def slots(self) -> np.ndarray:
+        """Row of data (one item per channel of the frame)."""
+
+        return self._slots
+
     def _make_body_bytes(self) -> bytes:
         """Create bytes describing the body of the FrameData object.
 
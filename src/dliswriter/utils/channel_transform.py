@@ -0,0 +1,249 @@
+from typing import Optional, Union
+
+import numpy as np
+
+from dliswriter.utils.enums import Unit
+from dliswriter.utils.internal.converters import ReprCodeConverter
+from dliswriter.utils.internal.types import number_type, numpy_dtype_type
+
+
+# linear conversions of units to a reference unit of their quantity: unit -> (quantity, factor, offset),
+# where value_in_reference_unit = value * factor + offset
+_UNIT_CONVERSIONS: dict[str, tuple[str, float, float]] = {
+    Unit.METER.value: ('length', 1., 0.),
+    Unit.KILOMETER.value: ('length', 1e3, 0.),
+    Unit.CENTIMETER.value: ('length', 1e-2, 0.),
+    Unit.MILLIMETER.value: ('length', 1e-3, 0.),
+    Unit.FOOT.value: ('length', 0.3048, 0.),
+    Unit.INCH.value: ('length', 0.0254, 0.),
+    Unit.KELVIN.value: ('temperature', 1., 0.),
+    Unit.DEGREE_CELSIUS.value: ('temperature', 1., 273.15),
+    Unit.DEGREE_FAHRENHEIT.value: ('temperature', 5 / 9, 459.67 * 5 / 9),
+    Unit.KILOPASCAL.value: ('pressure', 1e3, 0.),
+    Unit.MEGAPASCAL.value: ('pressure', 1e6, 0.),
+    Unit.GIGAPASCAL.value: ('pressure', 1e9, 0.),
+    Unit.BAR.value: ('pressure', 1e5, 0.),
+    Unit.POUND_PER_SQUARE_INCH.value: ('pressure', 6894.757293168361, 0.),
+    Unit.SECOND.value: ('time', 1., 0.),
+    Unit.MILLISECOND.value: ('time', 1e-3, 0.),
+    Unit.MICROSECOND.value: ('time', 1e-6, 0.),
+    Unit.KILOGRAM.value: ('mass', 1., 0.),
+    Unit.MEGAGRAM.value: ('mass', 1e3, 0.),
+    Unit.POUND_MASS.value: ('mass', 0.45359237, 0.),
+}
+
+
+class ChannelTransform:
+    """Linear transform (scale and offset, optionally followed by clipping) of the data of a channel.
+
+    The transform is applied when the data are written, chunk by chunk, to the chunks loaded from the source data
+    (see SourceDataWrapper.load_chunk) - so the source arrays are neither modified nor copied as a whole.
+    The transformed values are: clip(values * scale + offset, clip_min, clip_max).
+
+    A transform converting between units can be made with 'from_units'; the units of the channel it is assigned to
+    are then set to the target units (see ChannelItem.transform). A transform storing float values as integer codes
+    (e.g. UNORM, SNORM) can be made with 'quantization'.
+    """
+
+    __slots__ = ('_scale', '_offset', '_clip_min', '_clip_max', '_from_unit', '_to_unit', '_round_values',
+                 '_quantized_dtype')
+
+    def __init__(self, scale: number_type = 1., offset: number_type = 0., clip_min: Optional[number_type] = None,
+                 clip_max: Optional[number_type] = None, from_unit: Optional[Union[str, Unit]] = None,
+                 to_unit: Optional[Union[str, Unit]] = None, round_values: bool = False) -> None:
+        """Initialise ChannelTransform.
+
+        Args:
+            scale       :   Factor the values are multiplied by.
+            offset      :   Value added to the scaled values.
+            clip_min    :   Lower limit of the transformed values; smaller values are replaced by it.
+            clip_max    :   Upper limit of the transformed values; larger values are replaced by it.
+            from_unit   :   Units of the source data (informative; see 'from_units').
+            to_unit     :   Units of the transformed data. If specified, set as the units of the channel
+                            the transform is assigned to.
+            round_values:   If True, the transformed (and clipped) values are rounded to the nearest integers.
+        """
+
+        for label, value in (('Scale', scale), ('Offset', offset)):
+            if not np.isfinite(self._check_number(value, label)):
+                raise ValueError(f"{label} must be finite; got {value}")
+        if scale == 0:
+            raise ValueError("Scale cannot be 0")
+
+        for label, limit in (('Clip minimum', clip_min), ('Clip maximum', clip_max)):
+            if limit is not None and np.isnan(self._check_number(limit, label)):
+                raise ValueError(f"{label} cannot be NaN")
+        if clip_min is not None and clip_max is not None and clip_min > clip_max:
+            raise ValueError(f"Clip minimum ({clip_min}) cannot be larger than clip maximum ({clip_max})")
+
+        unit_converter = Unit.make_converter("units", soft=True, allow_none=True)
+
+        self._scale = scale
+        self._offset = offset
+        self._clip_min = clip_min
+        self._clip_max = clip_max
+        self._from_unit: Optional[str] = unit_converter(from_unit)
+        self._to_unit: Optional[str] = unit_converter(to_unit)
+        self._round_values = bool(round_values)
+        self._quantized_dtype: Optional[np.dtype] = None
+
+    @staticmethod
+    def _check_number(value: number_type, label: str) -> number_type:
+        """Check that the value is a (non-bool) real number."""
+
+        if isinstance(value, bool) or not isinstance(value, (int, float, np.integer, np.floating)):
+            raise TypeError(f"{label} must be a number; got {type(value)}: {value}")
+        return value
+
+    @classmethod
+    def from_units(cls, from_unit: Union[str, Unit], to_unit: Union[str, Unit], clip_min: Optional[number_type] = None,
+                   clip_max: Optional[number_type] = None) -> "ChannelTransform":
+        """Make a transform converting the values between units of the same quantity (e.g. 'ft' to 'm').
+
+        Args:
+            from_unit   :   Units of the source data.
+            to_unit     :   Units the data should be converted to.
+            clip_min    :   Lower limit of the converted values (in 'to_unit').
+            clip_max    :   Upper limit of the converted values (in 'to_unit').
+
+        Returns:
+            A ChannelTransform with the scale and offset of the conversion.
+        """
+
+        from_unit, to_unit = Unit(from_unit).value, Unit(to_unit).value
+
+        try:
+            from_quantity, from_factor, from_offset = _UNIT_CONVERSIONS[from_unit]
+            to_quantity, to_factor, to_offset = _UNIT_CONVERSIONS[to_unit]
+        except KeyError as exc:
+            raise ValueError(f"Conversion of units '{exc.args[0]}' is not supported; supported units are: "
+                             f"{', '.join(_UNIT_CONVERSIONS)}") from None
+
+        if from_quantity != to_quantity:
+            raise ValueError(f"Cannot convert {from_quantity} ('{from_unit}') to {to_quantity} ('{to_unit}')")
+
+        return cls(scale=from_factor / to_factor, offset=(from_offset - to_offset) / to_factor, clip_min=clip_min,
+                   clip_max=clip_max, from_unit=from_unit, to_unit=to_unit)
+
+    @classmethod
+    def quantization(cls, minimum: number_type, maximum: number_type,
+                     dtype: numpy_dtype_type = np.uint16) -> "ChannelTransform":
+        """Make a transform storing float values as integer codes, spread evenly over the range of an integer type.
+
+        The values from [minimum, maximum] are mapped linearly onto the whole range of 'dtype' (e.g. 0-65535 for
+        uint16 - UNORM; -32768-32767 for int16 - SNORM) and rounded; values outside the range are clipped.
+        The channel the transform is assigned to is written with 'dtype' as its cast_dtype. The values can be
+        restored (with the precision of (maximum - minimum) / number of codes) as: code * gain + offset,
+        where gain and offset are given by 'dequantization'.
+
+        Args:
+            minimum     :   Value mapped on the smallest code.
+            maximum     :   Value mapped on the largest code.
+            dtype       :   Integer data type of the codes.
+
+        Returns:
+            A ChannelTransform quantizing the values.
+        """
+
+        dtype = np.dtype(dtype)
+        if dtype.kind not in 'iu':
+            raise ValueError(f"Values can only be quantized to an integer type; got {dtype}")
+        ReprCodeConverter.validate_numpy_dtype(dtype)
+
+        for label, value in (('Minimum', minimum), ('Maximum', maximum)):
+            if not np.isfinite(cls._check_number(value, label)):
+                raise ValueError(f"{label} must be finite; got {value}")
+        if not minimum < maximum:
+            raise ValueError(f"Minimum ({minimum}) must be smaller than maximum ({maximum})")
+
+        info = np.iinfo(dtype)
+        scale = (info.max - info.min) / (maximum - minimum)
+
+        transform = cls(scale=scale, offset=info.min - minimum * scale, clip_min=info.min, clip_max=info.max,
+                        round_values=True)
+        transform._quantized_dtype = dtype
+        return transform
+
+    @property
+    def quantized_dtype(self) -> Optional[np.dtype]:
+        """Integer data type of the codes, if the transform is a quantization (see 'quantization'); otherwise None."""
+
+        return self._quantized_dtype
+
+    @property
+    def dequantization(self) -> Optional[tuple[float, float]]:
+        """Gain and offset restoring the values from the codes (value = code * gain + offset) for a quantization."""
+
+        if self._quantized_dtype is None:
+            return None
+
+        return 1 / self._scale, (0 - self._offset) / self._scale
+
+    @property
+    def scale(self) -> number_type:
+        """Factor the values are multiplied by."""
+
+        return self._scale
+
+    @property
+    def offset(self) -> number_type:
+        """Value added to the scaled values."""
+
+        return self._offset
+
+    @property
+    def clip_min(self) -> Optional[number_type]:
+        """Lower limit of the transformed values."""
+
+        return self._clip_min
+
+    @property
+    def clip_max(self) -> Optional[number_type]:
+        """Upper limit of the transformed values."""
+
+        return self._clip_max
+
+    @property
+    def from_unit(self) -> Optional[str]:
+        """Units of the source data."""
+
+        return self._from_unit
+
+    @property
+    def to_unit(self) -> Optional[str]:
+        """Units of the transformed data."""
+
+        return self._to_unit
+
+    def apply(self, values: np.ndarray) -> np.ndarray:
+        """Transform the values in place; return the same array.
+
+        Args:
+            values  :   Floating-point array to be transformed (e.g. a field of a loaded data chunk).
+                        NaNs remain NaNs.
+        """
+
+        if values.dtype.kind != 'f':
+            raise TypeError(f"Values can only be transformed in place in a float array; got {values.dtype}")
+
+        if self._scale != 1:
+            np.multiply(values, self._scale, out=values)
+        if self._offset != 0:
+            np.add(values, self._offset, out=values)
+        if self._clip_min is not None or self._clip_max is not None:
+            np.clip(values, self._clip_min, self._clip_max, out=values)
+        if self._round_values:
+            np.rint(values, out=values)
+
+        return values
+
+    def invert(self, value: number_type) -> float:
+        """Return the source value which is transformed to the given value (clipping and rounding not considered)."""
+
+        return float((value - self._offset) / self._scale)
+
+    def __repr__(self) -> str:
+        units = f", {self._from_unit} -> {self._to_unit}" if self._from_unit or self._to_unit else ""
+        clipped = self._clip_min is not None or self._clip_max is not None
+        clip = f", clip: [{self._clip_min}, {self._clip_max}]" if clipped else ""
+        return f"{self.__class__.__name__}(x * {self._scale} + {self._offset}{clip}{units})"
@@ -0,0 +1,197 @@
+import logging
+from enum import Enum
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Generator, Optional, Union
+
+from dliswriter.configuration import encoding_cache_context
+from dliswriter.utils.internal.internal_enums import RepresentationCode as RepC
+
+
+logger = logging.getLogger(__name__)
+
+
+class CachePolicy(str, Enum):
+    """Define how encoded values of a given representation code are cached."""
+
+    ALWAYS = 'always'   #: cache all values; never evict them (for the lifetime of the cache)
+    LRU = 'lru'         #: cache values, evicting the least recently used ones when the size limit is reached
+    NEVER = 'never'     #: do not cache the values; encode them every time
+
+
+@dataclass
+class EncodingCacheStats:
+    """Hit/miss statistics of an EncodingCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of look-ups which were hits. 0 if no look-ups have been made."""
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class EncodingCache:
+    """Cache bytes of values encoded according to their representation codes.
+
+    Many values (e.g. attribute labels and units - both encoded as IDENT - or references to other objects) repeat
+    across the objects of a file, so their encoded form can be reused. The cache is meant to be used for the duration
+    of a single write (see 'encoding_cache_scope'); the cached bytes (and the references to the cached values)
+    are released when the cache is cleared.
+
+    How values of each representation code are cached is defined by a CachePolicy. Values cached with
+    the LRU policy share a common size limit; values cached with the ALWAYS policy are not limited.
+    Values which cannot be hashed are never cached.
+    """
+
+    default_policies: dict[RepC, CachePolicy] = {
+        **{rc: CachePolicy.ALWAYS for rc in (RepC.IDENT, RepC.ASCII, RepC.OBNAME, RepC.OBJREF)},
+        **{rc: CachePolicy.NEVER for rc in (RepC.FSINGL, RepC.FDOUBL, RepC.FSING1, RepC.FSING2, RepC.FDOUB1,
+                                            RepC.FDOUB2, RepC.CSINGL, RepC.CDOUBL, RepC.ISINGL, RepC.VSINGL)},
+    }  #: policies for specific representation codes; the ones not listed here use the LRU policy
+
+    def __init__(self, maxsize: int = 65536, policies: Optional[dict[RepC, Union[CachePolicy, str]]] = None) -> None:
+        """Initialise EncodingCache.
+
+        Args:
+            maxsize     :   Maximal number of values cached with the LRU policy.
+            policies    :   Policies for specific representation codes, overriding the default ones
+                            (see 'default_policies').
+        """
+
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError(f"Cache size must be a non-negative integer; got {maxsize}")
+
+        self._maxsize = maxsize
+        self._policies = self.default_policies.copy()
+        for rc, policy in (policies or {}).items():
+            self._policies[RepC(rc)] = CachePolicy(policy)
+
+        self._permanent: dict[tuple, bytes] = {}
+        self._lru: OrderedDict[tuple, bytes] = OrderedDict()
+        self._stats: dict[RepC, EncodingCacheStats] = {}
+
+    @property
+    def maxsize(self) -> int:
+        """Maximal number of values cached with the LRU policy."""
+
+        return self._maxsize
+
+    def policy(self, representation_code: RepC) -> CachePolicy:
+        """Caching policy for the given representation code."""
+
+        return self._policies.get(representation_code, CachePolicy.LRU)
+
+    def __len__(self) -> int:
+        """Number of currently cached values."""
+
+        return len(self._permanent) + len(self._lru)
+
+    @property
+    def stats(self) -> dict[RepC, EncodingCacheStats]:
+        """Hit/miss statistics per representation code."""
+
+        return self._stats.copy()
+
+    @property
+    def total_stats(self) -> EncodingCacheStats:
+        """Hit/miss statistics summed over all representation codes."""
+
+        return EncodingCacheStats(
+            hits=sum(s.hits for s in self._stats.values()),
+            misses=sum(s.misses for s in self._stats.values()),
+            evictions=sum(s.evictions for s in self._stats.values())
+        )
+
+    def _get_stats(self, representation_code: RepC) -> EncodingCacheStats:
+        stats = self._stats.get(representation_code)
+        if stats is None:
+            stats = self._stats[representation_code] = EncodingCacheStats()
+        return stats
+
+    def encode(self, representation_code: RepC, value: Any, encoder: Callable[[RepC, Any], bytes]) -> bytes:
+        """Return bytes of the value encoded with the given representation code, using the cache when possible.
+
+        Args:
+            representation_code :   Representation code the value should be encoded with.
+            value               :   Value to be encoded.
+            encoder             :   Function encoding the value, called on a cache miss.
+        """
+
+        policy = self._policies.get(representation_code, CachePolicy.LRU)
+        if policy is CachePolicy.NEVER or (policy is CachePolicy.LRU and not self._maxsize):
+            return encoder(representation_code, value)
+
+        key = (representation_code, type(value), value)  # type included because e.g. 1 == 1.0 == True
+        store = self._permanent if policy is CachePolicy.ALWAYS else self._lru
+
+        try:
+            bts = store.get(key)
+        except TypeError:  # unhashable value
+            return encoder(representation_code, value)
+
+        stats = self._get_stats(representation_code)
+
+        if bts is not None:
+            stats.hits += 1
+            if policy is CachePolicy.LRU:
+                self._lru.move_to_end(key)
+            return bts
+
+        stats.misses += 1
+        bts = encoder(representation_code, value)
+        store[key] = bts
+
+        if policy is CachePolicy.LRU and len(self._lru) > self._maxsize:
+            evicted_key, _ = self._lru.popitem(last=False)
+            self._get_stats(evicted_key[0]).evictions += 1
+
+        return bts
+
+    def clear(self) -> None:
+        """Remove all cached values, releasing the memory. Statistics are kept."""
+
+        self._permanent.clear()
+        self._lru.clear()
+
+    def reset_stats(self) -> None:
+        """Reset the hit/miss statistics."""
+
+        self._stats.clear()
+
+    def summary(self) -> str:
+        """Summarise the hit/miss statistics in a human-readable form."""
+
+        total = self.total_stats
+        parts = [f"{rc.name}: {s.hits} hits, {s.misses} misses" + (f", {s.evictions} evictions" if s.evictions else "")
+                 for rc, s in self._stats.items()]
+        return (f"{total.hits} hits, {total.misses} misses ({100 * total.hit_rate:.1f}% hit rate)"
+                + (f" [{'; '.join(parts)}]" if parts else ""))
+
+
+@contextmanager
+def encoding_cache_scope(cache: Optional[EncodingCache] = None) -> Generator[EncodingCache, None, None]:
+    """Context manager. Use the given (or a new) EncodingCache for encoding values within the scope of the context.
+
+    On exit, the cache is cleared (releasing the cached bytes and references to the encoded values)
+    and the previously used cache (if any) is restored. Statistics of the cache remain available.
+
+    The cache is set for the current execution context only (e.g. the current thread): writes running concurrently
+    in other threads use their own caches.
+    """
+
+    cache = cache if cache is not None else EncodingCache()
+
+    token = encoding_cache_context.set(cache)
+
+    try:
+        yield cache
+    finally:
+        encoding_cache_context.reset(token)
+        cache.clear()
+        logger.debug(f"Encoding cache statistics: {cache.summary()}")
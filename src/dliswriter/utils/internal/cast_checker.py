@@ -0,0 +1,211 @@
+import logging
+from enum import Enum
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+from dliswriter.utils.internal.fshort import FSHORT_MIN, FSHORT_MAX
+
+
+logger = logging.getLogger(__name__)
+
+
+class CastPolicy(str, Enum):
+    """Define what happens when the data cannot be cast to the target data type without damage."""
+
+    RAISE = 'raise'     #: raise a ValueError
+    CLIP = 'clip'       #: clip out-of-range values to the range of the target type (NaNs cast to integers: 0)
+    WARN = 'warn'       #: cast the data as numpy does (out-of-range values wrap around) and log a warning
+
+
+@dataclass
+class CastSummary:
+    """Counts of the problematic values found when casting data of a single channel."""
+
+    source_dtype: np.dtype
+    target_dtype: np.dtype
+    n_values: int = 0           #: total number of values cast (so far)
+    n_overflow: int = 0         #: number of values outside the range of the target type
+    n_nan: int = 0              #: number of NaN/inf values cast to an integer type
+    n_precision_loss: int = 0   #: number of values which changed due to limited precision of the target type
+
+    @property
+    def n_damaged(self) -> int:
+        """Number of values damaged by the cast (out-of-range or NaN values)."""
+
+        return self.n_overflow + self.n_nan
+
+    def __str__(self) -> str:
+        return (f"{self.source_dtype} -> {self.target_dtype}: {self.n_values} value(s), "
+                f"{self.n_overflow} out of range, {self.n_nan} NaN/inf, {self.n_precision_loss} with precision loss")
+
+
+class CastChecker:
+    """Cast chunks of channel data to target data types, checking for values which cannot be represented.
+
+    The checks are vectorised and only performed when the cast is not 'safe' in numpy sense (e.g. float64 to uint16,
+    int32 to int16). Out-of-range values and NaNs/infinities cast to integers are handled according to the policy.
+    Loss of precision (fractional parts truncated when casting floats to integers, large integers cast to floats)
+    is counted, but otherwise allowed. Rounding of floats cast to lower-precision floats (e.g. float64 to float32)
+    is considered expected and is not counted.
+
+    Data cast to float16 are written as FSHORT, whose range (FSHORT_MIN to FSHORT_MAX) is narrower than that
+    of float16; the range of values cast to float16 is therefore always checked against the FSHORT range.
+    """
+
+    def __init__(self, policy: Union[CastPolicy, str] = CastPolicy.WARN) -> None:
+        """Initialise CastChecker.
+
+        Args:
+            policy  :   What to do with values which cannot be represented in the target type (see CastPolicy).
+        """
+
+        self._policy = CastPolicy(policy)
+        self._summary: dict[str, CastSummary] = {}
+
+    @property
+    def policy(self) -> CastPolicy:
+        """Policy for values which cannot be represented in the target type."""
+
+        return self._policy
+
+    @property
+    def summary(self) -> dict[str, CastSummary]:
+        """Cast summaries of all channels whose data needed to be cast."""
+
+        return self._summary.copy()
+
+    def cast(self, name: str, values: np.ndarray, out: np.ndarray) -> None:
+        """Cast the values to the data type of the output array and store them there, checking for issues.
+
+        The cast and the checks are arranged to keep the overhead over a plain assignment low. The range
+        of the values is checked using min/max reductions of the source values; element-wise masks are only
+        computed if these checks indicate problems. Precision loss of floats cast to integers is determined
+        by comparing the stored values with the source ones; that of integers cast to floats (including 64-bit
+        integers cast to float64, which numpy considers safe) - by the range of the values exactly representable
+        in the float type.
+
+        Args:
+            name    :   Name of the channel the values belong to (used in the summary).
+            values  :   Values to be cast.
+            out     :   Array the cast values should be stored in; its shape must match that of the values.
+        """
+
+        source_dtype = values.dtype
+        target_dtype = out.dtype
+        if not values.size or (target_dtype != np.float16 and (
+                source_dtype == target_dtype or self._is_exact_cast(source_dtype, target_dtype))):
+            out[...] = values
+            return
+
+        summary = self._summary.get(name)
+        if summary is None:
+            summary = self._summary[name] = CastSummary(source_dtype=source_dtype, target_dtype=target_dtype)
+        summary.n_values += values.size
+
+        if np.issubdtype(target_dtype, np.integer):
+            self._cast_to_int(name, values, out, summary)
+        else:
+            self._cast_to_float(name, values, out, summary)
+
+    @staticmethod
+    def _is_exact_cast(source_dtype: np.dtype, target_dtype: np.dtype) -> bool:
+        """Check whether all values of the source type are represented exactly in the target type."""
+
+        if not np.can_cast(source_dtype, target_dtype, casting='safe'):
+            return False
+
+        if np.issubdtype(source_dtype, np.integer) and np.issubdtype(target_dtype, np.floating):
+            # e.g. int64 -> float64 is 'safe' for numpy, but integers larger than 2**53 are rounded
+            return bool(np.iinfo(source_dtype).bits <= np.finfo(target_dtype).nmant + 1)
+
+        return True
+
+    def _cast_to_int(self, name: str, values: np.ndarray, out: np.ndarray, summary: CastSummary) -> None:
+        """Cast integer or float values to an integer type."""
+
+        info = np.iinfo(out.dtype)
+        is_float = np.issubdtype(values.dtype, np.floating)
+
+        n_nan = n_overflow = 0
+        if not (values.min() >= info.min and values.max() <= info.max):  # also if there are any NaNs
+            if is_float:
+                nan_mask = ~np.isfinite(values)
+                n_nan = int(np.count_nonzero(nan_mask))
+                with np.errstate(invalid='ignore'):
+                    n_overflow = int(np.count_nonzero((values < info.min) | (values > info.max))) \
+                                 - int(np.count_nonzero(np.isinf(values)))
+            else:
+                n_overflow = int(np.count_nonzero((values < info.min) | (values > info.max)))
+
+            self._handle_damaged(name, n_overflow, n_nan, summary)
+
+            if self._policy is CastPolicy.CLIP:
+                values = np.clip(values, info.min, info.max)
+                if n_nan:
+                    values = np.where(np.isnan(values), 0, values)
+
+        with np.errstate(invalid='ignore', over='ignore'):
+            out[...] = values
+
+            if is_float:
+                # values changed by the cast, apart from the ones already counted as damaged
+                # (if clipped, the damaged values have already been replaced in 'values')
+                n_changed = int(np.count_nonzero(out != values))
+                if self._policy is not CastPolicy.CLIP:
+                    n_changed -= n_overflow + n_nan
+                summary.n_precision_loss += n_changed
+
+    def _cast_to_float(self, name: str, values: np.ndarray, out: np.ndarray, summary: CastSummary) -> None:
+        """Cast integer or float values to a float type (float16: to the range of FSHORT)."""
+
+        info = np.finfo(out.dtype)
+        low, high = (FSHORT_MIN, FSHORT_MAX) if out.dtype == np.float16 else (-info.max, info.max)
+
+        # values too large for the target type become infinities; NaNs are skipped by fmin/fmax
+        with np.errstate(over='ignore'):
+            out[...] = values
+
+        if not np.issubdtype(values.dtype, np.floating):
+            # large integer values might lose precision
+            limit = 2 ** (info.nmant + 1)  # integers up to this value are represented exactly
+            if values.min() < -limit or values.max() > limit:
+                summary.n_precision_loss += int(np.count_nonzero((values < -limit) | (values > limit)))
+
+        flat_values = values.ravel()
+        if not (np.fmax.reduce(flat_values) > high or np.fmin.reduce(flat_values) < low):
+            return
+
+        with np.errstate(invalid='ignore'):
+            overflow_mask = np.isfinite(values) & ((values > high) | (values < low))
+        n_overflow = int(np.count_nonzero(overflow_mask))
+        self._handle_damaged(name, n_overflow, 0, summary)
+
+        if self._policy is CastPolicy.CLIP and n_overflow:
+            out[...] = np.where(overflow_mask, np.clip(values, low, high), values)
+
+    def _handle_damaged(self, name: str, n_overflow: int, n_nan: int, summary: CastSummary) -> None:
+        """Update the summary with the damaged values; raise an error if so specified by the policy."""
+
+        if not n_overflow and not n_nan:
+            return
+
+        summary.n_overflow += n_overflow
+        summary.n_nan += n_nan
+
+        if self._policy is CastPolicy.RAISE:
+            raise ValueError(f"Data of channel '{name}' cannot be cast from {summary.source_dtype} to "
+                             f"{summary.target_dtype}: {n_overflow} value(s) out of range, {n_nan} NaN/inf value(s)")
+
+    def log_summary(self) -> None:
+        """Log the cast summaries of all channels; issue a warning for channels with damaged values."""
+
+        for name, summary in self._summary.items():
+            if summary.n_damaged:
+                action = "clipped" if self._policy is CastPolicy.CLIP else "cast with overflow"
+                logger.warning(f"Values of channel '{name}' {action} ({summary})")
+            elif summary.n_precision_loss:
+                logger.info(f"Values of channel '{name}' cast with precision loss ({summary})")
+            else:
+                logger.debug(f"Values of channel '{name}' cast without issues ({summary})")
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import numpy as np
+
+
+@dataclass
+class ChannelStatistics:
+    """Statistics of the data of a single channel, as written to the file (i.e. after the cast to its data type).
+
+    The statistics are updated chunk by chunk (see 'update'). For multidimensional channels, all elements
+    of all samples are taken into account.
+    """
+
+    n_values: int = 0                               #: number of values (sample elements) seen
+    n_nan: int = 0                                  #: number of NaN values
+    minimum: Optional[Union[int, float]] = None     #: minimal value (NaNs excluded); None if no values seen
+    maximum: Optional[Union[int, float]] = None     #: maximal value (NaNs excluded); None if no values seen
+
+    def update(self, values: np.ndarray) -> None:
+        """Update the statistics with a chunk of the channel's data.
+
+        For float data, NaNs are only looked for if the minimum of the chunk is NaN (NaNs propagate in min/max
+        reductions), so for data without NaNs, only the min and max reductions are computed.
+        """
+
+        if not values.size:
+            return
+
+        self.n_values += values.size
+
+        chunk_min = values.min()
+        if np.issubdtype(values.dtype, np.floating) and np.isnan(chunk_min):
+            n_nan = int(np.count_nonzero(np.isnan(values)))
+            self.n_nan += n_nan
+            if n_nan == values.size:
+                return
+            chunk_min, chunk_max = np.nanmin(values), np.nanmax(values)
+        else:
+            chunk_max = values.max()
+
+        chunk_min, chunk_max = chunk_min.item(), chunk_max.item()
+
+        if self.minimum is None or chunk_min < self.minimum:
+            self.minimum = chunk_min
+        if self.maximum is None or chunk_max > self.maximum:
+            self.maximum = chunk_max
+
+    def __str__(self) -> str:
+        return f"{self.n_values} value(s), {self.n_nan} NaN, min: {self.minimum}, max: {self.maximum}"
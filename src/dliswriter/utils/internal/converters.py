@@ -61,12 +61,13 @@ class ReprCodeConverter:
         'uint16': RepresentationCode.UNORM,
         'uint32': RepresentationCode.ULONG,
         'float32': RepresentationCode.FSINGL,
-        'float64': RepresentationCode.FDOUBL
+        'float64': RepresentationCode.FDOUBL,
+        'float16': RepresentationCode.FSHORT,   # channel data only: encoded as FSHORT words (see utils.internal.fshort)
     }
 
     # mapping of numerical representation codes on corresponding numpy dtypes
     repr_codes_to_numpy_dtypes: dict[RepresentationCode, numpy_dtype_type]\
-        = {v: getattr(np, k) for k, v in numpy_dtypes_to_repr_codes.items()}
+        = {v: getattr(np, k) for k, v in numpy_dtypes_to_repr_codes.items() if v is not RepresentationCode.FSHORT}
 
     # mapping of different object types on corresponding representation codes
     generic_types: dict[type, RepresentationCode] = {
@@ -98,6 +99,33 @@ class ReprCodeConverter:
 
         return cls.validate_numpy_dtype(dt)[1]
 
+    @classmethod
+    def determine_supported_numpy_dtype(cls, arr: np.ndarray) -> np.dtype:
+        """Determine a (native byte order) numpy dtype, corresponding to a representation code, for a numeric array.
+
+        Arrays of 64-bit integers are narrowed to 32-bit ones if their values fit in the 32-bit range
+        (Python integers are represented as SLONG as well). Half-precision floats are widened to single precision.
+        """
+
+        name = arr.dtype.name
+        kind = arr.dtype.kind
+        if kind == 'f' and arr.dtype.itemsize < 4:
+            return np.dtype(np.float32)
+
+        if name in cls.numpy_dtypes_to_repr_codes:
+            return np.dtype(name)
+
+        if kind in 'iu':
+            target = np.dtype(np.int32 if kind == 'i' else np.uint32)
+            info = np.iinfo(target)
+            if not arr.size or (arr.min() >= info.min and arr.max() <= info.max):
+                return target
+            raise ValueError(f"Values of the {name} array do not fit in the range of {target.name}, "
+                             f"the largest integer type with a corresponding representation code")
+
+        raise ValueError(f"Dtype {name} is not supported; "
+                         f"allowed dtypes are: {', '.join(cls.numpy_dtypes_to_repr_codes)}")
+
     @classmethod
     def determine_repr_code_from_generic_type(cls, t: type) -> RepresentationCode:
         """Determine representation code for a given type (e.g. int, float, str, etc.)."""
@@ -129,8 +157,20 @@ class ReprCodeConverter:
             is raised.
         """
 
-        repr_codes = [cls._determine_repr_code_single(v) for v in values]
-        if len(set(repr_codes)) == 1:
+        # values of the same type (other than arrays) have the same representation code, so it is determined
+        # only once per type
+        codes_per_type: dict[type, RepresentationCode] = {}
+        repr_codes_set: set[RepresentationCode] = set()
+        for v in values:
+            t = type(v)
+            if t is np.ndarray:
+                repr_codes_set.add(cls._determine_repr_code_single(v))
+            elif t not in codes_per_type:
+                codes_per_type[t] = cls._determine_repr_code_single(v)
+                repr_codes_set.add(codes_per_type[t])
+
+        repr_codes = sorted(repr_codes_set)
+        if len(repr_codes) == 1:
             return repr_codes[0]
 
         if not all(rc in cls.numeric_codes for rc in repr_codes):
@@ -0,0 +1,176 @@
+"""Decimation of the data of a frame into the rows of an overview frame, computed chunk by chunk.
+
+An overview frame (see LogicalFile.add_overview_frame) holds one row per window of 'factor' consecutive rows
+of the data of its source frame. Its rows are computed from the chunks of the source data as they are loaded
+for writing the source frame, so that the source data are read only once.
+"""
+
+from enum import Enum
+from typing import TYPE_CHECKING, NamedTuple, Optional, Sequence, TypeVar
+
+import numpy as np
+
+from dliswriter.utils.internal.fshort import decode_fshort, encode_fshort
+from dliswriter.utils.internal.types import number_type
+
+if TYPE_CHECKING:
+    from dliswriter.logical_record.eflr_types.frame import FrameItem
+
+
+T = TypeVar('T')
+
+
+class DecimationMethod(str, Enum):
+    """Define how the values of a window of rows are reduced to a row of an overview frame."""
+
+    PICK = 'pick'           #: values of the first row of the window
+    MEAN = 'mean'           #: mean of the (not absent) values of the window; mean index value
+    MIN_MAX = 'min-max'     #: minimum and maximum of the (not absent) values; index value of the first row
+
+
+class OverviewDefinition(NamedTuple):
+    """Overview frame of a frame, with the parameters of the decimation."""
+
+    frame: "FrameItem"
+    factor: int
+    method: DecimationMethod
+
+
+def expand_for_method(items: Sequence[T], method: DecimationMethod, has_index: bool) -> list[T]:
+    """Match items (e.g. channels) of a source frame with the channels of its overview frame.
+
+    For the 'min-max' method, each channel other than the index channel has two channels in the overview frame
+    (minimum and maximum values); the other methods keep the channels of the source frame.
+    """
+
+    if method is not DecimationMethod.MIN_MAX:
+        return list(items)
+
+    n_index = int(has_index)
+    return list(items[:n_index]) + [item for item in items[n_index:] for _ in range(2)]
+
+
+def n_overview_chunks(n_rows: int, chunk_rows: Optional[int], factor: int) -> int:
+    """Number of chunks of overview rows computed (see Decimator) from data loaded in chunks of the given size."""
+
+    chunk_rows = chunk_rows or n_rows
+    n_chunks = 0
+    n_windows = 0
+    for stop in range(chunk_rows, n_rows + chunk_rows, chunk_rows):
+        if (n_full := min(stop, n_rows) // factor) > n_windows:
+            n_chunks += 1
+            n_windows = n_full
+
+    return n_chunks + int(n_rows % factor != 0)
+
+
+class Decimator:
+    """Compute the rows of an overview frame from consecutive chunks of the data of its source frame.
+
+    Rows which do not fill a window are carried over to the next chunk; those remaining at the end of the data
+    make a last, partial window (see 'flush'). Absent values (NaNs and the absent values of the data sets)
+    are excluded from the means, minima, and maxima; a window with no valid values gets the absent value
+    of the data set (or NaN). Data sets written as FSHORT (loaded as FSHORT words) are decoded for the computation
+    and encoded back.
+    """
+
+    __slots__ = ('_factor', '_method', '_has_index', '_chunk_dtype', '_fshort_names', '_absent_values',
+                 '_overview_dtype', '_remainder')
+
+    def __init__(self, factor: int, method: DecimationMethod, dtype: np.dtype, chunk_dtype: np.dtype,
+                 absent_values: dict[str, number_type], has_index: bool) -> None:
+        """Initialise Decimator.
+
+        Args:
+            factor          :   Number of rows of the source data per row of the overview frame.
+            method          :   Method of reducing the values of a window to a single row.
+            dtype           :   Data type of the source data (float16 marking the data sets written as FSHORT).
+            chunk_dtype     :   Data type of the loaded chunks of the source data.
+            absent_values   :   Absent values of the data sets, by data type name.
+            has_index       :   True if the first data set is the index of the frame.
+        """
+
+        self._factor = factor
+        self._method = method
+        self._has_index = has_index
+        self._chunk_dtype = chunk_dtype
+        self._fshort_names = frozenset(name for name in dtype.names or () if dtype[name].base == np.float16)
+        self._absent_values = absent_values
+
+        names = chunk_dtype.names or ()
+        self._overview_dtype = chunk_dtype if method is not DecimationMethod.MIN_MAX else np.dtype(
+            [(names[0], chunk_dtype[names[0]])] * has_index +
+            [(f"{name}-{suffix}", chunk_dtype[name]) for name in names[int(has_index):] for suffix in ('MIN', 'MAX')]
+        )
+
+        self._remainder: Optional[np.ndarray] = None
+
+    def update(self, chunk: np.ndarray) -> np.ndarray:
+        """Compute the overview rows of the windows completed by the given chunk of the source data."""
+
+        rows = chunk if self._remainder is None else np.concatenate((self._remainder, chunk))
+        n_full = rows.shape[0] - rows.shape[0] % self._factor
+        self._remainder = rows[n_full:].copy() if n_full < rows.shape[0] else None
+
+        return self.decimate(rows[:n_full])
+
+    def flush(self) -> np.ndarray:
+        """Compute the overview row of the rows remaining at the end of the data (if any) and reset the decimator."""
+
+        rows, self._remainder = self._remainder, None
+        return self.decimate(rows if rows is not None else np.zeros(0, dtype=self._chunk_dtype))
+
+    def decimate(self, rows: np.ndarray) -> np.ndarray:
+        """Compute an overview row for each window of 'factor' rows (the last window might be partial)."""
+
+        starts = np.arange(0, rows.shape[0], self._factor)
+        if self._method is DecimationMethod.PICK:
+            return rows[starts]
+
+        overview = np.zeros(starts.shape[0], dtype=self._overview_dtype)
+        if not starts.size:
+            return overview
+
+        for i, name in enumerate(rows.dtype.names or ()):
+            if i == 0 and self._has_index:
+                overview[name] = self._reduce(rows[name], starts, name, np.add) \
+                    if self._method is DecimationMethod.MEAN else rows[name][starts]
+            elif self._method is DecimationMethod.MEAN:
+                overview[name] = self._reduce(rows[name], starts, name, np.add)
+            else:
+                overview[f"{name}-MIN"] = self._reduce(rows[name], starts, name, np.minimum)
+                overview[f"{name}-MAX"] = self._reduce(rows[name], starts, name, np.maximum)
+
+        return overview
+
+    def _reduce(self, values: np.ndarray, starts: np.ndarray, name: str, ufunc: np.ufunc) -> np.ndarray:
+        """Reduce the valid values of each window with the given ufunc (np.add: mean; np.minimum, np.maximum).
+
+        Args:
+            values  :   Values of a data set (as loaded in the chunks).
+            starts  :   Rows at which the consecutive windows start.
+            name    :   Data type name of the data set.
+            ufunc   :   Function reducing the values.
+
+        Returns:
+            Reduced values, one per window, of the data type of the loaded values.
+        """
+
+        x = decode_fshort(values).astype(np.float64) if name in self._fshort_names else values.astype(np.float64)
+        absent_value = self._absent_values.get(name)
+        missing = np.isnan(x) if absent_value is None else np.isnan(x) | (x == absent_value)
+
+        fill = 0. if ufunc is np.add else np.inf if ufunc is np.minimum else -np.inf
+        counts = np.add.reduceat((~missing).astype(np.int64), starts, axis=0)
+        reduced = ufunc.reduceat(np.where(missing, fill, x), starts, axis=0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result = reduced / counts if ufunc is np.add else np.where(counts > 0, reduced, np.nan)
+        if absent_value is not None:
+            result[counts == 0] = absent_value
+
+        if name in self._fshort_names:
+            return encode_fshort(result)
+        if values.dtype.kind in 'iu':
+            return np.rint(result).astype(values.dtype)
+        return result.astype(values.dtype)
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+# candidate data types for narrowing, in the order of preference (smallest first; integers before floats)
+_UNSIGNED_CANDIDATES = (np.dtype(np.uint8), np.dtype(np.uint16), np.dtype(np.uint32))
+_SIGNED_CANDIDATES = (np.dtype(np.int8), np.dtype(np.int16), np.dtype(np.int32))
+
+
+@dataclass
+class NarrowingProposal:
+    """Proposal of the smallest data type (representation code) representing the data of a channel losslessly."""
+
+    name: str                   #: name of the channel (data set)
+    current_dtype: np.dtype     #: data type the data would be written in
+    proposed_dtype: np.dtype    #: smallest data type representing all the values exactly; same as current if none
+    n_values: int               #: number of values (sample elements) of the channel
+
+    @property
+    def narrowed(self) -> bool:
+        """True if the proposed data type is smaller than the current one."""
+
+        return self.proposed_dtype.itemsize < self.current_dtype.itemsize
+
+    @property
+    def bytes_saved(self) -> int:
+        """Number of bytes of the frame data saved by writing the values in the proposed data type."""
+
+        return self.n_values * (self.current_dtype.itemsize - self.proposed_dtype.itemsize)
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.current_dtype} -> {self.proposed_dtype} ({self.bytes_saved} bytes saved)"
+
+
+class NarrowingAnalysis:
+    """Check - chunk by chunk - in which smaller data types the data of a channel can be represented exactly.
+
+    For float data, the checks are: whether all values are integers (so that they can be written as integers
+    in the range of the values) and whether they survive a round trip through float32. Each check is skipped
+    for the following chunks once it has failed.
+    """
+
+    __slots__ = ('_analysed', '_integral', '_float32_exact', '_minimum', '_maximum')
+
+    def __init__(self) -> None:
+        self._analysed = False
+        self._integral = True
+        self._float32_exact = True
+        self._minimum: Optional[float] = None
+        self._maximum: Optional[float] = None
+
+    def update(self, values: np.ndarray) -> None:
+        """Update the analysis with a chunk of the channel's data (as it would be written)."""
+
+        if not values.size:
+            return
+
+        self._analysed = True
+        is_float = values.dtype.kind == 'f'
+
+        if self._integral:
+            if is_float and not np.array_equal(np.trunc(values), values):  # False also for NaNs
+                self._integral = False
+            else:
+                chunk_min, chunk_max = values.min().item(), values.max().item()
+                self._minimum = chunk_min if self._minimum is None else min(self._minimum, chunk_min)
+                self._maximum = chunk_max if self._maximum is None else max(self._maximum, chunk_max)
+
+        if self._float32_exact and is_float and values.dtype.itemsize > 4:
+            with np.errstate(over='ignore'):
+                self._float32_exact = np.array_equal(values.astype(np.float32), values, equal_nan=True)
+
+    def propose(self, dtype: np.dtype) -> np.dtype:
+        """Return the smallest data type which represents all the analysed values exactly.
+
+        Integer types are only proposed for values within their range. Signed integer types are only proposed
+        for data which are signed integers already (some DLIS viewers cannot interpret signed integers correctly).
+        If no smaller data type is found (or no values have been analysed), the provided dtype is returned.
+        """
+
+        if not self._analysed:
+            return dtype
+
+        candidates: list[np.dtype] = []
+
+        if self._integral and self._minimum is not None and self._maximum is not None:
+            candidates.extend(_UNSIGNED_CANDIDATES)
+            if dtype.kind == 'i':
+                candidates.extend(_SIGNED_CANDIDATES)
+        if dtype.kind == 'f' and self._float32_exact:
+            candidates.append(np.dtype(np.float32))
+
+        for candidate in sorted(candidates, key=lambda dt: (dt.itemsize, dt.kind == 'f')):
+            if candidate.itemsize >= dtype.itemsize:
+                break
+            if candidate.kind == 'f' or self._in_range(candidate):
+                return candidate
+
+        return dtype
+
+    def _in_range(self, dtype: np.dtype) -> bool:
+        """Check whether the analysed (integer) values are within the range of the integer data type."""
+
+        info = np.iinfo(dtype)
+        return info.min <= self._minimum <= self._maximum <= info.max  # type: ignore  # checked in 'propose'
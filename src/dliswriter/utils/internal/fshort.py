@@ -0,0 +1,57 @@
+"""Vectorized conversion of floats to and from RP66 FSHORT (low precision floating point) representation.
+
+An FSHORT value is a 16-bit word: a 12-bit fractional two's complement mantissa M (sign bit included) followed by
+a 4-bit unsigned exponent E; the value is M * 2**E. The mantissa has the same number of significant bits as that
+of a half-precision float (float16), so float16 values with magnitudes in [0.5, 32768) are represented exactly.
+Smaller magnitudes have a fixed resolution of 2**-11 (the exponent cannot be negative).
+"""
+
+import numpy as np
+
+
+FSHORT_MAX = 2047 / 2048 * 2 ** 15     #: largest value representable as FSHORT
+FSHORT_MIN = -2 ** 15                  #: smallest value representable as FSHORT
+
+
+def encode_fshort(values: np.ndarray) -> np.ndarray:
+    """Convert float values to FSHORT words.
+
+    Values outside the FSHORT range (including infinities) are saturated to the smallest/largest representable
+    value. NaNs (which cannot be represented) are encoded as 0. When writing channel data, out-of-range values
+    are handled (according to the cast policy) before the encoding; see CastChecker.
+
+    Args:
+        values  :   Array of floats (of any shape).
+
+    Returns:
+        Array of the same shape, of dtype uint16 (native byte order), containing the FSHORT words.
+    """
+
+    x = np.nan_to_num(values.astype(np.float64), nan=0., posinf=FSHORT_MAX, neginf=FSHORT_MIN)
+
+    exponent = np.maximum(np.frexp(x)[1], 0)
+    mantissa = np.rint(np.ldexp(x, 11 - exponent))  # x / 2**E, as a 12-bit fraction
+
+    # rounding up to 1.0 (not representable in the fraction) - renormalise
+    carry = mantissa >= 2048
+    mantissa[carry] /= 2
+    exponent[carry] += 1
+
+    # out of range - saturate
+    overflow = exponent > 15
+    exponent[overflow] = 15
+    mantissa[overflow] = np.where(x[overflow] > 0, 2047, -2048)
+
+    words: np.ndarray = (((mantissa.astype(np.int64) & 0xFFF) << 4) | exponent).astype(np.uint16)
+    return words
+
+
+def decode_fshort(words: np.ndarray) -> np.ndarray:
+    """Convert FSHORT words (uint16, native byte order) to float32 values."""
+
+    words = words.astype(np.int32)
+    mantissa = words >> 4
+    mantissa[mantissa >= 2048] -= 4096  # two's complement
+
+    values: np.ndarray = np.ldexp(mantissa / 2048, words & 0xF).astype(np.float32)
+    return values
@@ -0,0 +1,76 @@
+"""Binary search for row ranges of monotonic index data sets, reading only a few chunks of (e.g. HDF5) data."""
+
+from typing import Any, Union
+
+import numpy as np
+
+from dliswriter.utils.internal.types import number_type
+
+
+def _search_sorted(dataset: Any, value: float, lo: int, hi: int, side: str, sign: int, block_rows: int) -> int:
+    """Find the row at which 'value' would be inserted in the sorted rows lo:hi of the data set (as np.searchsorted).
+
+    Single values are read while narrowing the range down to 'block_rows' rows; these are then read at once.
+
+    Args:
+        dataset     :   1D data set (numpy array, h5py.Dataset) whose values multiplied by 'sign' are sorted.
+        value       :   Value to be found (multiplied by 'sign' already).
+        lo          :   First row of the searched range.
+        hi          :   Row after the last one of the searched range.
+        side        :   'left' for the first row with value >= 'value'; 'right' for the first one with value > 'value'.
+        sign        :   1 for ascending data, -1 for descending data.
+        block_rows  :   Number of rows below which the remaining range is read as a whole.
+    """
+
+    while hi - lo > block_rows:
+        mid = (lo + hi) // 2
+        mid_value = sign * float(dataset[mid])
+        if mid_value < value or (side == 'right' and mid_value == value):
+            lo = mid + 1
+        else:
+            hi = mid
+
+    block = sign * np.asarray(dataset[lo:hi], dtype=np.float64)
+    return lo + int(np.searchsorted(block, value, side=side))  # type: ignore  # side is 'left' or 'right'
+
+
+def find_rows_in_range(dataset: Any, start: number_type, stop: number_type, from_idx: int = 0,
+                       to_idx: Union[int, None] = None, block_rows: Union[int, None] = None) -> tuple[int, int]:
+    """Find the rows of a monotonic (ascending or descending) data set with values in the range [start, stop].
+
+    Args:
+        dataset     :   1D data set (numpy array, h5py.Dataset) with monotonic values (e.g. depth or time).
+        start       :   Smallest value of the range.
+        stop        :   Largest value of the range (inclusive).
+        from_idx    :   First row of the searched part of the data set.
+        to_idx      :   Row after the last one of the searched part of the data set. Defaults to the length.
+        block_rows  :   Number of rows read at once to finish the search, e.g. the number of rows of the HDF5
+                        chunks of the data set. Defaults to the chunk rows of the data set, if it is chunked
+                        (h5py.Dataset), or 1 otherwise.
+
+    Returns:
+        The first row with a value in the range and the row after the last one with a value in the range.
+        If no values are in the range, both rows are equal.
+    """
+
+    if start > stop:
+        raise ValueError(f"Start of the range ({start}) cannot be larger than its stop ({stop})")
+
+    if to_idx is None:
+        to_idx = dataset.shape[0]
+
+    if block_rows is None:
+        chunks = getattr(dataset, 'chunks', None)  # h5py.Dataset: shape of the HDF5 chunks (None if not chunked)
+        block_rows = chunks[0] if isinstance(chunks, tuple) else 1
+
+    if to_idx <= from_idx:
+        return from_idx, from_idx
+
+    descending = float(dataset[to_idx - 1]) < float(dataset[from_idx])
+    sign = -1 if descending else 1
+    low, high = (-float(stop), -float(start)) if descending else (float(start), float(stop))
+
+    first = _search_sorted(dataset, low, from_idx, to_idx, 'left', sign, block_rows)
+    last = _search_sorted(dataset, high, first, to_idx, 'right', sign, block_rows)
+
+    return first, last
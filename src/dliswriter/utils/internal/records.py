@@ -0,0 +1,87 @@
+"""Iterate over definitions of multiple objects (e.g. a channel catalogue) provided in tabular form."""
+
+from typing import Any, Collection, Generator, Iterable, Mapping, Union
+
+import numpy as np
+
+
+records_type = Union[Iterable[Mapping[str, Any]], np.ndarray, Any]  #: list of dicts, structured array, or DataFrame
+
+
+def _is_missing(value: Any) -> bool:
+    """Check whether a value denotes a missing cell of a table (None or a float NaN, e.g. from a DataFrame)."""
+
+    return value is None or (value.__class__ is float and value != value)
+
+
+def _normalise(value: Any) -> Any:
+    """Convert numpy scalars and bytes (e.g. from a structured array) to the corresponding Python objects."""
+
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bytes):
+        value = value.decode('ascii')
+    return value
+
+
+def _check_keys(keys: Collection[str], allowed_keys: Collection[str], required_keys: Collection[str]) -> None:
+    """Check that the keys (column names) are all allowed and that all the required ones are present."""
+
+    if unknown := [k for k in keys if k not in allowed_keys]:
+        raise ValueError(f"Unexpected column(s): {', '.join(map(repr, unknown))}; "
+                         f"allowed columns are: {', '.join(map(repr, sorted(allowed_keys)))}")
+
+    if missing := [k for k in required_keys if k not in keys]:
+        raise ValueError(f"Missing required column(s): {', '.join(map(repr, missing))}")
+
+
+def _iter_rows(keys: tuple[str, ...], rows: Iterable[Iterable[Any]]) -> Generator[dict[str, Any], None, None]:
+    """Yield dictionaries made of the keys and values of each of the rows, skipping the missing values."""
+
+    for row in rows:
+        yield {k: _normalise(v) for k, v in zip(keys, row) if not _is_missing(v)}
+
+
+def iter_records(records: records_type, allowed_keys: Collection[str],
+                 required_keys: Collection[str] = ('name',)) -> Generator[dict[str, Any], None, None]:
+    """Iterate over the records, yielding a dictionary of the (non-missing) values of each of them.
+
+    The names of the columns are validated once, before any record is yielded; for a list of dictionaries,
+    the keys are validated once per distinct set of keys.
+
+    Args:
+        records         :   The records. Accepted forms:
+                                - an iterable of mappings (e.g. a list of dicts),
+                                - a numpy structured array (field names are the column names),
+                                - a pandas DataFrame (or any object with 'columns' and 'itertuples' like it).
+                            None and NaN values are considered missing and are not included in the yielded dicts.
+        allowed_keys    :   Names of the columns which are allowed.
+        required_keys   :   Names of the columns which must be present.
+    """
+
+    if isinstance(records, np.ndarray):
+        if records.dtype.names is None:
+            raise TypeError("Records provided as a numpy array must be a structured array")
+        keys = records.dtype.names
+        _check_keys(keys, allowed_keys, required_keys)
+        yield from _iter_rows(keys, records.tolist())
+
+    elif hasattr(records, 'columns') and hasattr(records, 'itertuples'):
+        keys = tuple(str(c) for c in records.columns)
+        _check_keys(keys, allowed_keys, required_keys)
+        yield from _iter_rows(keys, records.itertuples(index=False, name=None))
+
+    elif isinstance(records, Iterable) and not isinstance(records, (str, bytes, Mapping)):
+        checked: set[frozenset] = set()
+        for record in records:
+            if not isinstance(record, Mapping):
+                raise TypeError(f"Expected a mapping (e.g. a dict) describing a single record; "
+                                f"got {type(record)}: {record}")
+            if (key_set := frozenset(record)) not in checked:
+                _check_keys(key_set, allowed_keys, required_keys)
+                checked.add(key_set)
+            yield {k: v for k, v in record.items() if not _is_missing(v)}
+
+    else:
+        raise TypeError(f"Expected a list of dicts, a numpy structured array, or a DataFrame; "
+                        f"got {type(records)}: {records}")
@@ -0,0 +1,84 @@
+from typing import Optional, Union
+
+import numpy as np
+
+
+class SamplingDetection:
+    """Detect - chunk by chunk - the effective sampling of a data set padded with absent values (NaNs, masked values).
+
+    E.g. a 10 Hz channel aligned on a 100 Hz grid has a valid value in every 10th row. The sampling is described
+    by the stride: the greatest common divisor of the distances between the rows with valid values, and the phase:
+    the row (modulo stride) of the first valid value. All the valid values are then found in the rows
+    phase, phase + stride, phase + 2 * stride, etc.; rows in between can be skipped without losing any values.
+    """
+
+    __slots__ = ('_first', '_stride', '_n_valid')
+
+    def __init__(self) -> None:
+        self._first: Optional[int] = None
+        self._stride = 0
+        self._n_valid = 0
+
+    @staticmethod
+    def valid_rows(values: np.ndarray) -> np.ndarray:
+        """Return a boolean array, True for the rows (first axis) of the values containing any non-absent values."""
+
+        valid = ~np.ma.getmaskarray(values)
+        if values.dtype.kind == 'f':
+            np.logical_and(valid, ~np.isnan(np.ma.getdata(values)), out=valid)
+        return np.any(valid.reshape(valid.shape[0], -1), axis=1)  # type: ignore  # array for 2D input
+
+    def update(self, values: np.ndarray, start: int) -> None:
+        """Update the detection with a chunk of the data set.
+
+        Args:
+            values  :   Chunk of the data set (e.g. a numpy masked array).
+            start   :   Row of the data set at which the chunk starts.
+        """
+
+        rows = np.flatnonzero(self.valid_rows(values)) + start
+        if not rows.size:
+            return
+
+        self._n_valid += rows.size
+
+        if self._first is None:
+            self._first = int(rows[0])
+        self._stride = int(np.gcd.reduce(rows - self._first, initial=self._stride))
+
+    @property
+    def n_valid(self) -> int:
+        """Number of rows with valid values."""
+
+        return self._n_valid
+
+    @property
+    def sampling(self) -> Optional[tuple[int, int]]:
+        """Phase and stride of the valid values, or None if fewer than 2 valid values have been found."""
+
+        if self._first is None or not self._stride:
+            return None
+
+        return self._first % self._stride, self._stride
+
+
+def detect_sampling(data: dict[str, np.ndarray], chunk_rows: Union[int, None] = None) -> dict[str, SamplingDetection]:
+    """Detect the sampling (phase, stride) of the data sets, processing them in chunks (see SamplingDetection).
+
+    Args:
+        data        :   Data sets of the same number of rows, by name.
+        chunk_rows  :   Number of rows per chunk. If None, the data sets are processed as a whole.
+
+    Returns:
+        Detections (holding the phase and stride) of the data sets, by name.
+    """
+
+    n_rows = next(iter(data.values())).shape[0] if data else 0
+    chunk_rows = chunk_rows or max(n_rows, 1)
+    detections = {name: SamplingDetection() for name in data}
+
+    for start in range(0, n_rows, chunk_rows):
+        for name, detection in detections.items():
+            detection.update(data[name][start:start + chunk_rows], start=start)
+
+    return detections
@@ -1,15 +1,26 @@
 from collections.abc import Sequence
-from typing import Generator, Union, Any
+from typing import Generator, Union, Any, Optional
 
 
 class SizedGenerator(Sequence):
-    """Wrap a generator with a pre-defined number of elements."""
+    """Wrap a generator with a pre-defined number of elements.
 
-    def __init__(self, generator: Generator, size: int) -> None:
+    The number of elements can also be unknown (None); in this case, calling len() on the object raises a TypeError.
+    """
+
+    def __init__(self, generator: Generator, size: Optional[int]) -> None:
         self._generator = generator
         self._size = size
 
+    @property
+    def size(self) -> Optional[int]:
+        """Number of elements of the generator (None if unknown)."""
+
+        return self._size
+
     def __len__(self) -> int:
+        if self._size is None:
+            raise TypeError("Number of elements of the generator is unknown")
         return self._size
 
     def __iter__(self) -> Generator:
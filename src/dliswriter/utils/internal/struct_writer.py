@@ -1,8 +1,10 @@
+import struct
 from datetime import datetime, timezone
-from typing import Any, TYPE_CHECKING
-from functools import lru_cache
+from typing import Any, TYPE_CHECKING, Sequence
+import numpy as np
 
 from dliswriter.utils.internal.internal_enums import RepresentationCode
+from dliswriter.configuration import global_config
 
 if TYPE_CHECKING:
     from dliswriter.logical_record.core.eflr import EFLRItem
@@ -136,10 +138,22 @@ _struct_dict = {
 }
 
 
-@lru_cache(maxsize=65536)
+def _write_struct(representation_code: RepresentationCode, value: Any) -> bytes:
+    """Convert a value to bytes according to the RP66 V1 spec (without using a cache). See 'write_struct'."""
+
+    func = _struct_dict.get(representation_code, None)  # get a converter corresponding to the repr code
+    if func:
+        return func(value)  # type: ignore  # that's the point, we're calling for any type
+
+    return representation_code.convert(value)  # if no converter was found, use the one built in the enum
+
+
 def write_struct(representation_code: RepresentationCode, value: Any) -> bytes:
     """Convert a value to bytes according to the RP66 V1 spec.
 
+    If an EncodingCache is active (see 'encoding_cache_scope'; DLISFile.write uses one by default), previously
+    encoded values are retrieved from the cache.
+
     Args:
         representation_code :   The way the value should be represented as.
         value               :   Value to be converted.
@@ -148,8 +162,70 @@ def write_struct(representation_code: RepresentationCode, value: Any) -> bytes:
         Value converted to bytes depending on representation_code and RP66 V1 spec.
     """
 
-    func = _struct_dict.get(representation_code, None)  # get a converter corresponding to the repr code
-    if func:
-        return func(value)  # type: ignore  # that's the point, we're calling for any type
+    cache = global_config.encoding_cache
+    if cache is not None:
+        return cache.encode(representation_code, value, _write_struct)
 
-    return representation_code.convert(value)  # if no converter was found, use the one built in the enum
+    return _write_struct(representation_code, value)
+
+
+def write_structs(representation_code: RepresentationCode, values: Sequence) -> bytes:
+    """Convert multiple values, all with the same representation code, to bytes according to the RP66 V1 spec.
+
+    Values of the numeric representation codes are packed with a single struct call; other values are converted
+    one by one with 'write_struct'.
+
+    Args:
+        representation_code :   The way the values should be represented as.
+        values              :   Values to be converted.
+
+    Returns:
+        Concatenated bytes of the converted values.
+    """
+
+    converter = representation_code.converter
+    if converter is not None and representation_code not in _struct_dict and len(converter.format) == 2:
+        try:
+            return struct.pack('>' + converter.format[1] * len(values), *values)
+        except struct.error:
+            pass  # let the one-by-one conversion below raise the error for the offending value
+
+    return b''.join(write_struct(representation_code, v) for v in values)
+
+
+def write_struct_array(representation_code: RepresentationCode, values: np.ndarray) -> bytes:
+    """Convert a numpy array of values to bytes according to the RP66 V1 spec.
+
+    For the numeric representation codes, the array is cast to the corresponding big-endian dtype at once.
+    Integer codes require the values to be integers within the range of the code; for float codes, values too large
+    for the code cause an error. Arrays with other representation codes are converted element by element
+    (see 'write_structs'). Multidimensional arrays are flattened in row-major order.
+
+    Args:
+        representation_code :   The way the values should be represented as.
+        values              :   Values to be converted.
+
+    Returns:
+        Concatenated bytes of the converted values.
+    """
+
+    converter = representation_code.converter
+    if converter is None or representation_code in _struct_dict or len(converter.format) != 2:
+        return write_structs(representation_code, values.ravel().tolist())
+
+    target_dtype = np.dtype('>' + converter.format[1])
+    name = representation_code.name
+
+    if target_dtype.kind in 'iu':
+        if values.dtype.kind == 'f' and not np.array_equal(values, np.trunc(values)):
+            raise ValueError(f"Non-integer values cannot be represented as {name}")
+        info = np.iinfo(target_dtype)
+        if values.size and (values.min() < info.min or values.max() > info.max):
+            raise ValueError(f"Values outside the range [{info.min}, {info.max}] cannot be represented as {name}")
+        return values.astype(target_dtype).tobytes()
+
+    try:
+        with np.errstate(over='raise'):
+            return values.astype(target_dtype).tobytes()
+    except FloatingPointError:
+        raise ValueError(f"Values too large to be represented as {name}")
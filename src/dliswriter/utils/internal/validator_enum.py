@@ -8,6 +8,9 @@ from dliswriter.configuration import global_config
 logger = logging.getLogger(__name__)
 
 
+_converters: dict[tuple, Callable] = {}  # converters already made by ValidatorEnum.make_converter
+
+
 class ValidatorEnum(str, Enum):
     """Define an enum with a converter defining ability.
 
@@ -16,23 +19,31 @@ class ValidatorEnum(str, Enum):
     member is found.
 
     The enum's values are expected to be strings.
+
+    Converters are shared: 'make_converter' called repeatedly with the same arguments returns the same callable.
     """
 
     value: str
 
     @classmethod
     def make_converter(cls, label: Optional[str] = None, allow_none: bool = False, soft: bool = False) -> Callable:
+        key = (cls, label, allow_none, soft)
+        converter = _converters.get(key)
+        if converter is None:
+            converter = _converters[key] = cls._make_converter(label=label, allow_none=allow_none, soft=soft)
+        return converter
+
+    @classmethod
+    def _make_converter(cls, label: Optional[str], allow_none: bool, soft: bool) -> Callable:
+        allowed_values = frozenset(m.value for m in cls.__members__.values())  # looked up instead of calling cls(v)
+
         def converter(v: Union[str, None, "ValidatorEnum"]) -> Union[str, None]:
             if allow_none and v is None:
                 return None
 
-            try:
-                cls(v)
-            except ValueError:
-                pass
-            else:
-                if isinstance(v, cls):
-                    return v.value
+            if isinstance(v, cls):
+                return v.value
+            if isinstance(v, str) and v in allowed_values:
                 return v
 
             if not isinstance(v, str):
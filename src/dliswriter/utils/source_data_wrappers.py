@@ -1,11 +1,22 @@
 import numpy as np
-import h5py    # type: ignore  # untyped library
-from typing import Union, Optional, Any, Generator
+from typing import Union, Optional, Any, Generator, TYPE_CHECKING
 import logging
 from abc import ABC
+from typing_extensions import Self
 
 from dliswriter.utils.internal.converters import ReprCodeConverter
-from dliswriter.utils.internal.types import data_form_type, data_source_type, file_name_type, numpy_dtype_type
+from dliswriter.utils.internal.cast_checker import CastChecker, CastPolicy, CastSummary
+from dliswriter.utils.internal.channel_statistics import ChannelStatistics
+from dliswriter.utils.internal.dtype_narrowing import NarrowingAnalysis, NarrowingProposal
+from dliswriter.utils.internal.fshort import encode_fshort
+from dliswriter.utils.internal.index_search import find_rows_in_range
+from dliswriter.utils.channel_transform import ChannelTransform
+from dliswriter.utils.virtual_channel import VirtualChannel
+from dliswriter.utils.internal.types import (data_form_type, data_source_type, file_name_type, numpy_dtype_type,
+                                             number_type)
+
+if TYPE_CHECKING:
+    import h5py    # type: ignore  # untyped library
 
 
 logger = logging.getLogger(__name__)
@@ -16,7 +27,11 @@ class SourceDataWrapper(ABC):
 
     def __init__(self, data_source: data_source_type, mapping: dict[str, str],
                  known_dtypes: Optional[dict[str, numpy_dtype_type]] = None, from_idx: int = 0,
-                 to_idx: Optional[int] = None) -> None:
+                 to_idx: Optional[int] = None, cast_policy: Union[CastPolicy, str] = CastPolicy.WARN,
+                 absent_values: Optional[dict[str, number_type]] = None,
+                 default_absent_value: Optional[number_type] = None,
+                 transforms: Optional[dict[str, ChannelTransform]] = None,
+                 virtual_channels: Optional[dict[str, VirtualChannel]] = None) -> None:
         """Initialise a SourceDataWrapper.
 
         Args:
@@ -28,6 +43,24 @@ class SourceDataWrapper(ABC):
                                 the data.
             from_idx        :   Index from which data should be loaded (or number of initial rows to ignore).
             to_idx          :   Index up to which data should be loaded.
+            cast_policy     :   What to do if data sets have values which cannot be represented in the data types
+                                they are cast to (e.g. known_dtypes): 'raise' an error, 'clip' the values,
+                                or 'warn' (cast the values as they are, letting them overflow). See CastChecker.
+            absent_values   :   Mapping of data type names on the values to be written in place of absent values:
+                                NaNs (in float data sets, or float source data cast to integers) and masked values
+                                (if the source data set is a numpy masked array). Data types without an absent value
+                                are loaded as they are. An absent value which cannot be represented exactly
+                                in the target data type of its data set is an error.
+            default_absent_value:   Absent value of the data sets not included in 'absent_values' (e.g. the absent
+                                value of a frame). It is only used for the data sets whose target data types
+                                can represent it exactly (e.g. -999.25 is not used for integer data sets).
+            transforms      :   Mapping of data type names on transforms (e.g. unit conversions) applied to the data
+                                sets when loading chunks, before filling in the absent values. The transforms are
+                                computed in floating point; for integer target data types, the transformed values
+                                are cast (according to 'cast_policy').
+            virtual_channels:   Mapping of data type names on virtual channels - data computed for each chunk
+                                (e.g. evenly spaced index values, or values derived from other data sets) rather
+                                than read from the data source. Their entries in 'mapping' are ignored.
 
             Note:
                 All data sets from 'mapping' should be found in the 'data_source'. On the other hand, 'data_source'
@@ -40,11 +73,43 @@ class SourceDataWrapper(ABC):
         self._data_source = data_source
         self._mapping = mapping
 
-        # numpy dtype object which will be used for constructing data chunks (see 'load_chunk')
-        self._dtype = self.determine_dtypes(self._data_source, self._mapping, known_dtypes=known_dtypes)
+        # data sets computed for each chunk rather than read from the data source, by data type name
+        self._virtual_channels = virtual_channels or {}
 
-        # total number of rows - guessed from the first dataset
-        total_n_rows = self._data_source[next(iter(mapping.values()))].shape[0]
+        # numpy dtype object which will be used for constructing data chunks (see 'load_chunk')
+        self._dtype = self.determine_dtypes(self._data_source, self._mapping, known_dtypes=known_dtypes,
+                                            virtual_channels=self._virtual_channels)
+
+        # data sets written as FSHORT (float16 in the dtype); in the loaded chunks, they hold FSHORT words (uint16)
+        self._fshort_names = [name for name in self._mapping if self._dtype[name].base == np.float16]
+        self._chunk_dtype = self._dtype if not self._fshort_names else np.dtype([
+            (name, np.dtype((np.uint16, self._dtype[name].shape)) if name in self._fshort_names else self._dtype[name])
+            for name in self._mapping
+        ])
+
+        # casts the data sets to the types specified in the dtype (when loading chunks); collects cast summaries
+        self._cast_checker = CastChecker(cast_policy)
+
+        # values replacing NaNs and masked values, by data type name
+        self._absent_values = self._check_absent_values(absent_values or {})
+        if default_absent_value is not None:
+            self._absent_values.update({
+                name: default_absent_value for name in self._mapping
+                if name not in self._absent_values and self._can_represent(name, default_absent_value)
+            })
+
+        # transforms applied to the loaded data sets, by data type name
+        self._transforms = transforms or {}
+
+        # statistics of the loaded (cast) data, by data type name; collected only if requested
+        self._statistics: dict[str, ChannelStatistics] = {}
+        self._collect_statistics = False
+
+        # total number of rows - guessed from the first dataset (which is not virtual)
+        stored_names = [loc for name, loc in mapping.items() if name not in self._virtual_channels]
+        if not stored_names:
+            raise ValueError("At least one of the data sets must be read from the data source (not virtual)")
+        total_n_rows = self._data_source[stored_names[0]].shape[0]
 
         self._from_idx = from_idx
         self._to_idx = to_idx if to_idx is not None else total_n_rows
@@ -62,6 +127,18 @@ class SourceDataWrapper(ABC):
 
         return self._n_rows
 
+    @property
+    def from_idx(self) -> int:
+        """Row of the data source from which the data are loaded."""
+
+        return self._from_idx
+
+    @property
+    def virtual_channels(self) -> dict[str, VirtualChannel]:
+        """Data sets computed for each chunk rather than read from the data source, by data type name."""
+
+        return self._virtual_channels
+
     @property
     def data_source(self) -> data_source_type:
         """Source data object."""
@@ -74,9 +151,138 @@ class SourceDataWrapper(ABC):
 
         return self._dtype
 
+    @property
+    def chunk_dtype(self) -> np.dtype:
+        """Data type of the loaded chunks: 'dtype', with the data sets written as FSHORT holding FSHORT words."""
+
+        return self._chunk_dtype
+
+    @property
+    def absent_values(self) -> dict[str, number_type]:
+        """Values replacing NaNs and masked values of the data sets, by data type name."""
+
+        return self._absent_values.copy()
+
+    @property
+    def cast_summary(self) -> dict[str, CastSummary]:
+        """Summaries of casting the data sets (which needed casting) to the target data types, by data type name."""
+
+        return self._cast_checker.summary
+
+    def log_cast_summary(self) -> None:
+        """Log summaries of casting the data sets to the target data types (see CastChecker.log_summary)."""
+
+        self._cast_checker.log_summary()
+
+    def _check_absent_values(self, absent_values: dict[str, number_type]) -> dict[str, number_type]:
+        """Check that the absent values can be represented exactly in the target data types of the data sets."""
+
+        for name, value in absent_values.items():
+            if not self._can_represent(name, value):
+                raise ValueError(f"Absent value {value} of '{name}' cannot be represented as {self._dtype[name].base}")
+
+        return dict(absent_values)
+
+    def _can_represent(self, name: str, value: number_type) -> bool:
+        """Check whether the value can be represented exactly in the target data type of the data set."""
+
+        with np.errstate(over='ignore', invalid='ignore'):
+            return bool(np.array(value).astype(self._dtype[name].base).item() == value)
+
+    @property
+    def channel_statistics(self) -> dict[str, ChannelStatistics]:
+        """Statistics (min, max, NaN count) of the data sets, by data type name (see 'collect_statistics').
+
+        Empty if the statistics have not been collected.
+        """
+
+        return self._statistics.copy()
+
+    def collect_statistics(self) -> None:
+        """Collect statistics of the data sets (after the cast to the target data types) when loading chunks.
+
+        The statistics are computed on the chunks which are loaded anyway (e.g. to be written to a file),
+        so no additional pass over the data is needed. The statistics collected so far are discarded.
+        """
+
+        self._statistics = {name: ChannelStatistics() for name in self._mapping}
+        self._collect_statistics = True
+
+    def compute_statistics(self, chunk_rows: Union[int, None]) -> dict[str, ChannelStatistics]:
+        """Load all the data in chunks (without keeping them) to compute statistics of the data sets.
+
+        This is a pre-pass over the data, meant for when the statistics are needed before the data are written
+        (e.g. to be included in the metadata). The data are cast as they would be when written, but the cast
+        summaries are not affected (an error is raised, though, if the cast policy says so).
+        The statistics are not collected again when the chunks are loaded next time.
+
+        Args:
+            chunk_rows  :   Maximal number of rows per chunk (see 'iter_chunks').
+
+        Returns:
+            Statistics of the data sets, by data type name.
+        """
+
+        cast_checker = self._cast_checker
+        self._cast_checker = CastChecker(cast_checker.policy)
+        self.collect_statistics()
+
+        try:
+            for _ in self.iter_chunks(chunk_rows):
+                pass
+        finally:
+            self._cast_checker = cast_checker
+            self._collect_statistics = False
+
+        return self.channel_statistics
+
+    def analyse_narrowing(self, chunk_rows: Union[int, None]) -> dict[str, NarrowingProposal]:
+        """Load all the data in chunks (without keeping them) to find the smallest lossless data type of each data set.
+
+        The data are analysed as they would be written: cast to the current target data types, transformed,
+        with absent values filled in (the absent values themselves must be representable in the proposed types).
+        As in 'compute_statistics', the cast summaries are not affected.
+
+        Args:
+            chunk_rows  :   Maximal number of rows per chunk (see 'iter_chunks').
+
+        Returns:
+            Proposals of the data types, by data type name (see NarrowingProposal).
+        """
+
+        analyses = {name: NarrowingAnalysis() for name in self._mapping if name not in self._fshort_names}
+
+        cast_checker = self._cast_checker
+        self._cast_checker = CastChecker(cast_checker.policy)
+
+        try:
+            for _, chunk in self.iter_chunks(chunk_rows):
+                for name, analysis in analyses.items():
+                    analysis.update(chunk[name])
+        finally:
+            self._cast_checker = cast_checker
+
+        proposals = {}
+        for name in self._mapping:
+            dtype = self._dtype[name]
+            proposed_dtype = dtype.base
+            if name in analyses:  # FSHORT data sets are not narrowed any further
+                if (absent_value := self._absent_values.get(name)) is not None:
+                    analyses[name].update(np.array([absent_value], dtype=dtype.base))
+                proposed_dtype = analyses[name].propose(dtype.base)
+            proposals[name] = NarrowingProposal(
+                name=name,
+                current_dtype=dtype.base,
+                proposed_dtype=proposed_dtype,
+                n_values=self._n_rows * int(np.prod(dtype.shape)),
+            )
+
+        return proposals
+
     @staticmethod
     def determine_dtypes(data_object: data_source_type, mapping: dict[str, str],
-                         known_dtypes: Optional[dict[str, numpy_dtype_type]] = None) -> np.dtype:
+                         known_dtypes: Optional[dict[str, numpy_dtype_type]] = None,
+                         virtual_channels: Optional[dict[str, VirtualChannel]] = None) -> np.dtype:
         """Determine the structured numpy dtype for the provided data, with given data names mapping.
 
         Args:
@@ -86,6 +292,8 @@ class SourceDataWrapper(ABC):
             known_dtypes    :   Mapping of data type names on data types (if any are known). Does not have to contain
                                 all dtypes. Can also be completely omitted. Missing data types are determined from
                                 the data.
+            virtual_channels:   Mapping of data type names on virtual channels; their data types are determined
+                                from the values computed for the first row.
 
         Returns:
             A numpy.dtype object, specifying the names, dtypes, and (if not 1D) shapes of the data sets to be contained
@@ -94,16 +302,20 @@ class SourceDataWrapper(ABC):
 
         dtypes = []  # list of data type tuples, later transformed to a np.dtype
         known_dtypes = known_dtypes or {}
+        virtual_channels = virtual_channels or {}
 
         for dtype_name, dataset_name in mapping.items():
             dt: Union[tuple[str, Any], tuple[str, Any, int]]
 
-            try:
-                dset = data_object[dataset_name]
-            except (ValueError, KeyError):
-                raise ValueError(f"No dataset '{dataset_name}' found in the source data")
-            dset_row0 = dset[0:1]  # get in form of a 1-element (or 1-row) array, not a single number
-            # for h5 data, the above retrieves the first row of the current data set
+            if (virtual_channel := virtual_channels.get(dtype_name)) is not None:
+                dset_row0 = virtual_channel.evaluate(data_object, 0, 1)
+            else:
+                try:
+                    dset = data_object[dataset_name]
+                except (ValueError, KeyError):
+                    raise ValueError(f"No dataset '{dataset_name}' found in the source data")
+                dset_row0 = dset[0:1]  # get in form of a 1-element (or 1-row) array, not a single number
+                # for h5 data, the above retrieves the first row of the current data set
 
             # determine the numpy number dtype
             number_type = known_dtypes.get(dtype_name, dset_row0.dtype)
@@ -119,6 +331,21 @@ class SourceDataWrapper(ABC):
 
         return np.dtype(dtypes)
 
+    def close(self) -> None:
+        """Release any resources held by the wrapper. No resources are held by default."""
+
+        pass
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context; the wrapper is closed when the context is exited."""
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the runtime context; close the wrapper."""
+
+        self.close()
+
     def __getitem__(self, item: str) -> np.ndarray:
         """Retrieve a dataset of the given name from the dataset.
 
@@ -129,12 +356,51 @@ class SourceDataWrapper(ABC):
             A np.ndarray with the data.
         """
 
+        if (virtual_channel := self._virtual_channels.get(item)) is not None:
+            return virtual_channel.evaluate(self._data_source, self._from_idx, self._to_idx)
+
         try:
             data = self._data_source[self._mapping[item]]
         except (ValueError, KeyError):
             raise ValueError(f"No dataset '{item}' found in the source data")
         return data[self._from_idx:self._to_idx]
 
+    def find_index_rows(self, name: str, index_range: tuple[number_type, number_type]) -> tuple[int, int]:
+        """Find the rows in which the values of a monotonic (e.g. index) data set are within the given range.
+
+        The rows are found by a binary search on the source data set, within the rows selected for the wrapper
+        (from_idx:to_idx); only a few of its values (or, for chunked HDF5 data sets, a few chunks) are read.
+        If the data set has a transform, the range refers to the transformed values. For a virtual data set,
+        only the values of the rows visited by the search are computed.
+
+        Args:
+            name        :   Name of the data set (as used for the dtype name).
+            index_range :   Smallest and largest value (both inclusive) of the data set in the selected rows.
+
+        Returns:
+            The first selected row and the row after the last selected one (in terms of rows of the source data),
+            which can be used as 'from_idx' and 'to_idx'.
+        """
+
+        dataset: Any
+        if (virtual_channel := self._virtual_channels.get(name)) is not None:
+            dataset = virtual_channel.as_dataset(self._data_source, n_rows=self._to_idx)
+        else:
+            try:
+                dataset = self._data_source[self._mapping[name]]
+            except (ValueError, KeyError):
+                raise ValueError(f"No dataset '{name}' found in the source data")
+
+        start, stop = index_range
+        if (transform := self._transforms.get(name)) is not None:
+            start, stop = sorted((transform.invert(start), transform.invert(stop)))
+
+        first, last = find_rows_in_range(dataset, start, stop, from_idx=self._from_idx, to_idx=self._to_idx)
+        if first >= last:
+            raise ValueError(f"No values of data set '{name}' are within the range {index_range}")
+
+        return first, last
+
     def load_chunk(self, start: int, stop: Union[int, None]) -> np.ndarray:
         """Copy a chunk of the source data into a structured numpy array of the pre-determined dtype.
 
@@ -148,6 +414,7 @@ class SourceDataWrapper(ABC):
 
         Returns:
             A structured numpy array, containing the required chunks of all the relevant data sets from the source data.
+            Data sets of type float16 are included as (uint16) FSHORT words, as they are written to the file.
         """
 
         if start < 0:
@@ -169,11 +436,78 @@ class SourceDataWrapper(ABC):
 
         chunk = np.zeros(n_rows, dtype=self._dtype)
         for key, loc in self._mapping.items():
-            chunk[key] = self._data_source[loc][idx]
+            if (virtual_channel := self._virtual_channels.get(key)) is not None:
+                values = virtual_channel.evaluate(self._data_source, idx.start, idx.stop)
+            else:
+                values = self._data_source[loc][idx]
+            self._load_data_set(key, values, out=chunk[key])
 
-        return chunk
+        if not self._fshort_names:
+            return chunk
 
-    def make_chunked_generator(self, chunk_rows: Union[int, None]) -> Generator:
+        for key in self._fshort_names:
+            chunk[key].view(np.uint16)[...] = encode_fshort(chunk[key])
+        return chunk.view(self._chunk_dtype)
+
+    def _load_data_set(self, key: str, values: np.ndarray, out: np.ndarray) -> None:
+        """Cast a chunk of a data set into the chunk array; transform the values and fill in absent values (if needed).
+
+        For float64 data sets, the transform (if any) is applied in place to the (already cast) chunk array.
+        For other data sets (integers, narrower floats), it is applied to a float64 copy of the chunk of the source
+        data, which is then cast - so that the range of the transformed values is checked and the transform
+        is computed at full precision.
+        NaNs of float data sets are replaced in place in the chunk array. Masked values, and NaNs which
+        would otherwise be cast to an integer type, are replaced before the cast, in the chunk of the source data.
+        Statistics (if collected) are computed on the transformed values as written, excluding the absent values.
+        Without an absent value, masked values are written (and included in the statistics) as they are.
+
+        Args:
+            key     :   Data type name of the data set.
+            values  :   Chunk of the source data set (possibly a numpy masked array).
+            out     :   Array the cast values should be stored in - a field of the chunk array.
+        """
+
+        absent_value = self._absent_values.get(key)
+        transform = self._transforms.get(key)
+        transform_in_place = transform is not None and out.dtype == np.float64
+        mask = np.ma.getmask(values)
+        values = np.ma.getdata(values)
+
+        if transform is not None and not transform_in_place:
+            values = transform.apply(values.astype(np.float64))
+
+        if absent_value is None:
+            mask = np.ma.nomask  # nothing to replace the masked values with
+        else:
+            if values.dtype.kind == 'f' and out.dtype.kind != 'f':
+                mask = mask | np.isnan(values)
+            if mask is not np.ma.nomask and mask.any():
+                values = np.where(mask, absent_value, values)
+            else:
+                mask = np.ma.nomask
+
+        self._cast_checker.cast(key, values, out=out)
+
+        if transform is not None and transform_in_place:
+            transform.apply(out)
+            if absent_value is not None and mask is not np.ma.nomask:
+                np.copyto(out, absent_value, where=mask)  # absent values substituted before the cast were transformed
+
+        if self._collect_statistics:
+            self._statistics[key].update(out if mask is np.ma.nomask else out[~mask])
+
+        if absent_value is not None and out.dtype.kind == 'f':
+            np.copyto(out, absent_value, where=np.isnan(out))
+
+    def n_chunks(self, chunk_rows: Union[int, None]) -> int:
+        """Number of chunks the data will be loaded in, given the maximal number of rows per chunk."""
+
+        if chunk_rows is None:
+            return 1
+
+        return -(-self._n_rows // chunk_rows)  # ceiling division
+
+    def iter_chunks(self, chunk_rows: Union[int, None]) -> Generator:
         """Define a generator yielding consecutive chunks of input data with the specified size.
 
         Args:
@@ -181,7 +515,9 @@ class SourceDataWrapper(ABC):
                             size of the data). If None, the entire data is loaded as a single chunk.
 
         Yields:
-            Structured numpy.ndarray objects with the consecutive chunks of the source data.
+            2-tuples of:
+                int         :   Index of the first row of the chunk (counting from the first loaded row, i.e. from_idx).
+                np.ndarray  :   Structured numpy.ndarray with the consecutive chunk of the source data.
         """
 
         if chunk_rows is None:
@@ -202,22 +538,39 @@ class SourceDataWrapper(ABC):
 
         for i in range(n_full_chunks):
             logger.debug(f"Loading chunk {i+1}/{total_chunks} ({chunk_rows} rows)")
-            yield from self.load_chunk(i * chunk_rows, (i + 1) * chunk_rows)
+            yield i * chunk_rows, self.load_chunk(i * chunk_rows, (i + 1) * chunk_rows)
 
         if remainder_rows:
             logger.debug(f"Loading chunk {total_chunks}/{total_chunks} ({remainder_rows} rows)")
-            yield from self.load_chunk(n_full_chunks * chunk_rows, None)
+            yield n_full_chunks * chunk_rows, self.load_chunk(n_full_chunks * chunk_rows, None)
+
+    def make_chunked_generator(self, chunk_rows: Union[int, None]) -> Generator:
+        """Define a generator yielding consecutive rows of input data, loaded in chunks of the specified size.
+
+        Args:
+            chunk_rows  :   Maximal number of rows per chunk (the last chunk might be smaller, depending on the total
+                            size of the data). If None, the entire data is loaded as a single chunk.
+
+        Yields:
+            Consecutive rows of structured numpy.ndarray chunks of the source data.
+        """
+
+        for _, chunk in self.iter_chunks(chunk_rows):
+            yield from chunk
 
     @classmethod
     def make_wrapper(cls, source: data_form_type, mapping: Optional[dict] = None,
+                     hdf5_options: Optional[dict[str, Any]] = None,
                      **kwargs: Any) -> Union["DictDataWrapper", "NumpyDataWrapper", "HDF5DataWrapper"]:
         """Create an instance of one of the SourceDataWrapper subclasses based on the provided data.
 
         Args:
-            source  :   Original data object.
-            mapping :   Mapping of data type names on the names of data in the data source (e.g. on the paths to
-                        particular HDF5 datasets).
-            kwargs:     Additional keyword arguments accepted by the SourceDataWrapper subclasses' constructors.
+            source          :   Original data object.
+            mapping         :   Mapping of data type names on the names of data in the data source (e.g. on the paths
+                                to particular HDF5 datasets).
+            hdf5_options    :   Keyword arguments for opening the source HDF5 file (see HDF5DataWrapper).
+                                Ignored if the source is not an HDF5 file.
+            kwargs          :   Additional keyword arguments accepted by the SourceDataWrapper subclasses' constructors.
         """
 
         if isinstance(source, dict):
@@ -234,17 +587,22 @@ class SourceDataWrapper(ABC):
             raise ValueError(f"Expected a path to an HDF5 file; got {source_str}")
         if mapping is None:
             raise ValueError("Mapping must be provided to create a HDF5DataWrapper")
-        return HDF5DataWrapper(source, mapping, **kwargs)
+        return HDF5DataWrapper(source, mapping, hdf5_options=hdf5_options, **kwargs)
 
 
 class HDF5DataWrapper(SourceDataWrapper):
     """Wrap source data provided in the form of a HDF5 file."""
 
-    _data_source: h5py.File
+    _data_source: "h5py.File"
 
     def __init__(self, data_file_name: file_name_type, mapping: dict,
                  known_dtypes: Optional[dict[str, numpy_dtype_type]] = None, from_idx: int = 0,
-                 to_idx: Optional[int] = None) -> None:
+                 to_idx: Optional[int] = None, hdf5_options: Optional[dict[str, Any]] = None,
+                 cast_policy: Union[CastPolicy, str] = CastPolicy.WARN,
+                 absent_values: Optional[dict[str, number_type]] = None,
+                 default_absent_value: Optional[number_type] = None,
+                 transforms: Optional[dict[str, ChannelTransform]] = None,
+                 virtual_channels: Optional[dict[str, VirtualChannel]] = None) -> None:
         """Initialise HDF5DataWrapper.
 
         Args:
@@ -256,26 +614,55 @@ class HDF5DataWrapper(SourceDataWrapper):
                                 the data.
             from_idx        :   Index from which data should be loaded (or number of initial rows to ignore).
             to_idx          :   Index up to which data should be loaded.
+            cast_policy     :   Policy for values which cannot be represented in the target data types
+                                (see SourceDataWrapper).
+            absent_values   :   Values written in place of NaNs and masked values, by data type name
+                                (see SourceDataWrapper).
+            default_absent_value:   Absent value of the other data sets, used if it can be represented
+                                in their data types (see SourceDataWrapper).
+            transforms      :   Transforms of the loaded data, by data type name (see SourceDataWrapper).
+            virtual_channels:   Data sets computed for each chunk, by data type name (see SourceDataWrapper).
+            hdf5_options    :   Additional keyword arguments passed to h5py.File when opening the file,
+                                e.g. 'rdcc_nbytes' (size of the raw data chunk cache, in bytes) or 'driver'
+                                (e.g. 'sec2' or 'core'). The file is always opened in read-only mode.
         """
 
+        hdf5_options = hdf5_options or {}
+        if 'mode' in hdf5_options:
+            raise ValueError("The source HDF5 file is always opened in read-only mode; 'mode' cannot be specified")
+
         # open the file
-        h5_data = h5py.File(data_file_name, 'r')
+        import h5py  # imported here (on first use), as it takes long to import
+
+        h5_data = h5py.File(data_file_name, 'r', **hdf5_options)
 
         # add a forward slash at the beginning of each value in the mapping dict - if missing
         mapping = {k: (f'/{v}' if not v.startswith('/') else v) for k, v in mapping.items()}
 
-        super().__init__(h5_data, mapping, known_dtypes=known_dtypes, from_idx=from_idx, to_idx=to_idx)
+        try:
+            super().__init__(h5_data, mapping, known_dtypes=known_dtypes, from_idx=from_idx, to_idx=to_idx,
+                             cast_policy=cast_policy, absent_values=absent_values,
+                             default_absent_value=default_absent_value, transforms=transforms,
+                             virtual_channels=virtual_channels)
+        except Exception:
+            h5_data.close()  # do not keep the file open until the (partially initialised) object is collected
+            raise
 
     def close(self) -> None:
         """Close the HDF5 file (if open)."""
 
-        if hasattr(self, '_data_source'):  # object might be partially initialised
-            try:
-                self._data_source.close()
-            except TypeError as exc:
-                logger.error(f"Error closing the source data file: {exc}")
-            else:
-                logger.debug("Source data file closed")
+        if not hasattr(self, '_data_source'):  # object might be partially initialised
+            return
+
+        if not self._data_source:  # h5py.File evaluates to False if already closed
+            return
+
+        try:
+            self._data_source.close()
+        except TypeError as exc:
+            logger.error(f"Error closing the source data file: {exc}")
+        else:
+            logger.debug("Source data file closed")
 
     def __del__(self) -> None:
         """Close the HDF5 file when deleting the object (if still open at this point)."""
@@ -290,7 +677,11 @@ class NumpyDataWrapper(SourceDataWrapper):
 
     def __init__(self, arr: np.ndarray, mapping: Optional[dict] = None,
                  known_dtypes: Optional[dict[str, numpy_dtype_type]] = None, from_idx: int = 0,
-                 to_idx: Optional[int] = None) -> None:
+                 to_idx: Optional[int] = None, cast_policy: Union[CastPolicy, str] = CastPolicy.WARN,
+                 absent_values: Optional[dict[str, number_type]] = None,
+                 default_absent_value: Optional[number_type] = None,
+                 transforms: Optional[dict[str, ChannelTransform]] = None,
+                 virtual_channels: Optional[dict[str, VirtualChannel]] = None) -> None:
         """Initialise NumpyDataWrapper.
 
         Args:
@@ -303,7 +694,14 @@ class NumpyDataWrapper(SourceDataWrapper):
                                 the data.
             from_idx        :   Index from which data should be loaded (or number of initial rows to ignore).
             to_idx          :   Index up to which data should be loaded.
-
+            cast_policy     :   Policy for values which cannot be represented in the target data types
+                                (see SourceDataWrapper).
+            absent_values   :   Values written in place of NaNs and masked values, by data type name
+                                (see SourceDataWrapper).
+            default_absent_value:   Absent value of the other data sets, used if it can be represented
+                                in their data types (see SourceDataWrapper).
+            transforms      :   Transforms of the loaded data, by data type name (see SourceDataWrapper).
+            virtual_channels:   Data sets computed for each chunk, by data type name (see SourceDataWrapper).
         """
 
         self._check_source_arr(arr)
@@ -312,12 +710,17 @@ class NumpyDataWrapper(SourceDataWrapper):
             # default mapping: 1 to 1 for all existing data type names
             mapping = {k: k for k in arr.dtype.names}
 
-        super().__init__(arr, mapping, known_dtypes=known_dtypes, from_idx=from_idx, to_idx=to_idx)
+        super().__init__(arr, mapping, known_dtypes=known_dtypes, from_idx=from_idx, to_idx=to_idx,
+                         cast_policy=cast_policy, absent_values=absent_values,
+                         default_absent_value=default_absent_value, transforms=transforms,
+                         virtual_channels=virtual_channels)
 
     def load_chunk(self, start: int, stop: Union[int, None]) -> np.ndarray:
         """Load a chunk of the input data.
 
-        If the target data type (data sets names and dtypes) is the same as the one in the source array,
+        If the target data type (data sets names and dtypes) is the same as the one in the source array
+        (and neither absent values need to be filled in, nor the data transformed or computed, nor statistics
+        collected),
         take a slice of the source array directly.
         Otherwise, use the 'load_chunk' from the superclass to copy the relevant data sets into a new structured array.
 
@@ -329,8 +732,10 @@ class NumpyDataWrapper(SourceDataWrapper):
             A structured numpy array, containing the required chunks of all the relevant data sets from the source data.
         """
 
-        if self._dtype == self._data_source.dtype:
-            return self._data_source[start:stop]
+        if self._dtype == self._data_source.dtype and not self._absent_values and not self._transforms \
+                and not self._virtual_channels and not self._fshort_names and not self._collect_statistics:
+            stop = self._to_idx if stop is None else self._from_idx + stop
+            return self._data_source[self._from_idx + start:stop]
 
         return super().load_chunk(start, stop)
 
@@ -353,7 +758,11 @@ class DictDataWrapper(SourceDataWrapper):
 
     def __init__(self, data_dict: dict[str, np.ndarray], mapping: Optional[dict] = None,
                  known_dtypes: Optional[dict[str, numpy_dtype_type]] = None, from_idx: int = 0,
-                 to_idx: Optional[int] = None) -> None:
+                 to_idx: Optional[int] = None, cast_policy: Union[CastPolicy, str] = CastPolicy.WARN,
+                 absent_values: Optional[dict[str, number_type]] = None,
+                 default_absent_value: Optional[number_type] = None,
+                 transforms: Optional[dict[str, ChannelTransform]] = None,
+                 virtual_channels: Optional[dict[str, VirtualChannel]] = None) -> None:
         """Initialise DictDataWrapper.
 
         Args:
@@ -366,7 +775,14 @@ class DictDataWrapper(SourceDataWrapper):
                                 the data.
             from_idx        :   Index from which data should be loaded (or number of initial rows to ignore).
             to_idx          :   Index up to which data should be loaded.
-
+            cast_policy     :   Policy for values which cannot be represented in the target data types
+                                (see SourceDataWrapper).
+            absent_values   :   Values written in place of NaNs and masked values, by data type name
+                                (see SourceDataWrapper).
+            default_absent_value:   Absent value of the other data sets, used if it can be represented
+                                in their data types (see SourceDataWrapper).
+            transforms      :   Transforms of the loaded data, by data type name (see SourceDataWrapper).
+            virtual_channels:   Data sets computed for each chunk, by data type name (see SourceDataWrapper).
         """
 
         self._check_source_dict(data_dict)
@@ -375,7 +791,10 @@ class DictDataWrapper(SourceDataWrapper):
             # default mapping: 1 to 1 for all keys of the data dict
             mapping = {k: k for k in data_dict.keys()}
 
-        super().__init__(data_dict, mapping, known_dtypes=known_dtypes, from_idx=from_idx, to_idx=to_idx)
+        super().__init__(data_dict, mapping, known_dtypes=known_dtypes, from_idx=from_idx, to_idx=to_idx,
+                         cast_policy=cast_policy, absent_values=absent_values,
+                         default_absent_value=default_absent_value, transforms=transforms,
+                         virtual_channels=virtual_channels)
 
     @staticmethod
     def _check_source_dict(data_dict: dict[str, np.ndarray]) -> None:
@@ -0,0 +1,117 @@
+import logging
+import os
+import shutil
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+from typing_extensions import Self
+
+from dliswriter.utils.internal.types import file_name_type
+
+
+logger = logging.getLogger(__name__)
+
+
+class SpillStore:
+    """Keep channel data arrays on disk rather than in memory until the DLIS file is written.
+
+    Each stored array is written right away to a separate .npy file in a scratch directory and replaced by a read-only
+    memory map of that file. The original array can then be released by the caller. When the DLIS file is written,
+    the data are read from the memory maps in chunks (see 'input_chunk_size' of DLISFile.write), so the memory
+    needed does not grow with the total size of the channel data.
+
+    The scratch directory (and the files in it) are removed when the store is closed - at the latest when the store
+    object is garbage-collected or the interpreter exits. The memory-mapped arrays must not be used afterwards.
+    """
+
+    def __init__(self, directory: Optional[file_name_type] = None, min_nbytes: int = 0) -> None:
+        """Initialise SpillStore.
+
+        Args:
+            directory   :   Directory in which the scratch directory (holding the data files) is created.
+                            If not provided, the default temporary directory of the system is used.
+            min_nbytes  :   Arrays smaller than this (in bytes) are kept in memory.
+        """
+
+        if not isinstance(min_nbytes, int) or min_nbytes < 0:
+            raise ValueError(f"Minimal number of bytes must be a non-negative integer; got {min_nbytes}")
+
+        self._path = Path(tempfile.mkdtemp(prefix='dliswriter-spill-', dir=directory))
+        self._min_nbytes = min_nbytes
+        self._n_arrays = 0
+        self._nbytes = 0
+
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self._path, ignore_errors=True)
+
+    @property
+    def path(self) -> Path:
+        """Scratch directory holding the data files."""
+
+        return self._path
+
+    @property
+    def closed(self) -> bool:
+        """True if the store has been closed (and the scratch directory removed)."""
+
+        return not self._finalizer.alive
+
+    @property
+    def nbytes(self) -> int:
+        """Total number of bytes of the arrays stored on disk."""
+
+        return self._nbytes
+
+    def store(self, array: np.ndarray) -> np.ndarray:
+        """Write the array to a file in the scratch directory and return a read-only memory map of it.
+
+        Arrays smaller than 'min_nbytes' (and empty arrays, which cannot be memory-mapped) are returned as they are.
+
+        Args:
+            array   :   The array to be stored. Arrays of object dtype are not supported.
+
+        Returns:
+            A read-only numpy.memmap with the same dtype, shape, and values as the stored array.
+        """
+
+        if self.closed:
+            raise RuntimeError("Cannot store data in a closed SpillStore")
+
+        if array.dtype.hasobject:
+            raise ValueError(f"Arrays of object dtype cannot be stored on disk; got {array.dtype}")
+
+        if array.nbytes < self._min_nbytes or not array.size:
+            return array
+
+        file_path = self._path / f'{self._n_arrays}.npy'
+        self._n_arrays += 1
+
+        mm = np.lib.format.open_memmap(file_path, mode='w+', dtype=array.dtype, shape=array.shape)
+        mm[...] = array
+        mm.flush()
+        del mm
+
+        self._nbytes += array.nbytes
+        logger.debug(f"Array of shape {array.shape} and dtype {array.dtype} ({array.nbytes} bytes) "
+                     f"stored in {file_path}")
+
+        stored: np.memmap = np.load(file_path, mmap_mode='r')
+        return stored
+
+    def close(self) -> None:
+        """Remove the scratch directory together with all the stored data."""
+
+        if self._finalizer.detach():
+            shutil.rmtree(self._path, ignore_errors=os.name == 'nt')  # files might still be open on Windows
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context; the store is closed when the context is exited."""
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the runtime context; close the store."""
+
+        self.close()
@@ -0,0 +1,183 @@
+from abc import ABC, abstractmethod
+from types import CodeType
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+from dliswriter.utils.internal.types import number_type
+
+
+class VirtualChannel(ABC):
+    """Data of a channel computed chunk by chunk when the data are loaded, rather than read from the source data.
+
+    A channel with a virtual channel assigned (see ChannelItem.virtual) has no data set of its own; its values
+    are evaluated for each loaded chunk (see SourceDataWrapper.load_chunk) and are then cast, transformed, etc.
+    as the data of any other channel. The data type of the values can be set as 'cast_dtype' of the channel.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def evaluate(self, data_source: Any, start: int, stop: int) -> np.ndarray:
+        """Compute the values of the rows start:stop (in terms of rows of the source data).
+
+        Args:
+            data_source :   Source data object (see SourceDataWrapper.data_source), e.g. to read the input data sets.
+            start       :   First row for which the values should be computed.
+            stop        :   Row after the last one for which the values should be computed.
+        """
+
+    def as_dataset(self, data_source: Any, n_rows: int) -> "VirtualDataSet":
+        """Represent the values as an (unevaluated) data set of the given number of rows - e.g. for a binary search."""
+
+        return VirtualDataSet(self, data_source, n_rows)
+
+
+class VirtualDataSet:
+    """Read-only, array-like view of the values of a virtual channel; values are computed only for the rows accessed.
+
+    Supports single-row indexing and slicing (with step 1), and 'shape' - as needed e.g. by find_rows_in_range.
+    """
+
+    __slots__ = ('_virtual_channel', '_data_source', 'shape')
+
+    def __init__(self, virtual_channel: VirtualChannel, data_source: Any, n_rows: int) -> None:
+        self._virtual_channel = virtual_channel
+        self._data_source = data_source
+        self.shape = (n_rows,)
+
+    def __getitem__(self, item: Union[int, slice]) -> Any:
+        if isinstance(item, slice):
+            start, stop, step = item.indices(self.shape[0])
+            if step != 1:
+                raise ValueError("Only slices with step 1 are supported")
+            return self._virtual_channel.evaluate(self._data_source, start, max(start, stop))
+
+        row = item + self.shape[0] if item < 0 else item
+        if not 0 <= row < self.shape[0]:
+            raise IndexError(f"Row {item} out of range for {self.shape[0]} rows")
+        return self._virtual_channel.evaluate(self._data_source, row, row + 1)[0]
+
+
+class EvenlySpacedIndex(VirtualChannel):
+    """Evenly spaced values, e.g. of a depth or time index: value = start + step * row (row of the source data)."""
+
+    __slots__ = ('_start', '_step')
+
+    def __init__(self, start: number_type, step: number_type) -> None:
+        """Initialise EvenlySpacedIndex.
+
+        Args:
+            start   :   Value of the first row of the source data.
+            step    :   Difference between the values of consecutive rows; negative for decreasing values.
+        """
+
+        for label, value in (('Start', start), ('Step', step)):
+            if isinstance(value, bool) or not isinstance(value, (int, float, np.integer, np.floating)):
+                raise TypeError(f"{label} must be a number; got {type(value)}: {value}")
+            if not np.isfinite(value):
+                raise ValueError(f"{label} must be finite; got {value}")
+        if step == 0:
+            raise ValueError("Step cannot be 0")
+
+        self._start = start
+        self._step = step
+
+    @property
+    def start(self) -> number_type:
+        """Value of the first row of the source data."""
+
+        return self._start
+
+    @property
+    def step(self) -> number_type:
+        """Difference between the values of consecutive rows."""
+
+        return self._step
+
+    def value_at(self, row: int) -> float:
+        """Return the value of the given row (computed as in 'evaluate')."""
+
+        return float(self.evaluate(None, row, row + 1)[0])
+
+    def evaluate(self, data_source: Any, start: int, stop: int) -> np.ndarray:
+        """Compute the values of the rows start:stop; the source data are not used."""
+
+        values: np.ndarray = self._start + self._step * np.arange(start, stop, dtype=np.float64)
+        return values
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._start} + {self._step} * row)"
+
+
+class DerivedChannel(VirtualChannel):
+    """Values computed from data sets of the source data, e.g. a sum or a ratio of other channels' data.
+
+    The values are computed for each chunk from the corresponding rows of the input data sets (as they are
+    in the source data - not cast or transformed), with a numpy expression or a function. If the result is
+    a masked array (e.g. computed from masked input data), its masked values are treated as absent values.
+    """
+
+    __slots__ = ('_expression', '_code', '_inputs')
+
+    def __init__(self, expression: Union[str, Callable[..., np.ndarray]],
+                 inputs: Union[list[str], dict[str, str]]) -> None:
+        """Initialise DerivedChannel.
+
+        Args:
+            expression  :   Expression (e.g. 'np.log10(RES) * 2') evaluated with the input data (chunks) as variables
+                            and numpy available as 'np', or a function called with the input data as positional
+                            arguments (in the order of 'inputs'). It must return an array with a value (or a row
+                            of values) per input row. The expression is evaluated as Python code (with 'eval'),
+                            with access to the Python builtins - it is not sandboxed and must come from a trusted
+                            source.
+            inputs      :   Names of the input data sets in the source data (for channels added with data,
+                            their dataset names - by default, the channel names), or a mapping of variable names
+                            used in the expression on the names of the input data sets.
+        """
+
+        if isinstance(inputs, (list, tuple)):
+            inputs = {name: name for name in inputs}
+        if not isinstance(inputs, dict) or not inputs:
+            raise ValueError(f"Expected a non-empty list or dict of input data set names; got {inputs}")
+
+        if isinstance(expression, str):
+            if invalid := [name for name in inputs if not name.isidentifier()]:
+                raise ValueError(f"Input names used in an expression must be valid identifiers; got {invalid} "
+                                 f"(use a dict of inputs to give the data sets such names)")
+            self._code: Optional[CodeType] = compile(expression, '<derived channel>', 'eval')
+        elif callable(expression):
+            self._code = None
+        else:
+            raise TypeError(f"Expected an expression string or a callable; got {type(expression)}: {expression}")
+
+        self._expression = expression
+        self._inputs: dict[str, str] = inputs
+
+    @property
+    def inputs(self) -> dict[str, str]:
+        """Mapping of variable names on the names of the input data sets."""
+
+        return self._inputs
+
+    def evaluate(self, data_source: Any, start: int, stop: int) -> np.ndarray:
+        """Compute the values of the rows start:stop from the corresponding rows of the input data sets."""
+
+        try:
+            arrays = {name: data_source[dataset_name][start:stop] for name, dataset_name in self._inputs.items()}
+        except (ValueError, KeyError) as exc:
+            raise ValueError(f"Input data set of {self} not found in the source data: {exc}")
+
+        if self._code is not None:
+            result = eval(self._code, {'np': np}, arrays)  # trusted code; see __init__
+        else:
+            result = self._expression(*arrays.values())  # type: ignore  # callable checked at init
+
+        values = result if isinstance(result, np.ma.MaskedArray) else np.asarray(result)  # keep the mask (if any)
+        if values.ndim == 0 or values.shape[0] != stop - start:
+            raise ValueError(f"{self} returned {values.shape} values for {stop - start} rows")
+        return values
+
+    def __repr__(self) -> str:
+        expression = self._expression if self._code is not None else getattr(self._expression, '__name__', '?')
+        return f"{self.__class__.__name__}({expression}; inputs: {', '.join(self._inputs.values())})"
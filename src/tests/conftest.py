@@ -3,7 +3,7 @@ import numpy as np
 from pathlib import Path
 import h5py  # type: ignore  # untyped library
 import os
-from typing import Generator
+from typing import Callable, Generator
 
 from dliswriter.logical_record import eflr_types
 from dliswriter.utils.source_data_wrappers import NumpyDataWrapper
@@ -35,6 +35,16 @@ def reference_data(reference_data_path: Path) -> Generator:
     f.close()
 
 
+@pytest.fixture(scope="session")
+def n_open_hdf5_files() -> Callable[[], int]:
+    """Function counting the HDF5 files currently open in the process (e.g. to check that source files are closed)."""
+
+    def count() -> int:
+        return int(h5py.h5f.get_obj_count(h5py.h5f.OBJ_ALL, h5py.h5f.OBJ_FILE))
+
+    return count
+
+
 @pytest.fixture(scope="session")
 def short_reference_data_path(base_data_path: Path) -> Path:
     """Path to the HDF5 file with short version of the reference data."""
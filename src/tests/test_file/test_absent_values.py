@@ -0,0 +1,154 @@
+import pytest
+from pathlib import Path
+from typing import Any
+import numpy as np
+
+from dliswriter import DLISFile, SpillStore
+from dliswriter.utils.source_data_wrappers import DictDataWrapper, NumpyDataWrapper
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+ABSENT = -999.25
+
+
+def test_nan_replaced_in_chunks() -> None:
+    """Test that NaNs are replaced in the loaded chunks, without modifying the source data."""
+
+    values = np.array([1.5, np.nan, 3.0, np.nan, 5.0])
+    wrapper = DictDataWrapper({'a': values, 'b': values.copy()}, absent_values={'a': ABSENT})
+
+    chunks = [chunk for _, chunk in wrapper.iter_chunks(chunk_rows=2)]
+
+    assert np.concatenate([c['a'] for c in chunks]).tolist() == [1.5, ABSENT, 3.0, ABSENT, 5.0]
+    assert np.isnan(np.concatenate([c['b'] for c in chunks])).sum() == 2  # no absent value - NaNs kept
+    assert np.isnan(values).sum() == 2
+
+
+def test_masked_and_nan_to_int() -> None:
+    """Test replacing masked values and NaNs cast to an integer type; they are not counted as damaged by the cast."""
+
+    ints = np.ma.MaskedArray(np.array([5, 70000, 7, 8]), mask=[False, True, False, False])
+    floats = np.array([1.0, np.nan, 3.0, 4.0])
+    wrapper = DictDataWrapper({'i': ints, 'f': floats}, known_dtypes={'i': np.uint16, 'f': np.int16},
+                              absent_values={'i': 65535, 'f': -1}, cast_policy='raise')
+    wrapper.collect_statistics()
+
+    chunk = wrapper.load_chunk(0, None)
+
+    assert chunk['i'].tolist() == [5, 65535, 7, 8]
+    assert chunk['f'].tolist() == [1, -1, 3, 4]
+    assert not any(summary.n_damaged for summary in wrapper.cast_summary.values())
+    assert wrapper.channel_statistics['i'].maximum == 8  # absent values not included in the statistics
+
+
+def test_masked_without_absent_value() -> None:
+    """Test that without an absent value, masked values are written and included in the statistics as they are."""
+
+    data = np.ma.MaskedArray(np.array([1., 50., 3.]), mask=[False, True, False])
+    wrapper = DictDataWrapper({'a': data})
+    wrapper.collect_statistics()
+
+    assert wrapper.load_chunk(0, None)['a'].tolist() == [1., 50., 3.]
+    assert wrapper.channel_statistics['a'].maximum == 50.
+
+
+def test_multidimensional_masked() -> None:
+    data = np.ma.MaskedArray(np.arange(6.).reshape(3, 2), mask=[[False, True], [False, False], [True, False]])
+    wrapper = DictDataWrapper({'m': data}, absent_values={'m': ABSENT})
+
+    assert wrapper.load_chunk(0, None)['m'].tolist() == [[0., ABSENT], [2., 3.], [ABSENT, 5.]]
+
+
+def test_structured_array_source() -> None:
+    """Test that absent values are filled in also if the source structured array could be sliced directly."""
+
+    arr = np.array([(1.0,), (np.nan,)], dtype=[('a', np.float64)])
+
+    assert np.isnan(NumpyDataWrapper(arr).load_chunk(0, None)['a'][1])
+    assert NumpyDataWrapper(arr, absent_values={'a': ABSENT}).load_chunk(0, None)['a'][1] == ABSENT
+
+
+@pytest.mark.parametrize(("value", "dtype"), ((-1, np.uint8), (1e40, np.float32), (0.5, np.int32)))
+def test_absent_value_not_representable(value: float, dtype: type) -> None:
+    with pytest.raises(ValueError, match="cannot be represented"):
+        DictDataWrapper({'a': np.zeros(3)}, known_dtypes={'a': dtype}, absent_values={'a': value})
+
+
+def test_default_absent_value_only_if_representable() -> None:
+    """Test that the default absent value is used for the data sets which can represent it; explicit ones prevail."""
+
+    data = {'a': np.array([1.5, np.nan]), 'i': np.array([1, 2], dtype=np.uint16), 'j': np.array([3., np.nan])}
+    wrapper = DictDataWrapper(data, known_dtypes={'j': np.int16}, absent_values={'j': -1}, default_absent_value=ABSENT)
+
+    assert wrapper.absent_values == {'j': -1, 'a': ABSENT}
+    assert wrapper.load_chunk(0, None).tolist() == [(1.5, 1, 3), (ABSENT, 2, -1)]
+
+
+def test_frame_absent_value_with_integer_channel(new_dlis_path: Path) -> None:
+    """Test that a frame absent value which an integer channel cannot represent is used for the float channels."""
+
+    df = make_df()
+    lf = df.logical_files[0]
+    channels = (
+        lf.add_channel('DEPTH', data=np.arange(4.)),
+        lf.add_channel('GR', data=np.array([1., np.nan, 3., 4.])),
+        lf.add_channel('I', data=np.arange(4, dtype=np.uint16)),
+    )
+    lf.add_frame('MAIN', channels=channels, absent_value=ABSENT)
+
+    df.write(new_dlis_path)
+
+    with load_dlis(new_dlis_path) as f:
+        curves = f.frames[0].curves()
+        assert curves['GR'].tolist() == [1., ABSENT, 3., 4.]
+        assert curves['I'].tolist() == [0, 1, 2, 3]
+
+    lf.channels[2].absent_value = ABSENT  # explicitly specified for the channel - an error
+    with pytest.raises(ValueError, match="cannot be represented as uint16"):
+        df.write(new_dlis_path)
+
+
+@pytest.mark.parametrize(("value", "error_type"), (("x", TypeError), (True, TypeError), (np.nan, ValueError)))
+def test_absent_value_invalid(value: Any, error_type: type[Exception]) -> None:
+    lf = make_df().logical_files[0]
+
+    with pytest.raises(error_type, match="Absent value"):
+        lf.add_channel('X', absent_value=value)
+
+
+def test_mask_shape_mismatch() -> None:
+    lf = make_df().logical_files[0]
+
+    with pytest.raises(ValueError, match="Shape of the mask"):
+        lf.add_channel('X', data=np.zeros(5), mask=np.zeros(4, dtype=bool))
+
+
+@pytest.mark.parametrize("spill", (False, True))
+def test_absent_values_in_file(new_dlis_path: Path, tmp_path: Path, spill: bool) -> None:
+    """Test absent values defined for a frame and for a channel, for NaNs and for a separate validity mask."""
+
+    with SpillStore(directory=tmp_path) as spill_store:
+        df = DLISFile(spill_store=spill_store if spill else None)
+        lf = df.add_logical_file()
+        lf.add_origin('ORIGIN')
+
+        gr = np.arange(10.)
+        gr[[2, 7]] = np.nan
+        counts = np.arange(10, dtype=np.uint16)
+
+        channels = (
+            lf.add_channel('DEPTH', data=np.arange(10.)),
+            lf.add_channel('GR', data=gr),
+            lf.add_channel('COUNTS', data=counts, mask=counts % 4 == 1, absent_value=65535),
+        )
+        lf.add_frame('MAIN', channels=channels, index_type='BOREHOLE-DEPTH', absent_value=ABSENT)
+
+        df.write(new_dlis_path, input_chunk_size=4)
+
+    with load_dlis(new_dlis_path) as f:
+        curves = f.frames[0].curves()
+        assert curves['GR'][[2, 7]].tolist() == [ABSENT, ABSENT]
+        assert curves['COUNTS'].tolist() == [0, 65535, 2, 3, 4, 65535, 6, 7, 8, 65535]
+        assert f.object('CHANNEL', 'COUNTS').reprc == 16  # UNORM: cast dtype determined from the data, not the mask
@@ -0,0 +1,152 @@
+import pytest
+from pathlib import Path
+import numpy as np
+
+from dliswriter import enums, EvenlySpacedIndex
+from dliswriter.logical_record import eflr_types
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+CHANNEL_RECORDS = [
+    {'name': 'DEPTH', 'units': 'm', 'data': np.arange(10.)},
+    {'name': 'RPM', 'long_name': 'Surface rpm', 'cast_dtype': np.float32, 'data': np.arange(10) * 100},
+    {'name': 'AMPLITUDE', 'dimension': 5, 'units': None, 'minimum_value': 0., 'data': np.random.rand(10, 5)},
+]
+
+
+def _channel_array() -> np.ndarray:
+    """Structured array defining the same channels as CHANNEL_RECORDS (without the data)."""
+
+    arr = np.zeros(3, dtype=[('name', 'U12'), ('units', 'U4'), ('minimum_value', float)])
+    arr['name'] = ['DEPTH', 'RPM', 'AMPLITUDE']
+    arr['units'] = ['m', 'rpm', 'V']
+    arr['minimum_value'] = [0, np.nan, -1]
+    return arr
+
+
+def test_add_channels_from_dicts() -> None:
+    """Test defining channels from a list of dicts."""
+
+    lf = make_df().logical_files[0]
+    channels = lf.add_channels(CHANNEL_RECORDS, set_name='SET')
+
+    assert [ch.name for ch in channels] == ['DEPTH', 'RPM', 'AMPLITUDE']
+    assert lf.channels == channels
+    assert all(ch.parent.set_name == 'SET' for ch in channels)
+    assert all(ch.origin_reference == lf.default_origin_reference for ch in channels)
+
+    assert channels[0].units.value == 'm'
+    assert channels[1].long_name.value == 'Surface rpm'
+    assert channels[1].cast_dtype is np.float32
+    assert channels[2].units.value is None
+    assert channels[2].minimum_value.value == [0.]
+    assert set(lf._data_dict) == {'DEPTH', 'RPM', 'AMPLITUDE'}
+
+
+def test_add_channels_from_structured_array() -> None:
+    """Test defining channels from a structured numpy array; NaN values are treated as missing."""
+
+    lf = make_df().logical_files[0]
+    channels = lf.add_channels(_channel_array(), origin_reference=3)
+
+    assert [ch.name for ch in channels] == ['DEPTH', 'RPM', 'AMPLITUDE']
+    assert all(type(ch.name) is str for ch in channels)
+    assert [ch.units.value for ch in channels] == ['m', 'rpm', 'V']
+    assert [ch.minimum_value.value for ch in channels] == [[0.], None, [-1.]]
+    assert all(ch.origin_reference == 3 for ch in channels)
+
+
+def test_add_channels_from_data_frame() -> None:
+    """Test defining channels from a pandas DataFrame."""
+
+    pd = pytest.importorskip('pandas')
+
+    lf = make_df().logical_files[0]
+    channels = lf.add_channels(pd.DataFrame(_channel_array()))
+
+    assert [ch.name for ch in channels] == ['DEPTH', 'RPM', 'AMPLITUDE']
+    assert [ch.minimum_value.value for ch in channels] == [[0.], None, [-1.]]
+
+
+def test_add_channels_unique_dataset_names() -> None:
+    """Test that channels defined in bulk get unique dataset names, also when repeating names of existing channels."""
+
+    lf = make_df().logical_files[0]
+    lf.add_channel('X')
+    channels = lf.add_channels([{'name': 'X'}, {'name': 'X'}, {'name': 'Y', 'dataset_name': 'data/y'}])
+
+    assert [ch.dataset_name for ch in channels] == ['X__1', 'X__2', 'data/y']
+    assert [ch.copy_number for ch in channels] == [1, 2, 0]
+
+
+@pytest.mark.parametrize(("records", "error_type", "match"), (
+        ([{'name': 'X', 'unit': 'm'}], ValueError, "Unexpected column.*'unit'"),
+        ([{'units': 'm'}], ValueError, "Missing required column.*'name'"),
+        ([{'name': None}], ValueError, "Name not specified for the channel no. 0"),
+        (np.zeros(3), TypeError, "must be a structured array"),
+        (['X', 'Y'], TypeError, "Expected a mapping"),
+        ({'name': 'X'}, TypeError, "Expected a list of dicts"),
+        ([{'name': 'X', 'data': [1, 2]}], ValueError, "Expected a numpy.ndarray"),
+        ([{'name': 'X', 'data': np.arange(2), 'virtual': EvenlySpacedIndex(0, 1)}], ValueError, "virtual channel"),
+))
+def test_add_channels_errors(records: object, error_type: type[Exception], match: str) -> None:
+    lf = make_df().logical_files[0]
+
+    with pytest.raises(error_type, match=match):
+        lf.add_channels(records)
+
+
+def test_add_channels_columns_checked_before_creating_any() -> None:
+    """Test that no channels are created if the columns of a structured array are not correct."""
+
+    arr = np.zeros(2, dtype=[('name', 'U4'), ('unit', 'U4')])
+    lf = make_df().logical_files[0]
+
+    with pytest.raises(ValueError, match="Unexpected column"):
+        lf.add_channels(arr)
+
+    assert not lf.channels
+
+
+def test_add_parameters() -> None:
+    """Test defining parameters from a list of dicts."""
+
+    lf = make_df().logical_files[0]
+    zone = lf.add_zone('Z', domain=enums.ZoneDomain.TIME, minimum=0, maximum=10)
+
+    parameters = lf.add_parameters([
+        {'name': 'P1', 'values': 12.5, 'long_name': 'First parameter'},
+        {'name': 'P2', 'values': ['A'], 'zones': [zone], 'set_name': 'OTHER'},
+        {'name': 'P3', 'values': np.arange(6).reshape(2, 3)},
+    ])
+
+    assert all(isinstance(p, eflr_types.ParameterItem) for p in parameters)
+    assert parameters[0].values.value == [12.5]
+    assert parameters[0].parent.set_name is None
+    assert parameters[1].zones.value == [zone]
+    assert parameters[1].parent.set_name == 'OTHER'
+    assert parameters[2].values.value.shape == (2, 3)
+
+    with pytest.raises(ValueError, match="Unexpected column.*'data'"):
+        lf.add_parameters([{'name': 'P4', 'data': 1}])
+
+
+def test_bulk_definitions_in_file(new_dlis_path: Path) -> None:
+    """Test writing a file with channels and parameters defined in bulk."""
+
+    df = make_df()
+    lf = df.logical_files[0]
+    channels = lf.add_channels(CHANNEL_RECORDS)
+    lf.add_frame('MAIN', channels=channels)
+    lf.add_parameters(np.array([('P1', 1.5), ('P2', 2.5)], dtype=[('name', 'U2'), ('values', float)]))
+
+    df.write(new_dlis_path)
+
+    with load_dlis(new_dlis_path) as f:
+        assert [ch.name for ch in f.channels] == ['DEPTH', 'RPM', 'AMPLITUDE']
+        assert f.channels[0].units == 'm'
+        assert f.channels[2].dimension == [5]
+        assert [p.values[0] for p in f.parameters] == [1.5, 2.5]
+        assert (f.frames[0].curves()['RPM'] == np.arange(10) * 100).all()
@@ -0,0 +1,118 @@
+import pytest
+import numpy as np
+from pathlib import Path
+
+from dliswriter import ChannelTransform
+from dliswriter.utils.source_data_wrappers import DictDataWrapper, NumpyDataWrapper
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+def test_fshort_chunks() -> None:
+    """Test that float16 data sets are loaded as FSHORT words; the statistics are those of the values."""
+
+    data = np.array([(0.5, 1.), (153., 2.)], dtype=[('a', np.float16), ('b', np.float64)])
+    wrapper = NumpyDataWrapper(data)
+    wrapper.collect_statistics()
+
+    chunk = wrapper.load_chunk(0, None)
+
+    assert chunk.dtype == np.dtype([('a', np.uint16), ('b', np.float64)])
+    assert chunk['a'].tolist() == [0x4000, 0x4C88]
+    assert wrapper.channel_statistics['a'].maximum == 153.
+    assert wrapper.analyse_narrowing(chunk_rows=None)['a'].proposed_dtype == np.float16
+
+
+def test_quantization_in_chunks() -> None:
+    transform = ChannelTransform.quantization(-10, 10, dtype=np.int16)
+    values = np.array([-10., -20., 0., 10., np.nan])
+    wrapper = DictDataWrapper({'a': values}, known_dtypes={'a': np.int16}, transforms={'a': transform},
+                              absent_values={'a': -32768})
+
+    chunk = wrapper.load_chunk(0, None)
+
+    assert chunk['a'].tolist() == [-32768, -32768, 0, 32767, -32768]
+    gain, offset = transform.dequantization  # type: ignore  # quantization
+    assert np.allclose(chunk['a'][:4] * gain + offset, [-10, -10, 0, 10], atol=gain / 2)
+
+
+@pytest.mark.parametrize(("kwargs", "message"), (
+        ({"minimum": 0, "maximum": 1, "dtype": np.float32}, "only be quantized to an integer type"),
+        ({"minimum": 1, "maximum": 1}, "must be smaller than"),
+        ({"minimum": 0, "maximum": np.inf}, "must be finite"),
+))
+def test_quantization_invalid(kwargs: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        ChannelTransform.quantization(**kwargs)
+
+
+@pytest.mark.parametrize("n_workers", (None, 2))
+def test_compact_image_channels(new_dlis_path: Path, n_workers: int) -> None:
+    """Test writing image channels as FSHORT and as quantized UNORM with dequantization coefficients."""
+
+    image = np.random.rand(50, 16) * 200 - 100
+    resistivity = np.random.rand(50, 16) * 1000
+
+    df = make_df()
+    lf = df.logical_files[0]
+    channels = (
+        lf.add_channel('DEPTH', data=np.arange(50.)),
+        lf.add_channel('IMAGE', data=image, cast_dtype=np.float16),
+        lf.add_channel('RES', data=resistivity, units='ohm', transform=ChannelTransform.quantization(0, 1000)),
+    )
+    lf.add_frame('MAIN', channels=channels, index_type='BOREHOLE-DEPTH')
+
+    df.write(new_dlis_path, input_chunk_size=20, n_workers=n_workers)
+
+    with load_dlis(new_dlis_path) as f:
+        assert f.object('CHANNEL', 'IMAGE').reprc == 1
+        assert f.object('CHANNEL', 'RES').reprc == 16
+        curves = f.frames[0].curves()
+        assert np.allclose(curves['IMAGE'], image, atol=2 ** -4)  # FSHORT: 11 significant bits for values < 128
+
+        source = f.object('CHANNEL', 'RES').source
+        assert source.name == 'RES-DEQUANTIZATION'
+        gain, offset = source.coefficients
+        assert np.allclose(curves['RES'] * gain + offset, resistivity, atol=1000 / 65535)
+
+
+def test_dequantization_source_transform_set_later(new_dlis_path: Path) -> None:
+    """Test that the dequantization coefficient is recorded also for transforms set on existing channels."""
+
+    values = np.linspace(0, 100, 10)
+
+    df = make_df()
+    lf = df.logical_files[0]
+    depth = lf.add_channel('DEPTH', data=np.arange(10.))
+    q1 = lf.add_channel('Q1', data=values)
+    q2 = lf.add_channel('Q2', data=values, transform=ChannelTransform.quantization(0, 1))
+    lf.add_frame('MAIN', channels=(depth, q1, q2), index_type='BOREHOLE-DEPTH')
+
+    q1.transform = ChannelTransform.quantization(0, 100, dtype=np.uint8)
+    q2.transform = ChannelTransform.quantization(0, 200)
+    df.write(new_dlis_path)
+
+    with load_dlis(new_dlis_path) as f:
+        curves = f.frames[0].curves()
+        for name, atol in (('Q1', 100 / 255), ('Q2', 200 / 65535)):
+            source = f.object('CHANNEL', name).source
+            assert source.name == f'{name}-DEQUANTIZATION'
+            gain, offset = source.coefficients
+            assert np.allclose(curves[name] * gain + offset, values, atol=atol)
+
+
+def test_dequantization_source_bulk() -> None:
+    """Test that the dequantization coefficient is added also for channels defined in bulk, unless source is given."""
+
+    lf = make_df().logical_files[0]
+    tool = lf.add_tool('TOOL')
+    transform = ChannelTransform.quantization(0, 1, dtype=np.uint8)
+
+    q1, q2 = lf.add_channels([{'name': 'Q1', 'transform': transform}, {'name': 'Q2', 'transform': transform,
+                                                                       'source': tool}])
+
+    assert q1.source.value.name == 'Q1-DEQUANTIZATION'
+    assert q1.source.value.coefficients.value == [1 / 255, 0.]
+    assert q1.cast_dtype == np.uint8
+    assert q2.source.value is tool
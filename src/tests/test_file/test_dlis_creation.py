@@ -1,10 +1,12 @@
 import h5py    # type: ignore  # untyped library
 import pytest
 from pathlib import Path
+from typing import Callable, Union
 import numpy as np
 
 from tests.common import N_COLS, load_dlis, select_channel
 from tests.dlis_files_for_testing import write_time_based_dlis, write_depth_based_dlis, write_dlis_from_dict
+from tests.dlis_files_for_testing.common import make_df
 
 
 def test_dlis_depth_based(short_reference_data: h5py.File, short_reference_data_path: Path, new_dlis_path: Path)\
@@ -163,3 +165,63 @@ def test_numpy_dtypes_with_casting(new_dlis_path: Path, data_arr: np.ndarray, ca
         assert ch.reprc == rc
         assert ch.curves().dtype == cast_dtype
         assert (ch.curves() == data_arr.astype(cast_dtype)).all()
+
+
+@pytest.mark.parametrize("hdf5_options", (None, {'driver': 'core'}, {'rdcc_nbytes': 2**22, 'driver': 'sec2'}))
+def test_source_file_closed_after_write(short_reference_data_path: Path, new_dlis_path: Path,
+                                        hdf5_options: Union[dict, None], n_open_hdf5_files: Callable[[], int]) -> None:
+    """Test that the source HDF5 file is closed when writing the DLIS file is done."""
+
+    n_open = n_open_hdf5_files()
+
+    write_time_based_dlis(new_dlis_path, data=short_reference_data_path, hdf5_options=hdf5_options)
+    assert n_open_hdf5_files() == n_open
+
+    with load_dlis(new_dlis_path) as f:
+        assert f.frames[0].curves().shape == (100,)
+
+
+def test_source_file_closed_after_failed_write(short_reference_data_path: Path, new_dlis_path: Path,
+                                               n_open_hdf5_files: Callable[[], int]) -> None:
+    """Test that the source HDF5 file is closed even if writing the DLIS file fails."""
+
+    n_open = n_open_hdf5_files()
+
+    with pytest.raises(ValueError):
+        write_time_based_dlis(new_dlis_path, data=short_reference_data_path, from_idx=200)
+
+    assert n_open_hdf5_files() == n_open
+
+
+def test_array_attribute_values(new_dlis_path: Path) -> None:
+    """Test writing numpy arrays as values of multivalued numeric attributes."""
+
+    df = make_df()
+    lf = df.logical_files[0]
+
+    ch = lf.add_channel('CH', data=np.random.rand(20), minimum_value=np.array([0.5]),
+                        maximum_value=np.array([2], dtype=np.int64))
+    lf.add_frame('MAIN', channels=(ch,))
+
+    zone = lf.add_zone('Z', domain='TIME', minimum=0, maximum=10)
+    param_values = np.random.rand(1, 5000).astype(np.float32)
+    lf.add_parameter('P', values=param_values, zones=[zone])
+    comp_values = np.arange(60, dtype=np.int64).reshape(2, 30)
+    lf.add_computation('C', values=comp_values)
+    lf.add_axis('A', coordinates=np.linspace(0, 1, 11))
+
+    df.write(new_dlis_path)
+
+    with load_dlis(new_dlis_path) as f:
+        assert f.channels[0].attic['MINIMUM-VALUE'].value == [0.5]
+        assert f.channels[0].attic['MAXIMUM-VALUE'].value == [2.0]
+
+        param = f.parameters[0]
+        assert param.dimension == [5000]
+        assert (param.values == param_values).all()
+
+        comp = f.computations[0]
+        assert comp.dimension == [30]
+        assert (comp.values == comp_values).all()
+
+        assert f.axes[0].coordinates == np.linspace(0, 1, 11).tolist()
@@ -181,6 +181,16 @@ def test_unique_dataset_name_from_repeated_channel_name(
     assert len(set(chs)) == 5  # 5 separate objects
 
 
+def test_unique_dataset_name_suffix_taken(double_frame_dlis: DLISFile) -> None:
+    """Check that a suffixed dataset name already used explicitly is skipped."""
+
+    lf = double_frame_dlis.logical_files[0]
+    lf.add_channel("X", dataset_name="Y__2")
+    chs = [lf.add_channel("Y") for _ in range(4)]
+
+    assert [ch.dataset_name for ch in chs] == ["Y", "Y__1", "Y__3", "Y__4"]
+
+
 def test_multiple_axes(double_frame_dlis_contents: dlis.LogicalFile) -> None:
     frames = double_frame_dlis_contents.frames
     for i in range(2):
@@ -0,0 +1,72 @@
+import pytest
+import numpy as np
+from pathlib import Path
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+def test_index_range_per_frame(new_dlis_path: Path) -> None:
+    """Test selecting rows by depth for frames with different sampling and direction."""
+
+    depth_fine = np.arange(2000., 4000., 0.5)
+    depth_up = np.arange(4000., 2000., -2.)
+
+    df = make_df()
+    lf = df.logical_files[0]
+    gr_data = np.arange(depth_fine.size, dtype=np.uint32)
+    fine = (lf.add_channel('DEPTH-FINE', data=depth_fine), lf.add_channel('GR', data=gr_data))
+    up = (lf.add_channel('DEPTH-UP', data=depth_up), lf.add_channel('RES', data=np.arange(depth_up.size) * 0.5))
+    lf.add_frame('FINE', channels=fine, index_type='BOREHOLE-DEPTH')
+    lf.add_frame('UP', channels=up, index_type='BOREHOLE-DEPTH')
+
+    df.write(new_dlis_path, input_chunk_size=256, index_range=(2500, 3100))
+
+    with load_dlis(new_dlis_path) as f:
+        curves_fine = f.object('FRAME', 'FINE').curves()
+        curves_up = f.object('FRAME', 'UP').curves()
+
+    assert curves_fine['DEPTH-FINE'][[0, -1]].tolist() == [2500, 3100]
+    assert curves_fine['GR'].tolist() == list(range(1000, 2201))
+    assert curves_up['DEPTH-UP'][[0, -1]].tolist() == [3100, 2500]
+    assert curves_up['RES'].tolist() == (np.arange(450, 751) * 0.5).tolist()
+
+
+def test_index_range_with_row_window(new_dlis_path: Path) -> None:
+    df = make_df()
+    lf = df.logical_files[0]
+    lf.add_frame('MAIN', channels=(lf.add_channel('TIME', data=np.arange(100.)),), index_type='NON-STANDARD')
+
+    df.write(new_dlis_path, index_range=(10, 40), from_idx=20, to_idx=30)
+
+    with load_dlis(new_dlis_path) as f:
+        assert f.frames[0].curves()['TIME'].tolist() == list(range(20, 30))
+
+
+@pytest.mark.parametrize("chunk_size", (None, 4))
+def test_index_range_structured_array(new_dlis_path: Path, chunk_size: int) -> None:
+    """Test that the rows found in a structured numpy array source are the ones written."""
+
+    data = np.zeros(100, dtype=[('DEPTH', np.float64), ('GR', np.float32)])
+    data['DEPTH'] = np.arange(100.)
+    data['GR'] = np.arange(100.) * 2
+
+    df = make_df()
+    lf = df.logical_files[0]
+    lf.add_frame('MAIN', channels=(lf.add_channel('DEPTH'), lf.add_channel('GR')), index_type='BOREHOLE-DEPTH')
+
+    df.write(new_dlis_path, data=data, input_chunk_size=chunk_size, index_range=(50, 59))
+
+    with load_dlis(new_dlis_path) as f:
+        curves = f.frames[0].curves()
+        assert curves['DEPTH'].tolist() == list(range(50, 60))
+        assert curves['GR'].tolist() == list(range(100, 120, 2))
+
+
+def test_index_range_no_index(new_dlis_path: Path) -> None:
+    df = make_df()
+    lf = df.logical_files[0]
+    lf.add_frame('MAIN', channels=(lf.add_channel('X', data=np.arange(100.)),))
+
+    with pytest.raises(ValueError, match="has no index channel"):
+        df.write(new_dlis_path, index_range=(10, 40))
@@ -0,0 +1,82 @@
+import pytest
+import numpy as np
+from pathlib import Path
+from typing import Any
+
+from dliswriter import DLISFile
+from dliswriter.logical_record.iflr_types.frame_data import FrameData
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+def make_fast_and_slow(fast_time: np.ndarray, slow_time: np.ndarray, **index_kwargs: Any) -> DLISFile:
+    df = make_df()
+    lf = df.logical_files[0]
+    fast = (lf.add_channel('TIME-FAST', data=fast_time, **index_kwargs),
+            lf.add_channel('A', data=np.arange(fast_time.size * 1.)))
+    slow = (lf.add_channel('TIME-SLOW', data=slow_time, **index_kwargs),
+            lf.add_channel('B', data=np.arange(slow_time.size * 1.)))
+    lf.add_frame('FAST', channels=fast, index_type='NON-STANDARD')
+    lf.add_frame('SLOW', channels=slow, index_type='NON-STANDARD')
+    lf.add_frame('NO-INDEX', channels=(lf.add_channel('C', data=np.arange(3.)),))
+    return df
+
+
+def frame_data_order(df: DLISFile) -> list[tuple[str, int]]:
+    multi_frame_data_objects = df._make_multi_frame_data_objects(chunk_size=4)
+    try:
+        return [
+            (record._frame.name, record.frame_number)
+            for record in df.generator(multi_frame_data_objects, interleave_frames=True)
+            if isinstance(record, FrameData)
+        ]
+    finally:
+        df._close_multi_frame_data_objects(multi_frame_data_objects)
+
+
+@pytest.mark.parametrize("decreasing", (False, True))
+def test_order(decreasing: bool) -> None:
+    """Test that the rows of the frames are merged by time; frame numbers are kept; ties follow frame order."""
+
+    fast_time, slow_time = np.arange(0., 1., 0.25), np.arange(0., 1., 0.5)
+    if decreasing:
+        fast_time, slow_time = fast_time[::-1], slow_time[::-1]
+
+    order = frame_data_order(make_fast_and_slow(fast_time, slow_time))
+
+    expected = [('FAST', 1), ('SLOW', 1), ('FAST', 2), ('FAST', 3), ('SLOW', 2), ('FAST', 4)]
+    if decreasing:
+        expected = [('FAST', 1), ('FAST', 2), ('SLOW', 1), ('FAST', 3), ('FAST', 4), ('SLOW', 2)]
+    assert order == expected + [('NO-INDEX', 1), ('NO-INDEX', 2), ('NO-INDEX', 3)]
+
+
+def test_order_fshort_index() -> None:
+    """Test that frames with float16 (FSHORT) indices are merged by the index values, not by the FSHORT words."""
+
+    df = make_fast_and_slow(np.arange(8.), np.arange(0.5, 8, 2), cast_dtype=np.float16)
+    order = [name[0] + str(n) for name, n in frame_data_order(df)]
+
+    assert order == ['F1', 'S1', 'F2', 'F3', 'S2', 'F4', 'F5', 'S3', 'F6', 'F7', 'S4', 'F8', 'N1', 'N2', 'N3']
+
+
+def test_written(new_dlis_path: Path) -> None:
+    fast_time, slow_time = np.arange(0., 10., 0.01), np.arange(0., 10., 0.1)
+    df = make_fast_and_slow(fast_time, slow_time)
+
+    df.write(new_dlis_path, input_chunk_size=64, interleave_frames=True)
+
+    with load_dlis(new_dlis_path) as f:
+        assert np.array_equal(f.object('FRAME', 'FAST').curves()['TIME-FAST'], fast_time)
+        assert np.array_equal(f.object('FRAME', 'SLOW').curves()['B'], np.arange(100.))
+        assert f.object('FRAME', 'NO-INDEX').curves()['C'].tolist() == [0., 1., 2.]
+
+
+def test_invalid(new_dlis_path: Path) -> None:
+    df = make_fast_and_slow(np.arange(5.), np.arange(5.)[::-1])
+
+    with pytest.raises(ValueError, match="increasing and decreasing"):
+        df.write(new_dlis_path, interleave_frames=True)
+
+    with pytest.raises(ValueError, match="multiple workers"):
+        make_fast_and_slow(np.arange(5.), np.arange(5.)).write(new_dlis_path, interleave_frames=True, n_workers=2)
@@ -0,0 +1,250 @@
+import pytest
+from pathlib import Path
+import numpy as np
+from dlisio import dlis  # type: ignore  # untyped library
+
+from dliswriter import DLISFile, EvenlySpacedIndex
+from dliswriter.file.logical_file_template import LogicalFileTemplate
+from dliswriter.file.file import LogicalFile
+from dliswriter.logical_record.eflr_types import ParameterSet, ParameterItem
+
+from tests.dlis_files_for_testing.common import make_df
+
+
+@pytest.fixture
+def template() -> LogicalFileTemplate:
+    """Template made of a logical file with an origin, a few channels, a frame, a zone, and a parameter."""
+
+    lf = make_df().logical_files[0]
+    depth = lf.add_channel('DEPTH', units='m', data=np.arange(10.), cast_dtype=np.float64, dimension=[1])
+    rpm = lf.add_channel('RPM', data=np.arange(10, dtype=np.float32), cast_dtype=np.float32, dimension=[1])
+    lf.add_frame('MAIN', channels=(depth, rpm), index_type='BOREHOLE-DEPTH')
+    zone = lf.add_zone('ZONE', domain='BOREHOLE-DEPTH', minimum=0, maximum=9)
+    lf.add_parameter('PARAM', values=[1.5], zones=[zone])
+
+    return lf.freeze()
+
+
+def _add_clone(template: LogicalFileTemplate, fh_sequence_number: int = 1) -> tuple[DLISFile, LogicalFile]:
+    df = DLISFile()
+    lf = df.add_logical_file_from_template(template)
+    lf.file_header.sequence_number = fh_sequence_number
+    return df, lf
+
+
+def _get_param(lf: LogicalFile) -> ParameterItem:
+    return next(lf._eflr_sets.get_all_items_for_set_type(ParameterSet))
+
+
+def test_template_independent_of_logical_file() -> None:
+    """Test that changes to the logical file made after freezing do not affect the template and vice versa."""
+
+    lf = make_df().logical_files[0]
+    ch = lf.add_channel('X')
+    template = lf.freeze()
+
+    ch.name = 'Y'
+    ch.units.value = 's'
+    lf.add_channel('Z')
+
+    clone = DLISFile().add_logical_file_from_template(template)
+    assert [c.name for c in clone.channels] == ['X']
+    assert clone.channels[0].units.value is None
+    assert clone.channels[0] is not ch
+
+
+def test_references_redirected(template: LogicalFileTemplate) -> None:
+    """Test that objects of the new logical file refer to one another rather than to the template ones."""
+
+    _, lf1 = _add_clone(template)
+    _, lf2 = _add_clone(template)
+
+    for lf in (lf1, lf2):
+        frame = lf.frames[0]
+        assert frame.channels.value == tuple(lf.channels)
+        assert frame.parent is lf._eflr_sets[type(frame.parent)][None]
+
+    assert lf1.channels[0] is not lf2.channels[0]
+    assert lf1.origins[0] is not lf2.origins[0]
+
+
+def test_converters_bound_to_clone(template: LogicalFileTemplate) -> None:
+    """Test that attributes of cloned items validate values in the context of the new item."""
+
+    _, lf = _add_clone(template)
+    ch = lf.channels[0]
+
+    ch.dimension.value = [1]
+    assert ch.dimension.parent_eflr is ch
+    assert all(attr.parent_eflr is ch for attr in ch.attributes.values())
+
+
+def test_modifying_clone(template: LogicalFileTemplate) -> None:
+    """Test that modifying an object of a new logical file does not affect the template nor other logical files."""
+
+    _, lf1 = _add_clone(template)
+    _, lf2 = _add_clone(template)
+
+    lf1.origins[0].well_name.value = 'WELL-1'
+    lf1.channels[0].units.value = 'ft'
+
+    assert lf2.origins[0].well_name.value is None
+    assert lf2.channels[0].units.value == 'm'
+    assert template._eflr_sets[type(lf1.origins[0].parent)][None].get_eflr_item('DEFINING ORIGIN').well_name.value \
+           is None
+
+
+def test_shared_values_frozen(template: LogicalFileTemplate) -> None:
+    """Test that values shared with the template cannot be modified in place, but can be replaced."""
+
+    _, lf1 = _add_clone(template)
+    _, lf2 = _add_clone(template)
+    frame = lf1.frames[0]
+
+    with pytest.raises(AttributeError):
+        frame.channels.value.append(lf1.channels[0])
+    assert _get_param(lf1).values.value == (1.5,)
+
+    frame.channels.value = [lf1.channels[0]]
+    assert frame.channels.value == [lf1.channels[0]]
+    assert len(lf2.frames[0].channels.value) == 2
+
+
+def test_shared_array_read_only() -> None:
+    lf = make_df().logical_files[0]
+    zones = [lf.add_zone(f'ZONE{i}', domain='BOREHOLE-DEPTH', minimum=i, maximum=i + 1) for i in range(2)]
+    lf.add_parameter('PARAM', values=np.array([1.5, 2.5]), zones=zones)
+    clone = DLISFile().add_logical_file_from_template(lf.freeze())
+
+    with pytest.raises(ValueError, match="read-only"):
+        _get_param(clone).values.value[0] = 3.5
+
+
+def test_encoded_bodies_shared(template: LogicalFileTemplate, tmp_path: Path) -> None:
+    """Test that sets unchanged in the new logical files reuse the bytes encoded for the first one."""
+
+    df1, lf1 = _add_clone(template)
+    df2, lf2 = _add_clone(template)
+    lf2.channels[1].long_name.value = 'Revolutions'
+
+    df1.write(tmp_path / 'f1.DLIS')
+    df2.write(tmp_path / 'f2.DLIS')
+
+    origin_set_1, origin_set_2 = (lf.origins[0].parent for lf in (lf1, lf2))
+    assert origin_set_1.shares_encoded_body
+    assert origin_set_1._make_body_bytes() is origin_set_2._make_body_bytes()
+
+    assert lf1.channels[0].parent.shares_encoded_body
+    assert not lf2.channels[0].parent.shares_encoded_body
+
+    with dlis.load(tmp_path / 'f2.DLIS') as (f, *_):
+        assert f.object('CHANNEL', 'RPM').long_name == 'Revolutions'
+        assert f.object('PARAMETER', 'PARAM').zones[0].name == 'ZONE'
+
+
+def test_renaming_invalidates_linked_sets(template: LogicalFileTemplate) -> None:
+    """Test that renaming an item stops sharing encoded bodies of all sets which might refer to it."""
+
+    _, lf = _add_clone(template)
+    assert lf.frames[0].parent.shares_encoded_body  # any set but the channel one
+
+    lf.channels[0].name = 'MD'
+
+    for eflr_set_dict in lf._eflr_sets.values():
+        for eflr_set in eflr_set_dict.values():
+            assert not eflr_set.shares_encoded_body
+
+
+def test_adding_objects_to_clone(template: LogicalFileTemplate) -> None:
+    """Test that objects added to a new logical file go to its own sets, not to those of other logical files."""
+
+    df = DLISFile()
+    lf1 = df.add_logical_file_from_template(template)
+    lf2 = df.add_logical_file_from_template(template)
+
+    ch = lf2.add_channel('NEW')
+
+    assert ch.parent is lf2.channels[0].parent
+    assert not ch.parent.shares_encoded_body
+    assert [c.name for c in lf1.channels] == ['DEPTH', 'RPM']
+    assert lf1.channels[0].parent.shares_encoded_body
+
+
+def test_multiple_logical_files_from_template(template: LogicalFileTemplate, tmp_path: Path) -> None:
+    """Test writing a file with several logical files created from the same template."""
+
+    df = DLISFile()
+    for i in range(3):
+        lf = df.add_logical_file_from_template(template)
+        lf.file_header.sequence_number = i + 1
+        lf.origins[0].well_name.value = f'WELL-{i}'
+
+    df.write(tmp_path / 'multi.DLIS')
+
+    with dlis.load(tmp_path / 'multi.DLIS') as files:
+        assert len(files) == 3
+        for i, f in enumerate(files):
+            assert f.origins[0].well_name == f'WELL-{i}'
+            assert [c.name for c in f.channels] == ['DEPTH', 'RPM']
+            assert (f.frames[0].curves()['RPM'] == np.arange(10)).all()
+
+
+def test_new_data_for_clone(template: LogicalFileTemplate, tmp_path: Path) -> None:
+    """Test that logical files created from a template can have their own data."""
+
+    df = DLISFile()
+    for i in range(3):
+        data = {'RPM': np.arange(10, dtype=np.float32) * i} if i else None
+        lf = df.add_logical_file_from_template(template, data=data)
+        lf.file_header.sequence_number = i + 1
+
+    df.write(tmp_path / 'new_data.DLIS')
+
+    with dlis.load(tmp_path / 'new_data.DLIS') as files:
+        assert (files[0].frames[0].curves()['RPM'] == np.arange(10)).all()
+        for i, f in enumerate(files[1:], start=1):
+            assert (f.frames[0].curves()['RPM'] == np.arange(10) * i).all()
+            assert (f.frames[0].curves()['DEPTH'] == np.arange(10)).all()
+
+
+def test_set_channel_data_dtype_and_shape(template: LogicalFileTemplate, tmp_path: Path) -> None:
+    """Test replacing the data of a cloned channel with data of a different type and sample shape."""
+
+    df, lf = _add_clone(template)
+    ch = lf.set_channel_data('RPM', np.arange(20, dtype=np.int32).reshape(10, 2), cast_dtype=np.int32)
+    assert ch is lf.channels[1]
+    assert ch.dimension.value == [2]
+    assert ch.element_limit.value == [2]
+    assert ch.representation_code.value.name == 'SLONG'
+
+    df.write(tmp_path / 'new_shape.DLIS')
+
+    with dlis.load(tmp_path / 'new_shape.DLIS') as (f, *_):
+        rpm = f.frames[0].curves()['RPM']
+        assert rpm.dtype == np.int32
+        assert (rpm == np.arange(20).reshape(10, 2)).all()
+
+
+def test_set_channel_data_errors(template: LogicalFileTemplate) -> None:
+    """Test that data cannot be bound to unknown or virtual channels."""
+
+    _, lf = _add_clone(template)
+
+    with pytest.raises(ValueError, match="Channel X not found"):
+        lf.set_channel_data('X', np.arange(10))
+
+    with pytest.raises(ValueError, match="Expected a numpy.ndarray"):
+        lf.set_channel_data('RPM', [1, 2, 3])  # type: ignore  # checking runtime validation
+
+    vch = lf.add_channel('V', virtual=EvenlySpacedIndex(0, 1))
+    with pytest.raises(ValueError, match="virtual channel"):
+        lf.set_channel_data(vch, np.arange(10))
+
+
+def test_cloned_attributes_cannot_be_replaced(template: LogicalFileTemplate) -> None:
+    """Test that Attributes of a cloned item cannot be overwritten, also before they are copied from the template."""
+
+    _, lf = _add_clone(template)
+
+    with pytest.raises(RuntimeError, match="Cannot set DLIS Attribute 'units'"):
+        lf.channels[0].units = 'ft'  # type: ignore  # checking runtime validation
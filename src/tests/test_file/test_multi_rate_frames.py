@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+from pathlib import Path
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+@pytest.fixture
+def multi_rate_data() -> dict[str, np.ndarray]:
+    """Channels sampled at 100, 10, and 1 Hz, aligned on a 100 Hz grid and padded with NaNs."""
+
+    n_rows = 1000
+    data = {
+        'TIME': np.arange(n_rows) / 100,
+        'FAST': np.sin(np.arange(n_rows)),
+        'MEDIUM': np.full(n_rows, np.nan),
+        'SLOW': np.full(n_rows, np.nan),
+        'IMAGE': np.full((n_rows, 8), np.nan),
+    }
+    data['MEDIUM'][::10] = np.arange(100.)
+    data['SLOW'][5::100] = np.arange(10.)
+    data['IMAGE'][::10] = np.random.rand(100, 8)
+    data['IMAGE'][20, 3] = np.nan  # an absent value within the sampled rows
+    return data
+
+
+def test_frames(multi_rate_data: dict[str, np.ndarray]) -> None:
+    lf = make_df().logical_files[0]
+
+    frames = lf.add_multi_rate_frames('MAIN', multi_rate_data, index_name='TIME', chunk_size=64)
+
+    assert [fr.name for fr in frames] == ['MAIN-1', 'MAIN-10', 'MAIN-100-5']
+    assert [[ch.name for ch in fr.channels.value] for fr in frames] == [
+        ['TIME-1', 'FAST'], ['TIME-10', 'MEDIUM', 'IMAGE'], ['TIME-100-5', 'SLOW']
+    ]
+    assert np.shares_memory(lf._data_dict['MEDIUM'], multi_rate_data['MEDIUM'])  # strided views, not copies
+
+
+def test_written(multi_rate_data: dict[str, np.ndarray], new_dlis_path: Path) -> None:
+    multi_rate_data['COUNTS'] = np.arange(1000, dtype=np.uint16)  # cannot represent the absent value
+    df = make_df()
+    df.logical_files[0].add_multi_rate_frames('MAIN', multi_rate_data, index_name='TIME', absent_value=-999.25)
+
+    df.write(new_dlis_path, input_chunk_size=100)
+
+    with load_dlis(new_dlis_path) as f:
+        assert f.object('FRAME', 'MAIN-1').curves()['COUNTS'].tolist() == list(range(1000))
+        slow = f.object('FRAME', 'MAIN-100-5')
+        assert slow.index_type == 'NON-STANDARD'
+        assert slow.curves()['TIME-100-5'].tolist() == (np.arange(5, 1000, 100) / 100).tolist()
+        assert slow.curves()['SLOW'].tolist() == list(range(10))
+
+        medium = f.object('FRAME', 'MAIN-10').curves()
+        assert medium['MEDIUM'].tolist() == list(range(100))
+        assert medium['IMAGE'][2, 3] == -999.25
+        assert np.array_equal(np.delete(medium['IMAGE'].ravel(), 19), np.delete(multi_rate_data['IMAGE'][::10], 19))
+
+
+def test_invalid_index() -> None:
+    lf = make_df().logical_files[0]
+
+    with pytest.raises(ValueError, match="No index data set"):
+        lf.add_multi_rate_frames('MAIN', {'A': np.zeros(10)}, index_name='TIME')
+
+    with pytest.raises(ValueError, match="must have a valid value in every row"):
+        lf.add_multi_rate_frames('MAIN', {'TIME': np.array([0., np.nan, 2.])}, index_name='TIME')
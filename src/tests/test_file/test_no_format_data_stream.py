@@ -0,0 +1,133 @@
+import pytest
+import numpy as np
+from pathlib import Path
+from typing import Iterator
+
+from dliswriter import DLISFile
+from dliswriter.file import NoFormatDataStream
+from dliswriter.logical_record import eflr_types
+from dliswriter.logical_record.iflr_types import NoFormatFrameData
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+@pytest.fixture
+def payload() -> bytes:
+    return np.random.default_rng(0).integers(0, 256, size=10_000, dtype=np.uint8).tobytes()
+
+
+@pytest.fixture
+def payload_path(payload: bytes, base_data_path: Path) -> Iterator[Path]:
+    p = base_data_path / "outputs/no_format_payload.bin"
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(payload)
+    yield p
+    p.unlink()
+
+
+def _make_no_format() -> eflr_types.NoFormatItem:
+    return eflr_types.NoFormatItem("NF", consumer_name="TESTER", parent=eflr_types.NoFormatSet())
+
+
+def _iter_in_pieces(bts: bytes, size: int) -> Iterator[bytes]:
+    for i in range(0, len(bts), size):
+        yield bts[i:i + size]
+
+
+@pytest.mark.parametrize(("n_bytes", "chunk_size", "expected_sizes"), (
+        (1000, 1000, [1000]),
+        (1000, 400, [400, 400, 200]),
+        (1000, 499, [499, 501]),  # last piece (2 bytes) merged with the previous one
+        (1000, 494, [494, 494, 12]),
+        (1000, 2000, [1000]),
+        (5, 100, [5]),
+))
+def test_piece_sizes(payload: bytes, payload_path: Path, n_bytes: int, chunk_size: int,
+                     expected_sizes: list[int]) -> None:
+    """Test splitting the data into pieces, both from a file and from an iterator."""
+
+    payload_path.write_bytes(payload[:n_bytes])
+
+    from_file = NoFormatDataStream(_make_no_format(), payload_path, chunk_size=chunk_size)
+    assert from_file.n_records == len(expected_sizes)
+
+    for it_size in (1, 7, 300, 5000):
+        from_iter = NoFormatDataStream(_make_no_format(), _iter_in_pieces(payload[:n_bytes], it_size),
+                                       chunk_size=chunk_size)
+        assert from_iter.n_records is None
+
+        pieces = list(from_iter.iter_pieces())
+        assert [len(p) for p in pieces] == expected_sizes
+        assert b''.join(pieces) == payload[:n_bytes]
+
+    pieces = list(from_file.iter_pieces())
+    assert [len(p) for p in pieces] == expected_sizes
+    assert b''.join(pieces) == payload[:n_bytes]
+
+
+def test_records(payload_path: Path) -> None:
+    """Test that NoFormatFrameData records are created from the pieces."""
+
+    nf = _make_no_format()
+    records = list(NoFormatDataStream(nf, payload_path, chunk_size=4096))
+
+    assert len(records) == 3
+    for r in records:
+        assert isinstance(r, NoFormatFrameData)
+        assert r.no_format_object is nf
+
+
+def test_str_iterator() -> None:
+    """Test that str pieces are encoded as ASCII."""
+
+    pieces = list(NoFormatDataStream(_make_no_format(), iter(["Lorem ipsum ", "dolor sit amet"]), chunk_size=20)
+                  .iter_pieces())
+    assert b''.join(pieces) == b"Lorem ipsum dolor sit amet"
+
+
+def test_iterator_consumed_once() -> None:
+    s = NoFormatDataStream(_make_no_format(), iter([b"x" * 100]), chunk_size=50)
+    list(s)
+
+    with pytest.raises(RuntimeError, match="already been consumed"):
+        list(s)
+
+
+@pytest.mark.parametrize(("source", "chunk_size", "exc_type"), (
+        ("some text", 100, TypeError),
+        (b"some bytes", 100, TypeError),
+        (Path("/no/such/file.pdf"), 100, FileNotFoundError),
+        (iter([b""]), 5, ValueError),
+        (12, 100, TypeError),
+))
+def test_wrong_arguments(source: object, chunk_size: int, exc_type: type[Exception]) -> None:
+    with pytest.raises(exc_type):
+        NoFormatDataStream(_make_no_format(), source, chunk_size=chunk_size)  # type: ignore  # testing wrong types
+
+
+def _write_file(new_dlis_path: Path, data: object, chunk_size: int) -> DLISFile:
+    df = make_df()
+    lf = df.logical_files[0]
+    lf.add_frame("MAIN", channels=(lf.add_channel("X", data=np.arange(10, dtype=np.float64)),))
+    nf1 = lf.add_no_format("NF1", consumer_name="TESTER")
+    nf2 = lf.add_no_format("NF2", consumer_name="TESTER")
+    lf.add_no_format_frame_data(nf1, data=data, chunk_size=chunk_size)  # type: ignore  # data type
+    lf.add_no_format_frame_data(nf2, data="Lorem ipsum dolor sit amet")
+    df.write(new_dlis_path)
+    return df
+
+
+@pytest.mark.parametrize("from_file", (True, False))
+def test_write_and_read(payload: bytes, payload_path: Path, new_dlis_path: Path, from_file: bool) -> None:
+    """Test writing streamed no-format data to a DLIS file and reading it back."""
+
+    data = payload_path if from_file else _iter_in_pieces(payload, 333)
+    _write_file(new_dlis_path, data, chunk_size=3000)
+
+    with load_dlis(new_dlis_path) as f:
+        nf1 = f.object("NO-FORMAT", "NF1")
+        assert nf1.data() == payload  # dlisio concatenates data of all records of the no-format object
+
+        nf2 = f.object("NO-FORMAT", "NF2")
+        assert nf2.data() == b"Lorem ipsum dolor sit amet"
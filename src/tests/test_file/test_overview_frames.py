@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+from pathlib import Path
+from typing import Optional
+
+from dliswriter import DLISFile
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+N_ROWS = 103
+
+
+@pytest.fixture
+def df_with_overviews() -> DLISFile:
+    """File with a depth-indexed frame and its 'pick', 'mean', and 'min-max' overview frames."""
+
+    df = make_df()
+    lf = df.logical_files[0]
+    gr = np.random.rand(N_ROWS) * 150
+    gr[10:13] = np.nan
+    channels = (
+        lf.add_channel('DEPTH', data=np.arange(N_ROWS) * 0.5, units='m'),
+        lf.add_channel('GR', data=gr, units='gAPI', cast_dtype=np.float32),
+        lf.add_channel('IMAGE', data=np.arange(N_ROWS * 3, dtype=np.uint16).reshape(N_ROWS, 3)),
+    )
+    frame = lf.add_frame('MAIN', channels=channels, index_type='BOREHOLE-DEPTH')
+    lf.add_overview_frame(frame, 10)
+    lf.add_overview_frame(frame, 4, method='mean', name='MEAN4')
+    lf.add_overview_frame(frame, 25, method='min-max')
+    return df
+
+
+@pytest.mark.parametrize(("chunk_size", "n_workers"), ((None, None), (7, None), (32, 2)))
+def test_overview_frames(df_with_overviews: DLISFile, new_dlis_path: Path, chunk_size: Optional[int],
+                         n_workers: Optional[int]) -> None:
+    """Test that overview frames are written (interleaved with the chunks of the source frame) and read back."""
+
+    lf = df_with_overviews.logical_files[0]
+    depth, gr, image = (lf._data_dict[name] for name in ('DEPTH', 'GR', 'IMAGE'))
+    df_with_overviews.write(new_dlis_path, input_chunk_size=chunk_size, n_workers=n_workers)
+
+    with load_dlis(new_dlis_path) as f:
+        frames = {fr.name: fr for fr in f.frames}
+        assert set(frames) == {'MAIN', 'MAIN-OVERVIEW10', 'MEAN4', 'MAIN-OVERVIEW25'}
+        assert frames['MAIN'].curves()['DEPTH'].size == N_ROWS
+
+        pick = frames['MAIN-OVERVIEW10']
+        assert pick.spacing == 5
+        assert pick.index_type == 'BOREHOLE-DEPTH'
+        curves = pick.curves()
+        assert [ch.name for ch in pick.channels] == ['DEPTH-OVERVIEW10', 'GR-OVERVIEW10', 'IMAGE-OVERVIEW10']
+        assert pick.channels[1].units == 'gAPI'
+        assert np.array_equal(curves['DEPTH-OVERVIEW10'], depth[::10])
+        assert np.allclose(curves['GR-OVERVIEW10'], gr[::10].astype(np.float32), equal_nan=True)
+        assert np.array_equal(curves['IMAGE-OVERVIEW10'], image[::10])
+
+        curves = frames['MEAN4'].curves()
+        assert frames['MEAN4'].spacing is None  # last window is partial
+        assert np.allclose(curves['DEPTH-OVERVIEW4'], [depth[i:i + 4].mean() for i in range(0, N_ROWS, 4)])
+        assert np.allclose(curves['GR-OVERVIEW4'], [np.nanmean(gr[i:i + 4]) for i in range(0, N_ROWS, 4)])
+
+        min_max = frames['MAIN-OVERVIEW25']
+        assert [ch.name for ch in min_max.channels] == \
+               ['DEPTH-OVERVIEW25', 'GR-MIN25', 'GR-MAX25', 'IMAGE-MIN25', 'IMAGE-MAX25']
+        curves = min_max.curves()
+        assert np.array_equal(curves['DEPTH-OVERVIEW25'], depth[::25])
+        assert np.allclose(curves['GR-MAX25'], [np.nanmax(gr[i:i + 25]) for i in range(0, N_ROWS, 25)])
+        assert np.array_equal(curves['IMAGE-MIN25'], image[::25])
+        assert np.array_equal(curves['IMAGE-MAX25'], [image[i:i + 25].max(axis=0) for i in range(0, N_ROWS, 25)])
+
+
+def test_no_index(new_dlis_path: Path) -> None:
+    """Test an overview frame of a frame indexed by row number."""
+
+    df = make_df()
+    lf = df.logical_files[0]
+    values = np.arange(30.)
+    frame = lf.add_frame('MAIN', channels=[lf.add_channel('X', data=values)])
+    overview = lf.add_overview_frame(frame, 8, method='min-max')
+
+    df.write(new_dlis_path, input_chunk_size=5)
+
+    assert overview.index_max.value == 4
+    with load_dlis(new_dlis_path) as f:
+        curves = f.object('FRAME', 'MAIN-OVERVIEW8').curves()
+        assert curves['X-MIN8'].tolist() == [0., 8., 16., 24.]
+        assert curves['X-MAX8'].tolist() == [7., 15., 23., 29.]
+
+
+def test_overview_of_template_clone(new_dlis_path: Path) -> None:
+    """Test that a logical file created from a template computes the overviews of its own frames."""
+
+    df = make_df()
+    lf = df.logical_files[0]
+    frame = lf.add_frame('MAIN', channels=[lf.add_channel('X', data=np.arange(10.))], index_type='BOREHOLE-DEPTH')
+    lf.add_overview_frame(frame, 5)
+
+    clone = df.add_logical_file_from_template(lf.freeze())
+    clone.file_header.sequence_number = 2
+    assert clone.frames[0].overviews[0].frame is clone.frames[1]
+
+    df.write(new_dlis_path)
+
+    with load_dlis(new_dlis_path) as f:
+        assert f.object('FRAME', 'MAIN-OVERVIEW5').curves()['X-OVERVIEW5'].tolist() == [0., 5.]
+
+
+@pytest.mark.parametrize(("factor", "method", "message"), (
+        (1, 'pick', "must be an integer larger than 1"),
+        (2.5, 'pick', "must be an integer larger than 1"),
+        (2, 'median', "is not a valid DecimationMethod"),
+))
+def test_invalid_definition(factor: int, method: str, message: str) -> None:
+    lf = make_df().logical_files[0]
+    frame = lf.add_frame('MAIN', channels=[lf.add_channel('X', data=np.arange(10.))])
+
+    with pytest.raises(ValueError, match=message):
+        lf.add_overview_frame(frame, factor, method=method)
+
+
+def test_overview_of_overview() -> None:
+    lf = make_df().logical_files[0]
+    frame = lf.add_frame('MAIN', channels=[lf.add_channel('X', data=np.arange(10.))])
+    overview = lf.add_overview_frame(frame, 2)
+
+    with pytest.raises(ValueError, match="overviews of overview frames are not supported"):
+        lf.add_overview_frame(overview, 2)
+
+
+def test_interleaving_rejected(df_with_overviews: DLISFile, new_dlis_path: Path) -> None:
+    with pytest.raises(ValueError, match="Frames with overview frames cannot be interleaved"):
+        df_with_overviews.write(new_dlis_path, interleave_frames=True)
@@ -0,0 +1,216 @@
+import pytest
+import threading
+import numpy as np
+from pathlib import Path
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+
+from dliswriter import DLISFile, AttrSetup, ParallelEFLREncoder, parallel_eflr_encoding_scope, enums, eflr_types
+from dliswriter.configuration import global_config
+from dliswriter.file.frame_data_scheduler import FrameDataScheduler, encode_frame_data_chunk
+from dliswriter.file.writer import make_visible_records
+from dliswriter.logical_record.iflr_types import FrameData
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_sul, make_file_header
+
+
+N_ROWS = (120, 35, 77)
+
+
+def _make_dlis_file() -> DLISFile:
+    """Define a DLIS file with several frames of different row numbers and dtypes."""
+
+    df = DLISFile(storage_unit_label=make_sul())
+    lf = df.add_logical_file(file_header=make_file_header())
+    lf.add_origin("DEFINING ORIGIN", creation_time="2050/03/02 15:30:00", file_set_number=1)
+
+    for idx_fr, n in enumerate(N_ROWS):
+        depth = lf.add_channel(f"DEPTH-{idx_fr}", data=np.arange(n) * 0.5 + idx_fr, units='m')
+        rpm = lf.add_channel(f"RPM-{idx_fr}", data=(np.arange(n) % 7).astype(np.uint16))
+        img = lf.add_channel(f"IMG-{idx_fr}", data=np.random.rand(n, 40).astype(np.float32))
+        lf.add_frame(f"FRAME-{idx_fr}", channels=(depth, rpm, img), index_type=enums.FrameIndexType.BOREHOLE_DEPTH)
+
+    return df
+
+
+@pytest.mark.parametrize(("input_chunk_size", "n_workers"), (
+        (10, 2),
+        (None, 3),
+        (16, 2),
+        (1000, 4),
+))
+def test_parallel_output_identical(new_dlis_path: Path, input_chunk_size: Optional[int], n_workers: int) -> None:
+    """Test that encoding frame data in worker processes produces exactly the same file as serial encoding."""
+
+    np.random.seed(1)
+    _make_dlis_file().write(new_dlis_path, input_chunk_size=input_chunk_size)
+    serial_bytes = new_dlis_path.read_bytes()
+
+    np.random.seed(1)
+    _make_dlis_file().write(new_dlis_path, input_chunk_size=input_chunk_size, n_workers=n_workers)
+    parallel_bytes = new_dlis_path.read_bytes()
+
+    assert parallel_bytes == serial_bytes
+
+
+def test_parallel_output_readable(new_dlis_path: Path) -> None:
+    """Test that the data written with multiple workers are read back correctly."""
+
+    df = _make_dlis_file()
+    df.write(new_dlis_path, input_chunk_size=8, n_workers=2)
+
+    with load_dlis(new_dlis_path) as f:
+        for idx_fr, n in enumerate(N_ROWS):
+            frame = [fr for fr in f.frames if fr.name == f"FRAME-{idx_fr}"][0]
+            curves = frame.curves()
+            assert curves.shape == (n,)
+            assert np.array_equal(curves['FRAMENO'], np.arange(1, n + 1))
+            assert np.allclose(curves[f"DEPTH-{idx_fr}"], np.arange(n) * 0.5 + idx_fr)
+
+
+def test_encode_chunk_matches_frame_data() -> None:
+    """Test that encoding a chunk at once gives the same bytes as encoding consecutive FrameData objects."""
+
+    df = _make_dlis_file()
+    lf = df.logical_files[0]
+    frame = lf.frames[0]
+    mfd = lf._make_multi_frame_data(frame, chunk_size=50)
+
+    expected = b''
+    for frame_data in mfd:
+        expected += b''.join(make_visible_records(frame_data.represent_as_bytes(), 8192))
+
+    encoded = b''
+    for first_frame_number, chunk in mfd.iter_chunks():
+        assert isinstance(first_frame_number, int)
+        encoded += encode_frame_data_chunk(frame.obname, first_frame_number, chunk, 8192)
+
+    assert encoded == expected
+    assert isinstance(frame_data, FrameData)
+
+
+def test_scheduler_order_check() -> None:
+    """Test that requesting encoded data in a wrong order raises an error."""
+
+    df = _make_dlis_file()
+    lf = df.logical_files[0]
+    mfds = [lf._make_multi_frame_data(fr, chunk_size=50) for fr in lf.frames]
+
+    with FrameDataScheduler(mfds, visible_record_length=8192, n_workers=2) as scheduler:
+        with pytest.raises(RuntimeError, match="order of submission"):
+            next(scheduler.encoded_records(mfds[1]))
+
+
+@pytest.mark.parametrize("n_workers", (0, -2, 1.5))
+def test_scheduler_wrong_n_workers(n_workers: int) -> None:
+    with pytest.raises(ValueError, match="positive integer"):
+        FrameDataScheduler([], visible_record_length=8192, n_workers=n_workers)
+
+
+def _make_metadata_heavy_dlis_file(n_items: int = 300) -> DLISFile:
+    """Define a DLIS file with many parameters and channels, some of them referring to other objects."""
+
+    df = DLISFile(storage_unit_label=make_sul())
+    lf = df.add_logical_file(file_header=make_file_header())
+    lf.add_origin("DEFINING ORIGIN", creation_time="2050/03/02 15:30:00", file_set_number=1)
+
+    zones = [lf.add_zone(f"ZONE-{i}", domain=enums.ZoneDomain.TIME, minimum=i, maximum=i + 1) for i in range(3)]
+    axis = lf.add_axis("AXIS", coordinates=[1, 2, 3])
+
+    for i in range(n_items):
+        lf.add_parameter(f"PARAM-{i}", values=[i * 0.5, i, i + 1], zones=zones, long_name=f"Parameter no. {i}")
+        lf.add_channel(f"CH-{i}", units='m', dimension=[3], axis=axis, cast_dtype=np.float32,
+                       minimum_value=float(i), maximum_value=[i + 1.5])
+
+    depth = lf.add_channel("DEPTH", units='m')
+    lf.add_frame("FRAME", channels=(depth, lf.channels[0]), index_type=enums.FrameIndexType.BOREHOLE_DEPTH)
+    lf.add_equipment("EQ", serial_number="123", weight=AttrSetup(12.5, units='kg'))
+
+    return df
+
+
+@pytest.mark.parametrize(("min_items", "batch_size"), ((1, 1), (100, 64), (200, None)))
+def test_parallel_eflr_encoding_identical(min_items: int, batch_size: Optional[int]) -> None:
+    """Test that encoding EFLR items in batches (in parallel) produces exactly the same bytes as serial encoding."""
+
+    def make_bodies() -> list[bytes]:
+        lf = _make_metadata_heavy_dlis_file().logical_files[0]
+        return [bytes(s._make_body_bytes()) for d in lf._eflr_sets.values() for s in d.values()]
+
+    serial_bodies = make_bodies()
+
+    encoder = ParallelEFLREncoder(n_workers=2, min_items=min_items, batch_size=batch_size,
+                                  executor=ThreadPoolExecutor(max_workers=2))
+    with parallel_eflr_encoding_scope(encoder):
+        parallel_bodies = make_bodies()
+
+    assert parallel_bodies == serial_bodies
+
+
+def test_parallel_eflr_output_identical(new_dlis_path: Path) -> None:
+    """Test that a file with EFLRs encoded in worker processes is identical to the one encoded serially."""
+
+    data = {'DEPTH': np.arange(10.), 'CH-0': np.random.rand(10, 3)}
+
+    _make_metadata_heavy_dlis_file().write(new_dlis_path, data=data)
+    serial_bytes = new_dlis_path.read_bytes()
+
+    with parallel_eflr_encoding_scope(ParallelEFLREncoder(n_workers=2, min_items=100)):
+        _make_metadata_heavy_dlis_file().write(new_dlis_path, data=data)
+    parallel_bytes = new_dlis_path.read_bytes()
+
+    assert parallel_bytes == serial_bytes
+
+    with load_dlis(new_dlis_path) as f:
+        assert len(f.parameters) == 300
+        assert [z.name for z in f.object('PARAMETER', 'PARAM-7').zones] == ['ZONE-0', 'ZONE-1', 'ZONE-2']
+
+
+def test_parallel_eflr_encoding_scope_per_thread() -> None:
+    """Test that an encoder set in one thread is not used by the code running concurrently in another thread."""
+
+    barrier = threading.Barrier(2)
+    results: dict[str, bool] = {}
+
+    def run_with_encoder() -> None:
+        with parallel_eflr_encoding_scope(ParallelEFLREncoder(n_workers=2, min_items=1)) as encoder:
+            barrier.wait()  # scope entered
+            results['own'] = global_config.eflr_encoder is encoder
+            barrier.wait()  # other thread checked
+
+    def run_without_encoder() -> None:
+        barrier.wait()
+        results['other'] = global_config.eflr_encoder is None
+        barrier.wait()
+
+    threads = [threading.Thread(target=run_with_encoder), threading.Thread(target=run_without_encoder)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {'own': True, 'other': True}
+    assert global_config.eflr_encoder is None
+
+
+def test_parallel_eflr_errors_raised() -> None:
+    """Test that errors in the definitions of the items are raised in the main process."""
+
+    lf = _make_metadata_heavy_dlis_file(n_items=10).logical_files[0]
+    lf.add_parameter("WRONG", values=[1, 2], zones=[lf.add_zone("Z", domain='TIME', minimum=0, maximum=1)])
+    parameter_set = lf._eflr_sets.get_or_make_set(eflr_types.ParameterSet)
+
+    with parallel_eflr_encoding_scope(ParallelEFLREncoder(n_workers=2, min_items=1)):
+        with pytest.raises(RuntimeError, match="same number of values and zones"):
+            parameter_set._make_body_bytes()
+
+
+@pytest.mark.parametrize(("kwargs", "match"), (
+        ({'n_workers': 0}, "Number of workers"),
+        ({'n_workers': 2, 'min_items': 0}, "Minimal number of items"),
+        ({'n_workers': 2, 'batch_size': 2.5}, "Batch size"),
+))
+def test_parallel_eflr_encoder_wrong_arguments(kwargs: dict, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        ParallelEFLREncoder(**kwargs)
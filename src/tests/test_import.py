@@ -0,0 +1,26 @@
+import subprocess
+import sys
+import pytest
+
+
+def _run_in_new_interpreter(code: str) -> str:
+    return subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True).stdout
+
+
+@pytest.mark.parametrize("module_name", ('h5py', 'progressbar', 'concurrent.futures.process'))
+def test_optional_modules_not_imported(module_name: str) -> None:
+    """Test that modules needed only in some cases are not imported together with the package."""
+
+    out = _run_in_new_interpreter(f"import sys, dliswriter; print({module_name!r} in sys.modules)")
+    assert out.strip() == 'False'
+
+
+def test_import_time_budget() -> None:
+    """Test that importing the package (excluding numpy) takes less than the budget.
+
+    The budget is generous (the import typically takes 0.1-0.2 s); see benchmarks/import_time.py for measurements.
+    """
+
+    out = _run_in_new_interpreter(
+        "import time, numpy; t = time.perf_counter(); import dliswriter; print(time.perf_counter() - t)")
+    assert float(out) < 2
@@ -1,8 +1,12 @@
+import struct
 import pytest
+import numpy as np
 from datetime import datetime, timedelta
 from typing import Any, Generator
 
-from dliswriter.logical_record.core.attribute import Attribute, DTimeAttribute
+from dliswriter.logical_record.core.attribute import Attribute, DTimeAttribute, NumericAttribute, EFLRAttribute
+from dliswriter.utils.internal.internal_enums import RepresentationCode as RepC
+from dliswriter.utils.internal.struct_writer import write_struct, write_structs, write_struct_array
 
 
 @pytest.fixture
@@ -49,3 +53,143 @@ def test_parse_dtime_wrong_type(dts: Any) -> None:
 
     with pytest.raises(TypeError, match="Expected a str.*"):
         DTimeAttribute.parse_dtime(dts)
+
+
+@pytest.mark.parametrize(("value", "rc"), (
+        ([1.5, 2.5, -3.25], RepC.FDOUBL),
+        ([[1, 2], [3, 4]], RepC.USHORT),
+        (["a", "bc", "def"], RepC.ASCII),
+        (list(range(1000)), RepC.SLONG)
+))
+def test_write_to_buffer(value: list, rc: RepC) -> None:
+    """Check that the attribute bytes are appended to the buffer, after the bytes already present there."""
+
+    attr = Attribute('values', multivalued=True, multidimensional=True, representation_code=rc, units='m')
+    attr.value = value
+
+    buffer = bytearray(b'xyz')
+    attr.write_to(buffer)
+
+    assert buffer[:3] == b'xyz'
+    assert buffer[3:] == attr.get_as_bytes()
+    assert buffer.endswith(b''.join(write_struct(rc, v) for v in Attribute.flatten_list(value)))
+
+
+@pytest.mark.parametrize(("values", "rc"), (
+        ([0.1, 2.0, 1e300], RepC.FDOUBL),
+        ([1, 127, -128], RepC.SSHORT),
+        ([0, 1, 1], RepC.STATUS),
+        ([], RepC.FSINGL)
+))
+def test_write_structs(values: list, rc: RepC) -> None:
+    """Check that values converted together are the same as values converted one by one."""
+
+    assert write_structs(rc, values) == b''.join(write_struct(rc, v) for v in values)
+
+
+def test_write_structs_error() -> None:
+    """Check that an error is raised for values which cannot be represented with the given code."""
+
+    with pytest.raises(struct.error):
+        write_structs(RepC.USHORT, [1, 2, 256])
+
+    with pytest.raises(ValueError, match="STATUS must be 1.*"):
+        write_structs(RepC.STATUS, [1, 2])
+
+
+@pytest.mark.parametrize(("arr", "rc"), (
+        (np.random.rand(1000), RepC.FDOUBL),
+        (np.random.rand(10, 10).astype(np.float32), RepC.FSINGL),
+        (np.arange(-50, 50, dtype=np.int64), RepC.SLONG),
+        (np.arange(300, dtype=np.uint16).reshape(3, 100), RepC.UNORM),
+        (np.array([1.5, -2], dtype=np.float16), RepC.FSINGL)
+))
+def test_array_value(arr: np.ndarray, rc: RepC) -> None:
+    """Check that numeric arrays are kept as arrays, with representation code determined from the dtype."""
+
+    attr = Attribute('values', multivalued=True, multidimensional=True)
+    attr.value = arr
+
+    assert isinstance(attr.value, np.ndarray)
+    assert attr.value is not arr
+    assert attr.representation_code is rc
+    assert attr.count == arr.size
+    assert attr.get_as_bytes().endswith(b''.join(write_struct(rc, v) for v in arr.ravel().tolist()))
+
+
+def test_array_value_same_bytes_as_list() -> None:
+    """Check that an array value is encoded in the same way as the equivalent list."""
+
+    arr = np.random.rand(4, 25)
+
+    attr_arr = Attribute('values', multivalued=True, multidimensional=True)
+    attr_arr.value = arr
+    attr_list = Attribute('values', multivalued=True, multidimensional=True)
+    attr_list.value = arr.tolist()
+
+    assert attr_arr.get_as_bytes() == attr_list.get_as_bytes()
+
+
+@pytest.mark.parametrize(("attr", "arr"), (
+        (Attribute('x', multivalued=True), np.array([[1, 2], [3, 4]])),  # not multidimensional
+        (Attribute('x', multivalued=True), np.array(['a', 'b'])),  # not numeric
+        (EFLRAttribute('x', multivalued=True), np.array([])),  # repr code of the dtype not allowed
+))
+def test_array_value_as_list(attr: Attribute, arr: np.ndarray) -> None:
+    """Check that arrays which cannot be kept as arrays are treated like lists."""
+
+    attr.value = arr
+    assert isinstance(attr.value, list)
+
+
+def test_array_value_too_large_int() -> None:
+    attr = Attribute('x', multivalued=True)
+    with pytest.raises(ValueError, match=".*do not fit in the range of int32.*"):
+        attr.value = np.array([1, 2**40])
+
+
+@pytest.mark.parametrize(("arr", "int_only", "dtype"), (
+        (np.array([1, 2, 3], dtype=np.int16), False, np.float64),
+        (np.array([1, 2, 3], dtype=np.float32), False, np.float32),
+        (np.array([1, 2, 3], dtype=np.int16), True, np.int16),
+        (np.array([1., 2., 3.]), True, np.int32),
+))
+def test_numeric_attribute_array(arr: np.ndarray, int_only: bool, dtype: type) -> None:
+    """Check that arrays set as values of NumericAttribute are converted like the individual values would be."""
+
+    attr = NumericAttribute('x', multivalued=True, int_only=int_only)
+    attr.value = arr
+
+    assert isinstance(attr.value, np.ndarray)
+    assert attr.value.dtype == dtype
+    assert (attr.value == arr).all()
+
+
+def test_numeric_attribute_array_not_int() -> None:
+    attr = NumericAttribute('x', multivalued=True, int_only=True)
+    with pytest.raises(ValueError, match=".*cannot all be represented as integers.*"):
+        attr.value = np.array([1, 2.5])
+
+
+@pytest.mark.parametrize(("arr", "rc"), (
+        (np.array([1.5, 2.5]), RepC.FSINGL),
+        (np.array([1, 2, 3], dtype=np.uint8), RepC.SNORM),
+        (np.array([[1, 2], [3, 4]]), RepC.ULONG),
+        (np.array([0, 1, 1]), RepC.STATUS),
+        (np.array([100, 200]), RepC.UVARI)
+))
+def test_write_struct_array(arr: np.ndarray, rc: RepC) -> None:
+    """Check that arrays converted at once are the same as values converted one by one."""
+
+    assert write_struct_array(rc, arr) == b''.join(write_struct(rc, v) for v in arr.ravel().tolist())
+
+
+@pytest.mark.parametrize(("arr", "rc", "message"), (
+        (np.array([1.5, 2]), RepC.SLONG, "Non-integer values.*"),
+        (np.array([1., np.nan]), RepC.SLONG, "Non-integer values.*"),
+        (np.array([-1, 2]), RepC.USHORT, "Values outside the range.*"),
+        (np.array([1e300]), RepC.FSINGL, "Values too large.*"),
+))
+def test_write_struct_array_error(arr: np.ndarray, rc: RepC, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        write_struct_array(rc, arr)
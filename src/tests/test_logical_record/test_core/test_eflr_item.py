@@ -0,0 +1,92 @@
+import pytest
+
+from dliswriter.logical_record import eflr_types
+from dliswriter.logical_record.core.eflr import EFLRItem
+from dliswriter.logical_record.core.attribute import Attribute, NumericAttribute
+
+
+EFLR_ITEM_TYPES = [t for t in vars(eflr_types).values() if isinstance(t, type) and issubclass(t, EFLRItem)]
+
+
+@pytest.mark.parametrize("item_type", EFLR_ITEM_TYPES)
+def test_no_instance_dict(item_type: type[EFLRItem]) -> None:
+    """Check that all EFLRItem subclasses define __slots__, so that their instances do not have a __dict__."""
+
+    assert all('__slots__' in klass.__dict__ for klass in item_type.__mro__ if klass is not object)
+
+
+def test_attribute_schema(channel_parent: eflr_types.ChannelSet) -> None:
+    """Check that attribute names are determined once per class, in the order of definition."""
+
+    ch1 = eflr_types.ChannelItem('CH1', parent=channel_parent, units='m')
+    ch2 = eflr_types.ChannelItem('CH2', parent=channel_parent)
+
+    names = eflr_types.ChannelItem.__dict__['_attribute_names']
+    assert names == ('long_name', 'properties', 'representation_code', 'units', 'dimension', 'axis',
+                     'element_limit', 'source', 'minimum_value', 'maximum_value')
+    assert tuple(ch1.attributes) == tuple(ch2.attributes) == names
+    assert ch1.attributes['units'] is ch1.units
+    assert ch2.units.value is None
+
+
+def test_attribute_schema_subclass_without_slots(channel_parent: eflr_types.ChannelSet) -> None:
+    """Check that subclasses not defining __slots__ can still add Attributes."""
+
+    class CustomChannelItem(eflr_types.ChannelItem):
+        def __init__(self, *args, **kwargs) -> None:  # type: ignore  # test class
+            self.custom = NumericAttribute('custom')
+            super().__init__(*args, **kwargs)
+
+    ch = CustomChannelItem('CH', parent=channel_parent, custom=12.5)
+    assert tuple(ch.attributes)[:2] == ('custom', 'long_name')
+    assert ch.custom.value == 12.5
+    assert 'custom' not in eflr_types.ChannelItem.__dict__['_attribute_names']
+
+
+def test_attributes_are_slotted() -> None:
+    """Check that Attribute instances do not have a __dict__ and share their unit checker."""
+
+    attr1 = Attribute('a')
+    attr2 = NumericAttribute('b')
+
+    assert not hasattr(attr1, '__dict__')
+    assert not hasattr(attr2, '__dict__')
+    assert attr1._unit_checker is attr2._unit_checker
+
+    with pytest.raises(AttributeError):
+        attr1.xyz = 1  # type: ignore  # testing that it is not allowed
+
+
+def test_obname_computed_once(channel_parent: eflr_types.ChannelSet) -> None:
+    ch = eflr_types.ChannelItem('CH', parent=channel_parent, origin_reference=2)
+    assert ch.obname is ch.obname
+
+
+def test_name_index(channel_parent: eflr_types.ChannelSet) -> None:
+    """Check that items can be looked up by name and copy number and that copy numbers are assigned accordingly."""
+
+    items = [eflr_types.ChannelItem(name, parent=channel_parent) for name in ('A', 'B', 'A', 'A')]
+
+    assert [it.copy_number for it in items] == [0, 0, 1, 2]
+    assert channel_parent.count_items_with_name('A') == 3
+    assert channel_parent.count_items_with_name('C') == 0
+    assert channel_parent.get_eflr_item('A', 2) is items[3]
+    assert channel_parent.get_eflr_item('B') is items[1]
+    assert channel_parent.get_eflr_item('B', 1) is None
+    assert list(channel_parent.iter_eflr_items()) == items
+
+
+def test_name_index_after_renaming(channel_parent: eflr_types.ChannelSet) -> None:
+    """Check that renaming an item updates the name index, so that copy numbers of new items remain unique."""
+
+    ch1 = eflr_types.ChannelItem('A', parent=channel_parent, origin_reference=1)
+    obname = ch1.obname
+    ch1.name = 'B'
+
+    assert ch1.obname != obname
+    assert channel_parent.count_items_with_name('A') == 0
+    assert channel_parent.get_eflr_item('B') is ch1
+
+    ch2 = eflr_types.ChannelItem('B', parent=channel_parent, origin_reference=1)
+    assert ch2.copy_number == 1
+    assert ch2.obname != ch1.obname
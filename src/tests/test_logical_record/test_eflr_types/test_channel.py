@@ -59,6 +59,26 @@ def test_dataset_name_not_specified(name: str) -> None:
     assert c.dataset_name == name
 
 
+def test_dataset_name_index() -> None:
+    """Check that the ChannelSet keeps track of the dataset names of its channels, also when they are changed."""
+
+    channel_set = ChannelSet()
+    c1 = ChannelItem('X', parent=channel_set)
+    c2 = ChannelItem('Y', parent=channel_set, dataset_name='data/y')
+
+    assert channel_set.has_dataset_name('X')
+    assert channel_set.has_dataset_name('data/y')
+    assert not channel_set.has_dataset_name('Y')
+
+    c1.name = 'Z'  # dataset name follows the channel name
+    assert not channel_set.has_dataset_name('X')
+    assert channel_set.has_dataset_name('Z')
+
+    c2.dataset_name = 'data/yy'
+    assert not channel_set.has_dataset_name('data/y')
+    assert channel_set.has_dataset_name('data/yy')
+
+
 @pytest.mark.parametrize(('dimension', 'element_limit'), (([10], None), ([10, 10], None), (None, [1, 2, 3])))
 def test_dimension_and_element_limit(dimension: Union[list[int], None], element_limit: Union[list[int], None]) -> None:
     """Test that it is enough to specify dimension OR element limit in the config for both to be set to that value."""
@@ -142,7 +162,8 @@ def test_clearing_unit(chan: ChannelItem) -> None:
         (np.dtype(np.float64), RepresentationCode.FDOUBL),
         (np.uint8, RepresentationCode.USHORT),
         (np.int16, RepresentationCode.SNORM),
-        (np.dtype(np.int32), RepresentationCode.SLONG)
+        (np.dtype(np.int32), RepresentationCode.SLONG),
+        (np.float16, RepresentationCode.FSHORT)
 ))
 def test_setting_cast_dtype(chan: ChannelItem, dt: numpy_dtype_type, repc: RepresentationCode) -> None:
     """Test that representation code is correctly set based on provided cast dtype."""
@@ -163,7 +184,7 @@ def test_clearing_cast_dtype(chan: ChannelItem) -> None:
     assert chan.representation_code.value is None
 
 
-@pytest.mark.parametrize('dt', (np.float16, np.int64, np.bool_))
+@pytest.mark.parametrize('dt', (np.int64, np.bool_))
 def test_setting_cast_dtype_dtype_not_supported(chan: ChannelItem, dt: numpy_dtype_type) -> None:
     with pytest.raises(ValueError, match="Dtype .* is not supported.*"):
         chan.cast_dtype = dt
@@ -1,7 +1,7 @@
 import logging
 import pytest
 import numpy as np
-from typing import Optional
+from typing import Any, Optional
 
 from dliswriter.logical_record.eflr_types.frame import FrameSet, FrameItem
 from dliswriter.utils.internal.internal_enums import RepresentationCode
@@ -11,16 +11,13 @@ from dliswriter import DLISFile, high_compatibility_mode_decorator, enums
 def test_frame_creation() -> None:
     """Test creating d FrameObject."""
 
-    frame = FrameItem(
-        "MAIN-FRAME",
-        **{
-            "index_type": "BOREHOLE-DEPTH",
-            "encrypted": 1,
-            "description": "The main frame",
-            "spacing": {"value": 0.2, "units": "m"},
-        },
-        parent=FrameSet(),
-    )
+    kwargs: dict[str, Any] = {
+        "index_type": "BOREHOLE-DEPTH",
+        "encrypted": 1,
+        "description": "The main frame",
+        "spacing": {"value": 0.2, "units": "m"},
+    }
+    frame = FrameItem("MAIN-FRAME", **kwargs, parent=FrameSet())
 
     assert frame.name == "MAIN-FRAME"
     assert frame.index_type.value == "BOREHOLE-DEPTH"
@@ -0,0 +1,187 @@
+import pytest
+import numpy as np
+from pathlib import Path
+
+from dliswriter import DLISFile
+from dliswriter.utils.internal.cast_checker import CastChecker, CastPolicy
+from dliswriter.utils.internal.fshort import FSHORT_MAX
+from dliswriter.utils.source_data_wrappers import DictDataWrapper
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+def _cast(checker: CastChecker, values: np.ndarray, dtype: type) -> np.ndarray:
+    out: np.ndarray = np.zeros(values.shape, dtype=dtype)
+    checker.cast('X', values, out=out)
+    return out
+
+
+def test_safe_cast_not_checked() -> None:
+    checker = CastChecker()
+    out = _cast(checker, np.arange(10, dtype=np.uint8), np.float32)
+
+    assert (out == np.arange(10)).all()
+    assert not checker.summary
+
+
+def test_float_to_int_overflow_warn() -> None:
+    checker = CastChecker(policy='warn')
+    values = np.array([1.0, 2.5, 70000.0, -3.0, np.nan, 5.0])
+    _cast(checker, values, np.uint16)
+
+    s = checker.summary['X']
+    assert s.n_values == 6
+    assert s.n_overflow == 2
+    assert s.n_nan == 1
+    assert s.n_precision_loss == 1
+    assert s.n_damaged == 3
+
+
+def test_float_to_int_clip() -> None:
+    checker = CastChecker(policy=CastPolicy.CLIP)
+    values = np.array([1.0, 2.5, 70000.0, -3.0, np.nan, np.inf])
+    out = _cast(checker, values, np.uint16)
+
+    assert out.tolist() == [1, 2, 65535, 0, 0, 65535]
+    s = checker.summary['X']
+    assert s.n_overflow == 2
+    assert s.n_nan == 2
+    assert s.n_precision_loss == 1
+
+
+@pytest.mark.parametrize(("values", "dtype"), (
+        (np.array([1.0, 1e6]), np.int16),
+        (np.array([1.0, np.nan]), np.int32),
+        (np.array([1, 300], dtype=np.int32), np.uint8),
+        (np.array([1.0, 1e300]), np.float32),
+))
+def test_raise(values: np.ndarray, dtype: type) -> None:
+    with pytest.raises(ValueError, match="cannot be cast"):
+        _cast(CastChecker(policy='raise'), values, dtype)
+
+
+def test_int_to_int() -> None:
+    checker = CastChecker(policy='clip')
+    out = _cast(checker, np.array([-5, 0, 100, 40000], dtype=np.int32), np.int16)
+
+    assert out.tolist() == [-5, 0, 100, 32767]
+    assert checker.summary['X'].n_overflow == 1
+    assert checker.summary['X'].n_precision_loss == 0
+
+
+def test_float_to_float() -> None:
+    checker = CastChecker(policy='clip')
+    values = np.array([1.1, -1e300, np.inf, np.nan, 1e300])
+    out = _cast(checker, values, np.float32)
+
+    assert out[0] == np.float32(1.1)
+    assert out[1] == -np.finfo(np.float32).max
+    assert np.isposinf(out[2])
+    assert np.isnan(out[3])
+    assert out[4] == np.finfo(np.float32).max
+    assert checker.summary['X'].n_overflow == 2
+    assert checker.summary['X'].n_precision_loss == 0  # rounding of floats is expected
+
+
+def test_int_to_float_precision_loss() -> None:
+    checker = CastChecker()
+    _cast(checker, np.array([1, 2**24, 2**24 + 1, -2**30], dtype=np.int32), np.float32)
+
+    assert checker.summary['X'].n_precision_loss == 2
+    assert checker.summary['X'].n_damaged == 0
+
+
+def test_int64_to_float64_precision_loss() -> None:
+    """Test that int64 -> float64 (a 'safe' cast for numpy) is checked, while int32 -> float64 is not."""
+
+    checker = CastChecker()
+    _cast(checker, np.array([1, 2**53, 2**53 + 1], dtype=np.int64), np.float64)
+    _cast(checker, np.array([2**31 - 1], dtype=np.int32), np.float64)
+
+    assert list(checker.summary) == ['X']
+    assert checker.summary['X'].n_precision_loss == 1
+
+
+def test_float_overflow_only_nans_and_infinities() -> None:
+    checker = CastChecker(policy='raise')
+    out = _cast(checker, np.array([np.nan, np.inf, -np.inf, 1.5]), np.float32)
+
+    assert out[3] == 1.5
+    assert checker.summary['X'].n_damaged == 0
+
+
+@pytest.mark.parametrize("source_dtype", (np.float64, np.float16, np.int32))
+def test_float16_checked_against_fshort_range(source_dtype: type) -> None:
+    """Test that values which fit float16, but not FSHORT (as which float16 is written) are out of range."""
+
+    values: np.ndarray = np.array([1, 32768, -40000, 65504, -32768], dtype=source_dtype)
+    checker = CastChecker(policy='clip')
+    out = _cast(checker, values, np.float16)
+
+    assert out.tolist() == [1, FSHORT_MAX, -32768, FSHORT_MAX, -32768]
+    assert checker.summary['X'].n_overflow == 3
+
+    with pytest.raises(ValueError, match="cannot be cast"):
+        _cast(CastChecker(policy='raise'), values, np.float16)
+
+
+def test_wrong_policy() -> None:
+    with pytest.raises(ValueError):
+        CastChecker(policy='ignore')
+
+
+def test_summary_accumulated_over_chunks() -> None:
+    """Test that the summary of a data wrapper covers all loaded chunks; check values in multidimensional data."""
+
+    data = {'a': np.array([1.0, 300.0, 2.0, 500.0]), 'b': np.tile(np.array([[0.5, -1.0]]), (4, 1))}
+    w = DictDataWrapper(data, known_dtypes={'a': np.uint8, 'b': np.int8}, cast_policy='clip')
+    chunks = [w.load_chunk(0, 2), w.load_chunk(2, None)]
+
+    assert [c['a'].tolist() for c in chunks] == [[1, 255], [2, 255]]
+    assert w.cast_summary['a'].n_overflow == 2
+    assert w.cast_summary['a'].n_values == 4
+    assert w.cast_summary['b'].n_values == 8
+    assert w.cast_summary['b'].n_precision_loss == 4
+
+
+def _make_file(values: np.ndarray) -> DLISFile:
+    df = make_df()
+    lf = df.logical_files[0]
+    index = lf.add_channel("DEPTH", data=np.arange(values.size, dtype=np.float64))
+    ch = lf.add_channel("RPM", data=values, cast_dtype=np.uint16)
+    lf.add_frame("MAIN", channels=(index, ch))
+    return df
+
+
+def test_write_with_policy(new_dlis_path: Path) -> None:
+    values = np.array([10.0, 20.0, 70000.0, -1.0])
+
+    with pytest.raises(ValueError, match="cannot be cast"):
+        _make_file(values).write(new_dlis_path, cast_policy='raise')
+
+    _make_file(values).write(new_dlis_path, cast_policy='clip')
+    with load_dlis(new_dlis_path) as f:
+        assert f.frames[0].curves()['RPM'].tolist() == [10, 20, 65535, 0]
+
+
+def test_write_fshort_out_of_range(new_dlis_path: Path) -> None:
+    """Test that values in the float16 range which exceed the FSHORT range are subject to the cast policy."""
+
+    df = make_df()
+    lf = df.logical_files[0]
+    index = lf.add_channel("DEPTH", data=np.arange(3.))
+    ch = lf.add_channel("X", data=np.array([40000., -50000., 65504.]), cast_dtype=np.float16)
+    lf.add_frame("MAIN", channels=(index, ch))
+
+    with pytest.raises(ValueError, match="cannot be cast"):
+        df.write(new_dlis_path, cast_policy='raise')
+
+    df.write(new_dlis_path, cast_policy='clip')
+    with load_dlis(new_dlis_path) as f:
+        assert f.frames[0].curves()['X'].tolist() == [FSHORT_MAX, -32768, FSHORT_MAX]
+
+
+def test_write_summary_logged(new_dlis_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    _make_file(np.array([10.0, 70000.0])).write(new_dlis_path)
+    assert "Values of channel 'RPM' cast with overflow" in caplog.text
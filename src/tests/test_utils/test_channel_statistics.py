@@ -0,0 +1,109 @@
+import pytest
+import numpy as np
+from pathlib import Path
+from typing import Any
+
+from dliswriter.utils.internal.channel_statistics import ChannelStatistics
+from dliswriter.utils.source_data_wrappers import DictDataWrapper
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+def test_update_in_chunks() -> None:
+    """Test that statistics updated chunk by chunk match the ones of the whole data; NaNs are counted and skipped."""
+
+    values = np.random.rand(100, 3) * 100 - 50
+    values[[3, 40, 41], [0, 2, 1]] = np.nan
+
+    stats = ChannelStatistics()
+    for i in range(0, 100, 30):
+        stats.update(values[i:i + 30])
+
+    assert stats.n_values == 300
+    assert stats.n_nan == 3
+    assert stats.minimum == np.nanmin(values)
+    assert stats.maximum == np.nanmax(values)
+    assert type(stats.minimum) is float
+
+
+def test_update_int_and_all_nan() -> None:
+    stats = ChannelStatistics()
+    stats.update(np.array([np.nan, np.nan]))
+    assert (stats.n_values, stats.n_nan, stats.minimum, stats.maximum) == (2, 2, None, None)
+
+    stats = ChannelStatistics()
+    stats.update(np.array([5, -3, 12], dtype=np.int16))
+    stats.update(np.zeros(0, dtype=np.int16))
+    assert (stats.n_values, stats.n_nan, stats.minimum, stats.maximum) == (3, 0, -3, 12)
+    assert type(stats.maximum) is int
+
+
+def test_wrapper_statistics_of_cast_data() -> None:
+    """Test that the wrapper computes the statistics of the cast data, without affecting the cast summary."""
+
+    data = {'a': np.array([1.7, -2.2, 300.0, 4.0]), 'b': np.arange(4, dtype=np.int32)}
+    wrapper = DictDataWrapper(data, known_dtypes={'a': np.uint8}, cast_policy='clip')
+
+    stats = wrapper.compute_statistics(chunk_rows=3)
+    assert (stats['a'].minimum, stats['a'].maximum) == (0, 255)
+    assert (stats['b'].minimum, stats['b'].maximum, stats['b'].n_values) == (0, 3, 4)
+    assert not wrapper.cast_summary
+
+    list(wrapper.iter_chunks(chunk_rows=3))  # statistics complete; not collected again
+    assert wrapper.channel_statistics['b'].n_values == 4
+    assert wrapper.cast_summary['a'].n_overflow == 2
+
+
+def _make_df_with_frame(depth: np.ndarray, rpm: np.ndarray, **rpm_kwargs: Any) -> tuple:
+    df = make_df()
+    lf = df.logical_files[0]
+    channels = (lf.add_channel('DEPTH', data=depth), lf.add_channel('RPM', data=rpm, **rpm_kwargs))
+    lf.add_frame('MAIN', channels=channels, index_type='BOREHOLE-DEPTH')
+    return df, channels
+
+
+@pytest.mark.parametrize("n_workers", (None, 2))
+def test_statistics_collected_when_writing(new_dlis_path: Path, n_workers: int) -> None:
+    """Test that statistics are collected from the chunks being written; the channel metadata are not changed."""
+
+    rpm = np.random.rand(200) * 1000
+    rpm[17] = np.nan
+    df, (depth_channel, rpm_channel) = _make_df_with_frame(np.arange(200.), rpm)
+
+    df.write(new_dlis_path, input_chunk_size=64, collect_channel_statistics=True, n_workers=n_workers)
+
+    assert (depth_channel.statistics.minimum, depth_channel.statistics.maximum) == (0, 199)
+    assert rpm_channel.statistics.n_nan == 1
+    assert rpm_channel.statistics.maximum == np.nanmax(rpm)
+    assert rpm_channel.minimum_value.value is None
+
+    with load_dlis(new_dlis_path) as f:
+        assert 'MINIMUM-VALUE' not in f.object('CHANNEL', 'RPM').attic.keys()
+
+
+def test_statistics_not_collected_by_default(new_dlis_path: Path) -> None:
+    df, (depth_channel, _) = _make_df_with_frame(np.arange(10.), np.arange(10.))
+    df.write(new_dlis_path)
+
+    assert depth_channel.statistics is None
+
+
+def test_fill_channel_limits(new_dlis_path: Path) -> None:
+    """Test that channel limits are set from the (cast) data in a pre-pass and written to the file."""
+
+    rpm = np.linspace(-1000, 70000, 100)
+    df, (depth_channel, rpm_channel) = _make_df_with_frame(np.arange(100.), rpm, cast_dtype=np.uint16,
+                                                           maximum_value=60000.)
+
+    df.write(new_dlis_path, input_chunk_size=30, fill_channel_limits=True, cast_policy='clip')
+
+    assert rpm_channel.statistics.minimum == 0
+    assert rpm_channel.statistics.maximum == 65535
+    assert rpm_channel.statistics.n_values == 100  # not counted twice
+
+    with load_dlis(new_dlis_path) as f:
+        depth = f.object('CHANNEL', 'DEPTH').attic
+        assert (depth['MINIMUM-VALUE'].value, depth['MAXIMUM-VALUE'].value) == ([0.], [99.])
+        rpm = f.object('CHANNEL', 'RPM').attic
+        assert (rpm['MINIMUM-VALUE'].value, rpm['MAXIMUM-VALUE'].value) == ([0.], [60000.])  # max set explicitly
@@ -0,0 +1,131 @@
+import pytest
+import numpy as np
+from pathlib import Path
+
+from dliswriter import ChannelTransform
+from dliswriter.utils.internal.fshort import decode_fshort
+from dliswriter.utils.enums import Unit
+from dliswriter.utils.source_data_wrappers import DictDataWrapper
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+@pytest.mark.parametrize(("from_unit", "to_unit", "values", "expected"), (
+        ("ft", "m", [0., 1., 1000.], [0., 0.3048, 304.8]),
+        (Unit.DEGREE_FAHRENHEIT, Unit.DEGREE_CELSIUS, [32., 212., -40.], [0., 100., -40.]),
+        ("degC", "K", [0., -273.15], [273.15, 0.]),
+        ("psi", "kPa", [1.], [6.894757293168361]),
+        ("us", "ms", [1500.], [1.5]),
+))
+def test_unit_conversion(from_unit: str, to_unit: str, values: list[float], expected: list[float]) -> None:
+    transform = ChannelTransform.from_units(from_unit, to_unit)
+
+    assert np.allclose(transform.apply(np.array(values)), expected)
+    assert transform.to_unit == Unit(to_unit).value
+
+
+@pytest.mark.parametrize(("kwargs", "error_type", "message"), (
+        ({"from_unit": "ft", "to_unit": "degC"}, ValueError, "Cannot convert length"),
+        ({"from_unit": "gAPI", "to_unit": "m"}, ValueError, "'gAPI' is not supported"),
+        ({"from_unit": "xyz", "to_unit": "m"}, ValueError, "not a valid Unit"),
+))
+def test_unit_conversion_invalid(kwargs: dict, error_type: type[Exception], message: str) -> None:
+    with pytest.raises(error_type, match=message):
+        ChannelTransform.from_units(**kwargs)
+
+
+@pytest.mark.parametrize(("kwargs", "error_type", "message"), (
+        ({"scale": 0}, ValueError, "Scale cannot be 0"),
+        ({"offset": np.inf}, ValueError, "Offset must be finite"),
+        ({"scale": "2"}, TypeError, "Scale must be a number"),
+        ({"clip_min": 5, "clip_max": 1}, ValueError, "cannot be larger"),
+))
+def test_invalid_transform(kwargs: dict, error_type: type[Exception], message: str) -> None:
+    with pytest.raises(error_type, match=message):
+        ChannelTransform(**kwargs)
+
+
+def test_apply_only_to_floats() -> None:
+    with pytest.raises(TypeError, match="float array"):
+        ChannelTransform(scale=2).apply(np.arange(3))
+
+
+def test_transform_in_chunks() -> None:
+    """Test that the transform is applied to the loaded chunks, without modifying the source data."""
+
+    values = np.array([1., 2., np.nan, 4., 50.])
+    transforms = {'a': ChannelTransform(scale=2, offset=1, clip_max=20)}
+    wrapper = DictDataWrapper({'a': values}, transforms=transforms)
+
+    chunks = [chunk['a'] for _, chunk in wrapper.iter_chunks(chunk_rows=2)]
+
+    assert np.array_equal(np.concatenate(chunks), [3., 5., np.nan, 9., 20.], equal_nan=True)
+    assert np.array_equal(values, [1., 2., np.nan, 4., 50.], equal_nan=True)
+
+
+def test_transform_integers_and_absent_values() -> None:
+    """Test that integer data are transformed in floating point and cast; absent values are not transformed."""
+
+    data = {
+        'i': np.arange(5, dtype=np.uint16),
+        'f': np.ma.MaskedArray(np.arange(5.), mask=[False, True, False, False, False]),
+    }
+    transforms = {'i': ChannelTransform(scale=0.5), 'f': ChannelTransform(offset=100)}
+    wrapper = DictDataWrapper(data, transforms=transforms, absent_values={'f': -999.25})
+    wrapper.collect_statistics()
+
+    chunk = wrapper.load_chunk(0, None)
+
+    assert chunk['i'].tolist() == [0, 0, 1, 1, 2]
+    assert chunk['i'].dtype == np.uint16
+    assert chunk['f'].tolist() == [100., -999.25, 102., 103., 104.]
+    assert (wrapper.channel_statistics['f'].minimum, wrapper.channel_statistics['f'].maximum) == (100., 104.)
+
+
+def test_transform_before_narrow_float_cast() -> None:
+    """Test that data cast to a narrower float type are transformed first, so that the transformed range is checked."""
+
+    data = {'a': np.array([1000., 70000., 90000.]), 'b': np.array([0.1, 1e39, np.nan])}
+    transforms = {'a': ChannelTransform.from_units('ft', 'm'), 'b': ChannelTransform(scale=1e-10)}
+    wrapper = DictDataWrapper(data, known_dtypes={'a': np.float16, 'b': np.float32}, transforms=transforms,
+                              cast_policy='raise', absent_values={'b': -999.25})
+
+    chunk = wrapper.load_chunk(0, None)  # no error: transformed values within the ranges of FSHORT and float32
+
+    assert np.allclose(decode_fshort(chunk['a']), [304.8, 21336., 27432.], rtol=1e-3)
+    assert np.allclose(chunk['b'], [1e-11, 1e29, -999.25])
+    assert not wrapper.cast_summary['a'].n_damaged
+
+
+def test_channel_units(new_dlis_path: Path) -> None:
+    """Test that the channel units are set from the transform and the data are converted when written."""
+
+    df = make_df()
+    lf = df.logical_files[0]
+    depth = lf.add_channel('DEPTH', data=np.arange(0., 50., 10.), units='ft',
+                           transform=ChannelTransform.from_units('ft', 'm'))
+    temp = lf.add_channel('TEMP', data=np.array([32., 50., 68., 86., 104.]), units='degF',
+                          transform=ChannelTransform.from_units('degF', 'degC', clip_max=30))
+    lf.add_frame('MAIN', channels=(depth, temp), index_type='BOREHOLE-DEPTH')
+
+    assert depth.units.value == 'm'
+
+    df.write(new_dlis_path, fill_channel_limits=True)
+
+    with load_dlis(new_dlis_path) as f:
+        assert f.object('CHANNEL', 'TEMP').units == 'degC'
+        curves = f.frames[0].curves()
+        assert np.allclose(curves['DEPTH'], [0., 3.048, 6.096, 9.144, 12.192])
+        assert np.allclose(curves['TEMP'], [0., 10., 20., 30., 30.])
+        assert f.object('CHANNEL', 'TEMP').attic['MAXIMUM-VALUE'].value == [30.]
+
+
+def test_channel_units_mismatch() -> None:
+    lf = make_df().logical_files[0]
+
+    with pytest.raises(ValueError, match="do not match the units of the transform"):
+        lf.add_channel('X', units='s', transform=ChannelTransform.from_units('ft', 'm'))
+
+    with pytest.raises(TypeError, match="Expected a ChannelTransform"):
+        lf.add_channel('Y', transform=2.)  # type: ignore  # testing wrong type
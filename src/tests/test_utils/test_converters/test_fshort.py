@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from dliswriter.utils.internal.converters import ReprCodeConverter
+from dliswriter.utils.internal.fshort import encode_fshort, decode_fshort, FSHORT_MAX, FSHORT_MIN
+from dliswriter.utils.internal.internal_enums import RepresentationCode
+
+
+@pytest.mark.parametrize(("value", "word"), (
+        (0., 0x0000),
+        (1., 0x4001),
+        (-1., 0xC001),
+        (153., 0x4C88),
+        (0.5, 0x4000),
+        (2 ** -11, 0x0010),
+        (FSHORT_MAX, 0x7FFF),
+        (FSHORT_MIN, 0x800F),
+))
+def test_encode(value: float, word: int) -> None:
+    assert encode_fshort(np.array([value]))[0] == word
+    assert decode_fshort(np.array([word], dtype=np.uint16))[0] == value
+
+
+def test_float16_round_trip() -> None:
+    """Test that float16 values with magnitudes from 0.5 to 32768 are represented exactly."""
+
+    values = (np.random.randn(1000) * 2000).astype(np.float16).reshape(100, 10)
+    values = values[np.abs(values) >= 0.5]
+
+    assert np.array_equal(decode_fshort(encode_fshort(values)), values.astype(np.float32))
+
+
+def test_small_values_and_rounding() -> None:
+    values = np.array([1e-5, 3e-4, -3e-4, 32767.9, 2047.9])
+    assert decode_fshort(encode_fshort(values)).tolist() == [0., 2 ** -11, -2 ** -11, FSHORT_MAX, 2048.]
+
+
+def test_saturation() -> None:
+    values = np.array([40000., -40000., np.inf, -np.inf, np.nan])
+    assert decode_fshort(encode_fshort(values)).tolist() == [FSHORT_MAX, FSHORT_MIN, FSHORT_MAX, FSHORT_MIN, 0.]
+
+
+def test_repr_code() -> None:
+    assert ReprCodeConverter.determine_repr_code_from_numpy_dtype(np.float16) is RepresentationCode.FSHORT
+    assert ReprCodeConverter.determine_supported_numpy_dtype(np.zeros(2, dtype=np.float16)) == np.float32
@@ -0,0 +1,100 @@
+import pytest
+import numpy as np
+from typing import Optional
+
+from dliswriter.utils.internal.decimation import Decimator, DecimationMethod, n_overview_chunks
+from dliswriter.utils.internal.fshort import decode_fshort, encode_fshort
+
+
+def decimate_in_chunks(decimator: Decimator, data: np.ndarray, chunk_rows: int) -> list[np.ndarray]:
+    overview_chunks = [decimator.update(data[i:i + chunk_rows]) for i in range(0, data.shape[0], chunk_rows)]
+    overview_chunks.append(decimator.flush())
+    return [c for c in overview_chunks if c.shape[0]]
+
+
+@pytest.fixture
+def data() -> np.ndarray:
+    data = np.zeros(23, dtype=[('depth', np.float64), ('gr', np.float32), ('flag', np.uint8, (2,))])
+    data['depth'] = np.arange(23.)
+    data['gr'] = np.random.rand(23) * 100
+    data['gr'][[4, 5, 6, 7, 12]] = np.nan
+    data['flag'] = np.arange(46).reshape(23, 2) % 7
+    return data
+
+
+@pytest.mark.parametrize("chunk_rows", (1, 3, 4, 7, 23))
+def test_pick(data: np.ndarray, chunk_rows: int) -> None:
+    decimator = Decimator(4, DecimationMethod.PICK, data.dtype, data.dtype, {}, has_index=True)
+    overview = np.concatenate(decimate_in_chunks(decimator, data, chunk_rows))
+
+    assert overview.tobytes() == data[::4].tobytes()
+
+
+@pytest.mark.parametrize("chunk_rows", (1, 3, 7, 23))
+def test_mean(data: np.ndarray, chunk_rows: int) -> None:
+    """Test that absent values are excluded from the means; a window without valid values gets NaN."""
+
+    decimator = Decimator(4, DecimationMethod.MEAN, data.dtype, data.dtype, {}, has_index=True)
+    overview = np.concatenate(decimate_in_chunks(decimator, data, chunk_rows))
+
+    assert overview['depth'].tolist() == [1.5, 5.5, 9.5, 13.5, 17.5, 21.]
+    gr = data['gr']
+    expected_gr = [np.nanmean(gr[i:i + 4]) if not np.isnan(gr[i:i + 4]).all() else np.nan for i in range(0, 23, 4)]
+    assert np.allclose(overview['gr'], expected_gr, equal_nan=True)
+    assert np.isnan(overview['gr'][1])
+    assert overview['flag'].tolist() == [np.rint(data['flag'][i:i + 4].mean(axis=0)).tolist() for i in range(0, 23, 4)]
+
+
+@pytest.mark.parametrize("chunk_rows", (2, 5, 23))
+def test_min_max(data: np.ndarray, chunk_rows: int) -> None:
+    decimator = Decimator(5, DecimationMethod.MIN_MAX, data.dtype, data.dtype, {'flag': 0}, has_index=True)
+    overview = np.concatenate(decimate_in_chunks(decimator, data, chunk_rows))
+
+    assert overview.dtype.names == ('depth', 'gr-MIN', 'gr-MAX', 'flag-MIN', 'flag-MAX')
+    assert overview['depth'].tolist() == [0., 5., 10., 15., 20.]
+    assert np.allclose(overview['gr-MIN'], [np.nanmin(data['gr'][i:i + 5]) for i in range(0, 23, 5)])
+    assert np.allclose(overview['gr-MAX'], [np.nanmax(data['gr'][i:i + 5]) for i in range(0, 23, 5)])
+
+    flag = np.where(data['flag'] == 0, 99, data['flag'])  # 0 is absent
+    assert overview['flag-MIN'].tolist() == [flag[i:i + 5].min(axis=0).tolist() for i in range(0, 23, 5)]
+
+
+def test_no_valid_values_absent_value() -> None:
+    data = np.zeros(4, dtype=[('a', np.float32), ('b', np.uint16)])
+    data['a'] = [np.nan, np.nan, 1., 2.]
+    data['b'] = [7, 7, 3, 7]
+
+    decimator = Decimator(2, DecimationMethod.MEAN, data.dtype, data.dtype, {'a': -999., 'b': 7}, has_index=False)
+    overview = decimator.decimate(data)
+
+    assert overview['a'].tolist() == [-999., 1.5]
+    assert overview['b'].tolist() == [7, 3]
+
+
+def test_fshort() -> None:
+    """Test that FSHORT words are decoded for computing the means and encoded back."""
+
+    values = np.array([1., 3., 100., 200.])
+    dtype = np.dtype([('a', np.float16)])
+    chunk = np.zeros(4, dtype=[('a', np.uint16)])
+    chunk['a'] = encode_fshort(values)
+
+    overview = Decimator(2, DecimationMethod.MEAN, dtype, chunk.dtype, {}, has_index=False).decimate(chunk)
+
+    assert decode_fshort(overview['a']).tolist() == [2., 150.]
+
+
+@pytest.mark.parametrize(("n_rows", "chunk_rows", "factor"), (
+        (23, 4, 5),
+        (23, 7, 2),
+        (20, 5, 10),
+        (20, None, 3),
+        (3, 2, 10),
+        (100, 3, 4),
+))
+def test_n_overview_chunks(n_rows: int, chunk_rows: Optional[int], factor: int) -> None:
+    data = np.zeros(n_rows, dtype=[('a', np.float64)])
+    decimator = Decimator(factor, DecimationMethod.PICK, data.dtype, data.dtype, {}, has_index=True)
+
+    assert n_overview_chunks(n_rows, chunk_rows, factor) == \
+        len(decimate_in_chunks(decimator, data, chunk_rows or n_rows))
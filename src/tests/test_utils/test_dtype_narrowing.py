@@ -0,0 +1,102 @@
+import pytest
+import numpy as np
+from pathlib import Path
+
+from dliswriter.utils.internal.dtype_narrowing import NarrowingAnalysis
+from dliswriter.utils.source_data_wrappers import DictDataWrapper
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+@pytest.mark.parametrize(("values", "expected"), (
+        (np.array([0., 3., 255.]), np.uint8),
+        (np.array([0., 3., 256.]), np.uint16),
+        (np.array([0., 70000.]), np.uint32),
+        (np.array([-1., 3.]), np.float32),              # signed integers not proposed for float data
+        (np.array([0.5, 0.25, np.nan]), np.float32),
+        (np.array([0.1, 2.]), np.float64),              # 0.1 not exact in float32
+        (np.array([1e300]), np.float64),
+        (np.array([70000, 5], dtype=np.uint32), np.uint32),
+        (np.array([-3, 5], dtype=np.int32), np.int8),
+        (np.array([-3, 50000], dtype=np.int32), np.int32),
+        (np.array([3, 200], dtype=np.int32), np.uint8),
+        (np.array([0.5, 1.5], dtype=np.float32), np.float32),
+))
+def test_propose(values: np.ndarray, expected: type) -> None:
+    analysis = NarrowingAnalysis()
+    analysis.update(values)
+
+    assert analysis.propose(values.dtype) == expected
+
+
+def test_propose_in_chunks() -> None:
+    """Test that a check failing in a later chunk is taken into account."""
+
+    analysis = NarrowingAnalysis()
+    analysis.update(np.array([1., 2.]))
+    analysis.update(np.zeros(0))
+    assert analysis.propose(np.dtype(np.float64)) == np.uint8
+
+    analysis.update(np.array([[300., 2.5]]))
+    assert analysis.propose(np.dtype(np.float64)) == np.float32
+
+
+def test_no_values() -> None:
+    assert NarrowingAnalysis().propose(np.dtype(np.float64)) == np.float64
+
+
+def test_wrapper_proposals() -> None:
+    """Test proposals for the data as written: transformed, cast, with absent values; cast summary not affected."""
+
+    data = {
+        'depth': np.arange(0., 100., 0.5),
+        'counts': np.tile([[1., 2., np.nan]], (200, 1)),
+        'clipped': np.linspace(-10, 1000, 200),
+    }
+    wrapper = DictDataWrapper(data, known_dtypes={'clipped': np.uint16}, cast_policy='clip',
+                              absent_values={'counts': 255})
+
+    proposals = wrapper.analyse_narrowing(chunk_rows=64)
+
+    assert proposals['depth'].proposed_dtype == np.float32
+    assert proposals['depth'].bytes_saved == 200 * 4
+    assert proposals['counts'].proposed_dtype == np.uint8
+    assert proposals['counts'].bytes_saved == 600 * 7
+    assert not proposals['clipped'].narrowed
+    assert not wrapper.cast_summary
+
+
+def test_absent_value_must_be_representable() -> None:
+    wrapper = DictDataWrapper({'a': np.array([1., np.nan])}, absent_values={'a': -999.25})
+    assert wrapper.analyse_narrowing(chunk_rows=None)['a'].proposed_dtype == np.float32
+
+
+def test_auto_narrow(new_dlis_path: Path) -> None:
+    """Test that channels without cast_dtype are narrowed and written losslessly; explicit cast_dtype is kept."""
+
+    df = make_df()
+    lf = df.logical_files[0]
+    depth_data = np.arange(0., 50., 0.25)
+    channels = (
+        lf.add_channel('DEPTH', data=depth_data),
+        lf.add_channel('FLAG', data=np.arange(200.) % 3),
+        lf.add_channel('GR', data=np.random.rand(200) * 100),
+        lf.add_channel('KEPT', data=np.arange(200.), cast_dtype=np.float64),
+    )
+    lf.add_frame('MAIN', channels=channels, index_type='BOREHOLE-DEPTH')
+
+    proposals = df.analyse_narrowing(input_chunk_size=64)
+    assert [p.name for p in proposals] == ['DEPTH', 'FLAG', 'GR']
+    assert sum(p.bytes_saved for p in proposals) == 200 * (4 + 7)
+    assert channels[1].cast_dtype is None  # nothing changed by the analysis
+
+    df.write(new_dlis_path, input_chunk_size=64, auto_narrow=True)
+
+    assert [ch.cast_dtype for ch in channels] == [np.float32, np.uint8, np.float64, np.float64]
+
+    with load_dlis(new_dlis_path) as f:
+        assert [f.object('CHANNEL', name).reprc for name in ('DEPTH', 'FLAG', 'GR', 'KEPT')] == [2, 15, 7, 7]
+        curves = f.frames[0].curves()
+        assert np.array_equal(curves['DEPTH'], depth_data)
+        assert np.array_equal(curves['FLAG'], np.arange(200) % 3)
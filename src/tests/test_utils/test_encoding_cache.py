@@ -0,0 +1,140 @@
+import pytest
+import threading
+from pathlib import Path
+
+from dliswriter import EncodingCache, CachePolicy, encoding_cache_scope
+from dliswriter.configuration import global_config
+from dliswriter.utils.internal.internal_enums import RepresentationCode as RepC
+from dliswriter.utils.internal.struct_writer import write_struct, _write_struct
+
+from tests.dlis_files_for_testing import write_time_based_dlis
+
+
+def test_default_policies() -> None:
+    cache = EncodingCache()
+
+    assert cache.policy(RepC.IDENT) is CachePolicy.ALWAYS
+    assert cache.policy(RepC.OBNAME) is CachePolicy.ALWAYS
+    assert cache.policy(RepC.FDOUBL) is CachePolicy.NEVER
+    assert cache.policy(RepC.USHORT) is CachePolicy.LRU
+
+
+def test_custom_policies() -> None:
+    cache = EncodingCache(policies={RepC.FDOUBL: 'lru', RepC.IDENT: CachePolicy.NEVER})
+
+    assert cache.policy(RepC.FDOUBL) is CachePolicy.LRU
+    assert cache.policy(RepC.IDENT) is CachePolicy.NEVER
+    assert cache.policy(RepC.ASCII) is CachePolicy.ALWAYS
+
+
+def test_hits_and_misses() -> None:
+    cache = EncodingCache()
+
+    for _ in range(3):
+        assert cache.encode(RepC.IDENT, "DEPTH", _write_struct) == _write_struct(RepC.IDENT, "DEPTH")
+        assert cache.encode(RepC.FDOUBL, 1.5, _write_struct) == _write_struct(RepC.FDOUBL, 1.5)
+
+    assert cache.stats[RepC.IDENT].hits == 2
+    assert cache.stats[RepC.IDENT].misses == 1
+    assert RepC.FDOUBL not in cache.stats  # not cached at all
+    assert len(cache) == 1
+    assert cache.total_stats.hit_rate == pytest.approx(2 / 3)
+
+
+def test_lru_eviction() -> None:
+    cache = EncodingCache(maxsize=3)
+
+    for v in (1, 2, 3, 1, 4):  # 4 evicts 2 - the least recently used value
+        cache.encode(RepC.USHORT, v, _write_struct)
+    for name in ("A", "B", "C", "D"):  # not subject to the size limit
+        cache.encode(RepC.IDENT, name, _write_struct)
+
+    assert len(cache) == 7
+    assert cache.stats[RepC.USHORT].evictions == 1
+
+    cache.encode(RepC.USHORT, 1, _write_struct)
+    cache.encode(RepC.USHORT, 2, _write_struct)
+    assert cache.stats[RepC.USHORT].hits == 2
+    assert cache.stats[RepC.USHORT].misses == 5
+
+
+def test_value_types_distinguished() -> None:
+    """Test that values equal in Python, but of different types (and encoded differently) are cached separately."""
+
+    cache = EncodingCache()
+
+    assert cache.encode(RepC.ASCII, 1, _write_struct) == _write_struct(RepC.ASCII, "1")
+    assert cache.encode(RepC.ASCII, 1.0, _write_struct) == _write_struct(RepC.ASCII, "1.0")
+    assert cache.encode(RepC.ASCII, True, _write_struct) == _write_struct(RepC.ASCII, "True")
+
+
+def test_unhashable_value() -> None:
+    cache = EncodingCache()
+    cache.encode(RepC.IDENT, ["a"], lambda rc, v: b"x")
+    assert len(cache) == 0
+
+
+def test_wrong_maxsize() -> None:
+    with pytest.raises(ValueError, match="non-negative integer"):
+        EncodingCache(maxsize=-1)
+
+
+def test_scope() -> None:
+    """Test that the cache is used and cleared within the scope, and the previous state is restored afterwards."""
+
+    caches = [global_config.encoding_cache]
+
+    with encoding_cache_scope() as cache:
+        caches.append(global_config.encoding_cache)
+        write_struct(RepC.IDENT, "ABC")
+        write_struct(RepC.IDENT, "ABC")
+        assert len(cache) == 1
+
+    caches.append(global_config.encoding_cache)
+    assert caches == [None, cache, None]
+    assert len(cache) == 0
+    assert cache.stats[RepC.IDENT].hits == 1
+
+
+def test_scopes_in_threads() -> None:
+    """Test that scopes entered in different threads use their own caches, also when they are exited out of order."""
+
+    barrier = threading.Barrier(2)
+    results: dict[str, bool] = {}
+
+    def run(name: str, exit_first: bool) -> None:
+        with encoding_cache_scope() as cache:
+            barrier.wait()  # both scopes entered
+            if not exit_first:
+                barrier.wait()  # the other scope exited
+            results[name] = global_config.encoding_cache is cache
+        if exit_first:
+            barrier.wait()
+        results[name] = results[name] and global_config.encoding_cache is None
+
+    threads = [threading.Thread(target=run, args=(name, name == 'A')) for name in ('A', 'B')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {'A': True, 'B': True}
+    assert global_config.encoding_cache is None
+
+
+def test_cache_used_in_write(new_dlis_path: Path, short_reference_data_path: Path) -> None:
+    """Test that the cache passed to write is used, cleared afterwards, and does not change the produced file."""
+
+    cache = EncodingCache()
+    write_time_based_dlis(new_dlis_path, data=short_reference_data_path, encoding_cache=cache)
+    cached_bytes = new_dlis_path.read_bytes()
+
+    assert cache.total_stats.hits > 0
+    assert len(cache) == 0
+    assert global_config.encoding_cache is None
+
+    no_cache = EncodingCache(maxsize=0, policies={rc: CachePolicy.NEVER for rc in RepC})
+    write_time_based_dlis(new_dlis_path, data=short_reference_data_path, encoding_cache=no_cache)
+
+    assert not no_cache.stats
+    assert new_dlis_path.read_bytes() == cached_bytes
@@ -0,0 +1,91 @@
+import pytest
+import numpy as np
+import h5py  # type: ignore  # untyped library
+from pathlib import Path
+from typing import Any
+
+from dliswriter import ChannelTransform
+from dliswriter.utils.internal.index_search import find_rows_in_range
+from dliswriter.utils.source_data_wrappers import DictDataWrapper, HDF5DataWrapper
+
+
+class CountingDataset:
+    """Array wrapper counting the read operations."""
+
+    def __init__(self, arr: np.ndarray) -> None:
+        self.arr = arr
+        self.shape = arr.shape
+        self.n_reads = 0
+
+    def __getitem__(self, item: Any) -> Any:
+        self.n_reads += 1
+        return self.arr[item]
+
+
+@pytest.mark.parametrize(("start", "stop", "expected"), (
+        (2500, 3100, (500, 1101)),
+        (2500.5, 3100.5, (501, 1101)),
+        (0, 1000, (0, 0)),
+        (1000, 2000, (0, 1)),
+        (4999, 6000, (2999, 3000)),
+        (6000, 7000, (3000, 3000)),
+))
+def test_ascending(start: float, stop: float, expected: tuple) -> None:
+    assert find_rows_in_range(np.arange(2000., 5000.), start, stop) == expected
+
+
+def test_descending() -> None:
+    """Test a descending index (e.g. an up-log); the range is still given as (smallest, largest)."""
+
+    depth = np.arange(5000., 2000., -0.5)
+    first, last = find_rows_in_range(depth, 2500, 3100)
+
+    assert depth[first] == 3100
+    assert depth[last - 1] == 2500
+    assert last - first == 1201
+
+
+def test_repeated_values_and_window() -> None:
+    time = np.repeat(np.arange(10), 3)
+
+    assert find_rows_in_range(time, 2, 4) == (6, 15)
+    assert find_rows_in_range(time, 2, 4, from_idx=7, to_idx=12) == (7, 12)
+
+
+def test_invalid_range() -> None:
+    with pytest.raises(ValueError, match="cannot be larger than"):
+        find_rows_in_range(np.arange(10), 5, 4)
+
+
+def test_number_of_reads() -> None:
+    """Test that the number of values read is logarithmic in the data size."""
+
+    dataset = CountingDataset(np.arange(2 ** 20, dtype=np.float64))
+    assert find_rows_in_range(dataset, 1000.5, 500000, block_rows=1024) == (1001, 500001)
+    assert dataset.n_reads <= 2 + 2 * (10 + 1)
+
+
+def test_hdf5_chunked(tmp_path: Path) -> None:
+    file_name = tmp_path / 'depth.h5'
+    with h5py.File(file_name, 'w') as f:
+        f.create_dataset('depth', data=np.arange(0., 1000., 0.1), chunks=(128,))
+        f.create_dataset('gr', data=np.random.rand(10000), chunks=(128,))
+
+    with HDF5DataWrapper(file_name, mapping={'DEPTH': 'depth', 'GR': 'gr'}) as wrapper:
+        assert wrapper.find_index_rows('DEPTH', (250, 310)) == (2500, 3101)
+
+
+def test_wrapper_transform_and_errors() -> None:
+    """Test that the range refers to the transformed values and that an empty selection is an error."""
+
+    data = {'depth': np.arange(0., 1000., 1.)}
+    wrapper = DictDataWrapper(data, transforms={'depth': ChannelTransform.from_units('ft', 'm')}, from_idx=10)
+
+    first, last = wrapper.find_index_rows('depth', (100, 200))
+    assert (first, last) == (329, 657)
+    assert data['depth'][first] * 0.3048 >= 100 > data['depth'][first - 1] * 0.3048
+
+    assert wrapper.find_index_rows('depth', (0, 5)) == (10, 17)
+
+    with pytest.raises(ValueError, match="No values of data set 'depth'"):
+        wrapper.find_index_rows('depth', (1000, 2000))
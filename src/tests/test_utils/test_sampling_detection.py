@@ -0,0 +1,48 @@
+import pytest
+import numpy as np
+from typing import Optional
+
+from dliswriter.utils.internal.sampling_detection import SamplingDetection, detect_sampling
+
+
+def padded(n_rows: int, phase: int, stride: int) -> np.ndarray:
+    values = np.full(n_rows, np.nan)
+    values[phase::stride] = np.arange(values[phase::stride].size)
+    return values
+
+
+@pytest.mark.parametrize(("values", "expected"), (
+        (padded(100, 0, 1), (0, 1)),
+        (padded(100, 0, 10), (0, 10)),
+        (padded(100, 3, 10), (3, 10)),
+        (padded(100, 95, 10), None),                    # a single valid value
+        (np.full(100, np.nan), None),
+        (np.arange(100, dtype=np.int32), (0, 1)),
+        (np.ma.MaskedArray(np.arange(100), mask=np.arange(100) % 4 != 1), (1, 4)),
+))
+def test_sampling(values: np.ndarray, expected: Optional[tuple]) -> None:
+    detection = detect_sampling({'a': values}, chunk_rows=7)['a']
+    assert detection.sampling == expected
+
+
+def test_gap_and_irregular() -> None:
+    """Test that a missing sample keeps the stride, while an off-grid sample reduces it."""
+
+    values = padded(100, 0, 10)
+    values[50] = np.nan
+    assert detect_sampling({'a': values}, chunk_rows=16)['a'].sampling == (0, 10)
+
+    values[55] = 1.
+    assert detect_sampling({'a': values}, chunk_rows=16)['a'].sampling == (0, 5)
+
+
+def test_multidimensional() -> None:
+    values = np.full((20, 3), np.nan)
+    values[2::4, 1] = 1.
+
+    detection = SamplingDetection()
+    detection.update(values[:10], start=0)
+    detection.update(values[10:], start=10)
+
+    assert detection.sampling == (2, 4)
+    assert detection.n_valid == 5
@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 import h5py  # type: ignore  # untyped library
 from pathlib import Path
-from typing import Union
+from typing import Callable, Union
 
 from dliswriter.utils.source_data_wrappers import HDF5DataWrapper, SourceDataWrapper
 
@@ -100,3 +100,49 @@ def test_getitem(short_reference_data_path: Path, mapping: dict, from_idx: int,
         for key in ('time', 'rpm', 'rad', 'amp'):
             assert isinstance(w[key], np.ndarray)
             assert (w[key] == data[mapping[key]][from_idx:to_idx]).all()
+
+
+def test_context_manager(short_reference_data_path: Path, mapping: dict, n_open_hdf5_files: Callable[[], int]) -> None:
+    """Test that the HDF5 file is closed when the wrapper's context is exited."""
+
+    n_open = n_open_hdf5_files()
+
+    with HDF5DataWrapper(short_reference_data_path, mapping) as w:
+        assert n_open_hdf5_files() == n_open + 1
+        assert w.load_chunk(0, 5).size == 5
+
+    assert not w.data_source
+    assert n_open_hdf5_files() == n_open
+
+    w.close()  # closing again should not cause any issues
+
+
+@pytest.mark.parametrize("hdf5_options", ({'driver': 'core'}, {'rdcc_nbytes': 2**24}, {'driver': 'sec2'}))
+def test_hdf5_options(short_reference_data_path: Path, mapping: dict, hdf5_options: dict) -> None:
+    """Test passing additional options for opening the HDF5 file."""
+
+    with SourceDataWrapper.make_wrapper(short_reference_data_path, mapping=mapping, hdf5_options=hdf5_options) as w:
+        assert isinstance(w, HDF5DataWrapper)
+        if 'driver' in hdf5_options:
+            source = w.data_source
+            assert isinstance(source, h5py.File)
+            assert source.driver == hdf5_options['driver']
+
+        with h5py.File(short_reference_data_path, 'r') as data:
+            assert (w.load_chunk(0, 10)['rpm'] == data['/contents/rpm'][:10]).all()
+
+
+def test_hdf5_options_mode_not_allowed(short_reference_data_path: Path, mapping: dict) -> None:
+    with pytest.raises(ValueError, match="read-only mode"):
+        HDF5DataWrapper(short_reference_data_path, mapping, hdf5_options={'mode': 'a'})
+
+
+def test_file_closed_on_failed_init(short_reference_data_path: Path, n_open_hdf5_files: Callable[[], int]) -> None:
+    """Test that the HDF5 file is not kept open if the wrapper cannot be initialised."""
+
+    n_open = n_open_hdf5_files()
+
+    with pytest.raises(ValueError, match="No dataset"):
+        HDF5DataWrapper(short_reference_data_path, {'x': '/contents/nonexistent'})
+
+    assert n_open_hdf5_files() == n_open
@@ -0,0 +1,94 @@
+import pytest
+from typing import Generator
+from pathlib import Path
+import numpy as np
+
+from dliswriter import DLISFile, SpillStore
+
+from tests.common import load_dlis
+
+
+@pytest.fixture
+def spill_store(tmp_path: Path) -> Generator:
+    with SpillStore(directory=tmp_path) as store:
+        yield store
+
+
+@pytest.mark.parametrize("array", (
+        np.arange(100, dtype=np.float32),
+        np.random.rand(50, 4),
+        np.array(['abc', 'd', 'efgh']),
+        np.zeros(10, dtype=[('x', np.int16), ('y', np.float64, (2,))]),
+))
+def test_store(spill_store: SpillStore, array: np.ndarray) -> None:
+    """Test that a stored array is replaced by a read-only memory map with the same contents."""
+
+    mm = spill_store.store(array)
+
+    assert isinstance(mm, np.memmap)
+    assert not mm.flags.writeable
+    assert mm.dtype == array.dtype
+    assert (mm == array).all()
+    assert spill_store.nbytes == array.nbytes
+
+
+def test_arrays_kept_in_memory(tmp_path: Path) -> None:
+    """Test that empty arrays and arrays smaller than the minimal size are returned as they are."""
+
+    store = SpillStore(directory=tmp_path, min_nbytes=100)
+    small = np.arange(10, dtype=np.int8)
+    empty = np.zeros((0, 3))
+
+    assert store.store(small) is small
+    assert store.store(empty) is empty
+    assert isinstance(store.store(np.arange(100.)), np.memmap)
+    assert store.nbytes == 800
+
+
+def test_errors(spill_store: SpillStore) -> None:
+    with pytest.raises(ValueError, match="object dtype"):
+        spill_store.store(np.array([1, 'a', None], dtype=object))
+
+    spill_store.close()
+    with pytest.raises(RuntimeError, match="closed SpillStore"):
+        spill_store.store(np.arange(10))
+
+
+def test_close_removes_files(tmp_path: Path) -> None:
+    """Test that the scratch directory is removed when the store is closed (also repeatedly) or garbage-collected."""
+
+    with SpillStore(directory=tmp_path) as store:
+        store.store(np.arange(10))
+        path = store.path
+        assert len(list(path.iterdir())) == 1
+
+    assert store.closed
+    assert not path.exists()
+    store.close()
+
+    path = SpillStore(directory=tmp_path).path
+    assert not path.exists()
+
+
+def test_write_file_with_spilled_data(spill_store: SpillStore, new_dlis_path: Path) -> None:
+    """Test writing a file whose channel data are kept on disk until the file is written."""
+
+    df = DLISFile(spill_store=spill_store)
+    lf = df.add_logical_file()
+    lf.add_origin('ORIGIN')
+
+    depth = np.arange(1000, dtype=np.float64)
+    amplitude = np.random.rand(1000, 8).astype(np.float32)
+    channels = [lf.add_channel('DEPTH', data=depth.copy()), lf.add_channel('AMPLITUDE', data=amplitude.copy())]
+    lf.add_channels([{'name': 'RPM', 'data': np.arange(1000, dtype=np.int32)}])
+    lf.add_frame('MAIN', channels=(*channels, lf.channels[-1]))
+
+    assert all(isinstance(v, np.memmap) for v in lf._data_dict.values())
+
+    df.write(new_dlis_path, input_chunk_size=128)
+
+    with load_dlis(new_dlis_path) as f:
+        curves = f.frames[0].curves()
+        assert (curves['DEPTH'] == depth).all()
+        assert (curves['AMPLITUDE'] == amplitude).all()
+        assert (curves['RPM'] == np.arange(1000)).all()
@@ -0,0 +1,136 @@
+import pytest
+import numpy as np
+from pathlib import Path
+
+from dliswriter import EvenlySpacedIndex, DerivedChannel, ChannelTransform
+from dliswriter.utils.source_data_wrappers import DictDataWrapper
+
+from tests.common import load_dlis
+from tests.dlis_files_for_testing.common import make_df
+
+
+def test_evenly_spaced_index() -> None:
+    index = EvenlySpacedIndex(2500, 0.5)
+
+    assert index.evaluate(None, 2, 5).tolist() == [2501., 2501.5, 2502.]
+    assert index.value_at(10) == 2505.
+    assert index.as_dataset(None, n_rows=100)[-1] == 2549.5
+
+
+@pytest.mark.parametrize(("kwargs", "error", "message"), (
+        ({"start": 0, "step": 0}, ValueError, "cannot be 0"),
+        ({"start": np.nan, "step": 1}, ValueError, "must be finite"),
+        ({"start": '0', "step": 1}, TypeError, "must be a number"),
+))
+def test_evenly_spaced_index_invalid(kwargs: dict, error: type, message: str) -> None:
+    with pytest.raises(error, match=message):
+        EvenlySpacedIndex(**kwargs)
+
+
+def test_derived_channel() -> None:
+    data = {'a': np.arange(10.), 'b-c': np.full(10, 2.)}
+
+    expression = DerivedChannel('np.sqrt(a) * b', inputs={'a': 'a', 'b': 'b-c'})
+    function = DerivedChannel(lambda a, b: a + b, inputs=['a', 'b-c'])
+
+    assert expression.evaluate(data, 4, 6).tolist() == [4., np.sqrt(5) * 2]
+    assert function.evaluate(data, 0, 2).tolist() == [2., 3.]
+
+
+@pytest.mark.parametrize(("args", "error", "message"), (
+        (('a +', ['a']), SyntaxError, "invalid syntax"),
+        (('a', ['b-c']), ValueError, "valid identifiers"),
+        (('a', []), ValueError, "non-empty"),
+        ((5, ['a']), TypeError, "expression string or a callable"),
+))
+def test_derived_channel_invalid(args: tuple, error: type, message: str) -> None:
+    with pytest.raises(error, match=message):
+        DerivedChannel(*args)
+
+
+def test_derived_channel_errors_on_evaluation() -> None:
+    with pytest.raises(ValueError, match="not found in the source data"):
+        DerivedChannel('a', inputs=['a']).evaluate({}, 0, 1)
+
+    with pytest.raises(ValueError, match="returned"):
+        DerivedChannel('a.sum()', inputs=['a']).evaluate({'a': np.zeros(5)}, 0, 5)
+
+
+def test_wrapper_chunks() -> None:
+    """Test that virtual data sets are computed for the loaded rows and then cast and transformed as others."""
+
+    data = {'gr': np.arange(20.), 'unused': np.zeros(20)}
+    virtual_channels = {'depth': EvenlySpacedIndex(100, 0.5), 'gr2': DerivedChannel('gr * 2', inputs=['gr'])}
+    wrapper = DictDataWrapper(data, mapping={'depth': 'depth', 'gr': 'gr', 'gr2': 'gr2'}, from_idx=4,
+                              virtual_channels=virtual_channels, known_dtypes={'gr2': np.uint8},
+                              transforms={'depth': ChannelTransform.from_units('m', 'cm')})
+
+    chunk = wrapper.load_chunk(2, 4)
+
+    assert chunk.dtype.names == ('depth', 'gr', 'gr2')
+    assert chunk['depth'].tolist() == [10300., 10350.]
+    assert chunk['gr2'].dtype == np.uint8 and chunk['gr2'].tolist() == [12, 14]
+    assert wrapper['depth'][0] == 102.
+    assert wrapper.find_index_rows('depth', (10300, 10400)) == (6, 9)
+
+
+def test_wrapper_needs_stored_data_set() -> None:
+    with pytest.raises(ValueError, match="At least one of the data sets"):
+        DictDataWrapper({}, mapping={'depth': 'depth'}, virtual_channels={'depth': EvenlySpacedIndex(0, 1)})
+
+
+def test_virtual_channels_in_file(new_dlis_path: Path) -> None:
+    """Test writing an evenly spaced virtual index and a derived channel; frame limits are set from the definition."""
+
+    rhob = np.random.rand(300) + 2
+    df = make_df()
+    lf = df.logical_files[0]
+    channels = (
+        lf.add_channel('DEPTH', virtual=EvenlySpacedIndex(3000, -0.1), units='m'),
+        lf.add_channel('RHOB', data=rhob),
+        lf.add_channel('PHI', virtual=DerivedChannel('(2.65 - RHOB) / 1.65', inputs=['RHOB']), cast_dtype=np.float32),
+    )
+    frame = lf.add_frame('MAIN', channels=channels, index_type='BOREHOLE-DEPTH')
+
+    df.write(new_dlis_path, input_chunk_size=64, from_idx=100)
+
+    assert (frame.index_min.value, frame.index_max.value, frame.spacing.value) == (2970.1, 2990., -0.1)
+    assert frame.spacing.units == 'm'
+
+    with load_dlis(new_dlis_path) as f:
+        curves = f.frames[0].curves()
+        assert np.allclose(curves['DEPTH'], 3000 - 0.1 * np.arange(100, 300))
+        assert np.allclose(curves['PHI'], (2.65 - rhob[100:]) / 1.65)
+
+
+def test_derived_channel_masked_input(new_dlis_path: Path) -> None:
+    """Test that values computed from masked input values are written as absent values."""
+
+    a = np.arange(30.)
+    b = np.ma.masked_array(np.arange(30.) * 2, mask=np.arange(30) % 7 == 0)
+    df = make_df()
+    lf = df.logical_files[0]
+    channels = (
+        lf.add_channel('DEPTH', data=np.arange(30.)),
+        lf.add_channel('A', data=a),
+        lf.add_channel('B', data=b),
+        lf.add_channel('S', virtual=DerivedChannel('A + B', inputs=['A', 'B'])),
+    )
+    lf.add_frame('MAIN', channels=channels, absent_value=-999.25)
+
+    df.write(new_dlis_path)
+
+    with load_dlis(new_dlis_path) as f:
+        curves = f.frames[0].curves()
+        assert curves['B'][::7].tolist() == curves['S'][::7].tolist() == [-999.25] * 5
+        assert np.array_equal(np.delete(curves['S'], np.s_[::7]), np.delete(a * 3, np.s_[::7]))
+
+
+def test_virtual_channel_with_data() -> None:
+    lf = make_df().logical_files[0]
+
+    with pytest.raises(ValueError, match="cannot be specified for a virtual channel"):
+        lf.add_channel('DEPTH', data=np.arange(10.), virtual=EvenlySpacedIndex(0, 1))
+
+    with pytest.raises(TypeError, match="Expected a VirtualChannel"):
+        lf.add_channel('DEPTH', virtual=np.arange(10.))  # type: ignore  # testing invalid input